@@ -1,11 +1,12 @@
 import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import os
 import sys
 import threading
 import time
 import traceback
 from uuid import UUID, uuid4
-from typing import Any, Callable, Generator, List
+from typing import Any, Callable, Dict, Generator, List, Tuple
 
 from dotenv import dotenv_values
 from pytest_mock import MockerFixture
@@ -82,7 +83,8 @@ def mock_uuid4_generator(mocker: MockerFixture) -> Callable[[str], UUIDGenerator
 
 @pytest.fixture
 def vellum_client_class(mocker: MockerFixture) -> Any:
-    vellum_client_class = mocker.patch("vellum.utils.vellum_client.Vellum")
+    vellum_client_class = mocker.patch("vellum.utils.vellum_client._Vellum")
+    mocker.patch("vellum.utils.vellum_client.Vellum", vellum_client_class)
     mocker.patch("vellum.workflows.vellum_client.Vellum", vellum_client_class)
     return vellum_client_class
 
@@ -103,7 +105,11 @@ def vellum_adhoc_prompt_client(vellum_client: Any) -> Any:
 
 @pytest.fixture
 def mock_httpx_transport(mocker: MockerFixture) -> Any:
-    return mocker.patch("httpx._client.HTTPTransport").return_value
+    # Patches requests on every transport, rather than the transport class, so that it also applies to clients that
+    # were created before the test, such as the ones shared by Vellum clients
+    transport = mocker.Mock()
+    transport.handle_request = mocker.patch("httpx.HTTPTransport.handle_request")
+    return transport
 
 
 @pytest.fixture
@@ -112,6 +118,50 @@ def mock_requests() -> Any:
         yield m
 
 
+# Called with each request and its body, returning the status code, headers and body of the response
+LocalHTTPHandler = Callable[[BaseHTTPRequestHandler, bytes], Tuple[int, Dict[str, str], bytes]]
+
+
+@pytest.fixture
+def local_http_server() -> Generator[Callable[[LocalHTTPHandler], str], None, None]:
+    """
+    Starts local HTTP/1.1 servers that keep connections alive, for tests that need real connections rather than a
+    mocked transport. Returns a function that starts a server with the given handler and returns its base URL.
+    """
+
+    servers: List[ThreadingHTTPServer] = []
+
+    def _start_server(handle: LocalHTTPHandler) -> str:
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _respond(self) -> None:
+                status_code, headers, content = handle(self, self.rfile.read(int(self.headers["Content-Length"] or 0)))
+                self.send_response(status_code)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = _respond
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield _start_server
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
 @pytest.fixture
 def debug_threads() -> Callable[[int], None]:
     """
@@ -3,6 +3,7 @@ import { isNil } from "lodash";
 import { MapNodeContext } from "src/context/node-context/map-node";
 import { NodeDefinitionGenerationError } from "src/generators/errors";
 import { AstNode } from "src/generators/extensions/ast-node";
+import { BoolInstantiation } from "src/generators/extensions/bool-instantiation";
 import { Field } from "src/generators/extensions/field";
 import { IntInstantiation } from "src/generators/extensions/int-instantiation";
 import { Reference } from "src/generators/extensions/reference";
@@ -104,6 +105,30 @@ export class MapNode extends BaseNestedWorkflowNode<
       statements.push(concurrencyField);
     }
 
+    if (
+      this.nodeData.data.variant === "INLINE" &&
+      !isNil(this.nodeData.data.batchSize)
+    ) {
+      statements.push(
+        new Field({
+          name: "batch_size",
+          initializer: new IntInstantiation(this.nodeData.data.batchSize),
+        })
+      );
+    }
+
+    if (
+      this.nodeData.data.variant === "INLINE" &&
+      this.nodeData.data.emitIterationEvents === false
+    ) {
+      statements.push(
+        new Field({
+          name: "emit_iteration_events",
+          initializer: new BoolInstantiation(false),
+        })
+      );
+    }
+
     return statements;
   }
 
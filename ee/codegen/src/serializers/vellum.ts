@@ -1586,6 +1586,11 @@ export const InlineMapNodeDataSerializer: ObjectSchema<
     listSchema(VellumVariableSerializer).optional()
   ),
   concurrency: numberSchema().optional(),
+  batchSize: propertySchema("batch_size", numberSchema().optional()),
+  emitIterationEvents: propertySchema(
+    "emit_iteration_events",
+    booleanSchema().optional()
+  ),
   label: stringSchema(),
   sourceHandleId: propertySchema("source_handle_id", stringSchema()),
   targetHandleId: propertySchema("target_handle_id", stringSchema()),
@@ -1602,6 +1607,8 @@ export declare namespace InlineMapNodeDataSerializer {
     output_variables: VellumVariableSerializer.Raw[];
     state_variables?: VellumVariableSerializer.Raw[] | null;
     concurrency?: number | null;
+    batch_size?: number | null;
+    emit_iteration_events?: boolean | null;
     label: string;
     source_handle_id: string;
     target_handle_id: string;
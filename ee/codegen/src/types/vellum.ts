@@ -557,6 +557,8 @@ export interface InlineMapNodeData {
   outputVariables: VellumVariable[];
   stateVariables?: VellumVariable[];
   concurrency?: number;
+  batchSize?: number;
+  emitIterationEvents?: boolean;
   label: string;
   sourceHandleId: string;
   targetHandleId: string;
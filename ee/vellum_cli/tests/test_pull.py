@@ -1352,6 +1352,7 @@ MY_OTHER_VELLUM_API_KEY=aaabbbcccddd
         api_key="aaabbbcccddd",
         environment=mock.ANY,
         api_version=None,
+        httpx_client=mock.ANY,
     )
 
     # AND the vellum lock file should have been updated with the correct workspace
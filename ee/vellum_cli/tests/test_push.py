@@ -958,6 +958,7 @@ MY_OTHER_VELLUM_API_KEY=aaabbbcccddd
         api_key="aaabbbcccddd",
         environment=mock.ANY,
         api_version=None,
+        httpx_client=mock.ANY,
     )
 
     # AND the vellum lock file should have been updated with the correct workspace
@@ -1120,6 +1121,7 @@ MY_OTHER_VELLUM_API_KEY=aaabbbcccddd
         api_key="aaabbbcccddd",
         environment=mock.ANY,
         api_version=None,
+        httpx_client=mock.ANY,
     )
 
     # AND the vellum lock file should have the same two workflows
@@ -1449,6 +1451,7 @@ MY_CUSTOM_VELLUM_API_KEY=custom-key-xyz
         api_key="custom-key-xyz",
         environment=mock.ANY,
         api_version=None,
+        httpx_client=mock.ANY,
     )
 
     with open(os.path.join(temp_dir, "vellum.lock.json")) as f:
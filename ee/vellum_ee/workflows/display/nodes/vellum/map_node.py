@@ -17,7 +17,13 @@ _MapNodeType = TypeVar("_MapNodeType", bound=MapNode)
 
 class BaseMapNodeDisplay(BaseAdornmentNodeDisplay[_MapNodeType], Generic[_MapNodeType]):
     __serializable_inputs__ = {MapNode.items}  # type: ignore[misc]
-    __unserializable_attributes__ = {MapNode.subworkflow, MapNode.max_concurrency}  # type: ignore[misc]
+    __unserializable_attributes__ = {  # type: ignore[misc]
+        MapNode.subworkflow,
+        MapNode.max_concurrency,
+        MapNode.batch_size,
+        MapNode.emit_iteration_events,
+        MapNode.executor,
+    }
 
     def serialize(
         self, display_context: WorkflowDisplayContext, error_output_id: Optional[UUID] = None, **_kwargs
@@ -91,6 +97,8 @@ class BaseMapNodeDisplay(BaseAdornmentNodeDisplay[_MapNodeType], Generic[_MapNod
                 "input_variables": cast(JsonObject, input_variables),
                 "output_variables": serialized_subworkflow["output_variables"],
                 "concurrency": raise_if_descriptor(node.max_concurrency),
+                "batch_size": raise_if_descriptor(node.batch_size),
+                "emit_iteration_events": raise_if_descriptor(node.emit_iteration_events),
                 "items_input_id": items_workflow_input_id,
                 "item_input_id": item_workflow_input_id,
                 "index_input_id": index_workflow_input_id,
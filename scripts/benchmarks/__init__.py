@@ -0,0 +1,5 @@
+"""
+Local performance benchmarks for the Vellum SDK.
+
+Each module in this package can be run directly, e.g. `python -m scripts.benchmarks.runner_fan_out`.
+"""
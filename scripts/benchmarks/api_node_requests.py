@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how many requests per second an APINode can send to a local HTTP server.
+
+`--requests` requests are sent one after another, and then from `--concurrency` threads the way a MapNode fans out
+over an APINode, first with the workflow context's shared connection pool and then with a new session per request,
+which is how APINode used to send requests, for comparison.
+
+    python -m scripts.benchmarks.api_node_requests --requests 1000 --concurrency 32
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+from typing import Any, Type
+
+from requests import Session
+
+from vellum.workflows.nodes.displayable.bases.api_node.node import BaseAPINode
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.utils.http import create_http_session
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which would otherwise stall kept-alive connections on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class UnpooledSession(Session):
+    """Opens a new session for every request, like APINode did before it shared a connection pool."""
+
+    def send(self, request: Any, **kwargs: Any) -> Any:  # type: ignore[override]
+        with Session() as session:
+            return session.send(request, **kwargs)
+
+
+def requests_per_second(
+    node_class: Type[BaseAPINode], context: WorkflowContext, requests: int, concurrency: int
+) -> float:
+    def send(_: int) -> None:
+        node_class(context=context).run()
+
+    start = time.perf_counter()
+    if concurrency == 1:
+        for index in range(requests):
+            send(index)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(send, range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    class LocalAPINode(BaseAPINode):
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    print(f"Requests: {args.requests}, concurrency: {args.concurrency}")
+    print(f"{'session':<10} {'sequential (req/s)':>19} {'concurrent (req/s)':>19}")
+    try:
+        for label, session in (
+            ("pooled", create_http_session(pool_maxsize=args.concurrency)),
+            ("unpooled", UnpooledSession()),
+        ):
+            context = WorkflowContext(http_session=session)
+            sequential = requests_per_second(LocalAPINode, context, args.requests, 1)
+            concurrent = requests_per_second(LocalAPINode, context, args.requests, args.concurrency)
+            print(f"{label:<10} {sequential:>19.0f} {concurrent:>19.0f}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmarks running many I/O bound workflows at once, with `BaseWorkflow.arun` on a single event loop compared to
+`BaseWorkflow.run` on a pool of threads.
+
+Each of the `--workflows` workflows runs an APINode against a local HTTP server that waits `--delay` seconds before
+responding. The event loop awaits every workflow at once, with up to `--max-connections` requests in flight, while
+the thread pool runs `--threads` workflows at a time.
+
+    python -m scripts.benchmarks.async_workflows --workflows 1000 --delay 0.1 --threads 64
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import multiprocessing
+import threading
+import time
+from typing import Any, Callable, Tuple
+
+from vellum.utils.vellum_client import create_vellum_client
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.nodes.displayable.bases.api_node.node import BaseAPINode
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.utils.http import create_async_http_client, create_http_session
+
+
+class DelayedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which would otherwise stall kept-alive connections on delayed ACKs
+    disable_nagle_algorithm = True
+    delay = 0.1
+
+    def do_GET(self) -> None:
+        time.sleep(self.delay)
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def serve(delay: float, backlog: int, ports: "multiprocessing.Queue[int]") -> None:
+    """Runs the delayed server in its own process, so that its threads aren't counted against the workflows'."""
+    DelayedHandler.delay = delay
+    ThreadingHTTPServer.request_queue_size = backlog
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DelayedHandler)
+    server.daemon_threads = True
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+class PeakThreadCounter:
+    """Samples the number of live threads in the background, keeping the highest count seen."""
+
+    def __init__(self) -> None:
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "PeakThreadCounter":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(0.005):
+            self.peak = max(self.peak, threading.active_count())
+
+
+def measure(run: Callable[[], int]) -> Tuple[float, float, int, int]:
+    """Returns the wall time, CPU time, peak thread count, and number of fulfilled workflows of `run`."""
+    with PeakThreadCounter() as thread_counter:
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        fulfilled = run()
+        wall, cpu = time.perf_counter() - start_wall, time.process_time() - start_cpu
+    return wall, cpu, thread_counter.peak, fulfilled
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workflows", type=int, default=1000)
+    parser.add_argument("--delay", type=float, default=0.1)
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--max-connections", type=int, default=100)
+    args = parser.parse_args()
+
+    ports: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(args.delay, args.workflows, ports), daemon=True)
+    server.start()
+    port = ports.get()
+
+    class LocalAPINode(BaseAPINode):
+        url = f"http://127.0.0.1:{port}/"
+
+    class APIWorkflow(BaseWorkflow):
+        graph = LocalAPINode
+
+        class Outputs(BaseWorkflow.Outputs):
+            status_code = LocalAPINode.Outputs.status_code
+
+    # Building a Vellum client loads certificates, which would otherwise dominate the cost of each workflow
+    vellum_client = create_vellum_client()
+
+    def run_with_threads() -> int:
+        session = create_http_session(pool_maxsize=args.threads)
+
+        def run_workflow(_: int) -> bool:
+            workflow = APIWorkflow(context=WorkflowContext(vellum_client=vellum_client, http_session=session))
+            return workflow.run().name == "workflow.execution.fulfilled"
+
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            return sum(executor.map(run_workflow, range(args.workflows)))
+
+    def run_with_event_loop() -> int:
+        async def run_workflows() -> int:
+            async_http_client = create_async_http_client(max_connections=args.max_connections)
+
+            async def run_workflow() -> bool:
+                context = WorkflowContext(vellum_client=vellum_client, async_http_client=async_http_client)
+                workflow = APIWorkflow(context=context)
+                return (await workflow.arun()).name == "workflow.execution.fulfilled"
+
+            try:
+                return sum(await asyncio.gather(*[run_workflow() for _ in range(args.workflows)]))
+            finally:
+                await async_http_client.aclose()
+
+        return asyncio.run(run_workflows())
+
+    print(f"Workflows: {args.workflows}, server delay: {args.delay}s")
+    print(f"{'mode':<28} {'wall (s)':>9} {'cpu (s)':>9} {'workflows/s':>12} {'peak threads':>13} {'fulfilled':>10}")
+    try:
+        for label, run in (
+            (f"run, {args.threads} threads", run_with_threads),
+            (f"arun, {args.max_connections} connections", run_with_event_loop),
+        ):
+            wall, cpu, peak_threads, fulfilled = measure(run)
+            print(
+                f"{label:<28} {wall:>9.2f} {cpu:>9.2f} {args.workflows / wall:>12.0f} {peak_threads:>13} "
+                f"{fulfilled:>10}"
+            )
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
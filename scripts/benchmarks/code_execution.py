@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how long CodeExecutionNodes take to run their inline Python code.
+
+First a script of roughly `--script-lines` lines is run `--executions` times with the compiled code cache, and then
+with the cache cleared before every execution, for comparison. Then `--items` calls of a CPU bound script are run
+from `--items` threads, the way a MapNode runs its subworkflows, on the workflow's own threads and then in a
+CodeExecutionProcessPool with `--workers` warm workers.
+
+    python -m scripts.benchmarks.code_execution --script-lines 500 --executions 1000 --items 8 --workers 4
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Callable, List
+
+from vellum.workflows.nodes.displayable.code_execution_node import CodeExecutionProcessPool
+from vellum.workflows.nodes.displayable.code_execution_node.utils import _compile_code, run_code_inline
+from vellum.workflows.vellum_client import create_vellum_client
+
+CPU_BOUND_SCRIPT = """\
+def main(limit: int) -> int:
+    total = 0
+    for index in range(limit):
+        total += index * index % 7
+    return total
+"""
+
+
+def build_script(script_lines: int) -> str:
+    lines: List[str] = []
+    for index in range(script_lines // 2):
+        lines.append(f"def helper_{index}(value):")
+        lines.append(f"    return value + {index}")
+    lines.append("def main(value: int) -> int:")
+    lines.append("    return helper_0(value)")
+    return "\n".join(lines)
+
+
+def run_inline(script: str, executions: int, clear_cache: bool) -> float:
+    vellum_client = create_vellum_client()
+    start = time.perf_counter()
+    for index in range(executions):
+        if clear_cache:
+            _compile_code.cache_clear()
+        run_code_inline(script, {"value": index}, int, "benchmark.py", vellum_client)
+    return (time.perf_counter() - start) / executions
+
+
+def run_items(run_item: Callable[[int], object], items: int) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=items) as executor:
+        list(executor.map(run_item, range(items)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--script-lines", type=int, default=500)
+    parser.add_argument("--executions", type=int, default=1000)
+    parser.add_argument("--items", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--limit", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    script = build_script(args.script_lines)
+    print(f"Script lines: {args.script_lines}, executions: {args.executions}")
+    print(f"{'compiled code':<16} {'per execution (us)':>19}")
+    for label, clear_cache in (("cached", False), ("uncached", True)):
+        elapsed = run_inline(script, args.executions, clear_cache)
+        print(f"{label:<16} {elapsed * 1_000_000:>19.1f}")
+
+    vellum_client = create_vellum_client()
+    pool = CodeExecutionProcessPool(max_workers=args.workers)
+    pool.warm_up()
+    try:
+        print()
+        print(f"CPU bound items: {args.items}, workers: {args.workers}")
+        print(f"{'executed in':<16} {'total (s)':>10}")
+        in_thread = run_items(
+            lambda _: run_code_inline(CPU_BOUND_SCRIPT, {"limit": args.limit}, int, "cpu.py", vellum_client),
+            args.items,
+        )
+        print(f"{'threads':<16} {in_thread:>10.2f}")
+        in_pool = run_items(lambda _: pool.run_code(CPU_BOUND_SCRIPT, {"limit": args.limit}, int, "cpu.py"), args.items)
+        print(f"{'process pool':<16} {in_pool:>10.2f}")
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
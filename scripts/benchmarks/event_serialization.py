@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how long it takes to serialize the events of a workflow run to JSON-compatible dicts.
+
+A workflow that grows a chat history in state and streams and outputs chat messages is run once, and every
+event it emits is serialized with `model_dump(mode="json")`, with and without an event max size. The same
+events are then serialized again with the legacy `json.loads(json.dumps(...))` round trip and full size check
+patched back in, for comparison.
+
+    python -m scripts.benchmarks.event_serialization --messages 200 --iterations 20
+"""
+
+import argparse
+from contextlib import contextmanager
+import json
+import time
+from typing import Any, Iterator, List, Optional
+
+from vellum import ChatMessage
+from vellum.utils.json_encoder import VellumJsonEncoder
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.events import node as node_events, workflow as workflow_events
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.inputs import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.outputs import BaseOutput
+from vellum.workflows.state import BaseState
+
+
+class State(BaseState):
+    chat_history: List[ChatMessage] = []
+
+
+class ChatNode(BaseNode[State]):
+    messages = 200
+
+    class Outputs(BaseNode.Outputs):
+        chat_history: List[ChatMessage]
+
+    def run(self) -> Iterator[BaseOutput]:
+        for index in range(self.messages):
+            message = ChatMessage(role="ASSISTANT", text=f"Message {index} " + "lorem ipsum " * 20)
+            self.state.chat_history.append(message)
+            yield BaseOutput(name="chat_history", delta=message.model_dump(mode="json"))
+
+        yield BaseOutput(name="chat_history", value=list(self.state.chat_history))
+
+
+class ChatWorkflow(BaseWorkflow[BaseInputs, State]):
+    graph = ChatNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        chat_history = ChatNode.Outputs.chat_history
+
+
+def _legacy_default_serializer(obj: Any) -> Any:
+    return json.loads(json.dumps(obj, cls=VellumJsonEncoder))
+
+
+def _legacy_exceeds_json_length(obj: Any, max_length: int) -> bool:
+    return len(json.dumps(obj, cls=VellumJsonEncoder)) > max_length
+
+
+@contextmanager
+def legacy_serialization() -> Iterator[None]:
+    patched = [
+        (module, name, getattr(module, name))
+        for module in (node_events, workflow_events)
+        for name in ("default_serializer", "exceeds_json_length")
+        if hasattr(module, name)
+    ]
+    legacy = {"default_serializer": _legacy_default_serializer, "exceeds_json_length": _legacy_exceeds_json_length}
+    for module, name, _ in patched:
+        setattr(module, name, legacy[name])
+
+    try:
+        yield
+    finally:
+        for module, name, original in patched:
+            setattr(module, name, original)
+
+
+def serialize_all(events: List[WorkflowEvent], iterations: int, event_max_size: Optional[int]) -> float:
+    for event in events:
+        event._event_max_size = event_max_size
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for event in events:
+            event.model_dump(mode="json")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--event-max-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    ChatNode.messages = args.messages
+    events = list(ChatWorkflow().stream(event_filter=lambda workflow, event: True))
+    if events[-1].name != "workflow.execution.fulfilled":
+        raise RuntimeError(f"Workflow did not fulfill: {events[-1]}")
+
+    print(f"Events: {len(events)}, messages: {args.messages}, iterations: {args.iterations}")
+    print(f"{'serializer':<12} {'max size':>12} {'total (s)':>12} {'per event (us)':>16}")
+    for label in ("single-pass", "legacy"):
+        for event_max_size in (None, args.event_max_size):
+            if label == "legacy":
+                with legacy_serialization():
+                    elapsed = serialize_all(events, args.iterations, event_max_size)
+            else:
+                elapsed = serialize_all(events, args.iterations, event_max_size)
+
+            per_event = elapsed / (len(events) * args.iterations) * 1_000_000
+            print(f"{label:<12} {str(event_max_size):>12} {elapsed:>12.3f} {per_event:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how long it takes to import the SDK's top level packages.
+
+Each module is imported `--runs` times in a fresh interpreter with `python -X importtime`, and the cumulative
+import time the interpreter reports for it is averaged, along with how many modules the import loaded.
+
+    python -m scripts.benchmarks.import_time --runs 5 vellum vellum.workflows
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+
+def measure_once(module: str) -> Tuple[float, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}, sys; print(len(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Each stderr line looks like `import time: <self us> | <cumulative us> | <indented module name>`
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            cumulative_us = int(cumulative)
+
+    if cumulative_us is None:
+        raise RuntimeError(f"No import time reported for {module}:\n{result.stderr}")
+    return cumulative_us / 1000, int(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", default=["vellum", "vellum.workflows"])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Runs: {args.runs}")
+    print(f"{'module':<24} {'mean (ms)':>10} {'stdev (ms)':>11} {'modules':>8}")
+    for module in args.modules:
+        measurements: List[Tuple[float, int]] = [measure_once(module) for _ in range(args.runs)]
+        elapsed = [ms for ms, _ in measurements]
+        stdev = statistics.stdev(elapsed) if len(elapsed) > 1 else 0.0
+        print(f"{module:<24} {statistics.mean(elapsed):>10.1f} {stdev:>11.1f} {measurements[-1][1]:>8}")
+
+
+if __name__ == "__main__":
+    main()
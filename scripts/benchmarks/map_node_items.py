@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the overhead of a MapNode over many trivial items.
+
+Each item runs a subworkflow with a single node that returns its item, so the wall time, CPU time and peak thread
+count are those of the MapNode itself. Pass `--max-concurrency` to override the node's default concurrency,
+`--batch-size` to run items in batches, `--no-iteration-events` to only stream the node's final outputs and
+`--executor` to run the iterations in worker processes or on a SQLite work queue polled by worker threads, where each
+batch is one round trip.
+
+    python -m scripts.benchmarks.map_node_items --items 10000
+    python -m scripts.benchmarks.map_node_items --items 10000 --batch-size 100 --no-iteration-events
+    python -m scripts.benchmarks.map_node_items --items 2000 --executor process-pool --batch-size 100
+    python -m scripts.benchmarks.map_node_items --items 2000 --executor work-queue --batch-size 100
+"""
+
+import argparse
+from contextlib import ExitStack
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.core.map_node.executors import (
+    BaseMapNodeExecutor,
+    ProcessPoolMapNodeExecutor,
+    SqliteMapNodeWorkQueue,
+    ThreadMapNodeExecutor,
+    WorkQueueMapNodeExecutor,
+    run_map_node_worker,
+)
+from vellum.workflows.nodes.core.map_node.node import DEFAULT_MAX_CONCURRENCY, MapNode
+from vellum.workflows.state.base import BaseState
+
+
+class ItemNode(BaseNode):
+    item = MapNode.SubworkflowInputs.item
+
+    class Outputs(BaseNode.Outputs):
+        value: Any
+
+    def run(self) -> Outputs:
+        return self.Outputs(value=self.item)
+
+
+class ItemWorkflow(BaseWorkflow[MapNode.SubworkflowInputs, BaseState]):
+    graph = ItemNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        value = ItemNode.Outputs.value
+
+
+class PeakThreadCounter:
+    """Samples the number of live threads in the background, keeping the highest count seen."""
+
+    def __init__(self) -> None:
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "PeakThreadCounter":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(0.005):
+            self.peak = max(self.peak, threading.active_count())
+
+
+class WorkQueueWorkers:
+    """Runs `count` workers for a work queue on background threads, until the context exits."""
+
+    def __init__(self, work_queue: SqliteMapNodeWorkQueue, count: int) -> None:
+        self._stop = threading.Event()
+        self._threads = [
+            threading.Thread(target=run_map_node_worker, args=(work_queue,), kwargs={"stop_signal": self._stop})
+            for _ in range(count)
+        ]
+
+    def __enter__(self) -> "WorkQueueWorkers":
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+
+
+def create_executor(name: str, workers: int, stack: ExitStack) -> BaseMapNodeExecutor:
+    if name == "process-pool":
+        executor = ProcessPoolMapNodeExecutor(max_workers=workers)
+        stack.callback(executor.shutdown)
+        return executor
+
+    if name == "work-queue":
+        work_queue = SqliteMapNodeWorkQueue()
+        stack.callback(os.remove, work_queue.path)
+        stack.enter_context(WorkQueueWorkers(work_queue, workers))
+        return WorkQueueMapNodeExecutor(work_queue)
+
+    return ThreadMapNodeExecutor()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument("--no-iteration-events", action="store_true")
+    parser.add_argument("--executor", choices=["thread", "process-pool", "work-queue"], default="thread")
+    args = parser.parse_args()
+
+    with ExitStack() as stack:
+        run(args, stack)
+
+
+def run(args: argparse.Namespace, stack: ExitStack) -> None:
+    max_concurrency: Optional[int] = args.max_concurrency
+    executor = create_executor(args.executor, max_concurrency or DEFAULT_MAX_CONCURRENCY, stack)
+
+    class ItemsMapNode(MapNode):
+        items = list(range(args.items))
+        subworkflow = ItemWorkflow
+        batch_size = args.batch_size
+        emit_iteration_events = not args.no_iteration_events
+
+    ItemsMapNode.executor = executor  # type: ignore[assignment]
+    ItemsMapNode.max_concurrency = max_concurrency  # type: ignore[assignment]
+
+    node = ItemsMapNode(state=BaseState())
+    with PeakThreadCounter() as thread_counter:
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        outputs = list(node.run())
+        wall, cpu = time.perf_counter() - start_wall, time.process_time() - start_cpu
+
+    if outputs[-1].value != list(range(args.items)):
+        raise RuntimeError("MapNode did not map every item")
+
+    concurrency = max_concurrency if max_concurrency is not None else f"default ({DEFAULT_MAX_CONCURRENCY})"
+    print(
+        f"Items: {args.items}, max concurrency: {concurrency}, batch size: {args.batch_size}, "
+        f"iteration events: {not args.no_iteration_events}, executor: {args.executor}"
+    )
+    print(f"wall:         {wall:.2f} s")
+    print(f"cpu:          {cpu:.2f} s ({cpu / wall:.0%} of wall)")
+    print(f"items/s:      {args.items / wall:.0f}")
+    print(f"peak threads: {thread_counter.peak}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmarks decoding the NDJSON responses of `execute_prompt_stream` and `execute_workflow_stream`.
+
+Each fixture in `scripts/benchmarks/fixtures` is a recorded stream, replayed `--repeat` times from a mock transport in
+`--chunk-size` byte chunks, keeping the best of `--rounds` rounds. It is decoded the way the generated clients used
+to, with `iter_lines`, `json.loads` and `parse_obj_as`, and then with each backend of `iter_ndjson_events`. Every
+stream is finally sent through the sync and async clients, to check that they decode every event.
+
+    python -m scripts.benchmarks.ndjson_streaming --repeat 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from typing import Any, AsyncIterator, Callable, Iterator, List
+
+import httpx
+
+from vellum import AsyncVellum, ExecutePromptEvent, Vellum, VellumEnvironment, WorkflowStreamEvent
+from vellum.client.core.pydantic_utilities import parse_obj_as
+from vellum.client.utils import NDJSON_BACKENDS, iter_ndjson_events
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+ENVIRONMENT = VellumEnvironment(
+    default="http://vellum.test", documents="http://vellum.test", predict="http://vellum.test"
+)
+
+
+class ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, content: bytes, chunk_size: int) -> None:
+        self._chunks = [content[start : start + chunk_size] for start in range(0, len(content), chunk_size)]
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._chunks
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self._chunks:
+            yield chunk
+
+
+def create_transport(content: bytes, chunk_size: int) -> httpx.MockTransport:
+    return httpx.MockTransport(lambda request: httpx.Response(200, stream=ChunkedStream(content, chunk_size)))
+
+
+def decode_like_generated_client(response: httpx.Response, type_: Any) -> Iterator[Any]:
+    for text in response.iter_lines():
+        try:
+            if len(text) == 0:
+                continue
+            yield parse_obj_as(type_=type_, object_=json.loads(text))
+        except Exception:
+            pass
+
+
+def replay(
+    content: bytes, chunk_size: int, repeat: int, decode: Callable[[httpx.Response], Iterator[Any]], rounds: int = 1
+) -> "tuple[int, float]":
+    client = httpx.Client(transport=create_transport(content, chunk_size))
+    best_cpu = float("inf")
+    for _ in range(rounds):
+        events = 0
+        start = time.process_time()
+        for _ in range(repeat):
+            with client.stream("POST", "http://vellum.test/") as response:
+                events += sum(1 for _ in decode(response))
+        best_cpu = min(best_cpu, time.process_time() - start)
+    return events, best_cpu
+
+
+def count_client_events(fixture: str, content: bytes, chunk_size: int) -> "tuple[int, int]":
+    vellum_client = Vellum(
+        api_key="benchmark",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.Client(transport=create_transport(content, chunk_size)),
+    )
+    async_vellum_client = AsyncVellum(
+        api_key="benchmark",
+        environment=ENVIRONMENT,
+        httpx_client=httpx.AsyncClient(transport=create_transport(content, chunk_size)),
+    )
+
+    if fixture == "execute_prompt_stream":
+        sync_events = sum(1 for _ in vellum_client.execute_prompt_stream(inputs=[], prompt_deployment_name="benchmark"))
+
+        async def count_async_events() -> int:
+            stream = async_vellum_client.execute_prompt_stream(inputs=[], prompt_deployment_name="benchmark")
+            return len([event async for event in stream])
+
+    else:
+        sync_events = sum(
+            1 for _ in vellum_client.execute_workflow_stream(inputs=[], workflow_deployment_name="benchmark")
+        )
+
+        async def count_async_events() -> int:
+            stream = async_vellum_client.execute_workflow_stream(inputs=[], workflow_deployment_name="benchmark")
+            return len([event async for event in stream])
+
+    return sync_events, asyncio.run(count_async_events())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    backends: List[str] = list(NDJSON_BACKENDS)
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        backends.remove("orjson")
+
+    for fixture, type_ in (
+        ("execute_prompt_stream", ExecutePromptEvent),
+        ("execute_workflow_stream", WorkflowStreamEvent),
+    ):
+        with open(os.path.join(FIXTURES_DIR, f"{fixture}.ndjson"), "rb") as f:
+            content = f.read()
+        lines = content.count(b"\n")
+        print(f"{fixture}: {lines} events, {len(content) / 1024:.0f} KiB, replayed {args.repeat} times")
+
+        # Warm up type adapters and imports, so that no decoder pays for them
+        for backend in backends:
+            replay(content, args.chunk_size, 1, lambda response: iter_ndjson_events(response, type_, backend))
+
+        events, cpu = replay(
+            content,
+            args.chunk_size,
+            args.repeat,
+            lambda response: decode_like_generated_client(response, type_),
+            rounds=args.rounds,
+        )
+        baseline = cpu
+        print(f"  {'generated':<10} {cpu / events * 1e6:6.1f} us/event  {events / cpu:8.0f} events/s")
+        for backend in backends:
+            events, cpu = replay(
+                content,
+                args.chunk_size,
+                args.repeat,
+                lambda response: iter_ndjson_events(response, type_, backend),
+                rounds=args.rounds,
+            )
+            print(
+                f"  {backend:<10} {cpu / events * 1e6:6.1f} us/event  {events / cpu:8.0f} events/s  "
+                f"({baseline / cpu:.2f}x)"
+            )
+
+        sync_events, async_events = count_client_events(fixture, content, args.chunk_size)
+        if sync_events != lines or async_events != lines:
+            raise RuntimeError(f"Expected {lines} events from the clients, got {sync_events} and {async_events}")
+
+
+if __name__ == "__main__":
+    main()
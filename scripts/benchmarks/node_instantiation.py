@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how long it takes to define a workflow's classes and to instantiate its nodes.
+
+A workflow of `--nodes` nodes is defined, each node with a few annotated outputs and attributes that reference
+the previous node's outputs, the workflow inputs and the state. Defining the workflow covers the class level
+attribute accesses made while building its graph and references. Every node is then instantiated `--iterations`
+times, the way the runner does for each node execution, with the cached type inference and then with it
+disabled, for comparison.
+
+    python -m scripts.benchmarks.node_instantiation --nodes 100 --iterations 20
+"""
+
+import argparse
+from contextlib import contextmanager
+import time
+import types
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.inputs import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state import BaseState
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.types import utils as type_utils
+
+
+def build_workflow(node_count: int) -> Type[BaseWorkflow]:
+    class Inputs(BaseInputs):
+        query: str
+        limit: int = 10
+
+    class State(BaseState):
+        counter: int = 0
+        history: List[str] = []
+
+    nodes: List[Type[BaseNode]] = []
+    previous: Optional[Type[BaseNode]] = None
+    for index in range(node_count):
+        name = f"Node{index}"
+        outputs_class = type(
+            "Outputs",
+            (BaseNode.Outputs,),
+            {
+                "__module__": __name__,
+                "__qualname__": f"{name}.Outputs",
+                "__annotations__": {"text": str, "score": float, "tags": List[str]},
+            },
+        )
+        attributes: Dict[str, Any] = {
+            "__module__": __name__,
+            "__annotations__": {"model": str, "temperature": float},
+            "Outputs": outputs_class,
+            "model": "gpt-4o",
+            "temperature": 0.5,
+            "query": Inputs.query,
+            "limit": Inputs.limit,
+            "counter": State.counter,
+        }
+        if previous is not None:
+            attributes["previous_text"] = getattr(previous.Outputs, "text")
+            attributes["previous_tags"] = getattr(previous.Outputs, "tags")
+
+        node = types.new_class(name, (BaseNode[State],), exec_body=lambda namespace: namespace.update(attributes))
+        nodes.append(node)
+        previous = node
+
+    graph: Any = nodes[0]
+    for node in nodes[1:]:
+        graph = graph >> node
+
+    return types.new_class(
+        "ChainWorkflow",
+        (BaseWorkflow[Inputs, State],),
+        exec_body=lambda namespace: namespace.update({"__module__": __name__, "graph": graph}),
+    )
+
+
+@contextmanager
+def uncached_type_inference() -> Iterator[None]:
+    original = type_utils._get_type_cache
+    setattr(type_utils, "_get_type_cache", lambda cls: None)
+    try:
+        yield
+    finally:
+        setattr(type_utils, "_get_type_cache", original)
+
+
+def measure(node_count: int, iterations: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    workflow_class = build_workflow(node_count)
+    define_elapsed = time.perf_counter() - start
+
+    workflow = workflow_class()
+    state = workflow.get_default_state(workflow_class.get_inputs_class()(query="What is the weather?"))
+    context = WorkflowContext()
+    nodes = list(workflow_class.get_nodes())
+    for node_class in nodes:
+        state.meta.node_outputs[getattr(node_class.Outputs, "text")] = f"{node_class.__name__} text"
+        state.meta.node_outputs[getattr(node_class.Outputs, "tags")] = ["a", "b"]
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for node_class in nodes:
+            node_class(state=state, context=context)
+    instantiate_elapsed = (time.perf_counter() - start) / iterations
+
+    return {"define": define_elapsed, "instantiate": instantiate_elapsed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"Nodes: {args.nodes}, iterations: {args.iterations}")
+    print(f"{'type inference':<16} {'define (ms)':>12} {'instantiate all (ms)':>21}")
+    for label in ("cached", "uncached"):
+        if label == "uncached":
+            with uncached_type_inference():
+                result = measure(args.nodes, args.iterations)
+        else:
+            result = measure(args.nodes, args.iterations)
+
+        print(f"{label:<16} {result['define'] * 1000:>12.1f} {result['instantiate'] * 1000:>21.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how long the WorkflowRunner spends streaming node outputs to the consumer.
+
+A single node streams `--chunks` string tokens, the way a prompt node streams a model response, followed by
+the list of all tokens as its final value. The workflow is run with each output validation mode.
+
+    python -m scripts.benchmarks.node_output_streaming --chunks 5000 --runs 5
+"""
+
+import argparse
+import statistics
+import time
+from typing import Iterator, List
+
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.outputs import BaseOutput
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.types import OutputValidationMode
+
+
+class TokenStreamingNode(BaseNode):
+    chunks = 5000
+
+    class Outputs(BaseNode.Outputs):
+        tokens: List[str]
+
+    def run(self) -> Iterator[BaseOutput]:
+        tokens = []
+        for index in range(self.chunks):
+            token = f"token-{index} "
+            tokens.append(token)
+            yield BaseOutput(name="tokens", delta=token)
+
+        yield BaseOutput(name="tokens", value=tokens)
+
+
+class TokenStreamingWorkflow(BaseWorkflow):
+    graph = TokenStreamingNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        tokens = TokenStreamingNode.Outputs.tokens
+
+
+def measure_once(output_validation_mode: OutputValidationMode) -> float:
+    workflow = TokenStreamingWorkflow(context=WorkflowContext(output_validation_mode=output_validation_mode))
+
+    start = time.perf_counter()
+    terminal_event = workflow.run()
+    elapsed = time.perf_counter() - start
+
+    if terminal_event.name != "workflow.execution.fulfilled":
+        raise RuntimeError(f"Workflow did not fulfill: {terminal_event}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    TokenStreamingNode.chunks = args.chunks
+    print(f"Chunks: {args.chunks}, runs: {args.runs}")
+    print(f"{'mode':<10} {'median (ms)':>12} {'per chunk (us)':>16}")
+    for output_validation_mode in OutputValidationMode:
+        elapsed = statistics.median(measure_once(output_validation_mode) for _ in range(args.runs))
+        per_chunk = elapsed / args.chunks * 1_000_000
+        print(f"{output_validation_mode.value:<10} {elapsed * 1000:>12.1f} {per_chunk:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how long `cast_to_output_type` takes per call, the way CodeExecutionNode results, FinalOutputNode
+values and deserialized state fields are cast.
+
+Each value is cast to its output type `--iterations` times with the cached type adapters, and then with the
+legacy approach of building a pydantic model on every call, for comparison.
+
+    python -m scripts.benchmarks.output_casting --iterations 2000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from pydantic import create_model
+
+from vellum import ChatMessage
+from vellum.workflows.nodes.utils import _clean_output_type, cast_to_output_type
+from vellum.workflows.types.core import Json
+
+CASES: List[Tuple[str, Any, Any]] = [
+    ("str", "hello world", str),
+    ("int", 42, int),
+    ("Json", {"key": [1, 2, {"nested": "value"}]}, Json),
+    ("List[str]", [f"item {index}" for index in range(20)], List[str]),
+    ("Dict[str, int]", {f"key {index}": index for index in range(20)}, Dict[str, int]),
+    ("List[ChatMessage]", [{"role": "USER", "text": f"Message {index}"} for index in range(5)], List[ChatMessage]),
+]
+
+
+def legacy_cast_to_output_type(result: Any, output_type: Any) -> Any:
+    DynamicModel = create_model("Output", output_type=(_clean_output_type(output_type), ...))
+    return DynamicModel.model_validate({"output_type": result}).output_type  # type: ignore[attr-defined]
+
+
+def measure(cast: Callable[[Any, Any], Any], result: Any, output_type: Any, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        cast(result, output_type)
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"Iterations: {args.iterations}")
+    print(f"{'output type':<20} {'cached (us)':>12} {'legacy (us)':>12} {'speedup':>8}")
+    for label, result, output_type in CASES:
+        cached = measure(cast_to_output_type, result, output_type, args.iterations)
+        legacy = measure(legacy_cast_to_output_type, result, output_type, args.iterations)
+        print(f"{label:<20} {cached * 1_000_000:>12.1f} {legacy * 1_000_000:>12.1f} {legacy / cached:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
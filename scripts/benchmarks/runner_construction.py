@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how long it takes to construct a WorkflowRunner and traverse its workflow's graph.
+
+The workflow is a chain of `--nodes` nodes split across several parallel branches, so that its graph has many
+edges and merges. Each iteration constructs a runner, the way MapNode and RetryNode do for every subworkflow
+they run, and reads the workflow's edges, nodes and entrypoints.
+
+    python -m scripts.benchmarks.runner_construction --nodes 200 --iterations 200
+"""
+
+import argparse
+import time
+from typing import List, Type
+
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.runner import WorkflowRunner
+
+
+def build_workflow(node_count: int, branches: int) -> Type[BaseWorkflow]:
+    def make_node(index: int) -> Type[BaseNode]:
+        return type(f"Node{index}", (BaseNode,), {"__module__": __name__})
+
+    start_node = make_node(0)
+    end_node = make_node(node_count - 1)
+    branch_length = max((node_count - 2) // branches, 1)
+
+    branch_graphs: List = []
+    index = 1
+    for _ in range(branches):
+        branch = start_node >> make_node(index)
+        index += 1
+        for _ in range(branch_length - 1):
+            branch = branch >> make_node(index)
+            index += 1
+        branch_graphs.append(branch >> end_node)
+
+    return type("WideWorkflow", (BaseWorkflow,), {"__module__": __name__, "graph": set(branch_graphs)})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=200)
+    parser.add_argument("--branches", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    workflow_class = build_workflow(args.nodes, args.branches)
+    node_count = len(list(workflow_class.get_nodes()))
+    edge_count = len(list(workflow_class.get_edges()))
+
+    runner_elapsed = 0.0
+    traversal_elapsed = 0.0
+    for _ in range(args.iterations):
+        workflow = workflow_class()
+
+        start = time.perf_counter()
+        WorkflowRunner(workflow)
+        runner_elapsed += time.perf_counter() - start
+
+        start = time.perf_counter()
+        list(workflow_class.get_edges())
+        list(workflow_class.get_nodes())
+        list(workflow_class.get_entrypoints())
+        traversal_elapsed += time.perf_counter() - start
+
+    print(f"Nodes: {node_count}, edges: {edge_count}, iterations: {args.iterations}")
+    print(f"runner construction: {runner_elapsed / args.iterations * 1000:.3f} ms")
+    print(f"graph traversal:     {traversal_elapsed / args.iterations * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how quickly the WorkflowRunner delivers terminal events to the consumer.
+
+A single node records the moment it is fulfilled, and the consumer measures the delay until it receives
+the `workflow.execution.fulfilled` event. Runs can be executed concurrently to observe tail latency under
+load, and optionally with a cancel signal attached.
+
+    python -m scripts.benchmarks.runner_event_latency --runs 200 --concurrency 50
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import math
+import statistics
+from threading import Event as ThreadingEvent
+import time
+from typing import List, Optional
+
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.types import CancelSignal, ObservableCancelSignal
+
+
+class FulfilledAtNode(BaseNode):
+    class Outputs(BaseNode.Outputs):
+        fulfilled_at: float
+
+    def run(self) -> Outputs:
+        return self.Outputs(fulfilled_at=time.perf_counter())
+
+
+class LatencyWorkflow(BaseWorkflow):
+    graph = FulfilledAtNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        fulfilled_at = FulfilledAtNode.Outputs.fulfilled_at
+
+
+def measure_once(cancel_signal_kind: str) -> float:
+    cancel_signal: Optional[CancelSignal] = None
+    if cancel_signal_kind == "event":
+        cancel_signal = ThreadingEvent()
+    elif cancel_signal_kind == "observable":
+        cancel_signal = ObservableCancelSignal()
+
+    latency: Optional[float] = None
+    workflow = LatencyWorkflow()
+    # Consume the whole stream so that the runner can tear down its background threads
+    for event in workflow.stream(cancel_signal=cancel_signal):
+        if event.name == "workflow.execution.fulfilled":
+            latency = time.perf_counter() - event.outputs.fulfilled_at
+
+    if latency is None:
+        raise RuntimeError("Workflow did not fulfill")
+    return latency
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(len(ordered) * pct) - 1)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--cancel-signal", choices=["none", "event", "observable"], default="none")
+    args = parser.parse_args()
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        latencies = list(pool.map(lambda _: measure_once(args.cancel_signal), range(args.runs)))
+
+    latencies_ms = [latency * 1000 for latency in latencies]
+    print(f"Runs: {args.runs}, concurrency: {args.concurrency}, cancel signal: {args.cancel_signal}")
+    print(f"median: {statistics.median(latencies_ms):.3f} ms")
+    print(f"p95:    {percentile(latencies_ms, 0.95):.3f} ms")
+    print(f"p99:    {percentile(latencies_ms, 0.99):.3f} ms")
+    print(f"max:    {max(latencies_ms):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
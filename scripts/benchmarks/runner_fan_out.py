@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the WorkflowRunner on a wide fan-out graph.
+
+A start node fans out to N trivial nodes which all merge into a single AWAIT_ALL node. For each node
+executor we report wall time and the peak number of live threads observed while the workflow ran.
+
+    python -m scripts.benchmarks.runner_fan_out --width 500 --iterations 5
+"""
+
+import argparse
+import math
+import statistics
+import threading
+import time
+from typing import Callable, Dict, List, Tuple, Type
+
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.executors import BaseNodeExecutor, PooledNodeExecutor, ThreadPerNodeExecutor
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.types.core import MergeBehavior
+
+
+def build_fan_out_workflow(width: int) -> Type[BaseWorkflow]:
+    class StartNode(BaseNode):
+        pass
+
+    fan_out_nodes = {type(f"FanOutNode{i}", (BaseNode,), {"__module__": __name__}) for i in range(width)}
+
+    class EndNode(BaseNode):
+        class Trigger(BaseNode.Trigger):
+            merge_behavior = MergeBehavior.AWAIT_ALL
+
+    class FanOutWorkflow(BaseWorkflow):
+        graph = StartNode >> fan_out_nodes >> EndNode
+
+    return FanOutWorkflow
+
+
+class ThreadSampler:
+    def __init__(self, interval: float = 0.001) -> None:
+        self._interval = interval
+        self._stop = threading.Event()
+        self.peak = 0
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, threading.active_count())
+            self._stop.wait(self._interval)
+
+    def __enter__(self) -> "ThreadSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def run_benchmark(
+    workflow_class: Type[BaseWorkflow], executor_factory: Callable[[], BaseNodeExecutor], iterations: int
+) -> Tuple[List[float], int]:
+    executor = executor_factory()
+    durations: List[float] = []
+    peak_threads = 0
+    for _ in range(iterations):
+        workflow = workflow_class(context=WorkflowContext(node_executor=executor))
+        with ThreadSampler() as sampler:
+            start = time.perf_counter()
+            event = workflow.run()
+            durations.append(time.perf_counter() - start)
+        if event.name != "workflow.execution.fulfilled":
+            raise RuntimeError(f"Workflow did not fulfill: {event}")
+        peak_threads = max(peak_threads, sampler.peak)
+
+    executor.shutdown()
+    return durations, peak_threads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--max-workers", type=int, default=32)
+    args = parser.parse_args()
+
+    workflow_class = build_fan_out_workflow(args.width)
+    executors: Dict[str, Callable[[], BaseNodeExecutor]] = {
+        "thread-per-node": ThreadPerNodeExecutor,
+        "pooled (unbounded)": PooledNodeExecutor,
+        f"pooled (max_workers={args.max_workers})": lambda: PooledNodeExecutor(max_workers=args.max_workers),
+    }
+
+    print(f"Fan-out width: {args.width}, iterations: {args.iterations}")
+    print(f"{'executor':<32}{'median (s)':>12}{'p95 (s)':>12}{'peak threads':>14}")
+    for name, factory in executors.items():
+        durations, peak_threads = run_benchmark(workflow_class, factory, args.iterations)
+        p95 = sorted(durations)[max(0, math.ceil(len(durations) * 0.95) - 1)]
+        print(f"{name:<32}{statistics.median(durations):>12.4f}{p95:>12.4f}{peak_threads:>14}")
+
+
+if __name__ == "__main__":
+    main()
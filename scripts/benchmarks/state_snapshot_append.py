@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmarks the cost of appending to a chat history held on workflow state.
+
+A single node appends messages one at a time to a `List[ChatMessage]` state attribute, so every append is
+snapshotted by the WorkflowRunner. We report the mean cost per append over the first and last windows of the
+run for each snapshot mode. A flat cost means appends are O(1) amortized regardless of history length.
+
+    python -m scripts.benchmarks.state_snapshot_append --messages 10000 --deepcopy-messages 1000
+"""
+
+import argparse
+import statistics
+import time
+from typing import List, Type
+
+from pydantic import Field
+
+from vellum import ChatMessage
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.types import SnapshotMode
+
+
+def build_workflow(snapshot_mode: SnapshotMode, messages: int) -> Type[BaseWorkflow]:
+    class State(BaseState):
+        __snapshot_mode__ = snapshot_mode
+        chat_history: List[ChatMessage] = Field(default_factory=list)
+
+    class AppendNode(BaseNode[State]):
+        class Outputs(BaseNode.Outputs):
+            durations: List[float]
+
+        def run(self) -> Outputs:
+            durations = []
+            for index in range(messages):
+                message = ChatMessage(role="USER" if index % 2 == 0 else "ASSISTANT", text=f"Message {index}")
+                start = time.perf_counter()
+                self.state.chat_history.append(message)
+                durations.append(time.perf_counter() - start)
+            return self.Outputs(durations=durations)
+
+    class ChatHistoryWorkflow(BaseWorkflow[BaseWorkflow.get_inputs_class(), State]):  # type: ignore[misc]
+        graph = AppendNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            durations = AppendNode.Outputs.durations
+
+    return ChatHistoryWorkflow
+
+
+def run_benchmark(snapshot_mode: SnapshotMode, messages: int) -> List[float]:
+    workflow = build_workflow(snapshot_mode, messages)()
+    event = workflow.run()
+    if event.name != "workflow.execution.fulfilled":
+        raise RuntimeError(f"Workflow did not fulfill: {event}")
+    return event.outputs["durations"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument(
+        "--deepcopy-messages",
+        type=int,
+        default=1000,
+        help="History length for the DEEPCOPY mode, which grows quadratically",
+    )
+    parser.add_argument("--window", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'snapshot mode':<16}{'messages':>10}{'first window (us)':>20}{'last window (us)':>20}{'total (s)':>12}")
+    for snapshot_mode, messages in [
+        (SnapshotMode.DEEPCOPY, args.deepcopy_messages),
+        (SnapshotMode.STRUCTURAL, args.messages),
+    ]:
+        durations = run_benchmark(snapshot_mode, messages)
+        window = min(args.window, len(durations))
+        first = statistics.mean(durations[:window]) * 1e6
+        last = statistics.mean(durations[-window:]) * 1e6
+        print(f"{snapshot_mode.value:<16}{messages:>10}{first:>20.2f}{last:>20.2f}{sum(durations):>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
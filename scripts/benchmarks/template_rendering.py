@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how long it takes to render a Jinja template in the sandboxed environment used by TemplatingNode and
+Jinja prompt blocks.
+
+A template of roughly `--template-size` bytes, made of loops, conditionals and filter calls, is rendered
+`--renders` times with the default filters and globals and different inputs each time, the way a TemplatingNode
+inside a MapNode renders it once per item. The same renders are then repeated with the compiled template cache
+cleared before every render, for comparison.
+
+    python -m scripts.benchmarks.template_rendering --template-size 2048 --renders 10000
+"""
+
+import argparse
+import time
+from typing import List
+
+from vellum.utils.templating.constants import DEFAULT_JINJA_CUSTOM_FILTERS, DEFAULT_JINJA_GLOBALS
+from vellum.utils.templating.render import (
+    clear_template_cache,
+    get_template_cache_info,
+    render_sandboxed_jinja_template,
+)
+
+TEMPLATE_SECTION = """
+Section {{ loop_index }} for {{ user.name | title }}:
+{% for item in items %}- {{ item.label | replace("_", " ") }}: {{ item.value }}{% if item.value > 10 %}!{% endif %}
+{% endfor %}{% if user.tags %}Tags: {{ user.tags | join(", ") }}{% else %}No tags{% endif %}
+Payload: {{ user | tojson }}
+"""
+
+
+def build_template(template_size: int) -> str:
+    sections: List[str] = []
+    while sum(len(section) for section in sections) < template_size:
+        sections.append(TEMPLATE_SECTION.replace("loop_index", str(len(sections))))
+    return "".join(sections)
+
+
+def render_all(template: str, renders: int, clear_cache: bool) -> float:
+    start = time.perf_counter()
+    for index in range(renders):
+        if clear_cache:
+            clear_template_cache()
+
+        render_sandboxed_jinja_template(
+            template=template,
+            input_values={
+                "user": {"name": f"user {index}", "tags": ["a", "b"] if index % 2 else []},
+                "items": [{"label": f"item_{i}", "value": (index + i) % 20} for i in range(5)],
+            },
+            jinja_custom_filters={**DEFAULT_JINJA_CUSTOM_FILTERS},
+            jinja_globals=DEFAULT_JINJA_GLOBALS,
+        )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--template-size", type=int, default=2048)
+    parser.add_argument("--renders", type=int, default=10000)
+    args = parser.parse_args()
+
+    template = build_template(args.template_size)
+    print(f"Template size: {len(template)} bytes, renders: {args.renders}")
+    print(f"{'cache':<10} {'total (s)':>10} {'per render (us)':>16} {'hits':>8} {'misses':>8}")
+    for label, clear_cache in (("cached", False), ("uncached", True)):
+        clear_template_cache()
+        elapsed = render_all(template, args.renders, clear_cache)
+        cache_info = get_template_cache_info()
+        per_render = elapsed / args.renders * 1_000_000
+        print(f"{label:<10} {elapsed:>10.3f} {per_render:>16.1f} {cache_info.hits:>8} {cache_info.misses:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how long the WorkflowRunner spends deciding whether the node behind a wide merge is ready.
+
+`--width` upstream nodes fan into a single node, which is checked for readiness each time one of them is
+fulfilled. With AWAIT_ATTRIBUTES the merge node references every upstream output, plus a few constant
+attributes; with AWAIT_ALL it waits on every upstream node to invoke it.
+
+    python -m scripts.benchmarks.trigger_readiness --width 200 --runs 5
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any, Dict, Set, Type
+
+from vellum.workflows import BaseWorkflow
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.types.core import MergeBehavior
+
+
+def build_workflow(width: int, merge_behavior: MergeBehavior) -> Type[BaseWorkflow]:
+    class StartNode(BaseNode):
+        pass
+
+    upstream_nodes: Set[Type[BaseNode]] = set()
+    for index in range(width):
+        name = f"UpstreamNode{index}"
+        outputs_class = type(
+            "Outputs",
+            (BaseNode.Outputs,),
+            {"__module__": __name__, "__qualname__": f"{name}.Outputs", "__annotations__": {"value": int}},
+        )
+
+        def run(self: BaseNode, index: int = index) -> BaseNode.Outputs:
+            return self.Outputs(value=index)  # type: ignore[call-arg]
+
+        upstream_nodes.add(type(name, (BaseNode,), {"__module__": __name__, "Outputs": outputs_class, "run": run}))
+
+    merge_attributes: Dict[str, Any] = {
+        "__module__": __name__,
+        "Trigger": type(
+            "Trigger",
+            (BaseNode.Trigger,),
+            {"__module__": __name__, "__qualname__": "MergeNode.Trigger", "merge_behavior": merge_behavior},
+        ),
+        "model": "gpt-4o",
+        "parameters": {"temperature": 0.0, "max_tokens": 1000},
+    }
+    if merge_behavior == MergeBehavior.AWAIT_ATTRIBUTES:
+        for upstream_node in upstream_nodes:
+            upstream_value = getattr(upstream_node.Outputs, "value")
+            merge_attributes[f"{upstream_node.__name__}_value"] = upstream_value
+
+    merge_node = type("MergeNode", (BaseNode,), merge_attributes)
+
+    class WideMergeWorkflow(BaseWorkflow):
+        graph = StartNode >> upstream_nodes >> merge_node
+
+    return WideMergeWorkflow
+
+
+def measure_once(workflow_class: Type[BaseWorkflow]) -> float:
+    workflow = workflow_class()
+
+    start = time.perf_counter()
+    terminal_event = workflow.run()
+    elapsed = time.perf_counter() - start
+
+    if terminal_event.name != "workflow.execution.fulfilled":
+        raise RuntimeError(f"Workflow did not fulfill: {terminal_event}")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Width: {args.width}, runs: {args.runs}")
+    print(f"{'merge behavior':<18} {'median (ms)':>12}")
+    for merge_behavior in (MergeBehavior.AWAIT_ATTRIBUTES, MergeBehavior.AWAIT_ALL):
+        workflow_class = build_workflow(args.width, merge_behavior)
+        elapsed = statistics.median(measure_once(workflow_class) for _ in range(args.runs))
+        print(f"{merge_behavior.value:<18} {elapsed * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmarks prompt executions per second against a local stub of the Vellum API.
+
+`--requests` prompt executions are sent from `--concurrency` threads, each with a new client the way every
+WorkflowContext creates its own, first with clients from `create_vellum_client`, which share a connection pool, and
+then with default `Vellum` clients, which each open their own, for comparison. The stub waits `--latency` seconds
+before responding.
+
+    python -m scripts.benchmarks.vellum_client_pool --requests 2000 --concurrency 200
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from vellum import Vellum
+from vellum.utils.vellum_client import create_vellum_client, create_vellum_environment, get_connection_pool_stats
+
+RESPONSE_BODY = json.dumps(
+    {
+        "state": "FULFILLED",
+        "execution_id": "00000000-0000-0000-0000-000000000000",
+        "outputs": [{"type": "STRING", "value": "Hello, world!"}],
+    }
+).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which would otherwise stall kept-alive connections on delayed ACKs
+    disable_nagle_algorithm = True
+    latency = 0.0
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.latency:
+            time.sleep(self.latency)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    # Every benchmark thread may connect at once
+    request_queue_size = 1024
+
+
+def executions_per_second(create_client: Callable[[], Vellum], requests: int, concurrency: int) -> float:
+    def execute(_: int) -> None:
+        response = create_client().execute_prompt(prompt_deployment_name="benchmark", inputs=[])
+        if response.state != "FULFILLED":
+            raise RuntimeError(f"Unexpected response: {response}")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(execute, range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--max-connections", type=int, default=None)
+    args = parser.parse_args()
+
+    Handler.latency = args.latency
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # Clients are configured the way workers configure them, from the environment
+    os.environ["VELLUM_API_URL"] = f"http://127.0.0.1:{server.server_address[1]}"
+    max_connections: Optional[int] = args.max_connections or args.concurrency
+
+    def create_pooled_client() -> Vellum:
+        return create_vellum_client(api_key="benchmark", max_connections=max_connections)
+
+    def create_default_client() -> Vellum:
+        return Vellum(api_key="benchmark", environment=create_vellum_environment())
+
+    try:
+        # Warm up both paths, so that neither pays for imports
+        executions_per_second(create_pooled_client, requests=10, concurrency=1)
+        executions_per_second(create_default_client, requests=10, concurrency=1)
+
+        pooled = executions_per_second(create_pooled_client, args.requests, args.concurrency)
+        stats = get_connection_pool_stats(create_pooled_client())
+        default = executions_per_second(create_default_client, args.requests, args.concurrency)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"Requests: {args.requests}, concurrency: {args.concurrency}, latency: {args.latency * 1000:.0f} ms")
+    print(f"shared pool:        {pooled:.0f} executions/s")
+    print(f"client per context: {default:.0f} executions/s")
+    if stats is not None:
+        print(
+            f"pool: {stats.connections} connections ({stats.idle_connections} idle), "
+            f"{stats.total_requests} requests, max {stats.max_connections} connections"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmarks how quickly a VellumEmitter delivers events to a local stand-in for Vellum's events endpoint.
+
+`--events` events are emitted back to back and the emitter is then joined, once for each batch size and with and
+without gzipped request bodies. The number of requests shows how the events were batched.
+
+    python -m scripts.benchmarks.vellum_emitter --events 1000
+"""
+
+import argparse
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+from uuid import uuid4
+from typing import Any, List
+
+from vellum import Vellum, VellumEnvironment
+from vellum.workflows.emitters.vellum_emitter import VellumEmitter
+from vellum.workflows.events.workflow import WorkflowExecutionInitiatedBody, WorkflowExecutionInitiatedEvent
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+class Inputs(BaseInputs):
+    text: str
+
+
+class Workflow(BaseWorkflow[Inputs, BaseState]):
+    pass
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    requests = 0
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        Handler.requests += 1
+        body = b'{"success": true, "count": 0}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def build_events(count: int) -> List[WorkflowExecutionInitiatedEvent]:
+    return [
+        WorkflowExecutionInitiatedEvent(
+            id=uuid4(),
+            timestamp=datetime.now(timezone.utc),
+            trace_id=uuid4(),
+            span_id=uuid4(),
+            body=WorkflowExecutionInitiatedBody(workflow_definition=Workflow, inputs=Inputs(text="hello " * 50)),
+        )
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=1000)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    context = WorkflowContext(
+        vellum_client=Vellum(
+            api_key="benchmark", environment=VellumEnvironment(default=url, documents=url, predict=url)
+        )
+    )
+    events = build_events(args.events)
+
+    print(f"Events: {args.events}")
+    print(f"{'batch size':>10} {'gzip':>5} {'emit (ms)':>10} {'join (ms)':>10} {'requests':>9}")
+    try:
+        for max_batch_size in (10, 100, 500):
+            for compress in (False, True):
+                emitter = VellumEmitter(max_batch_size=max_batch_size, compress=compress)
+                emitter.register_context(context)
+                Handler.requests = 0
+
+                start = time.perf_counter()
+                for event in events:
+                    emitter.emit_event(event)
+                emitted = time.perf_counter()
+                emitter.join()
+                joined = time.perf_counter()
+
+                print(
+                    f"{max_batch_size:>10} {str(compress):>5} {(emitted - start) * 1000:>10.1f} "
+                    f"{(joined - emitted) * 1000:>10.1f} {Handler.requests:>9}"
+                )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
-import uuid
+import pytest
+import json
 from unittest.mock import Mock
-from vellum.client.utils import convert_input_variable_to_uuid
+import uuid
+
+import httpx
+
+from vellum import AsyncVellum, ExecutePromptEvent, VellumEnvironment, WorkflowStreamEvent
+from vellum.client.core.pydantic_utilities import parse_obj_as
+from vellum.client.utils import convert_input_variable_to_uuid, iter_ndjson_events, iter_ndjson_lines
 
 
 def test_convert_input_variable_to_uuid_with_valid_uuid():
@@ -32,3 +39,93 @@ def test_convert_input_variable_to_uuid_with_invalid_uuid_converts():
 
     # AND it's a valid UUID
     uuid.UUID(result)  # This will raise ValueError if not a valid UUID
+
+
+def test_iter_ndjson_lines__splits_lines_across_chunks():
+    """Test iter_ndjson_lines yields every non-empty line, wherever the chunks are split."""
+
+    # GIVEN chunks that split lines in the middle, with blank lines, CRLF endings and no trailing newline
+    chunks = [b'{"a":', b" 1}\r\n\n", b'{"b"', b": 2}\n  \n", b'{"c":', b" 3}"]
+
+    # WHEN the chunks are split into lines
+    lines = list(iter_ndjson_lines(chunks))
+
+    # THEN every non-empty line is yielded whole
+    assert lines == [b'{"a": 1}\r', b'{"b": 2}', b'{"c": 3}']
+
+
+@pytest.mark.parametrize("backend", ["pydantic", "orjson", "json"])
+def test_iter_ndjson_events__matches_generated_decoding(backend):
+    """Test iter_ndjson_events decodes the same events as the generated clients, for every backend."""
+
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+
+    # GIVEN a workflow stream with a workflow event, a node event, an event without its discriminator and a bad line
+    execution_id = str(uuid.uuid4())
+    events = [
+        {
+            "execution_id": execution_id,
+            "type": "WORKFLOW",
+            "data": {"id": str(uuid.uuid4()), "state": "INITIATED", "ts": "2025-01-01T00:00:00Z"},
+        },
+        {
+            "execution_id": execution_id,
+            "type": "NODE",
+            "data": {
+                "id": str(uuid.uuid4()),
+                "node_id": str(uuid.uuid4()),
+                "node_result_id": str(uuid.uuid4()),
+                "state": "STREAMING",
+                "ts": "2025-01-01T00:00:00Z",
+            },
+        },
+        {
+            "execution_id": execution_id,
+            "data": {"id": str(uuid.uuid4()), "state": "FULFILLED", "ts": "2025-01-01T00:00:00Z", "outputs": []},
+        },
+    ]
+    content = "\n".join([json.dumps(event) for event in events] + ["not json"]).encode()
+    response = httpx.Response(200, content=content)
+
+    # WHEN the stream is decoded
+    decoded = list(iter_ndjson_events(response, type_=WorkflowStreamEvent, backend=backend))
+
+    # THEN the events match those decoded with json.loads and parse_obj_as, and the bad line is skipped
+    assert decoded == [parse_obj_as(type_=WorkflowStreamEvent, object_=event) for event in events]  # type: ignore
+
+
+async def test_async_execute_prompt_stream__decodes_events():
+    """Test the async client decodes every event of a prompt stream."""
+
+    # GIVEN a prompt stream split into small chunks
+    execution_id = str(uuid.uuid4())
+    lines = [
+        {"state": "INITIATED", "execution_id": execution_id, "meta": {}},
+        {
+            "state": "STREAMING",
+            "execution_id": execution_id,
+            "output": {"type": "STRING", "value": "Hello"},
+            "output_index": 0,
+        },
+        {"state": "FULFILLED", "execution_id": execution_id, "outputs": [{"type": "STRING", "value": "Hello"}]},
+    ]
+    content = "\n".join(json.dumps(line) for line in lines).encode()
+
+    async def stream():
+        for start in range(0, len(content), 16):
+            yield content[start : start + 16]
+
+    client = AsyncVellum(
+        api_key="test-api-key",
+        environment=VellumEnvironment(default="http://test", documents="http://test", predict="http://test"),
+        httpx_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=stream()))
+        ),
+    )
+
+    # WHEN we stream the prompt's events
+    events = [event async for event in client.execute_prompt_stream(inputs=[], prompt_deployment_name="test")]
+
+    # THEN every event is decoded
+    assert events == [parse_obj_as(type_=ExecutePromptEvent, object_=line) for line in lines]  # type: ignore
@@ -1,10 +1,18 @@
 # Custom client utilities
 # This file is not generated by Fern and can be freely edited
 
+import json
+import os
 from uuid import UUID
-from typing import Optional
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from typing_extensions import Annotated, Literal, get_args, get_origin
+
+import httpx
+import pydantic
 from pydantic import SerializationInfo
 
+from .core.pydantic_utilities import IS_PYDANTIC_V2, annotated_types, parse_obj_as, type_adapter_cache
+
 
 def convert_input_variable_to_uuid(value: str, info: Optional[SerializationInfo] = None) -> str:
     """Convert input_variable to UUID using executable_id from context."""
@@ -22,3 +30,171 @@ def convert_input_variable_to_uuid(value: str, info: Optional[SerializationInfo]
 
             return str(uuid4_from_hash(f"{executable_id}|{value}"))
     return value
+
+
+# Streaming endpoints respond with one JSON encoded event per line. Token streams produce thousands of small events,
+# so lines are split as bytes and validated straight from JSON, without decoding them to `str` and `dict` first.
+NDJSON_BACKENDS = ("pydantic", "orjson", "json")
+
+
+def iter_ndjson_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Splits a stream of bytes into its non-empty lines, with any trailing carriage return left in place."""
+    pending: List[bytes] = []
+    for chunk in chunks:
+        if b"\n" not in chunk:
+            pending.append(chunk)
+            continue
+
+        if pending:
+            pending.append(chunk)
+            chunk = b"".join(pending)
+            pending = []
+
+        lines = chunk.split(b"\n")
+        tail = lines.pop()
+        if tail:
+            pending.append(tail)
+        for line in lines:
+            if line and not line.isspace():
+                yield line
+
+    line = b"".join(pending)
+    if line and not line.isspace():
+        yield line
+
+
+async def aiter_ndjson_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """The async counterpart of `iter_ndjson_lines`."""
+    pending: List[bytes] = []
+    async for chunk in chunks:
+        if b"\n" not in chunk:
+            pending.append(chunk)
+            continue
+
+        if pending:
+            pending.append(chunk)
+            chunk = b"".join(pending)
+            pending = []
+
+        lines = chunk.split(b"\n")
+        tail = lines.pop()
+        if tail:
+            pending.append(tail)
+        for line in lines:
+            if line and not line.isspace():
+                yield line
+
+    line = b"".join(pending)
+    if line and not line.isspace():
+        yield line
+
+
+_ndjson_decoders: Dict[Tuple[Any, str], Callable[[bytes], Any]] = {}
+
+
+def _get_discriminated_union_adapter(type_: Any) -> Optional[pydantic.TypeAdapter]:
+    """
+    Returns an adapter for `type_` discriminated by a literal field that tells its members apart, if it is a union of
+    models with one. Smart unions validate a value against every member, which dominates the cost of decoding events.
+    """
+    if get_origin(type_) is not Union:
+        return None
+
+    members = get_args(type_)
+    if not all(isinstance(member, type) and issubclass(member, pydantic.BaseModel) for member in members):
+        return None
+
+    for name in members[0].model_fields:
+        values = []
+        for member in members:
+            field = member.model_fields.get(name)
+            if field is None or get_origin(field.annotation) is not Literal or len(get_args(field.annotation)) != 1:
+                break
+            values.append(get_args(field.annotation)[0])
+        else:
+            if len(set(values)) == len(values):
+                try:
+                    return pydantic.TypeAdapter(Annotated[type_, pydantic.Field(discriminator=name)])
+                except pydantic.PydanticUserError:
+                    return None
+
+    return None
+
+
+def get_ndjson_decoder(type_: Any, backend: Optional[str] = None) -> Callable[[bytes], Any]:
+    """
+    Returns a function that decodes one line of a stream into `type_`.
+
+    backend: Optional[str] - "pydantic" validates each line with `TypeAdapter.validate_json`, "orjson" parses it with
+        orjson first, which must be installed, and "json" with the standard library, the way the generated clients
+        used to. Defaults to the `VELLUM_NDJSON_BACKEND` environment variable, or "pydantic".
+    """
+    backend = backend or os.getenv("VELLUM_NDJSON_BACKEND") or "pydantic"
+    if backend not in NDJSON_BACKENDS:
+        raise ValueError(f"Unknown NDJSON backend {backend!r}, expected one of {', '.join(NDJSON_BACKENDS)}")
+
+    decoder = _ndjson_decoders.get((type_, backend))
+    if decoder is not None:
+        return decoder
+
+    loads: Callable[[bytes], Any] = _import_orjson().loads if backend == "orjson" else json.loads
+
+    # Types with annotation metadata are dealiased as dicts by `parse_obj_as`, so they are left to it
+    if backend == "json" or not IS_PYDANTIC_V2 or getattr(type_, "__name__", None) in annotated_types:
+
+        def decoder(line: bytes) -> Any:
+            return parse_obj_as(type_=type_, object_=loads(line))
+
+    else:
+        discriminated_adapter = _get_discriminated_union_adapter(type_)
+        adapter = discriminated_adapter or type_adapter_cache.get(type_) or pydantic.TypeAdapter(type_)
+
+        def decoder(line: bytes) -> Any:
+            try:
+                if backend == "pydantic":
+                    return adapter.validate_json(line)
+                return adapter.validate_python(loads(line))
+            except pydantic.ValidationError:
+                if discriminated_adapter is None:
+                    raise
+                # Events that leave out their discriminator are still matched against every member of the union
+                return parse_obj_as(type_=type_, object_=loads(line))
+
+    _ndjson_decoders[(type_, backend)] = decoder
+    return decoder
+
+
+def _import_orjson() -> Any:
+    try:
+        import orjson
+    except ImportError as e:
+        raise ImportError("The orjson NDJSON backend requires orjson, installed with `pip install orjson`") from e
+
+    return orjson
+
+
+def iter_ndjson_events(response: httpx.Response, type_: Any, backend: Optional[str] = None) -> Iterator[Any]:
+    """
+    Decodes each line of a streaming response into `type_`, skipping lines that fail to decode like the generated
+    clients do.
+    """
+    decode = get_ndjson_decoder(type_, backend)
+    for line in iter_ndjson_lines(response.iter_bytes()):
+        try:
+            event = decode(line)
+        except Exception:
+            continue
+        yield event
+
+
+async def aiter_ndjson_events(
+    response: httpx.Response, type_: Any, backend: Optional[str] = None
+) -> AsyncIterator[Any]:
+    """The async counterpart of `iter_ndjson_events`."""
+    decode = get_ndjson_decoder(type_, backend)
+    async for line in aiter_ndjson_lines(response.aiter_bytes()):
+        try:
+            event = decode(line)
+        except Exception:
+            continue
+        yield event
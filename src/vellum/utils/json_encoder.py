@@ -1,11 +1,12 @@
 from dataclasses import asdict, is_dataclass
 from datetime import datetime
 import enum
+import json
 from json import JSONEncoder
 from queue import Queue
 import types
 from uuid import UUID
-from typing import Any, Callable, Dict, Protocol, Type
+from typing import Any, Callable, Dict, Optional, Protocol, Type
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
@@ -98,3 +99,134 @@ class VellumJsonEncoder(JSONEncoder):
             return self.encoders[obj.__class__](obj)
 
         return super().default(obj)
+
+
+def _float_to_json(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _key_to_json(key: Any) -> str:
+    if isinstance(key, str):
+        return str.__str__(key)
+    if isinstance(key, float):
+        return _float_to_json(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def to_json_compatible(obj: Any, encoder: Optional[JSONEncoder] = None) -> Any:
+    """Convert `obj` to the value that `json.loads(json.dumps(obj, cls=VellumJsonEncoder))` would return.
+
+    The conversion happens in a single pass over `obj`, without encoding it to a string and parsing it back.
+    Values of the builtin JSON types are copied inline, so that only containers and values the encoder needs
+    to handle cost a function call.
+    """
+    encoder = encoder or VellumJsonEncoder()
+    scalar_types = _JSON_SCALAR_TYPES
+    is_default_encoder = type(encoder) is VellumJsonEncoder
+
+    def convert(value: Any) -> Any:
+        value_type = type(value)
+        if value_type is dict:
+            return {
+                (key if type(key) is str else _key_to_json(key)): (
+                    item if type(item) in scalar_types else convert(item)
+                )
+                for key, item in value.items()
+            }
+        if value_type is list or value_type is tuple:
+            return [item if type(item) in scalar_types else convert(item) for item in value]
+        if value_type in scalar_types:
+            return value
+        if isinstance(value, str):
+            return str.__str__(value)
+        if isinstance(value, int):
+            return int(value)
+        if isinstance(value, float):
+            return float(value)
+        if isinstance(value, (list, tuple)):
+            return [convert(item) for item in value]
+        if isinstance(value, dict):
+            return {_key_to_json(key): convert(item) for key, item in value.items()}
+        if is_default_encoder and isinstance(value, BaseModel) and not hasattr(value_type, "__vellum_encode__"):
+            # Same as `VellumJsonEncoder.default`, without a missed attribute lookup on the instance
+            return convert(value.model_dump())
+        return convert(encoder.default(value))
+
+    try:
+        return convert(obj)
+    except RecursionError:
+        # Circular references are only detected by the json module, which raises the same error as before
+        return json.loads(json.dumps(obj, cls=type(encoder)))
+
+
+def exceeds_json_length(obj: Any, max_length: int) -> bool:
+    """Whether `json.dumps(obj, cls=VellumJsonEncoder)` would be longer than `max_length`.
+
+    For JSON compatible values, lower and upper bounds on the encoded length are accumulated in a single pass that
+    stops as soon as the lower bound exceeds `max_length`. The value is only encoded when the bounds straddle
+    `max_length`, or when it contains values that are not JSON compatible.
+    """
+    lower_bound = 0
+    upper_bound = 0
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            # Escaping can only lengthen a string, by at most 12 characters per code point (a surrogate pair)
+            lower_bound += len(value) + 2
+            upper_bound += 12 * len(value) + 2
+        elif value is None or value is True:
+            lower_bound += 4
+            upper_bound += 4
+        elif value is False:
+            lower_bound += 5
+            upper_bound += 5
+        elif isinstance(value, int):
+            length = len(int.__repr__(value))
+            lower_bound += length
+            upper_bound += length
+        elif isinstance(value, float):
+            length = len(_float_to_json(value))
+            lower_bound += length
+            upper_bound += length
+        elif isinstance(value, (list, tuple)):
+            # Brackets, plus a ", " separator between items
+            length = 2 + 2 * max(len(value) - 1, 0)
+            lower_bound += length
+            upper_bound += length
+            stack.extend(value)
+        elif isinstance(value, dict):
+            # Braces, a ": " after each key and a ", " separator between items
+            length = 2 + 2 * len(value) + 2 * max(len(value) - 1, 0)
+            lower_bound += length
+            upper_bound += length
+            for key, item in value.items():
+                stack.append(_key_to_json(key))
+                stack.append(item)
+        else:
+            return len(json.dumps(obj, cls=VellumJsonEncoder)) > max_length
+
+        if lower_bound > max_length:
+            return True
+
+    if upper_bound <= max_length:
+        return False
+
+    return len(json.dumps(obj, cls=VellumJsonEncoder)) > max_length
@@ -0,0 +1,28 @@
+from importlib import import_module
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_module_attributes(
+    module_name: str, dynamic_imports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Builds the module level `__getattr__` and `__dir__` (PEP 562) for a package whose public attributes should
+    only be imported on first access. `dynamic_imports` maps each attribute to the module, relative to
+    `module_name`, that defines it. Resolved attributes are stored on the package so later lookups are plain
+    attribute reads.
+    """
+
+    def __getattr__(attr_name: str) -> Any:
+        attr_module_name = dynamic_imports.get(attr_name)
+        if attr_module_name is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {attr_name!r}")
+
+        value = getattr(import_module(attr_module_name, module_name), attr_name)
+        setattr(sys.modules[module_name], attr_name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(dynamic_imports))
+
+    return __getattr__, __dir__
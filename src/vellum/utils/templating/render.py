@@ -1,6 +1,8 @@
+from functools import lru_cache
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+from jinja2 import Template
 from jinja2.sandbox import SandboxedEnvironment
 from pydantic import BaseModel
 
@@ -19,6 +21,84 @@ def finalize(obj: Any) -> str:
     return str(obj)
 
 
+class _IdentityKey:
+    """
+    Hashes and compares the wrapped object by identity, so that mutable objects like globals dicts can be part of
+    a cache key. Holding the reference keeps the object's id from being reused while the key is cached.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IdentityKey) and other.value is self.value
+
+
+FilterItems = Tuple[Tuple[str, FilterFunc], ...]
+
+_NO_JINJA_GLOBALS: Dict[str, Any] = {}
+
+
+def _create_environment(jinja_custom_filters: FilterItems) -> SandboxedEnvironment:
+    environment = SandboxedEnvironment(
+        keep_trailing_newline=True,
+        finalize=finalize,
+    )
+    environment.policies["json.dumps_kwargs"] = {
+        "cls": VellumJsonEncoder,
+    }
+    environment.filters.update(jinja_custom_filters)
+    return environment
+
+
+_get_environment = lru_cache(maxsize=64)(_create_environment)
+
+
+@lru_cache(maxsize=512)
+def _compile_template(template: str, jinja_custom_filters: FilterItems, jinja_globals: _IdentityKey) -> Template:
+    """
+    Compiled templates are reused across renders with the same template source, filters and globals. Filters are
+    compared by value, while globals are compared by identity and stay live, so that changes to a globals dict
+    are seen by later renders.
+    """
+
+    environment = _get_environment(jinja_custom_filters)
+    return environment.from_string(template, globals=jinja_globals.value)
+
+
+def get_template_cache_info() -> Any:
+    """Returns the hits, misses, maxsize and current size of the compiled template cache."""
+    return _compile_template.cache_info()
+
+
+def clear_template_cache() -> None:
+    _compile_template.cache_clear()
+    _get_environment.cache_clear()
+
+
+def _get_template(
+    template: str,
+    jinja_custom_filters: Optional[Dict[str, FilterFunc]],
+    jinja_globals: Optional[Dict[str, Any]],
+) -> Template:
+    filter_items: FilterItems = tuple(jinja_custom_filters.items()) if jinja_custom_filters else ()
+    globals_key = _IdentityKey(jinja_globals if jinja_globals else _NO_JINJA_GLOBALS)
+
+    try:
+        hash(filter_items)
+    except TypeError:
+        # Filters that can't be hashed can't be cached, so compile the template from scratch
+        environment = _create_environment(filter_items)
+        return environment.from_string(template, globals=globals_key.value)
+
+    return _compile_template(template, filter_items, globals_key)
+
+
 def render_sandboxed_jinja_template(
     *,
     template: str,
@@ -28,22 +108,7 @@ def render_sandboxed_jinja_template(
 ) -> str:
     """Render a Jinja template within a sandboxed environment."""
     try:
-        environment = SandboxedEnvironment(
-            keep_trailing_newline=True,
-            finalize=finalize,
-        )
-        environment.policies["json.dumps_kwargs"] = {
-            "cls": VellumJsonEncoder,
-        }
-
-        if jinja_custom_filters:
-            environment.filters.update(jinja_custom_filters)
-
-        jinja_template = environment.from_string(template)
-
-        if jinja_globals:
-            jinja_template.globals.update(jinja_globals)
-
+        jinja_template = _get_template(template, jinja_custom_filters, jinja_globals)
         rendered_template = jinja_template.render(input_values)
     except json.JSONDecodeError as e:
         if not e.doc:
@@ -0,0 +1,56 @@
+from vellum.utils.templating.render import (
+    clear_template_cache,
+    get_template_cache_info,
+    render_sandboxed_jinja_template,
+)
+
+
+def test_render_sandboxed_jinja_template__reuses_compiled_template():
+    # GIVEN an empty template cache
+    clear_template_cache()
+
+    # WHEN we render the same template with the same filters and globals but different inputs
+    jinja_globals = {"greeting": "Hello"}
+    first = render_sandboxed_jinja_template(
+        template="{{ greeting }}, {{ name | shout }}",
+        input_values={"name": "Alice"},
+        jinja_custom_filters={"shout": lambda value: value.upper()},
+        jinja_globals=jinja_globals,
+    )
+    second = render_sandboxed_jinja_template(
+        template="{{ greeting }}, {{ name | shout }}",
+        input_values={"name": "Bob"},
+        jinja_custom_filters={"shout": str.upper},
+        jinja_globals=jinja_globals,
+    )
+    third = render_sandboxed_jinja_template(
+        template="{{ greeting }}, {{ name | shout }}",
+        input_values={"name": "Carol"},
+        jinja_custom_filters={"shout": str.upper},
+        jinja_globals=jinja_globals,
+    )
+
+    # THEN each render uses its own inputs and filters
+    assert first == "Hello, ALICE"
+    assert second == "Hello, BOB"
+    assert third == "Hello, CAROL"
+
+    # AND the template is only compiled again when the filters change
+    cache_info = get_template_cache_info()
+    assert cache_info.misses == 2
+    assert cache_info.hits == 1
+
+
+def test_render_sandboxed_jinja_template__sees_updated_globals():
+    # GIVEN a globals dict that a template has already been rendered with
+    jinja_globals = {"greeting": "Hello"}
+    render_sandboxed_jinja_template(template="{{ greeting }}, world", input_values={}, jinja_globals=jinja_globals)
+
+    # WHEN the globals dict is updated and the template is rendered again
+    jinja_globals["greeting"] = "Goodbye"
+    rendered = render_sandboxed_jinja_template(
+        template="{{ greeting }}, world", input_values={}, jinja_globals=jinja_globals
+    )
+
+    # THEN the cached template renders with the updated globals
+    assert rendered == "Goodbye, world"
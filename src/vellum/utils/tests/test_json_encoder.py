@@ -1,9 +1,13 @@
+from datetime import datetime
+import enum
 import json
+from uuid import UUID, uuid4
+from typing import List
 
 from pydantic import BaseModel, Field
 from pydantic.fields import FieldInfo
 
-from vellum.utils.json_encoder import VellumJsonEncoder
+from vellum.utils.json_encoder import VellumJsonEncoder, exceeds_json_length, to_json_compatible
 
 
 class TestVellumJsonEncoder:
@@ -137,3 +141,53 @@ class TestVellumJsonEncoder:
         deserialized = json.loads(result)
         assert deserialized["outer"]["inner"] == "<generator object>"
         assert deserialized["outer"]["normal"] == "value"
+
+
+class TestToJsonCompatible:
+    """Tests for the single pass encoding helpers."""
+
+    def test_to_json_compatible__matches_round_trip(self):
+        """
+        Tests that to_json_compatible returns the same value as a dumps/loads round trip.
+        """
+
+        # GIVEN a payload mixing JSON native values with types the encoder has to convert
+        class Color(str, enum.Enum):
+            RED = "red"
+
+        class Message(BaseModel):
+            id: UUID
+            sent_at: datetime
+            tags: List[str]
+
+        data = {
+            "message": Message(id=uuid4(), sent_at=datetime(2024, 1, 1), tags=["a", "b"]),
+            "color": Color.RED,
+            "ids": {1, 2},
+            "pair": (1.5, None),
+            1: True,
+            "nested": [{"field": Field(default="default_value")}],
+        }
+
+        # WHEN we convert it to a JSON compatible value
+        result = to_json_compatible(data)
+
+        # THEN it should match the round trip through a JSON string
+        assert result == json.loads(json.dumps(data, cls=VellumJsonEncoder))
+
+    def test_exceeds_json_length__matches_encoded_length(self):
+        """
+        Tests that exceeds_json_length agrees with the length of the encoded value around the limit.
+        """
+
+        # GIVEN a JSON compatible payload with escaped and non-ASCII strings
+        data = {"text": 'Hello "world" é\U0001f600', "values": [1, 2.5, None, False], "nested": {"1": "a"}}
+        encoded_length = len(json.dumps(data, cls=VellumJsonEncoder))
+
+        # WHEN we check it against limits just below, at, and above its encoded length
+        results = [
+            exceeds_json_length(data, max_length) for max_length in range(encoded_length - 2, encoded_length + 2)
+        ]
+
+        # THEN only the limits below the encoded length should be exceeded
+        assert results == [True, True, False, False]
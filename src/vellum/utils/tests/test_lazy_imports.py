@@ -0,0 +1,32 @@
+import json
+import subprocess
+import sys
+
+
+def test_import_vellum_workflows__defers_node_classes():
+    # GIVEN a fresh interpreter that imports the workflows package and then resolves one of its node classes
+    script = """
+import json
+import sys
+
+import vellum.workflows
+
+loaded_before = set(sys.modules)
+
+from vellum.workflows import APINode
+
+print(json.dumps({
+    "displayable_before": any(m.startswith("vellum.workflows.nodes.displayable") for m in loaded_before),
+    "api_node": APINode.__module__,
+}))
+"""
+
+    # WHEN we run it
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    # THEN the node classes were not imported up front
+    output = json.loads(result.stdout)
+    assert output["displayable_before"] is False
+
+    # AND they still resolve on first access
+    assert output["api_node"] == "vellum.workflows.nodes.displayable.api_node.node"
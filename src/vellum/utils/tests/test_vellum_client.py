@@ -1,7 +1,9 @@
 import pytest
+import gc
 from unittest.mock import patch
 
-from vellum.utils.vellum_client import create_vellum_client, create_vellum_environment
+from vellum.utils import vellum_client
+from vellum.utils.vellum_client import create_vellum_client, create_vellum_environment, get_connection_pool_stats
 
 
 class TestCreateVellumClient:
@@ -93,3 +95,65 @@ class TestCreateVellumClient:
             # AND the default and documents URLs should remain unchanged
             assert environment.default == "https://api.vellum.ai"
             assert environment.documents == "https://documents.vellum.ai"
+
+    def test_create_vellum_client__shares_transport_by_api_url_and_key(self):
+        """Tests that clients for the same API URLs and API key share a connection pool, and others don't."""
+
+        # GIVEN no environment variables are set
+        with patch.dict("os.environ", {}, clear=True):
+            # WHEN creating clients with the same and different API keys
+            client = create_vellum_client(api_key="shared-api-key")
+            same_client = create_vellum_client(api_key="shared-api-key")
+            other_key_client = create_vellum_client(api_key="other-api-key")
+            unshared_client = create_vellum_client(api_key="shared-api-key", share_transport=False)
+
+        # THEN only the clients with the same API key and shared transports use the same connection pool
+        def get_httpx_client(vellum_client):
+            return vellum_client._client_wrapper.httpx_client.httpx_client
+
+        assert get_httpx_client(client) is get_httpx_client(same_client)
+        assert get_httpx_client(client) is not get_httpx_client(other_key_client)
+        assert get_httpx_client(client) is not get_httpx_client(unshared_client)
+
+    def test_create_vellum_client__drops_unused_shared_transports(self):
+        """Tests that only the most recently used shared connection pools outlive the clients that use them."""
+
+        # GIVEN only one unused connection pool is kept open
+        with patch.object(vellum_client, "MAX_IDLE_SHARED_CLIENTS", 1), patch.dict("os.environ", {}, clear=True):
+            # AND clients for a few API keys
+            pools = [
+                create_vellum_client(api_key=f"api-key-{index}")._client_wrapper.httpx_client.httpx_client._transport
+                for index in range(3)
+            ]
+
+            # WHEN every client is garbage collected and clients are created for the last and first API keys again
+            gc.collect()
+            last_client = create_vellum_client(api_key="api-key-2")
+            first_client = create_vellum_client(api_key="api-key-0")
+
+        # THEN only the most recently used connection pool is reused
+        assert last_client._client_wrapper.httpx_client.httpx_client._transport is pools[2]
+        assert first_client._client_wrapper.httpx_client.httpx_client._transport is not pools[0]
+
+    def test_get_connection_pool_stats__counts_requests_and_connections(self, local_http_server):
+        """Tests that pool stats reflect the requests sent through a client and the connections kept alive."""
+
+        # GIVEN a local server that keeps connections alive
+        server_url = local_http_server(lambda request, body: (200, {}, b"{}"))
+
+        # AND a client with its own connection pool
+        client = create_vellum_client(api_key="test-api-key", share_transport=False, max_connections=4)
+        httpx_client = client._client_wrapper.httpx_client.httpx_client
+
+        # WHEN we send a few requests through it one after another
+        for _ in range(3):
+            httpx_client.get(f"{server_url}/")
+
+        # THEN the stats count every request, sent over a single connection that is now idle
+        stats = get_connection_pool_stats(client)
+        assert stats is not None
+        assert stats.total_requests == 3
+        assert stats.in_flight_requests == 0
+        assert stats.connections == 1
+        assert stats.idle_connections == 1
+        assert stats.max_connections == 4
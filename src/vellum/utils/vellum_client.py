@@ -1,8 +1,381 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
 import os
-from typing import List, Optional
+import threading
+import weakref
+from typing import Any, AsyncIterator, Callable, Generic, Iterator, List, Optional, Tuple, TypeVar, Union, cast
 
-from vellum import Vellum, VellumEnvironment
+import httpx
+
+from vellum import AsyncVellum, Vellum, VellumEnvironment
 from vellum.client.types.api_version_enum import ApiVersionEnum
+from vellum.client.types.execute_prompt_event import ExecutePromptEvent
+from vellum.client.types.workflow_stream_event import WorkflowStreamEvent
+from vellum.client.utils import aiter_ndjson_events, iter_ndjson_events
+
+DEFAULT_MAX_CONNECTIONS = 100
+# Every connection is kept alive between requests, so that bursts of concurrent requests don't reconnect
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = DEFAULT_MAX_CONNECTIONS
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    """
+    A snapshot of the connection pool behind a Vellum client.
+
+    connections: int - The number of open connections.
+    idle_connections: int - The number of open connections that aren't serving a request.
+    in_flight_requests: int - The number of requests whose responses haven't been closed yet.
+    total_requests: int - The number of requests sent through the pool since it was created.
+    max_connections: Optional[int] - The maximum number of connections the pool opens at once.
+    """
+
+    connections: int
+    idle_connections: int
+    in_flight_requests: int
+    total_requests: int
+    max_connections: Optional[int]
+
+
+class _RequestCounter:
+    def __init__(self, limits: httpx.Limits) -> None:
+        self._limits = limits
+        self._lock = threading.Lock()
+        self._in_flight_requests = 0
+        self._total_requests = 0
+
+    def start(self) -> Callable[[], None]:
+        with self._lock:
+            self._in_flight_requests += 1
+            self._total_requests += 1
+
+        is_finished = False
+
+        def finish() -> None:
+            nonlocal is_finished
+            with self._lock:
+                if not is_finished:
+                    is_finished = True
+                    self._in_flight_requests -= 1
+
+        return finish
+
+    def get_stats(self, pool: object) -> ConnectionPoolStats:
+        connections = list(getattr(pool, "connections", []))
+        with self._lock:
+            return ConnectionPoolStats(
+                connections=len(connections),
+                idle_connections=sum(1 for connection in connections if connection.is_idle()),
+                in_flight_requests=self._in_flight_requests,
+                total_requests=self._total_requests,
+                max_connections=self._limits.max_connections,
+            )
+
+
+class _FinishingByteStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, finish: Callable[[], None]) -> None:
+        self._stream = stream
+        self._finish = finish
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._finish()
+
+
+class _AsyncFinishingByteStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, finish: Callable[[], None]) -> None:
+        self._stream = stream
+        self._finish = finish
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._finish()
+
+
+def _close_transports(transports: List[httpx.BaseTransport]) -> None:
+    for transport in transports:
+        transport.close()
+
+
+class _PooledClient(httpx.Client):
+    """
+    Counts the requests sent through the client's connection pool. Shared clients belong to the registry, so closing
+    one of the Vellum clients that use them leaves them open for the others.
+    """
+
+    def __init__(self, limits: httpx.Limits, http2: bool, is_shared: bool) -> None:
+        super().__init__(timeout=None, follow_redirects=True, limits=limits, http2=http2)
+        self._counter = _RequestCounter(limits)
+        self._is_shared = is_shared
+        # Shared clients are dropped by the registry once no Vellum client uses them, taking their connections along
+        transports = [self._transport, *(transport for transport in self._mounts.values() if transport is not None)]
+        self._close_pool = weakref.finalize(self, _close_transports, transports)
+
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        finish = self._counter.start()
+        try:
+            response = super().send(request, **kwargs)
+        except BaseException:
+            finish()
+            raise
+
+        if response.is_closed:
+            finish()
+        else:
+            response.stream = _FinishingByteStream(cast(httpx.SyncByteStream, response.stream), finish)
+        return response
+
+    def get_connection_pool_stats(self) -> ConnectionPoolStats:
+        return self._counter.get_stats(getattr(self._transport, "_pool", None))
+
+    def close(self) -> None:
+        if not self._is_shared:
+            super().close()
+
+
+class _AsyncPooledClient(httpx.AsyncClient):
+    """
+    The async counterpart of `_PooledClient`, whose connections belong to the event loop they were opened on.
+    """
+
+    def __init__(self, limits: httpx.Limits, http2: bool, is_shared: bool) -> None:
+        super().__init__(timeout=None, follow_redirects=True, limits=limits, http2=http2)
+        self._counter = _RequestCounter(limits)
+        self._is_shared = is_shared
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        finish = self._counter.start()
+        try:
+            response = await super().send(request, **kwargs)
+        except BaseException:
+            finish()
+            raise
+
+        if response.is_closed:
+            finish()
+        else:
+            response.stream = _AsyncFinishingByteStream(cast(httpx.AsyncByteStream, response.stream), finish)
+        return response
+
+    def get_connection_pool_stats(self) -> ConnectionPoolStats:
+        return self._counter.get_stats(getattr(self._transport, "_pool", None))
+
+    async def aclose(self) -> None:
+        if not self._is_shared:
+            await super().aclose()
+
+
+_ClientKey = Tuple[str, str, str, str, Optional[int], Optional[int], Optional[float], bool]
+_ClientType = TypeVar("_ClientType", _PooledClient, _AsyncPooledClient)
+
+# The number of shared clients kept open after the last Vellum client using them is gone, so that clients created one
+# after another, for example one per workflow run, reuse their connections
+MAX_IDLE_SHARED_CLIENTS = 16
+
+
+class _SharedClientRegistry(Generic[_ClientType]):
+    """
+    Holds shared clients for as long as a Vellum client uses them, and the most recently used ones beyond that. Every
+    other client is dropped once the last Vellum client using it is garbage collected.
+    """
+
+    def __init__(self) -> None:
+        self._clients: "weakref.WeakValueDictionary[_ClientKey, _ClientType]" = weakref.WeakValueDictionary()
+        self._recent_clients: "OrderedDict[_ClientKey, _ClientType]" = OrderedDict()
+
+    def get_or_create(self, key: _ClientKey, create: Callable[[], _ClientType]) -> _ClientType:
+        client = self._clients.get(key)
+        if client is None:
+            client = create()
+            self._clients[key] = client
+
+        self._recent_clients[key] = client
+        self._recent_clients.move_to_end(key)
+        while len(self._recent_clients) > MAX_IDLE_SHARED_CLIENTS:
+            self._recent_clients.popitem(last=False)
+
+        return client
+
+    def pop_all(self) -> List[_ClientType]:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._recent_clients.clear()
+        return clients
+
+
+_AsyncClientRegistry = _SharedClientRegistry[_AsyncPooledClient]
+
+_shared_clients: _SharedClientRegistry[_PooledClient] = _SharedClientRegistry()
+# Connections of async clients belong to the event loop they were opened on, so they are shared per loop
+_shared_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncClientRegistry]" = (
+    weakref.WeakKeyDictionary()
+)
+_shared_clients_lock = threading.Lock()
+
+
+def _forget_shared_clients() -> None:
+    # A forked child can't use the connections it inherited from its parent, so it opens its own
+    global _shared_clients_lock
+    _shared_clients_lock = threading.Lock()
+    for client in _shared_clients.pop_all():
+        client._close_pool.detach()
+    _shared_async_clients.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_shared_clients)
+
+
+def clear_shared_vellum_httpx_clients() -> None:
+    """
+    Closes the connection pools shared by Vellum clients, so that the next clients open new ones. Async clients are
+    closed on their event loop, right away if it isn't running, or as soon as it gets to it otherwise.
+    """
+
+    with _shared_clients_lock:
+        clients = _shared_clients.pop_all()
+        async_clients = [(loop, registry.pop_all()) for loop, registry in _shared_async_clients.items()]
+        _shared_async_clients.clear()
+
+    for client in clients:
+        httpx.Client.close(client)
+
+    for loop, loop_clients in async_clients:
+        _close_async_clients(loop, loop_clients)
+
+
+def _close_async_clients(loop: asyncio.AbstractEventLoop, clients: List[_AsyncPooledClient]) -> None:
+    # The connections of a closed loop were closed along with it
+    if not clients or loop.is_closed():
+        return
+
+    async def close_clients() -> None:
+        for client in clients:
+            await httpx.AsyncClient.aclose(client)
+
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(close_clients(), loop)
+    else:
+        loop.run_until_complete(close_clients())
+
+
+def _get_client_key(environment: VellumEnvironment, api_key: str, limits: httpx.Limits, http2: bool) -> _ClientKey:
+    # Only a digest of the API key is kept, so that the registry doesn't hold on to credentials
+    return (
+        environment.default,
+        environment.documents,
+        environment.predict,
+        hashlib.sha256(api_key.encode()).hexdigest(),
+        limits.max_connections,
+        limits.max_keepalive_connections,
+        limits.keepalive_expiry,
+        http2,
+    )
+
+
+def create_vellum_httpx_client(
+    environment: VellumEnvironment,
+    api_key: str,
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    share_transport: bool = True,
+) -> httpx.Client:
+    """
+    Creates the `httpx.Client` behind a Vellum client, or returns the one shared by clients with the same API URLs,
+    API key and pool options. See `create_vellum_client` for the pool options.
+    """
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    if not share_transport:
+        return _PooledClient(limits, http2=http2, is_shared=False)
+
+    key = _get_client_key(environment, api_key, limits, http2)
+    with _shared_clients_lock:
+        return _shared_clients.get_or_create(key, lambda: _PooledClient(limits, http2=http2, is_shared=True))
+
+
+def create_async_vellum_httpx_client(
+    environment: VellumEnvironment,
+    api_key: str,
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    share_transport: bool = True,
+) -> httpx.AsyncClient:
+    """
+    The async counterpart of `create_vellum_httpx_client`. Clients are only shared on the same running event loop.
+    """
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _AsyncPooledClient(limits, http2=http2, is_shared=False)
+
+    if not share_transport:
+        return _AsyncPooledClient(limits, http2=http2, is_shared=False)
+
+    key = _get_client_key(environment, api_key, limits, http2)
+    with _shared_clients_lock:
+        loop_clients = _shared_async_clients.get(loop)
+        if loop_clients is None:
+            loop_clients = _SharedClientRegistry()
+            _shared_async_clients[loop] = loop_clients
+        return loop_clients.get_or_create(key, lambda: _AsyncPooledClient(limits, http2=http2, is_shared=True))
+
+
+class _Vellum(Vellum):
+    """
+    A Vellum client whose streaming endpoints decode the raw bytes of the response with `iter_ndjson_events`, rather
+    than parsing each line to a dict first like the generated client.
+    """
+
+    def execute_prompt_stream(self, *args: Any, **kwargs: Any) -> Iterator[ExecutePromptEvent]:
+        with self.with_raw_response.execute_prompt_stream(*args, **kwargs) as response:
+            yield from iter_ndjson_events(response._response, type_=ExecutePromptEvent)
+
+    def execute_workflow_stream(self, *args: Any, **kwargs: Any) -> Iterator[WorkflowStreamEvent]:
+        with self.with_raw_response.execute_workflow_stream(*args, **kwargs) as response:
+            yield from iter_ndjson_events(response._response, type_=WorkflowStreamEvent)
+
+
+class _AsyncVellum(AsyncVellum):
+    """The async counterpart of `_Vellum`."""
+
+    async def execute_prompt_stream(self, *args: Any, **kwargs: Any) -> AsyncIterator[ExecutePromptEvent]:
+        async with self.with_raw_response.execute_prompt_stream(*args, **kwargs) as response:
+            async for event in aiter_ndjson_events(response._response, type_=ExecutePromptEvent):
+                yield event
+
+    async def execute_workflow_stream(self, *args: Any, **kwargs: Any) -> AsyncIterator[WorkflowStreamEvent]:
+        async with self.with_raw_response.execute_workflow_stream(*args, **kwargs) as response:
+            async for event in aiter_ndjson_events(response._response, type_=WorkflowStreamEvent):
+                yield event
 
 
 def create_vellum_client(
@@ -10,17 +383,112 @@ def create_vellum_client(
     api_url: Optional[str] = None,
     api_version: Optional[ApiVersionEnum] = None,
     predict_api_url: Optional[str] = None,
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    share_transport: bool = True,
 ) -> Vellum:
+    """
+    Creates a Vellum client whose connections are pooled with those of every other client created for the same
+    API URLs and API key in this process, unless `share_transport` is False.
+
+    max_connections: Optional[int] - The maximum number of connections open at once, across every host. Requests
+        wait for a free connection beyond that.
+    max_keepalive_connections: Optional[int] - The maximum number of idle connections kept alive.
+    keepalive_expiry: Optional[float] - The number of seconds an idle connection is kept alive for.
+    http2: bool - Whether to multiplex requests over HTTP/2 connections. Requires the `h2` package, installed with
+        `pip install httpx[http2]`.
+    share_transport: bool - Whether to share the connection pool with other clients that have the same API URLs,
+        API key and pool options.
+    """
+
     if api_key is None:
         api_key = os.getenv("VELLUM_API_KEY", default="")
 
-    return Vellum(
+    environment = create_vellum_environment(api_url, predict_api_url=predict_api_url)
+    return _Vellum(
         api_key=api_key,
-        environment=create_vellum_environment(api_url, predict_api_url=predict_api_url),
+        environment=environment,
         api_version=api_version,
+        httpx_client=create_vellum_httpx_client(
+            environment,
+            api_key,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            share_transport=share_transport,
+        ),
     )
 
 
+def create_async_vellum_client(
+    api_key: Optional[str] = None,
+    api_url: Optional[str] = None,
+    api_version: Optional[ApiVersionEnum] = None,
+    predict_api_url: Optional[str] = None,
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+    http2: bool = False,
+    share_transport: bool = True,
+) -> AsyncVellum:
+    """
+    The async counterpart of `create_vellum_client`, whose connection pool is shared with other clients created on
+    the same running event loop.
+    """
+
+    if api_key is None:
+        api_key = os.getenv("VELLUM_API_KEY", default="")
+
+    environment = create_vellum_environment(api_url, predict_api_url=predict_api_url)
+    return _AsyncVellum(
+        api_key=api_key,
+        environment=environment,
+        api_version=api_version,
+        httpx_client=create_async_vellum_httpx_client(
+            environment,
+            api_key,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            share_transport=share_transport,
+        ),
+    )
+
+
+def create_async_vellum_client_from(vellum_client: Vellum) -> AsyncVellum:
+    """
+    Creates an AsyncVellum client with the same API URLs, API key, headers and timeout as `vellum_client`, whose
+    connection pool is shared like those of `create_async_vellum_client`.
+    """
+
+    client_wrapper = vellum_client._client_wrapper
+    return _AsyncVellum(
+        api_key=client_wrapper.api_key,
+        environment=client_wrapper.get_environment(),
+        api_version=client_wrapper._api_version,
+        headers=client_wrapper.get_custom_headers(),
+        timeout=client_wrapper.get_timeout(),
+        httpx_client=create_async_vellum_httpx_client(client_wrapper.get_environment(), client_wrapper.api_key),
+    )
+
+
+def get_connection_pool_stats(client: Union[Vellum, AsyncVellum]) -> Optional[ConnectionPoolStats]:
+    """
+    Returns the stats of the connection pool behind a client created by `create_vellum_client` or
+    `create_async_vellum_client`, or None for clients with their own httpx client.
+    """
+
+    httpx_client = client._client_wrapper.httpx_client.httpx_client
+    if isinstance(httpx_client, (_PooledClient, _AsyncPooledClient)):
+        return httpx_client.get_connection_pool_stats()
+
+    return None
+
+
 def create_vellum_environment(
     api_url: Optional[str] = None,
     predict_api_url: Optional[str] = None,
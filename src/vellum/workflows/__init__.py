@@ -1,31 +1,12 @@
+from typing import TYPE_CHECKING
+
+from vellum.utils.lazy_imports import lazy_module_attributes
+
 from .constants import APIRequestMethod, AuthorizationType
 from .errors.types import WorkflowErrorCode
 from .exceptions import NodeException
 from .inputs import BaseInputs, DatasetRow
-from .nodes import (
-    APINode,
-    BaseInlinePromptNode,
-    BaseNode,
-    BasePromptDeploymentNode,
-    BaseSearchNode,
-    CodeExecutionNode,
-    ConditionalNode,
-    ErrorNode,
-    FinalOutputNode,
-    GuardrailNode,
-    InlinePromptNode,
-    InlineSubworkflowNode,
-    MapNode,
-    NoteNode,
-    PromptDeploymentNode,
-    RetryNode,
-    SearchNode,
-    SubworkflowDeploymentNode,
-    TemplatingNode,
-    TryNode,
-    WebSearchNode,
-)
-from .nodes.displayable.tool_calling_node import ToolCallingNode
+from .nodes import BaseNode
 from .nodes.mocks import MockNodeExecution
 from .ports import Port
 from .references.environment_variable import EnvironmentVariableReference
@@ -39,6 +20,59 @@ from .types.definition import DeploymentDefinition, MCPServer, VellumIntegration
 from .utils.functions import tool, use_tool_inputs
 from .workflows import BaseWorkflow
 
+if TYPE_CHECKING:
+    from .nodes import (
+        APINode,
+        BaseInlinePromptNode,
+        BasePromptDeploymentNode,
+        BaseSearchNode,
+        CodeExecutionNode,
+        ConditionalNode,
+        ErrorNode,
+        FinalOutputNode,
+        GuardrailNode,
+        InlinePromptNode,
+        InlineSubworkflowNode,
+        MapNode,
+        NoteNode,
+        PromptDeploymentNode,
+        RetryNode,
+        SearchNode,
+        SubworkflowDeploymentNode,
+        TemplatingNode,
+        TryNode,
+        WebSearchNode,
+    )
+    from .nodes.displayable.tool_calling_node import ToolCallingNode
+
+# Node classes are only imported on first access, so that `import vellum.workflows` doesn't pay for every node
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "APINode": ".nodes",
+        "BaseInlinePromptNode": ".nodes",
+        "BasePromptDeploymentNode": ".nodes",
+        "BaseSearchNode": ".nodes",
+        "CodeExecutionNode": ".nodes",
+        "ConditionalNode": ".nodes",
+        "ErrorNode": ".nodes",
+        "FinalOutputNode": ".nodes",
+        "GuardrailNode": ".nodes",
+        "InlinePromptNode": ".nodes",
+        "InlineSubworkflowNode": ".nodes",
+        "MapNode": ".nodes",
+        "NoteNode": ".nodes",
+        "PromptDeploymentNode": ".nodes",
+        "RetryNode": ".nodes",
+        "SearchNode": ".nodes",
+        "SubworkflowDeploymentNode": ".nodes",
+        "TemplatingNode": ".nodes",
+        "TryNode": ".nodes",
+        "WebSearchNode": ".nodes",
+        "ToolCallingNode": ".nodes.displayable.tool_calling_node",
+    },
+)
+
 __all__ = [
     "APINode",
     "APIRequestMethod",
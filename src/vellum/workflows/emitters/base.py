@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Literal, Optional
 
 from vellum.workflows.events.workflow import WorkflowEvent
 from vellum.workflows.state.base import BaseState
@@ -8,8 +8,22 @@ from vellum.workflows.state.base import BaseState
 if TYPE_CHECKING:
     from vellum.workflows.state.context import WorkflowContext
 
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest"]
+
 
 class BaseWorkflowEmitter(ABC):
+    """
+    Receives the events and state snapshots of each workflow run.
+
+    Every emitter is fed by its own background thread, so a slow emitter only delays itself. Up to
+    `delivery_queue_size` events and snapshots wait for the emitter, after which `delivery_overflow_policy` decides
+    whether the workflow's event stream waits for room ("block"), the oldest waiting item is discarded
+    ("drop_oldest"), or the new item is discarded ("drop_newest").
+    """
+
+    delivery_queue_size: int = 10_000
+    delivery_overflow_policy: OverflowPolicy = "block"
+
     def __init__(self):
         self._context: Optional["WorkflowContext"] = None
 
@@ -1,9 +1,19 @@
+import atexit
+from collections import deque
+import gzip
+import json
 import logging
 import threading
-from typing import List, Optional
+import time
+import weakref
+from typing import Deque, List, Optional, Tuple
 
-from vellum.core.request_options import RequestOptions
-from vellum.workflows.emitters.base import BaseWorkflowEmitter
+from vellum.client.core.api_error import ApiError
+from vellum.client.core.jsonable_encoder import jsonable_encoder
+from vellum.client.core.request_options import RequestOptions
+from vellum.client.core.serialization import convert_and_respect_annotation_metadata
+from vellum.client.types.create_workflow_event_request import CreateWorkflowEventRequest
+from vellum.workflows.emitters.base import BaseWorkflowEmitter, OverflowPolicy
 from vellum.workflows.events.workflow import WorkflowEvent as SDKWorkflowEvent
 from vellum.workflows.state.base import BaseState
 
@@ -11,6 +21,22 @@ logger = logging.getLogger(__name__)
 
 DISALLOWED_EVENTS = {"workflow.execution.streaming", "node.execution.streaming"}
 
+# How long the flusher thread waits for new events once the queue is empty before it exits
+FLUSHER_IDLE_TIMEOUT = 5.0
+
+# Emitters whose flusher thread is running. An emitter with queued events is kept alive by its flusher, but flushers
+# are daemon threads, so their queued events are sent before the interpreter exits instead of being dropped with them.
+_flushing_emitters: "weakref.WeakSet[VellumEmitter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _join_flushing_emitters() -> None:
+    for emitter in list(_flushing_emitters):
+        try:
+            emitter.join()
+        except Exception as e:
+            logger.exception(f"Failed to send queued events before exiting: {e}")
+
 
 class VellumEmitter(BaseWorkflowEmitter):
     """
@@ -23,6 +49,11 @@ class VellumEmitter(BaseWorkflowEmitter):
 
     The emitter will automatically use the same Vellum client configuration
     as the workflow it's attached to.
+
+    Events are queued and sent in batches by a single background flusher thread. A batch is sent once no new event
+    has been queued for `debounce_timeout` seconds, once its oldest event has waited `max_latency` seconds, or as soon
+    as it holds `max_batch_size` events or `max_batch_bytes` bytes of serialized events, whichever comes first.
+    Events are serialized once, as they are queued, and each request body is assembled from the serialized events.
     """
 
     def __init__(
@@ -31,6 +62,12 @@ class VellumEmitter(BaseWorkflowEmitter):
         timeout: Optional[float] = 30.0,
         max_retries: int = 3,
         debounce_timeout: float = 0.1,
+        max_latency: float = 1.0,
+        max_batch_size: int = 100,
+        max_batch_bytes: Optional[int] = 1_000_000,
+        max_queue_size: int = 10_000,
+        overflow_policy: OverflowPolicy = "block",
+        compress: bool = False,
     ):
         """
         Initialize the VellumEmitter.
@@ -38,15 +75,37 @@ class VellumEmitter(BaseWorkflowEmitter):
         Args:
             timeout: Request timeout in seconds.
             max_retries: Maximum number of retry attempts for failed requests.
-            debounce_timeout: Time in seconds to wait before sending batched events.
+            debounce_timeout: Time in seconds to wait for more events before sending batched events.
+            max_latency: Maximum time in seconds an event waits in the queue, even while new events keep arriving.
+            max_batch_size: Maximum number of events sent in a single request.
+            max_batch_bytes: Approximate maximum size in bytes of the events sent in a single request, or None to
+                not limit batches by size.
+            max_queue_size: Maximum number of events waiting to be sent.
+            overflow_policy: What to do with a new event once the queue is full: "block" until the flusher makes
+                room, "drop_oldest" to discard the oldest queued event, or "drop_newest" to discard the new event.
+            compress: Whether to gzip the body of each request.
         """
         super().__init__()
         self._timeout = timeout
         self._max_retries = max_retries
         self._debounce_timeout = debounce_timeout
-        self._event_queue: List[SDKWorkflowEvent] = []
+        self._max_latency = max_latency
+        self._max_batch_size = max_batch_size
+        self._max_batch_bytes = max_batch_bytes
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = overflow_policy
+        self._compress = compress
+
+        # Each queued event is stored with its serialized JSON and the time it was queued
+        self._event_queue: Deque[Tuple[SDKWorkflowEvent, bytes, float]] = deque()
+        self._queued_bytes = 0
+        self._last_queued_at = 0.0
+        self._dropped_events = 0
         self._queue_lock = threading.Lock()
-        self._debounce_timer: Optional[threading.Timer] = None
+        self._queue_condition = threading.Condition(self._queue_lock)
+        self._flusher: Optional[threading.Thread] = None
+        self._is_sending = False
+        self._pending_joins = 0
 
     def emit_event(self, event: SDKWorkflowEvent) -> None:
         """
@@ -62,45 +121,126 @@ class VellumEmitter(BaseWorkflowEmitter):
             return
 
         try:
-            with self._queue_lock:
-                self._event_queue.append(event)
+            payload = self._serialize_event(event)
+            with self._queue_condition:
+                if len(self._event_queue) >= self._max_queue_size:
+                    if self._overflow_policy == "drop_newest":
+                        self._drop_event(event)
+                        return
 
-                if self._debounce_timer:
-                    self._debounce_timer.cancel()
+                    if self._overflow_policy == "drop_oldest":
+                        dropped_event, dropped_payload, _ = self._event_queue.popleft()
+                        self._queued_bytes -= len(dropped_payload)
+                        self._drop_event(dropped_event)
+                    else:
+                        self._ensure_flusher()
+                        while len(self._event_queue) >= self._max_queue_size:
+                            self._queue_condition.wait()
 
-                self._debounce_timer = threading.Timer(self._debounce_timeout, self._flush_events)
-                self._debounce_timer.start()
+                self._last_queued_at = time.monotonic()
+                self._event_queue.append((event, payload, self._last_queued_at))
+                self._queued_bytes += len(payload)
+                self._ensure_flusher()
+                self._queue_condition.notify_all()
 
         except Exception as e:
             logger.exception(f"Failed to queue event {event.name}: {e}")
 
-    def _flush_events(self) -> None:
+    def _serialize_event(self, event: SDKWorkflowEvent) -> bytes:
         """
-        Send all queued events as a batch to Vellum's infrastructure.
+        Serialize an event the same way as client.events.create does.
         """
-        with self._queue_lock:
-            if not self._event_queue:
-                return
+        payload = jsonable_encoder(
+            convert_and_respect_annotation_metadata(
+                object_=event, annotation=CreateWorkflowEventRequest, direction="write"
+            )
+        )
+        return json.dumps(payload).encode("utf-8")
 
-            events_to_send = self._event_queue.copy()
-            self._event_queue.clear()
-            self._debounce_timer = None
+    def _drop_event(self, event: SDKWorkflowEvent) -> None:
+        if self._dropped_events == 0:
+            logger.warning(
+                f"VellumEmitter queue is full with {self._max_queue_size} events, dropping event {event.name}. "
+                "Further dropped events will not be logged."
+            )
 
-        try:
-            self._send_events(events_to_send)
-        except Exception as e:
-            logger.exception(f"Failed to send batched events: {e}")
+        self._dropped_events += 1
 
-    def __del__(self) -> None:
+    def _ensure_flusher(self) -> None:
         """
-        Cleanup: flush any pending events and cancel timer.
+        Start the flusher thread if it isn't running. Must be called while holding the queue lock.
         """
-        try:
-            if self._debounce_timer:
-                self._debounce_timer.cancel()
-            self._flush_events()
-        except Exception:
-            pass
+        if self._flusher is not None:
+            return
+
+        self._flusher = threading.Thread(target=self._run_flusher, name="VellumEmitter.flusher", daemon=True)
+        self._flusher.start()
+        _flushing_emitters.add(self)
+
+    def _run_flusher(self) -> None:
+        while True:
+            with self._queue_condition:
+                events_to_send = self._wait_for_batch()
+                if events_to_send is None:
+                    self._flusher = None
+                    _flushing_emitters.discard(self)
+                    return
+
+                self._is_sending = True
+                self._queue_condition.notify_all()
+
+            try:
+                self._send_events(events_to_send)
+            except Exception as e:
+                logger.exception(f"Failed to send batched events: {e}")
+            finally:
+                with self._queue_condition:
+                    self._is_sending = False
+                    self._queue_condition.notify_all()
+
+    def _wait_for_batch(self) -> Optional[List[bytes]]:
+        """
+        Wait until the next batch of events is due and take it off the queue. Returns None once the queue has been
+        empty for `FLUSHER_IDLE_TIMEOUT` seconds. Must be called while holding the queue lock.
+        """
+        while True:
+            if not self._event_queue:
+                if self._pending_joins or not self._queue_condition.wait(FLUSHER_IDLE_TIMEOUT):
+                    if not self._event_queue:
+                        return None
+                continue
+
+            remaining = self._get_time_until_flush()
+            if remaining <= 0:
+                return self._take_batch()
+
+            self._queue_condition.wait(remaining)
+
+    def _get_time_until_flush(self) -> float:
+        if self._pending_joins or len(self._event_queue) >= self._max_batch_size:
+            return 0
+
+        if self._max_batch_bytes is not None and self._queued_bytes >= self._max_batch_bytes:
+            return 0
+
+        oldest_queued_at = self._event_queue[0][2]
+        flush_at = min(self._last_queued_at + self._debounce_timeout, oldest_queued_at + self._max_latency)
+        return flush_at - time.monotonic()
+
+    def _take_batch(self) -> List[bytes]:
+        batch: List[bytes] = []
+        batch_bytes = 0
+        while self._event_queue and len(batch) < self._max_batch_size:
+            _, payload, _ = self._event_queue[0]
+            if batch and self._max_batch_bytes is not None and batch_bytes + len(payload) > self._max_batch_bytes:
+                break
+
+            self._event_queue.popleft()
+            self._queued_bytes -= len(payload)
+            batch_bytes += len(payload)
+            batch.append(payload)
+
+        return batch
 
     def snapshot_state(self, state: BaseState) -> None:
         """
@@ -111,40 +251,56 @@ class VellumEmitter(BaseWorkflowEmitter):
         """
         pass
 
-    def _send_events(self, events: List[SDKWorkflowEvent]) -> None:
+    def _send_events(self, payloads: List[bytes]) -> None:
         """
-        Send events to Vellum's events endpoint using client.events.create.
+        Send serialized events to the same endpoint as client.events.create, in a single request.
 
         Args:
-            events: List of WorkflowEvent objects to send.
+            payloads: The serialized events to send.
         """
         if not self._context:
             logger.warning("Cannot send events: No workflow context registered")
             return
 
-        if not events:
+        if not payloads:
             return
 
-        client = self._context.vellum_client
         if self._timeout is not None:
             request_options = RequestOptions(timeout_in_seconds=int(self._timeout), max_retries=self._max_retries)
         else:
             request_options = RequestOptions(max_retries=self._max_retries)
 
-        client.events.create(
-            # The API accepts a ClientWorkflowEvent but our SDK emits an SDKWorkflowEvent. These shapes are
-            # meant to be identical, just with different helper methods. We may consolidate the two in the future.
-            # But for now, the type ignore allows us to avoid an additional Model -> json -> Model conversion.
-            request=events,  # type: ignore[arg-type]
+        content = b"[" + b",".join(payloads) + b"]"
+        headers = {"content-type": "application/json"}
+        if self._compress:
+            content = gzip.compress(content)
+            headers["content-encoding"] = "gzip"
+
+        client_wrapper = self._context.vellum_client._client_wrapper
+        response = client_wrapper.httpx_client.request(
+            "monitoring/v1/events",
+            base_url=client_wrapper.get_environment().default,
+            method="POST",
+            content=content,
+            headers=headers,
             request_options=request_options,
         )
+        if not 200 <= response.status_code < 300:
+            raise ApiError(status_code=response.status_code, headers=dict(response.headers), body=response.text)
 
     def join(self) -> None:
         """
         Wait for any background threads or timers used by this emitter to complete.
         This ensures all pending work is finished before the workflow terminates.
-        """
-        self._flush_events()
 
-        if self._debounce_timer and self._debounce_timer.is_alive():
-            self._debounce_timer.join()
+        Every event queued before join was called is sent right away instead of waiting for its batch to fill up.
+        """
+        with self._queue_condition:
+            self._pending_joins += 1
+            try:
+                self._queue_condition.notify_all()
+                while self._event_queue or self._is_sending:
+                    self._ensure_flusher()
+                    self._queue_condition.wait()
+            finally:
+                self._pending_joins -= 1
@@ -1,11 +1,10 @@
-import json
 from typing import TYPE_CHECKING, Any, Dict, Generic, List, Literal, Optional, Set, Type, Union
 
 from pydantic import SerializationInfo, field_serializer, model_serializer
 
 from vellum.client.core.pydantic_utilities import UniversalBaseModel
 from vellum.client.types import SeverityEnum
-from vellum.utils.json_encoder import VellumJsonEncoder
+from vellum.utils.json_encoder import exceeds_json_length
 from vellum.workflows.errors import WorkflowError
 from vellum.workflows.expressions.accessor import AccessorExpression
 from vellum.workflows.outputs.base import BaseOutput
@@ -142,7 +141,7 @@ class NodeExecutionFulfilledEvent(_BaseNodeEvent, Generic[OutputsType]):
 
         if (
             self._event_max_size is not None
-            and len(json.dumps(serialized, cls=VellumJsonEncoder)) > self._event_max_size
+            and exceeds_json_length(serialized, self._event_max_size)
             and "body" in serialized
             and isinstance(serialized["body"], dict)
         ):
@@ -1,5 +1,4 @@
 from datetime import datetime
-import json
 from uuid import UUID, uuid4
 from typing import Annotated, Any, List, Literal, Optional, Union, get_args
 
@@ -7,7 +6,7 @@ from pydantic import Field, GetCoreSchemaHandler, PrivateAttr, Tag, ValidationIn
 from pydantic_core import CoreSchema, core_schema
 
 from vellum.client.core.pydantic_utilities import UniversalBaseModel
-from vellum.utils.json_encoder import VellumJsonEncoder
+from vellum.utils.json_encoder import to_json_compatible
 from vellum.workflows.types.definition import VellumCodeResourceDefinition
 from vellum.workflows.types.utils import datetime_now
 
@@ -21,12 +20,7 @@ def default_datetime_factory() -> datetime:
 
 
 def default_serializer(obj: Any) -> Any:
-    return json.loads(
-        json.dumps(
-            obj,
-            cls=VellumJsonEncoder,
-        )
-    )
+    return to_json_compatible(obj)
 
 
 class BaseParentContext(UniversalBaseModel):
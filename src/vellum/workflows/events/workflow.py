@@ -1,5 +1,4 @@
 from importlib.metadata import version
-import json
 import logging
 from uuid import UUID
 from typing import TYPE_CHECKING, Any, Dict, Generic, Iterable, Literal, Optional, Type, Union, cast
@@ -8,7 +7,7 @@ from typing_extensions import TypeGuard
 from pydantic import Field, SerializationInfo, field_serializer, field_validator, model_serializer
 
 from vellum.client.core.pydantic_utilities import UniversalBaseModel
-from vellum.utils.json_encoder import VellumJsonEncoder
+from vellum.utils.json_encoder import exceeds_json_length
 from vellum.workflows.errors import WorkflowError
 from vellum.workflows.outputs.base import BaseOutput
 from vellum.workflows.references import ExternalInputReference
@@ -225,7 +224,7 @@ class WorkflowExecutionFulfilledEvent(_BaseWorkflowEvent, Generic[OutputsType, S
 
         if (
             self._event_max_size is not None
-            and len(json.dumps(serialized, cls=VellumJsonEncoder)) > self._event_max_size
+            and exceeds_json_length(serialized, self._event_max_size)
             and "body" in serialized
             and isinstance(serialized["body"], dict)
         ):
@@ -0,0 +1,17 @@
+from .base import (
+    BaseNodeExecutor,
+    NodeExecutorMetrics,
+    PooledNodeExecutor,
+    ThreadPerNodeExecutor,
+    get_default_node_executor,
+    set_default_node_executor,
+)
+
+__all__ = [
+    "BaseNodeExecutor",
+    "NodeExecutorMetrics",
+    "PooledNodeExecutor",
+    "ThreadPerNodeExecutor",
+    "get_default_node_executor",
+    "set_default_node_executor",
+]
@@ -0,0 +1,248 @@
+from abc import ABC, abstractmethod
+import atexit
+from dataclasses import dataclass
+import logging
+from queue import Empty, Queue
+import threading
+from typing import Any, Callable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+WorkItem = Tuple[Callable[..., None], Tuple[Any, ...], dict]
+
+
+@dataclass(frozen=True)
+class NodeExecutorMetrics:
+    """A point-in-time snapshot of a node executor's utilization."""
+
+    workers: int
+    active_workers: int
+    idle_workers: int
+    queue_depth: int
+    peak_queue_depth: int
+    submitted: int
+    completed: int
+
+
+class BaseNodeExecutor(ABC):
+    """
+    Responsible for executing node work items on behalf of a WorkflowRunner.
+
+    Executors are reusable across runs and are shared with nested subworkflows through the
+    WorkflowContext, so that a single pool of workers can serve an entire tree of executions.
+    """
+
+    @abstractmethod
+    def submit(self, fn: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+        pass
+
+    @property
+    @abstractmethod
+    def metrics(self) -> NodeExecutorMetrics:
+        pass
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+class ThreadPerNodeExecutor(BaseNodeExecutor):
+    """
+    Spawns a brand new thread for every node execution. This was the original behavior of the
+    WorkflowRunner and is kept around for callers that depend on per-node thread isolation.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+
+    def submit(self, fn: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+        with self._lock:
+            self._submitted += 1
+            self._active += 1
+
+        thread = threading.Thread(target=self._run, args=(fn, args, kwargs))
+        thread.start()
+
+    def _run(self, fn: Callable[..., None], args: Tuple[Any, ...], kwargs: dict) -> None:
+        try:
+            fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    @property
+    def metrics(self) -> NodeExecutorMetrics:
+        with self._lock:
+            return NodeExecutorMetrics(
+                workers=self._active,
+                active_workers=self._active,
+                idle_workers=0,
+                queue_depth=0,
+                peak_queue_depth=0,
+                submitted=self._submitted,
+                completed=self._completed,
+            )
+
+
+class PooledNodeExecutor(BaseNodeExecutor):
+    """
+    A thread pool that reuses idle workers across node executions and runs.
+
+    New workers are only started when no idle worker is available to pick up a submitted item, and
+    workers exit after `idle_timeout` seconds without work, so the pool shrinks back down after a burst.
+
+    When `max_workers` is set, items submitted while every worker is busy wait in a queue. Nodes that
+    run nested workflows (e.g. MapNode, SubworkflowDeploymentNode) hold on to their worker while their
+    inner nodes execute, so a bounded pool shared with subworkflows must be sized above the
+    maximum nesting fan-out to avoid starving itself.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        idle_timeout: float = 60.0,
+        thread_name_prefix: str = "vellum-node-executor",
+    ) -> None:
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+
+        self._max_workers = max_workers
+        self._idle_timeout = idle_timeout
+        self._thread_name_prefix = thread_name_prefix
+
+        self._work_queue: Queue[Optional[WorkItem]] = Queue()
+        self._lock = threading.Lock()
+        self._threads: Set[threading.Thread] = set()
+        self._idle_workers = 0
+        self._queue_depth = 0
+        self._peak_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+        self._thread_counter = 0
+        self._is_shutdown = False
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        return self._max_workers
+
+    def submit(self, fn: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+        with self._lock:
+            if self._is_shutdown:
+                raise RuntimeError("Cannot submit work to a node executor that has been shut down")
+
+            self._submitted += 1
+            self._queue_depth += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._queue_depth)
+            self._work_queue.put((fn, args, kwargs))
+
+            if self._queue_depth > self._idle_workers and (
+                self._max_workers is None or len(self._threads) < self._max_workers
+            ):
+                self._start_worker()
+
+    def _start_worker(self) -> None:
+        self._thread_counter += 1
+        thread = threading.Thread(
+            target=self._worker,
+            name=f"{self._thread_name_prefix}_{self._thread_counter}",
+            daemon=True,
+        )
+        self._threads.add(thread)
+        thread.start()
+
+    def _worker(self) -> None:
+        current_thread = threading.current_thread()
+        while True:
+            with self._lock:
+                self._idle_workers += 1
+
+            try:
+                item = self._work_queue.get(timeout=self._idle_timeout)
+            except Empty:
+                with self._lock:
+                    self._idle_workers -= 1
+                    # An item may have been submitted while we were deciding to exit, in which case the
+                    # submitter counted on us to pick it up.
+                    if self._queue_depth > 0:
+                        continue
+                    self._threads.discard(current_thread)
+                return
+
+            with self._lock:
+                self._idle_workers -= 1
+                if item is None:
+                    self._threads.discard(current_thread)
+                    return
+                self._queue_depth -= 1
+
+            fn, args, kwargs = item
+            try:
+                fn(*args, **kwargs)
+            except Exception:
+                logger.exception("Unexpected error while executing node work item")
+            finally:
+                with self._lock:
+                    self._completed += 1
+
+            # Idle workers would otherwise keep the last node they ran, and its whole workflow, alive while they
+            # wait for more work
+            del item, fn, args, kwargs
+
+    @property
+    def metrics(self) -> NodeExecutorMetrics:
+        with self._lock:
+            return NodeExecutorMetrics(
+                workers=len(self._threads),
+                active_workers=len(self._threads) - self._idle_workers,
+                idle_workers=self._idle_workers,
+                queue_depth=self._queue_depth,
+                peak_queue_depth=self._peak_queue_depth,
+                submitted=self._submitted,
+                completed=self._completed,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            self._is_shutdown = True
+            threads = list(self._threads)
+
+        for _ in threads:
+            self._work_queue.put(None)
+
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+_default_node_executor: Optional[BaseNodeExecutor] = None
+_default_node_executor_lock = threading.Lock()
+
+
+def get_default_node_executor() -> BaseNodeExecutor:
+    """
+    Returns the process-wide node executor used by every WorkflowRunner that isn't given one explicitly.
+    """
+
+    global _default_node_executor
+    if _default_node_executor is None:
+        with _default_node_executor_lock:
+            if _default_node_executor is None:
+                _default_node_executor = PooledNodeExecutor()
+    return _default_node_executor
+
+
+def set_default_node_executor(executor: BaseNodeExecutor) -> None:
+    global _default_node_executor
+    with _default_node_executor_lock:
+        _default_node_executor = executor
+
+
+@atexit.register
+def _shutdown_default_node_executor() -> None:
+    # Workers are daemon threads so that idle workers never hold up interpreter exit, but we still
+    # want any in-flight node executions to finish before the process goes away.
+    if _default_node_executor is not None:
+        _default_node_executor.shutdown(wait=True)
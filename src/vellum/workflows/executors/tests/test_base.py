@@ -0,0 +1,71 @@
+import threading
+import time
+
+from vellum.workflows.executors import PooledNodeExecutor
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.types.core import MergeBehavior
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+def test_pooled_node_executor__bounded_fan_out():
+    # GIVEN a workflow that fans out to many nodes
+    class StartNode(BaseNode):
+        pass
+
+    fan_out_nodes = {type(f"FanOutNode{i}", (BaseNode,), {"__module__": __name__}) for i in range(20)}
+
+    class EndNode(BaseNode):
+        class Trigger(BaseNode.Trigger):
+            merge_behavior = MergeBehavior.AWAIT_ALL
+
+        class Outputs(BaseNode.Outputs):
+            thread_count: int
+
+        def run(self) -> Outputs:
+            return self.Outputs(thread_count=threading.active_count())
+
+    class FanOutWorkflow(BaseWorkflow):
+        graph = StartNode >> fan_out_nodes >> EndNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            thread_count = EndNode.Outputs.thread_count
+
+    # AND a bounded executor shared through the workflow context
+    executor = PooledNodeExecutor(max_workers=2)
+    workflow = FanOutWorkflow(context=WorkflowContext(node_executor=executor))
+
+    # WHEN we run the workflow
+    terminal_event = workflow.run()
+
+    # THEN the workflow should succeed
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+
+    # AND every node should have been executed by at most two pooled workers
+    metrics = executor.metrics
+    assert metrics.submitted == 22
+    assert metrics.completed == 22
+    assert metrics.workers <= 2
+    assert metrics.peak_queue_depth > 2
+
+    executor.shutdown()
+
+
+def test_pooled_node_executor__reuses_idle_workers():
+    # GIVEN an unbounded pooled executor
+    executor = PooledNodeExecutor()
+    thread_names = set()
+
+    # WHEN we submit work items one after another, waiting for the pool to go idle in between
+    for index in range(10):
+        executor.submit(lambda: thread_names.add(threading.current_thread().name))
+        deadline = time.monotonic() + 5
+        while executor.metrics.idle_workers == 0 or executor.metrics.completed <= index:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+
+    # THEN the same worker should have handled every item
+    assert len(thread_names) == 1
+    assert executor.metrics.completed == 10
+
+    executor.shutdown()
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+from uuid import UUID
+from typing import TYPE_CHECKING, Dict, List, Set, Type
+
+from vellum.workflows.edges.edge import Edge
+from vellum.workflows.graph.graph import Graph
+
+if TYPE_CHECKING:
+    from vellum.workflows.nodes.bases import BaseNode
+
+
+@dataclass(frozen=True)
+class CompiledGraph:
+    """
+    A workflow's graph resolved into its edges, nodes and dependencies, so that it only has to be traversed once
+    and can then be shared by every run of the workflow. None of its collections should be modified.
+    """
+
+    subgraphs: List[Graph]
+    unused_subgraphs: List[Graph]
+    edges: List[Edge]
+    nodes: List[Type["BaseNode"]]
+    unused_edges: List[Edge]
+    unused_nodes: List[Type["BaseNode"]]
+    entrypoints: Set[Type["BaseNode"]]
+    nodes_by_id: Dict[UUID, Type["BaseNode"]]
+    dependencies: Dict[Type["BaseNode"], Set[Type["BaseNode"]]]
+
+    def get_dependencies(self, node: Type["BaseNode"]) -> Set[Type["BaseNode"]]:
+        """
+        Returns the nodes with an edge into `node`.
+        """
+        return self.dependencies.get(node, set())
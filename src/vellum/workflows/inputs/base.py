@@ -10,7 +10,7 @@ from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.exceptions import WorkflowInitializationException
 from vellum.workflows.references import ExternalInputReference, WorkflowInputReference
 from vellum.workflows.references.input import InputReference
-from vellum.workflows.types.utils import coerce_to_declared_type, get_class_attr_names, infer_types
+from vellum.workflows.types.utils import clear_type_cache, coerce_to_declared_type, get_class_attr_names, infer_types
 
 
 @dataclass_transform(kw_only_default=True)
@@ -19,6 +19,16 @@ class _BaseInputsMeta(type):
         dct["__parent_class__"] = type(None)
         return super().__new__(cls, name, bases, dct)
 
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_") or name == "__annotations__":
+            clear_type_cache(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if not name.startswith("_") or name == "__annotations__":
+            clear_type_cache(cls)
+
     def __getattribute__(cls, name: str) -> Any:
         if name.startswith("_") or not issubclass(cls, BaseInputs):
             return super().__getattribute__(name)
@@ -1,5 +1,5 @@
 from .composio_service import ComposioService
-from .mcp_service import MCPService
+from .mcp_service import MCPService, MCPSessionPool
 from .vellum_integration_service import VellumIntegrationService
 
-__all__ = ["ComposioService", "MCPService", "VellumIntegrationService"]
+__all__ = ["ComposioService", "MCPService", "MCPSessionPool", "VellumIntegrationService"]
@@ -1,15 +1,21 @@
+import copy
 from dataclasses import dataclass
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
+from vellum.workflows.integrations.cache import TTLCache
+from vellum.workflows.utils.http import get_default_http_session
 
 logger = logging.getLogger(__name__)
 
+TOOL_CACHE_TTL_SECONDS = 300.0
+CONNECTIONS_CACHE_TTL_SECONDS = 60.0
+
 
 @dataclass
 class ConnectionInfo:
@@ -22,10 +28,21 @@ class ConnectionInfo:
     status: str = "ACTIVE"
 
 
+# Shared across instances, since a new ComposioService is created each time a tool is compiled or executed
+_tool_cache: TTLCache[Tuple[str, str], Dict[str, Any]] = TTLCache(ttl=TOOL_CACHE_TTL_SECONDS)
+_connections_cache: TTLCache[str, List[ConnectionInfo]] = TTLCache(ttl=CONNECTIONS_CACHE_TTL_SECONDS)
+
+
+def clear_composio_cache() -> None:
+    """Forgets every cached tool and user connection."""
+    _tool_cache.clear()
+    _connections_cache.clear()
+
+
 class ComposioService:
     """Composio API client for managing connections and executing tools"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, session: Optional[requests.Session] = None):
         # If no API key provided, look it up from environment variables
         if api_key is None:
             api_key = self._get_api_key_from_env()
@@ -40,6 +57,7 @@ class ComposioService:
 
         self.api_key = api_key
         self.base_url = "https://backend.composio.dev/api/v3"
+        self._session = session or get_default_http_session()
 
     @staticmethod
     def _get_api_key_from_env() -> Optional[str]:
@@ -65,9 +83,9 @@ class ComposioService:
 
         try:
             if method == "GET":
-                response = requests.get(url, headers=headers, params=params or {}, timeout=30)
+                response = self._session.get(url, headers=headers, params=params or {}, timeout=30)
             elif method == "POST":
-                response = requests.post(url, headers=headers, json=json_data or {}, timeout=30)
+                response = self._session.post(url, headers=headers, json=json_data or {}, timeout=30)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -88,10 +106,14 @@ class ComposioService:
             raise NodeException(f"Composio API request failed: {e}")
 
     def get_user_connections(self) -> List[ConnectionInfo]:
-        """Get all authorized connections for the user"""
+        """Get all authorized connections for the user. Connections are cached for CONNECTIONS_CACHE_TTL_SECONDS."""
+        cached_connections = _connections_cache.get(self.api_key)
+        if cached_connections is not None:
+            return list(cached_connections)
+
         response = self._make_request("/connected_accounts")
 
-        return [
+        connections = [
             ConnectionInfo(
                 connection_id=item.get("id"),
                 integration_name=item.get("toolkit", {}).get("slug", ""),
@@ -101,9 +123,23 @@ class ComposioService:
             )
             for item in response.get("items", [])
         ]
+        _connections_cache.set(self.api_key, connections)
+        return list(connections)
+
+    def invalidate_user_connections(self) -> None:
+        """Forgets the cached connections, for example after the user authorizes a new one."""
+        _connections_cache.invalidate(self.api_key)
+
+    def invalidate_tool(self, tool_slug: Optional[str] = None) -> None:
+        """Forgets the cached details of the tool with `tool_slug`, or of every tool if no slug is given."""
+        if tool_slug is None:
+            _tool_cache.invalidate_where(lambda key: key[0] == self.api_key)
+        else:
+            _tool_cache.invalidate((self.api_key, tool_slug))
 
     def get_tool_by_slug(self, tool_slug: str) -> Dict[str, Any]:
-        """Get detailed information about a tool using its slug identifier
+        """Get detailed information about a tool using its slug identifier. Tool details are cached for
+        TOOL_CACHE_TTL_SECONDS.
 
         Args:
             tool_slug: The unique slug identifier of the tool
@@ -119,11 +155,16 @@ class ComposioService:
         Raises:
             NodeException: If tool not found (404), unauthorized (401), or other API errors
         """
+        cached_tool = _tool_cache.get((self.api_key, tool_slug))
+        if cached_tool is not None:
+            return copy.deepcopy(cached_tool)
+
         endpoint = f"/tools/{tool_slug}"
 
         try:
             response = self._make_request(endpoint, method="GET")
             logger.info(f"Retrieved tool details for slug '{tool_slug}': {response}")
+            _tool_cache.set((self.api_key, tool_slug), copy.deepcopy(response))
             return response
         except Exception as e:
             # Enhanced error handling for specific cases
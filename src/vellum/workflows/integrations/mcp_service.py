@@ -1,19 +1,33 @@
 import asyncio
+import atexit
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import json
 import logging
+import os
+import threading
 import traceback
-from typing import Any, Dict, List, Optional
+from typing import Any, Coroutine, Dict, List, Optional, Tuple, TypeVar
 
 import httpx
 
 from vellum.workflows.constants import AuthorizationType
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
+from vellum.workflows.integrations.cache import TTLCache
 from vellum.workflows.types.core import VellumSecret
 from vellum.workflows.types.definition import MCPServer, MCPToolDefinition
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_SessionKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+TOOL_DEFINITIONS_TTL_SECONDS = 300.0
+
+
+class MCPSessionExpiredError(Exception):
+    """Raised when the MCP server no longer recognizes the session ID sent with a request."""
+
 
 class MCPHttpClient:
     """
@@ -86,6 +100,10 @@ class MCPHttpClient:
         # Send POST request
         response = await self._client.post(self.server_url, json=request_data, headers=headers)
 
+        # Servers respond with a 404 to requests for a session that they have terminated
+        if self.session_id and response.status_code == 404:
+            raise MCPSessionExpiredError(f"MCP session '{self.session_id}' has expired")
+
         # Check for session ID in response headers
         if "Mcp-Session-Id" in response.headers:
             self.session_id = response.headers["Mcp-Session-Id"]
@@ -176,7 +194,135 @@ class MCPHttpClient:
         return response.get("result", {})
 
 
+def _get_session_key(server_url: str, headers: Dict[str, str]) -> _SessionKey:
+    return server_url, tuple(sorted(headers.items()))
+
+
+class MCPSessionPool:
+    """
+    Keeps initialized MCP client sessions alive across tool listings and tool calls, keyed by server URL and auth
+    headers, so that each call doesn't pay for a new connection and `initialize` handshake. Every session is driven
+    by a single long-lived event loop running on a background thread.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_pid: Optional[int] = None
+        self._loop_lock = threading.Lock()
+        self._sessions: Dict[_SessionKey, MCPHttpClient] = {}
+        self._session_locks: Dict[_SessionKey, asyncio.Lock] = {}
+
+    def run(self, coroutine: Coroutine[Any, Any, _T]) -> _T:
+        """Runs `coroutine` on the pool's event loop and blocks until it completes."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result()
+
+    async def get_session(self, server_url: str, headers: Dict[str, str]) -> Tuple[MCPHttpClient, bool]:
+        """
+        Returns an initialized session for the server, along with whether it was just created. Must be awaited on
+        the pool's event loop.
+        """
+        key = _get_session_key(server_url, headers)
+        session = self._sessions.get(key)
+        if session is not None:
+            return session, False
+
+        session_lock = self._session_locks.setdefault(key, asyncio.Lock())
+        async with session_lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                return session, False
+
+            session = await MCPHttpClient(server_url, headers).__aenter__()
+            try:
+                await session.initialize()
+            except BaseException:
+                await session.__aexit__(None, None, None)
+                raise
+
+            self._sessions[key] = session
+            return session, True
+
+    async def discard_session(self, server_url: str, headers: Dict[str, str], session: MCPHttpClient) -> None:
+        """Closes a session that failed, so that the next call to the server initializes a new one."""
+        key = _get_session_key(server_url, headers)
+        if self._sessions.get(key) is session:
+            del self._sessions[key]
+
+        try:
+            await session.__aexit__(None, None, None)
+        except Exception:
+            logger.debug("Failed to close MCP session for %s", server_url, exc_info=True)
+
+    def close(self, timeout: float = 5) -> None:
+        """Closes every pooled session."""
+        with self._loop_lock:
+            loop = self._loop if self._loop_pid == os.getpid() else None
+
+        if loop is None or not loop.is_running():
+            return
+
+        async def _close_sessions() -> None:
+            sessions = list(self._sessions.items())
+            self._sessions.clear()
+            for (server_url, headers), session in sessions:
+                await self.discard_session(server_url, dict(headers), session)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_close_sessions(), loop).result(timeout=timeout)
+        except FutureTimeoutError:
+            logger.warning("Timed out closing MCP sessions")
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            # A forked process doesn't inherit the loop's thread, so it needs a loop and sessions of its own
+            if self._loop is None or self._loop_pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="vellum-mcp-event-loop", daemon=True).start()
+                self._loop = loop
+                self._loop_pid = os.getpid()
+                self._sessions = {}
+                self._session_locks = {}
+
+            return self._loop
+
+
+_default_session_pool: Optional[MCPSessionPool] = None
+_default_session_pool_lock = threading.Lock()
+
+_tool_definitions_cache: TTLCache[Tuple[str, _SessionKey], List[MCPToolDefinition]] = TTLCache(
+    ttl=TOOL_DEFINITIONS_TTL_SECONDS
+)
+
+
+def get_default_mcp_session_pool() -> MCPSessionPool:
+    """
+    Returns the process-wide MCP session pool used by every MCPService that isn't given one explicitly.
+    """
+
+    global _default_session_pool
+    if _default_session_pool is None:
+        with _default_session_pool_lock:
+            if _default_session_pool is None:
+                _default_session_pool = MCPSessionPool()
+                atexit.register(_default_session_pool.close)
+    return _default_session_pool
+
+
+def clear_mcp_cache() -> None:
+    """Closes the default pool's sessions and forgets every cached tool definition."""
+    if _default_session_pool is not None:
+        _default_session_pool.close()
+
+    _tool_definitions_cache.clear()
+
+
 class MCPService:
+    def __init__(self, session_pool: Optional[MCPSessionPool] = None, tool_definitions_ttl: Optional[float] = None):
+        self._session_pool = session_pool or get_default_mcp_session_pool()
+        self._tool_definitions_ttl = (
+            tool_definitions_ttl if tool_definitions_ttl is not None else TOOL_DEFINITIONS_TTL_SECONDS
+        )
+
     def _get_auth_headers(self, server: MCPServer) -> Dict[str, str]:
         headers = {}
         if server.authorization_type == AuthorizationType.BEARER_TOKEN:
@@ -209,18 +355,26 @@ class MCPService:
         headers = self._get_auth_headers(server)
 
         try:
-            async with MCPHttpClient(server.url, headers) as client:
-                await client.initialize()
-
-                if operation == "list_tools":
-                    return await client.list_tools()
-                elif operation == "call_tool":
-                    return await client.call_tool(
-                        name=kwargs["name"],
-                        arguments=kwargs["arguments"],
-                    )
-                else:
-                    raise ValueError(f"Unknown MCP operation: {operation}")
+            while True:
+                client, is_new_session = await self._session_pool.get_session(server.url, headers)
+                try:
+                    if operation == "list_tools":
+                        return await client.list_tools()
+                    elif operation == "call_tool":
+                        return await client.call_tool(
+                            name=kwargs["name"],
+                            arguments=kwargs["arguments"],
+                        )
+                    else:
+                        raise ValueError(f"Unknown MCP operation: {operation}")
+                except Exception as e:
+                    await self._session_pool.discard_session(server.url, headers, client)
+
+                    # A pooled session may have been terminated by the server, in which case we retry once with a
+                    # new one. The server never saw the request, so this is safe even for tool calls.
+                    if isinstance(e, MCPSessionExpiredError) and not is_new_session:
+                        continue
+                    raise
 
         except Exception as e:
             logger.error(f"Error executing MCP operation {operation}: {e}")
@@ -234,7 +388,7 @@ class MCPService:
     def list_tools(self, server: MCPServer) -> List[Dict[str, Any]]:
         """List available tools from an MCP server."""
         try:
-            tools = asyncio.run(self._execute_mcp_call(server, "list_tools"))
+            tools = self._session_pool.run(self._execute_mcp_call(server, "list_tools"))
             return tools
         except Exception as e:
             logger.warning(f"Failed to list tools from MCP server '{server.name}': {e}")
@@ -243,7 +397,7 @@ class MCPService:
     def execute_tool(self, tool_def: MCPToolDefinition, arguments: Dict[str, Any]) -> Any:
         """Execute a tool on an MCP server."""
         try:
-            result = asyncio.run(
+            result = self._session_pool.run(
                 self._execute_mcp_call(
                     tool_def.server,
                     "call_tool",
@@ -263,12 +417,25 @@ class MCPService:
                 raw_data={"tool_name": tool_def.name, "error_type": type(e).__name__, "error_message": str(e)},
             )
 
+    def invalidate_tool_definitions(self, server_def: MCPServer) -> None:
+        """Forgets the cached tool definitions of the server, so that the next hydration lists its tools again."""
+        _tool_definitions_cache.invalidate_where(lambda key: key[0] == server_def.name and key[1][0] == server_def.url)
+
     def hydrate_tool_definitions(self, server_def: MCPServer) -> List[MCPToolDefinition]:
-        """Hydrate an MCPToolDefinition with detailed information from the MCP server."""
+        """
+        Hydrate an MCPToolDefinition with detailed information from the MCP server. Tool definitions are cached per
+        server for `tool_definitions_ttl` seconds, so that nodes listing the same server's tools on every run only
+        hit the server once per TTL.
+        """
         try:
+            cache_key = (server_def.name, _get_session_key(server_def.url, self._get_auth_headers(server_def)))
+            cached = _tool_definitions_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+
             tools = self.list_tools(server_def)
 
-            return [
+            tool_definitions = [
                 MCPToolDefinition(
                     name=tool["name"],
                     server=server_def,
@@ -277,6 +444,12 @@ class MCPService:
                 )
                 for tool in tools
             ]
+
+            # An empty list is also what we get back when listing tools fails, so we don't cache it
+            if tool_definitions:
+                _tool_definitions_cache.set(cache_key, tool_definitions, ttl=self._tool_definitions_ttl)
+
+            return list(tool_definitions)
         except Exception as e:
             logger.warning(f"Failed to hydrate MCP server '{server_def.name}': {e}")
             return []
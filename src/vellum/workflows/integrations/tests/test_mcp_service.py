@@ -1,12 +1,14 @@
 import pytest
 import asyncio
+from http.server import BaseHTTPRequestHandler
 import json
 from unittest import mock
+from typing import Any, Dict, List, Set, Tuple
 
 from vellum.workflows.constants import AuthorizationType
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
-from vellum.workflows.integrations.mcp_service import MCPHttpClient, MCPService
+from vellum.workflows.integrations.mcp_service import MCPHttpClient, MCPService, MCPSessionPool
 from vellum.workflows.types.definition import MCPServer, MCPToolDefinition
 
 
@@ -180,7 +182,7 @@ def test_mcp_service_hydrate_tool_definitions():
     )
 
     # AND a mock MCP service that returns tools via SSE
-    with mock.patch("vellum.workflows.integrations.mcp_service.asyncio.run") as mock_run:
+    with mock.patch("vellum.workflows.integrations.mcp_service.MCPSessionPool.run") as mock_run:
         mock_run.return_value = [
             {
                 "name": "resolve-library-id",
@@ -216,7 +218,7 @@ def test_mcp_service_list_tools_handles_errors():
     sample_mcp_server = MCPServer(name="test-server", url="https://test.mcp.server.com/mcp")
 
     # AND a mock that raises an exception during SSE parsing
-    with mock.patch("vellum.workflows.integrations.mcp_service.asyncio.run") as mock_run:
+    with mock.patch("vellum.workflows.integrations.mcp_service.MCPSessionPool.run") as mock_run:
         mock_run.side_effect = Exception("SSE parsing failed")
 
         # WHEN we try to list tools
@@ -272,3 +274,85 @@ def test_mcp_service_call_tool_includes_stacktrace_and_raw_data_on_error():
         assert exc_info.value.raw_data["operation"] == "call_tool"
         assert exc_info.value.raw_data["error_type"] == "RuntimeError"
         assert exc_info.value.raw_data["error_message"] == "Tool execution failed"
+
+
+class StubMCPServer:
+    """A local MCP server with a single echo tool, that records the method of each request it receives."""
+
+    url: str
+
+    def __init__(self) -> None:
+        self.methods: List[str] = []
+        self.active_sessions: Set[str] = set()
+
+    def handle(self, request: BaseHTTPRequestHandler, body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        message = json.loads(body)
+        self.methods.append(message["method"])
+
+        session_id = request.headers.get("Mcp-Session-Id")
+        if message["method"] == "initialize":
+            session_id = f"session-{len(self.methods)}"
+            self.active_sessions.add(session_id)
+            result: Dict[str, Any] = {"protocolVersion": "2025-06-18", "capabilities": {"tools": {}}}
+        elif session_id not in self.active_sessions:
+            return 404, {}, b""
+        elif message["method"] == "tools/list":
+            result = {"tools": [{"name": "echo", "description": "Echoes", "inputSchema": {"type": "object"}}]}
+        else:
+            result = {"content": [{"type": "text", "text": message["params"]["arguments"]["text"]}]}
+
+        content = json.dumps({"jsonrpc": "2.0", "id": message["id"], "result": result}).encode()
+        return 200, {"Content-Type": "application/json", "Mcp-Session-Id": session_id}, content
+
+
+@pytest.fixture
+def stub_mcp_server(local_http_server) -> StubMCPServer:
+    stub = StubMCPServer()
+    stub.url = f"{local_http_server(stub.handle)}/mcp"
+    return stub
+
+
+def test_mcp_service__reuses_sessions_and_caches_tool_definitions(stub_mcp_server):
+    # GIVEN an MCP server
+    server = MCPServer(name="stub", url=stub_mcp_server.url)
+
+    # AND a service with its own session pool
+    session_pool = MCPSessionPool()
+    service = MCPService(session_pool=session_pool)
+
+    try:
+        # WHEN we hydrate the server's tools twice and call a tool twice
+        first_definitions = service.hydrate_tool_definitions(server)
+        second_definitions = MCPService(session_pool=session_pool).hydrate_tool_definitions(server)
+        results = [service.execute_tool(first_definitions[0], {"text": text}) for text in ("hello", "world")]
+    finally:
+        session_pool.close()
+
+    # THEN the tools and the tool results are returned
+    assert [tool.name for tool in first_definitions] == ["echo"]
+    assert second_definitions == first_definitions
+    assert [result["content"][0]["text"] for result in results] == ["hello", "world"]
+
+    # AND the session was only initialized once, and the tools were only listed once
+    assert stub_mcp_server.methods == ["initialize", "tools/list", "tools/call", "tools/call"]
+
+
+def test_mcp_service__reinitializes_expired_session(stub_mcp_server):
+    # GIVEN an MCP server with a session that a service has already initialized
+    server = MCPServer(name="stub", url=stub_mcp_server.url)
+    tool_definition = MCPToolDefinition(name="echo", server=server, parameters={})
+    session_pool = MCPSessionPool()
+    service = MCPService(session_pool=session_pool)
+
+    try:
+        service.execute_tool(tool_definition, {"text": "hello"})
+
+        # WHEN the server terminates the session and we call the tool again
+        stub_mcp_server.active_sessions.clear()
+        result = service.execute_tool(tool_definition, {"text": "world"})
+    finally:
+        session_pool.close()
+
+    # THEN the call is retried on a new session
+    assert result["content"][0]["text"] == "world"
+    assert stub_mcp_server.methods == ["initialize", "tools/call", "tools/call", "initialize", "tools/call"]
@@ -1,12 +1,25 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Hashable, Optional, Tuple
 
 from vellum.client.core.api_error import ApiError
 from vellum.workflows.constants import VellumIntegrationProviderType
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
+from vellum.workflows.integrations.cache import TTLCache
 from vellum.workflows.types.definition import VellumIntegrationToolDetails
 from vellum.workflows.vellum_client import Vellum
 
+TOOL_DEFINITION_CACHE_TTL_SECONDS = 300.0
+
+# Keyed by the client's credentials and environment along with the tool, and shared across service instances
+_tool_definition_cache: TTLCache[Tuple[Hashable, ...], VellumIntegrationToolDetails] = TTLCache(
+    ttl=TOOL_DEFINITION_CACHE_TTL_SECONDS
+)
+
+
+def clear_vellum_integration_cache() -> None:
+    """Forgets every cached tool definition."""
+    _tool_definition_cache.clear()
+
 
 def _extract_api_error_message(error: ApiError, fallback_message: str) -> str:
     """Extract a user-friendly error message from an ApiError.
@@ -44,6 +57,20 @@ class VellumIntegrationService:
         """Initialize the VellumIntegrationService with a Vellum client."""
         self._client = client
 
+    def _get_client_key(self) -> Tuple[Hashable, ...]:
+        client_wrapper = self._client._client_wrapper
+        return client_wrapper.api_key, client_wrapper.get_environment().default
+
+    def invalidate_tool_definition(
+        self,
+        integration: str,
+        provider: str,
+        tool_name: str,
+        toolkit_version: Optional[str] = None,
+    ) -> None:
+        """Forgets the cached definition of a tool, so that the next call to `get_tool_definition` fetches it again."""
+        _tool_definition_cache.invalidate((*self._get_client_key(), integration, provider, tool_name, toolkit_version))
+
     def get_tool_definition(
         self,
         integration: str,
@@ -51,7 +78,8 @@ class VellumIntegrationService:
         tool_name: str,
         toolkit_version: Optional[str] = None,
     ) -> VellumIntegrationToolDetails:
-        """Retrieve a tool definition from Vellum integrations.
+        """Retrieve a tool definition from Vellum integrations. Definitions are cached for
+        TOOL_DEFINITION_CACHE_TTL_SECONDS.
 
         Args:
             integration: The integration name (e.g., "GITHUB", "SLACK")
@@ -67,6 +95,11 @@ class VellumIntegrationService:
         Raises:
             NodeException: If the tool definition cannot be retrieved
         """
+        cache_key = (*self._get_client_key(), integration, provider, tool_name, toolkit_version)
+        cached_tool_details = _tool_definition_cache.get(cache_key)
+        if cached_tool_details is not None:
+            return cached_tool_details.model_copy(deep=True)
+
         try:
             response = self._client.integrations.retrieve_integration_tool_definition(
                 integration_name=integration,
@@ -75,7 +108,7 @@ class VellumIntegrationService:
                 toolkit_version=toolkit_version,
             )
 
-            return VellumIntegrationToolDetails(
+            tool_details = VellumIntegrationToolDetails(
                 provider=VellumIntegrationProviderType(response.provider),
                 integration_name=integration,
                 name=response.name,
@@ -83,6 +116,8 @@ class VellumIntegrationService:
                 parameters=response.input_parameters,
                 toolkit_version=response.toolkit_version,
             )
+            _tool_definition_cache.set(cache_key, tool_details.model_copy(deep=True))
+            return tool_details
         except ApiError as e:
             fallback_message = f"Failed to retrieve tool definition for {tool_name}"
             error_message = _extract_api_error_message(e, fallback_message)
@@ -1,22 +1,61 @@
-from vellum.workflows.nodes.bases import BaseNode
-from vellum.workflows.nodes.core import ErrorNode, InlineSubworkflowNode, MapNode, RetryNode, TemplatingNode, TryNode
-from vellum.workflows.nodes.displayable import (
-    APINode,
-    CodeExecutionNode,
-    ConditionalNode,
-    FinalOutputNode,
-    GuardrailNode,
-    InlinePromptNode,
-    NoteNode,
-    PromptDeploymentNode,
-    SearchNode,
-    SubworkflowDeploymentNode,
-    WebSearchNode,
-)
-from vellum.workflows.nodes.displayable.bases import (
-    BaseInlinePromptNode as BaseInlinePromptNode,
-    BasePromptDeploymentNode as BasePromptDeploymentNode,
-    BaseSearchNode as BaseSearchNode,
+from typing import TYPE_CHECKING
+
+from vellum.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from vellum.workflows.nodes.bases import BaseNode
+    from vellum.workflows.nodes.core import (
+        ErrorNode,
+        InlineSubworkflowNode,
+        MapNode,
+        RetryNode,
+        TemplatingNode,
+        TryNode,
+    )
+    from vellum.workflows.nodes.displayable import (
+        APINode,
+        CodeExecutionNode,
+        ConditionalNode,
+        FinalOutputNode,
+        GuardrailNode,
+        InlinePromptNode,
+        NoteNode,
+        PromptDeploymentNode,
+        SearchNode,
+        SubworkflowDeploymentNode,
+        WebSearchNode,
+    )
+    from vellum.workflows.nodes.displayable.bases import (
+        BaseInlinePromptNode as BaseInlinePromptNode,
+        BasePromptDeploymentNode as BasePromptDeploymentNode,
+        BaseSearchNode as BaseSearchNode,
+    )
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "BaseNode": "vellum.workflows.nodes.bases",
+        "ErrorNode": "vellum.workflows.nodes.core",
+        "InlineSubworkflowNode": "vellum.workflows.nodes.core",
+        "MapNode": "vellum.workflows.nodes.core",
+        "RetryNode": "vellum.workflows.nodes.core",
+        "TemplatingNode": "vellum.workflows.nodes.core",
+        "TryNode": "vellum.workflows.nodes.core",
+        "APINode": "vellum.workflows.nodes.displayable",
+        "CodeExecutionNode": "vellum.workflows.nodes.displayable",
+        "ConditionalNode": "vellum.workflows.nodes.displayable",
+        "FinalOutputNode": "vellum.workflows.nodes.displayable",
+        "GuardrailNode": "vellum.workflows.nodes.displayable",
+        "InlinePromptNode": "vellum.workflows.nodes.displayable",
+        "NoteNode": "vellum.workflows.nodes.displayable",
+        "PromptDeploymentNode": "vellum.workflows.nodes.displayable",
+        "SearchNode": "vellum.workflows.nodes.displayable",
+        "SubworkflowDeploymentNode": "vellum.workflows.nodes.displayable",
+        "WebSearchNode": "vellum.workflows.nodes.displayable",
+        "BaseInlinePromptNode": "vellum.workflows.nodes.displayable.bases",
+        "BasePromptDeploymentNode": "vellum.workflows.nodes.displayable.bases",
+        "BaseSearchNode": "vellum.workflows.nodes.displayable.bases",
+    },
 )
 
 __all__ = [
@@ -1,8 +1,10 @@
 from abc import ABC, ABCMeta
-from collections.abc import Callable as CollectionsCallable
+from collections.abc import Callable as CollectionsCallable, Mapping
+import dataclasses
 from dataclasses import field
 from functools import cached_property, reduce
 import inspect
+from queue import Queue
 from types import MappingProxyType
 from uuid import UUID, uuid4
 from typing import (
@@ -11,7 +13,9 @@ from typing import (
     Dict,
     Generic,
     Iterator,
+    List,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -22,6 +26,8 @@ from typing import (
     get_origin,
 )
 
+from pydantic import BaseModel
+
 from vellum.workflows.constants import undefined
 from vellum.workflows.descriptors.base import BaseDescriptor
 from vellum.workflows.descriptors.exceptions import InvalidExpressionException
@@ -45,7 +51,7 @@ from vellum.workflows.state.base import BaseState
 from vellum.workflows.state.context import WorkflowContext
 from vellum.workflows.types.core import MergeBehavior
 from vellum.workflows.types.generics import StateType
-from vellum.workflows.types.utils import get_class_attr_names, get_original_base, infer_types
+from vellum.workflows.types.utils import clear_type_cache, get_class_attr_names, get_original_base, infer_types
 from vellum.workflows.utils.uuids import generate_entity_id_from_path, uuid4_from_hash
 
 
@@ -71,6 +77,52 @@ def _is_annotated(cls: Type, name: str) -> Any:
     return None
 
 
+def _contains_descriptor(value: Any) -> bool:
+    """
+    Whether `resolve_value` would resolve any descriptor while traversing `value`.
+    """
+    if inspect.isclass(value):
+        return False
+
+    if isinstance(value, BaseDescriptor):
+        return True
+
+    if isinstance(value, property) or callable(value) or isinstance(value, (str, bytes)):
+        return False
+
+    if dataclasses.is_dataclass(value):
+        return any(_contains_descriptor(getattr(value, field.name)) for field in dataclasses.fields(value))
+
+    if isinstance(value, BaseModel):
+        return any(_contains_descriptor(getattr(value, key)) for key in value.dict().keys())
+
+    if isinstance(value, Mapping):
+        return any(_contains_descriptor(item) for item in value.values())
+
+    if isinstance(value, (Sequence, Set)):
+        return any(_contains_descriptor(item) for item in value)
+
+    return False
+
+
+def _is_output_unresolved(reference: OutputReference, state: BaseState) -> bool:
+    """
+    Equivalent to `is_unresolved(resolve_value(reference, state))`, without wrapping streaming outputs in a generator.
+    """
+    while True:
+        node_output = state.meta.node_outputs.get(reference, undefined)
+        if isinstance(node_output, Queue):
+            return False
+
+        if node_output is not undefined:
+            return is_unresolved(node_output)
+
+        if not state.meta.parent:
+            return True
+
+        state = state.meta.parent
+
+
 def _validate_no_parent_output_references(node_cls: Type["BaseNode"]) -> None:
     """
     Validates that the node does not reference parent class outputs.
@@ -205,6 +257,31 @@ class BaseNodeMeta(ABCMeta):
         }
         return node_class
 
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            cls._clear_awaited_attributes()
+        if not name.startswith("_") or name == "__annotations__":
+            clear_type_cache(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if not name.startswith("_"):
+            cls._clear_awaited_attributes()
+        if not name.startswith("_") or name == "__annotations__":
+            clear_type_cache(cls)
+
+    def _clear_awaited_attributes(cls) -> None:
+        """
+        Drops the attributes cached by `BaseNode.Trigger` for this node and every node that inherits from it.
+        """
+        if "__awaited_attributes__" in cls.__dict__:
+            type.__delattr__(cls, "__awaited_attributes__")
+
+        for subclass in type.__subclasses__(cls):
+            if isinstance(subclass, BaseNodeMeta):
+                subclass._clear_awaited_attributes()
+
     @property
     def _localns(cls) -> Dict[str, Any]:
         from vellum.workflows.workflows.base import BaseWorkflow
@@ -374,12 +451,14 @@ class BaseNode(Generic[StateType], ABC, BaseExecutable, metaclass=BaseNodeMeta):
                 return False
 
             if cls.merge_behavior == MergeBehavior.AWAIT_ATTRIBUTES:
-                for descriptor in cls.node_class:
-                    if not descriptor.instance:
+                for name, instance in cls._get_awaited_attributes():
+                    if type(instance) is OutputReference:
+                        if _is_output_unresolved(instance, state):
+                            return False
                         continue
 
                     try:
-                        resolved_value = resolve_value(descriptor.instance, state, path=descriptor.name)
+                        resolved_value = resolve_value(instance, state, path=name)
                     except InvalidExpressionException as e:
                         raise NodeException(
                             message=str(e),
@@ -400,17 +479,8 @@ class BaseNode(Generic[StateType], ABC, BaseExecutable, metaclass=BaseNodeMeta):
                 when all of its dependencies have invoked this node.
                 """
                 # Check if all dependencies have invoked this node
-                dependencies_invoked = state.meta.node_execution_cache._dependencies_invoked.get(node_span_id, set())
-                node_classes_invoked = {
-                    state.meta.node_execution_cache.__node_execution_lookup__[dep]
-                    for dep in dependencies_invoked
-                    if dep in state.meta.node_execution_cache.__node_execution_lookup__
-                }
-                if len(node_classes_invoked) != len(dependencies):
-                    return False
-
-                all_deps_invoked = all(dep in node_classes_invoked for dep in dependencies)
-                return all_deps_invoked
+                node_classes_invoked = state.meta.node_execution_cache.get_dependency_classes_invoked(node_span_id)
+                return node_classes_invoked == dependencies
 
             if cls.merge_behavior == MergeBehavior.CUSTOM:
                 return False
@@ -420,6 +490,31 @@ class BaseNode(Generic[StateType], ABC, BaseExecutable, metaclass=BaseNodeMeta):
                 code=WorkflowErrorCode.INVALID_INPUTS,
             )
 
+        @classmethod
+        def _get_awaited_attributes(cls) -> List[Tuple[str, Any]]:
+            """
+            Returns the name and value of each node attribute that AWAIT_ATTRIBUTES has to resolve to determine
+            whether the node is ready. Attributes that do not reference any descriptor always resolve to themselves,
+            so they are only checked once. The result is cached on the node class until one of its attributes is set.
+            """
+            node_class = cls.node_class
+            awaited_attributes = node_class.__dict__.get("__awaited_attributes__")
+            if awaited_attributes is not None:
+                return awaited_attributes
+
+            awaited_attributes = []
+            for descriptor in node_class:
+                if not descriptor.instance:
+                    continue
+
+                if not _contains_descriptor(descriptor.instance) and not is_unresolved(descriptor.instance):
+                    continue
+
+                awaited_attributes.append((descriptor.name, descriptor.instance))
+
+            type.__setattr__(node_class, "__awaited_attributes__", awaited_attributes)
+            return awaited_attributes
+
         @classmethod
         def _queue_node_execution(
             cls, state: StateType, dependencies: Set["Type[BaseNode]"], invoked_by: Optional[UUID] = None
@@ -441,7 +536,7 @@ class BaseNode(Generic[StateType], ABC, BaseExecutable, metaclass=BaseNodeMeta):
             if cls.merge_behavior not in {MergeBehavior.AWAIT_ANY, MergeBehavior.AWAIT_ALL}:
                 # Keep track of the dependencies that have invoked this node
                 # This would be needed while climbing the history in the loop
-                state.meta.node_execution_cache._dependencies_invoked[execution_id].add(invoked_by)
+                state.meta.node_execution_cache._add_invoked_dependency(execution_id, invoked_by)
                 return execution_id
 
             # For AWAIT_ANY in workflows, we need to detect if the node is in a loop
@@ -578,6 +673,23 @@ class BaseNode(Generic[StateType], ABC, BaseExecutable, metaclass=BaseNodeMeta):
     def run(self) -> NodeRunResponse:
         return self.Outputs()
 
+    async def arun(self) -> NodeRunResponse:
+        """
+        An optional async counterpart to `run`, awaited on the event loop when the workflow is run with `astream` or
+        `arun`. Nodes that don't implement it have `run` called on the workflow context's node executor instead.
+        """
+        return self.run()
+
+    @classmethod
+    def __has_arun__(cls) -> bool:
+        """
+        Whether this node's own `arun` should be awaited instead of calling `run`. A subclass that overrides `run`
+        without also overriding `arun` keeps running `run`, so that its override isn't skipped.
+        """
+        run_owner = next(base for base in cls.__mro__ if "run" in base.__dict__)
+        arun_owner = next(base for base in cls.__mro__ if "arun" in base.__dict__)
+        return arun_owner is not BaseNode and issubclass(arun_owner, run_owner)
+
     def __cancel__(self, message: str) -> None:
         """
         Called when the node should be cancelled. Override this method to propagate
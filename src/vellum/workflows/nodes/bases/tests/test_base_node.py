@@ -1,6 +1,6 @@
 import pytest
 from uuid import UUID
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, Optional, Set, Type
 
 from vellum.client.core.pydantic_utilities import UniversalBaseModel
 from vellum.client.types.string_vellum_value_request import StringVellumValueRequest
@@ -413,6 +413,37 @@ def test_base_node__trigger_should_initiate__invalid_merge_behavior():
     assert "INVALID_MERGE_BEHAVIOR" in workflow_rejected_event.error.message
 
 
+def test_base_node__trigger_should_initiate__awaits_attributes_set_after_first_check():
+    """
+    Tests that AWAIT_ATTRIBUTES readiness reflects node attributes that are set after the node was first checked.
+    """
+
+    # GIVEN an upstream node with an output
+    class UpstreamNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            value: str
+
+    # AND a downstream node that starts with constant attributes
+    class DownstreamNode(BaseNode):
+        constant = "hello"
+
+    # AND a state where the upstream node has not produced its output yet
+    state = BaseState()
+    dependencies: Set[Type[BaseNode]] = {UpstreamNode}
+
+    # WHEN we check the node before and after pointing its attribute at the upstream output
+    ready_with_constant = DownstreamNode.Trigger.should_initiate(state, dependencies, UUID(int=1))
+    setattr(DownstreamNode, "constant", UpstreamNode.Outputs.value)
+    ready_before_output = DownstreamNode.Trigger.should_initiate(state, dependencies, UUID(int=2))
+    state.meta.node_outputs[UpstreamNode.Outputs.value] = "world"
+    ready_after_output = DownstreamNode.Trigger.should_initiate(state, dependencies, UUID(int=3))
+
+    # THEN the node should only wait on the upstream output once the attribute references it
+    assert ready_with_constant is True
+    assert ready_before_output is False
+    assert ready_after_output is True
+
+
 def test_base_node__int_input_preserves_type_when_float_passed():
     """
     Tests that an int workflow input is correctly coerced to int when a float value is passed.
@@ -1,11 +1,29 @@
-from vellum.workflows.nodes.displayable.bases.api_node import BaseAPINode
+from typing import TYPE_CHECKING
 
-from .error_node import ErrorNode
-from .inline_subworkflow_node import InlineSubworkflowNode
-from .map_node import MapNode
-from .retry_node import RetryNode
-from .templating_node import TemplatingNode
-from .try_node import TryNode
+from vellum.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from vellum.workflows.nodes.displayable.bases.api_node import BaseAPINode
+
+    from .error_node import ErrorNode
+    from .inline_subworkflow_node import InlineSubworkflowNode
+    from .map_node import MapNode
+    from .retry_node import RetryNode
+    from .templating_node import TemplatingNode
+    from .try_node import TryNode
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "BaseAPINode": "vellum.workflows.nodes.displayable.bases.api_node",
+        "ErrorNode": ".error_node",
+        "InlineSubworkflowNode": ".inline_subworkflow_node",
+        "MapNode": ".map_node",
+        "RetryNode": ".retry_node",
+        "TemplatingNode": ".templating_node",
+        "TryNode": ".try_node",
+    },
+)
 
 __all__ = [
     "BaseAPINode",
@@ -1,4 +1,3 @@
-from threading import Event as ThreadingEvent
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Generic, Iterator, Optional, Set, Tuple, Type, TypeVar, Union
 
 from vellum.workflows.constants import undefined
@@ -12,7 +11,7 @@ from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
 from vellum.workflows.references import OutputReference
 from vellum.workflows.state.base import BaseState
 from vellum.workflows.state.context import WorkflowContext
-from vellum.workflows.types.core import EntityInputsInterface
+from vellum.workflows.types.core import EntityInputsInterface, ObservableCancelSignal
 from vellum.workflows.types.generics import InputsType, StateType
 from vellum.workflows.workflows.event_filters import all_workflow_event_filter
 
@@ -72,7 +71,7 @@ class InlineSubworkflowNode(
     subworkflow_inputs: ClassVar[Union[EntityInputsInterface, BaseInputs, Type[undefined]]] = undefined
 
     def run(self) -> Iterator[BaseOutput]:
-        self._child_cancel_signal = ThreadingEvent()
+        self._child_cancel_signal = ObservableCancelSignal()
 
         with execution_context(parent_context=get_parent_context()):
             subworkflow = self.subworkflow(
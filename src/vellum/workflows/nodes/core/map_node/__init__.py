@@ -1,5 +1,21 @@
+from .executors import (
+    BaseMapNodeExecutor,
+    BaseMapNodeWorkQueue,
+    ProcessPoolMapNodeExecutor,
+    SqliteMapNodeWorkQueue,
+    ThreadMapNodeExecutor,
+    WorkQueueMapNodeExecutor,
+    run_map_node_worker,
+)
 from .node import MapNode
 
 __all__ = [
+    "BaseMapNodeExecutor",
+    "BaseMapNodeWorkQueue",
     "MapNode",
+    "ProcessPoolMapNodeExecutor",
+    "SqliteMapNodeWorkQueue",
+    "ThreadMapNodeExecutor",
+    "WorkQueueMapNodeExecutor",
+    "run_map_node_worker",
 ]
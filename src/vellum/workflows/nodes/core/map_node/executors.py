@@ -0,0 +1,624 @@
+from abc import ABC, abstractmethod
+import json
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnContext
+from multiprocessing.process import BaseProcess
+import os
+import queue
+import sqlite3
+import tempfile
+from threading import BoundedSemaphore, Event as ThreadingEvent, Lock, Thread
+from uuid import UUID, uuid4
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from vellum.utils.json_encoder import VellumJsonEncoder
+from vellum.workflows.context import get_execution_context
+from vellum.workflows.errors.types import WorkflowError, WorkflowErrorCode
+from vellum.workflows.events.workflow import (
+    WorkflowEvent,
+    WorkflowExecutionFulfilledBody,
+    WorkflowExecutionFulfilledEvent,
+    WorkflowExecutionInitiatedBody,
+    WorkflowExecutionInitiatedEvent,
+    WorkflowExecutionPausedBody,
+    WorkflowExecutionPausedEvent,
+    WorkflowExecutionRejectedBody,
+    WorkflowExecutionRejectedEvent,
+)
+from vellum.workflows.exceptions import NodeException
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.types.core import CancelSignal, ObservableCancelSignal
+from vellum.workflows.types.utils import get_class_by_qualname
+
+if TYPE_CHECKING:
+    from vellum.workflows.nodes.core.map_node.node import MapNode
+    from vellum.workflows.workflows.base import BaseWorkflow
+
+# Every iteration of a batch reports `(index, event)` pairs, followed by `(index, None)` once it is done
+MapNodeBatchEvent = Tuple[int, Optional[WorkflowEvent]]
+
+# The messages that remote workers send back for each iteration, made of JSON serializable values:
+# ("initiated", index), ("fulfilled", index, outputs), ("rejected", index, message, code) and ("paused", index)
+_IterationMessage = Tuple[Any, ...]
+
+
+class BaseMapNodeExecutor(ABC):
+    """
+    Runs the iterations of MapNodes. A MapNode calls `run_batch` from up to `max_concurrency` of its own threads at
+    once, so executors only need to run one batch per call. Executors are reusable across nodes and runs.
+    """
+
+    @abstractmethod
+    def run_batch(
+        self,
+        node: "MapNode",
+        items: List[Any],
+        batch: range,
+        cancel_signal: ObservableCancelSignal,
+    ) -> Iterator[MapNodeBatchEvent]:
+        """
+        Runs the iterations of `batch` in index order, yielding the events of each iteration's subworkflow followed
+        by `(index, None)`. Iterations that haven't started once `cancel_signal` is set should be skipped.
+        """
+        pass
+
+
+class ThreadMapNodeExecutor(BaseMapNodeExecutor):
+    """
+    Runs iterations on the MapNode's own threads, in the current process. This is the default executor.
+    """
+
+    def run_batch(
+        self,
+        node: "MapNode",
+        items: List[Any],
+        batch: range,
+        cancel_signal: ObservableCancelSignal,
+    ) -> Iterator[MapNodeBatchEvent]:
+        context = WorkflowContext.create_from(node._context)
+        for index in batch:
+            if cancel_signal.is_set():
+                return
+
+            for event in node._stream_subworkflow(items=items, index=index, context=context):
+                yield index, event
+            yield index, None
+
+
+def _get_class_path(cls: type) -> str:
+    if cls.__qualname__ != cls.__name__:
+        raise NodeException(
+            message=f"{cls.__qualname__} must be defined at the top level of its module to run in another process",
+            code=WorkflowErrorCode.INVALID_INPUTS,
+        )
+
+    return f"{cls.__module__}.{cls.__name__}"
+
+
+def _create_batch_request(node: "MapNode", items: List[Any], batch: range) -> Dict[str, Any]:
+    state = node.state
+    parent_workflow = state.meta.workflow_definition
+    return {
+        "subworkflow": _get_class_path(node.subworkflow),
+        "parent_workflow": _get_class_path(parent_workflow),
+        "parent_state": json.loads(json.dumps(state, cls=VellumJsonEncoder)),
+        # Only the batch's own items are sent, so that payloads don't grow with the total number of items
+        "items": items[batch.start : batch.stop],
+        "start": batch.start,
+        "stop": batch.stop,
+    }
+
+
+def _run_batch_request(
+    request: Dict[str, Any], cancel_signal: Optional[CancelSignal] = None
+) -> Iterator[_IterationMessage]:
+    """
+    Runs the iterations of a batch request in the current process, on behalf of a remote executor's worker.
+    """
+
+    subworkflow_class: Type["BaseWorkflow"] = get_class_by_qualname(request["subworkflow"])
+    parent_workflow_class: Type["BaseWorkflow"] = get_class_by_qualname(request["parent_workflow"])
+    parent_state = parent_workflow_class.deserialize_state(request["parent_state"])
+    inputs_class = subworkflow_class.get_inputs_class()
+    items = request["items"]
+    start = request["start"]
+
+    for index in range(start, request["stop"]):
+        if cancel_signal is not None and cancel_signal.is_set():
+            return
+
+        yield ("initiated", index)
+        subworkflow = subworkflow_class(parent_state=parent_state)
+        terminal_event = subworkflow.run(
+            inputs=inputs_class(index=index, item=items[index - start], items=items),
+            cancel_signal=cancel_signal,
+        )
+        if terminal_event.name == "workflow.execution.fulfilled":
+            yield ("fulfilled", index, {descriptor.name: value for descriptor, value in terminal_event.outputs})
+        elif terminal_event.name == "workflow.execution.rejected":
+            yield ("rejected", index, terminal_event.error.message, terminal_event.error.code.value)
+        else:
+            yield ("paused", index)
+
+
+class _RemoteMapNodeExecutor(BaseMapNodeExecutor):
+    """
+    Runs each batch in a worker outside of the current process. Workers import the subworkflow and the parent
+    workflow by their class path, so both must be defined at the top level of a module, and rehydrate the parent
+    state from JSON. Only each iteration's initiated and terminal events are reported back, and node output mocks
+    aren't applied. Each batch only carries its own items, so the `items` input of remote iterations holds the items
+    of their batch rather than all of the node's items.
+    """
+
+    def run_batch(
+        self,
+        node: "MapNode",
+        items: List[Any],
+        batch: range,
+        cancel_signal: ObservableCancelSignal,
+    ) -> Iterator[MapNodeBatchEvent]:
+        span_ids: Dict[int, UUID] = {}
+        done_index = batch.start - 1
+        try:
+            request = _create_batch_request(node, items, batch)
+            for message in self._run_request(request, cancel_signal):
+                index = message[1]
+                yield index, self._create_event(node, items, message, span_ids.setdefault(index, uuid4()))
+                if message[0] != "initiated":
+                    done_index = index
+                    yield index, None
+        except Exception as e:
+            if cancel_signal.is_set() or done_index + 1 >= batch.stop:
+                return
+
+            if isinstance(e, NodeException):
+                error_message, code = e.message, e.code
+            else:
+                # Items or state that can't be sent to a worker fail here, before any of the batch has run
+                error_message, code = f"Failed to run the MapNode batch: {e}", WorkflowErrorCode.NODE_EXECUTION
+
+            index = done_index + 1
+            yield index, self._create_event(
+                node, items, ("rejected", index, error_message, code.value), span_ids.setdefault(index, uuid4())
+            )
+
+    @abstractmethod
+    def _run_request(
+        self, request: Dict[str, Any], cancel_signal: ObservableCancelSignal
+    ) -> Iterator[_IterationMessage]:
+        pass
+
+    def _create_event(
+        self, node: "MapNode", items: List[Any], message: _IterationMessage, span_id: UUID
+    ) -> WorkflowEvent:
+        execution = get_execution_context()
+        kind, index = message[0], message[1]
+        if kind == "initiated":
+            return WorkflowExecutionInitiatedEvent(
+                trace_id=execution.trace_id,
+                span_id=span_id,
+                body=WorkflowExecutionInitiatedBody(
+                    workflow_definition=node.subworkflow,
+                    inputs=node.subworkflow.get_inputs_class()(index=index, item=items[index], items=items),
+                ),
+                parent=execution.parent_context,
+            )
+
+        if kind == "fulfilled":
+            return WorkflowExecutionFulfilledEvent(
+                trace_id=execution.trace_id,
+                span_id=span_id,
+                body=WorkflowExecutionFulfilledBody(
+                    workflow_definition=node.subworkflow,
+                    outputs=node.subworkflow.Outputs(**message[2]),
+                ),
+                parent=execution.parent_context,
+            )
+
+        if kind == "rejected":
+            return WorkflowExecutionRejectedEvent(
+                trace_id=execution.trace_id,
+                span_id=span_id,
+                body=WorkflowExecutionRejectedBody(
+                    workflow_definition=node.subworkflow,
+                    error=WorkflowError(message=message[2], code=WorkflowErrorCode(message[3])),
+                ),
+                parent=execution.parent_context,
+            )
+
+        return WorkflowExecutionPausedEvent(
+            trace_id=execution.trace_id,
+            span_id=span_id,
+            body=WorkflowExecutionPausedBody(workflow_definition=node.subworkflow, external_inputs=[]),
+            parent=execution.parent_context,
+        )
+
+
+def _process_worker_main(connection: Connection) -> None:
+    connection.send("ready")
+
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+
+        if request is None:
+            return
+
+        try:
+            for message in _run_batch_request(request):
+                connection.send(message)
+        except Exception as e:
+            connection.send(("error", f"Failed to run the MapNode batch in a worker process: {e}"))
+
+        connection.send(("done",))
+
+
+class _ProcessWorker:
+    def __init__(self, context: SpawnContext) -> None:
+        self.connection, child_connection = context.Pipe()
+        self.process: BaseProcess = context.Process(target=_process_worker_main, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+
+    def wait_until_ready(self) -> None:
+        try:
+            self.connection.recv()
+        except EOFError as e:
+            self.kill()
+            raise NodeException(
+                message=f"MapNode worker process failed to start with exit code {self.process.exitcode}",
+                code=WorkflowErrorCode.INTERNAL_ERROR,
+            ) from e
+
+    def interrupt(self) -> None:
+        # Called from another thread, which then sees the pipe close and discards the worker
+        if self.process.is_alive():
+            self.process.kill()
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+        self.connection.close()
+
+
+def _stop_process_workers(workers: List[_ProcessWorker], lock: Lock) -> None:
+    with lock:
+        stopped_workers = list(workers)
+        workers.clear()
+
+    for worker in stopped_workers:
+        worker.stop()
+
+
+class ProcessPoolMapNodeExecutor(_RemoteMapNodeExecutor):
+    """
+    Runs each batch in one of a pool of warm worker processes, so that CPU bound subworkflows aren't limited to
+    a single core by the GIL.
+
+    max_workers: Optional[int] = None - The maximum number of worker processes. Defaults to the number of CPUs.
+
+    Items and outputs are sent between processes, so they must be picklable, and every batch carries its items
+    along with the parent state. Cancelling a MapNode kills the workers running its batches. Workers are
+    started with the `spawn` method, so scripts that use a pool must guard their entry point with
+    `if __name__ == "__main__":`, as with `concurrent.futures.ProcessPoolExecutor`.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        self._context = multiprocessing.get_context("spawn")
+        self._idle_workers: "queue.LifoQueue[_ProcessWorker]" = queue.LifoQueue()
+        self._available_workers = BoundedSemaphore(self.max_workers)
+        self._workers: List[_ProcessWorker] = []
+        self._lock = Lock()
+        self._is_shutdown = False
+
+        # Stops the workers once the executor is garbage collected or the interpreter exits, without keeping it alive
+        weakref.finalize(self, _stop_process_workers, self._workers, self._lock)
+
+    def shutdown(self) -> None:
+        """Stops every worker process. Batches that are in flight are killed."""
+        with self._lock:
+            self._is_shutdown = True
+
+        _stop_process_workers(self._workers, self._lock)
+
+    def _run_request(
+        self, request: Dict[str, Any], cancel_signal: ObservableCancelSignal
+    ) -> Iterator[_IterationMessage]:
+        if self._is_shutdown:
+            raise NodeException(
+                message="Cannot run a MapNode batch in a ProcessPoolMapNodeExecutor that has been shut down",
+                code=WorkflowErrorCode.INTERNAL_ERROR,
+            )
+
+        with self._available_workers:
+            worker = self._acquire_worker()
+            is_done = False
+            cancel_signal.add_callback(worker.interrupt)
+            try:
+                worker.connection.send(request)
+                while True:
+                    try:
+                        message = worker.connection.recv()
+                    except (EOFError, OSError) as e:
+                        raise NodeException(
+                            message=f"MapNode worker process exited unexpectedly with exit code "
+                            f"{worker.process.exitcode}",
+                            code=WorkflowErrorCode.NODE_EXECUTION,
+                        ) from e
+
+                    if message[0] == "done":
+                        is_done = True
+                        break
+                    if message[0] == "error":
+                        raise NodeException(message=message[1], code=WorkflowErrorCode.NODE_EXECUTION)
+
+                    yield message
+            finally:
+                cancel_signal.remove_callback(worker.interrupt)
+                if is_done and worker.process.is_alive():
+                    self._idle_workers.put(worker)
+                else:
+                    self._discard_worker(worker)
+
+    def _acquire_worker(self) -> _ProcessWorker:
+        while True:
+            try:
+                worker = self._idle_workers.get_nowait()
+            except queue.Empty:
+                return self._start_worker()
+
+            if worker.process.is_alive():
+                return worker
+
+            self._discard_worker(worker)
+
+    def _start_worker(self) -> _ProcessWorker:
+        worker = _ProcessWorker(self._context)
+        worker.wait_until_ready()
+        with self._lock:
+            self._workers.append(worker)
+
+        return worker
+
+    def _discard_worker(self, worker: _ProcessWorker) -> None:
+        worker.kill()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+
+
+class BaseMapNodeWorkQueue(ABC):
+    """
+    A queue of MapNode batches shared by a WorkQueueMapNodeExecutor and the workers that run them, for example
+    backed by a message broker that workers on other machines consume from. Jobs and results are JSON strings.
+    """
+
+    @abstractmethod
+    def put_job(self, payload: str) -> str:
+        """Enqueues a job, returning its id."""
+        pass
+
+    @abstractmethod
+    def claim_job(self) -> Optional[Tuple[str, str]]:
+        """Claims the oldest pending job for a worker, returning its id and payload, or None if there is none."""
+        pass
+
+    @abstractmethod
+    def put_result(self, job_id: str, payload: str) -> None:
+        pass
+
+    @abstractmethod
+    def get_results(self, job_id: str, after: int) -> List[Tuple[int, str]]:
+        """Returns the results of a job that were put after the result numbered `after`, in order."""
+        pass
+
+    @abstractmethod
+    def cancel_job(self, job_id: str) -> None:
+        pass
+
+    @abstractmethod
+    def is_cancelled(self, job_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def delete_job(self, job_id: str) -> None:
+        pass
+
+
+class SqliteMapNodeWorkQueue(BaseMapNodeWorkQueue):
+    """
+    A work queue stored in a SQLite database, that any number of local processes can share. Meant for tests and
+    single machine setups. If no `path` is given, a temporary database is created.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="vellum-map-node-queue-", suffix=".sqlite3")
+            os.close(fd)
+
+        self._path = path
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                id TEXT NOT NULL UNIQUE,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, seq);
+            CREATE TABLE IF NOT EXISTS results (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL,
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS results_job_id ON results (job_id, seq);
+            """
+        )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def put_job(self, payload: str) -> str:
+        job_id = str(uuid4())
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO jobs (id, status, payload) VALUES (?, 'PENDING', ?)",
+                (job_id, payload),
+            )
+        return job_id
+
+    def claim_job(self) -> Optional[Tuple[str, str]]:
+        with self._lock:
+            # Other processes may be claiming jobs at the same time, so the job is selected and claimed atomically
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT id, payload FROM jobs WHERE status = 'PENDING' ORDER BY seq LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    self._connection.execute("UPDATE jobs SET status = 'RUNNING' WHERE id = ?", (row[0],))
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+        return (row[0], row[1]) if row is not None else None
+
+    def put_result(self, job_id: str, payload: str) -> None:
+        with self._lock:
+            self._connection.execute("INSERT INTO results (job_id, payload) VALUES (?, ?)", (job_id, payload))
+
+    def get_results(self, job_id: str, after: int) -> List[Tuple[int, str]]:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT seq, payload FROM results WHERE job_id = ? AND seq > ? ORDER BY seq",
+                (job_id, after),
+            ).fetchall()
+
+    def cancel_job(self, job_id: str) -> None:
+        with self._lock:
+            self._connection.execute("UPDATE jobs SET status = 'CANCELLED' WHERE id = ?", (job_id,))
+
+    def is_cancelled(self, job_id: str) -> bool:
+        with self._lock:
+            row = self._connection.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row is None or row[0] == "CANCELLED"
+
+    def delete_job(self, job_id: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM results WHERE job_id = ?", (job_id,))
+            self._connection.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+
+class WorkQueueMapNodeExecutor(_RemoteMapNodeExecutor):
+    """
+    Puts each batch on a work queue, for workers started with `run_map_node_worker` to run, possibly on other
+    machines, and waits for their results.
+
+    work_queue: BaseMapNodeWorkQueue - The queue shared with the workers.
+    poll_interval: float = 0.1 - The number of seconds to wait between checks for new results.
+
+    Items and outputs are sent to and from workers as JSON, and every batch carries its items along with the parent
+    state. Cancelling a MapNode cancels its queued jobs, and workers stop the batches they are running.
+    """
+
+    def __init__(self, work_queue: BaseMapNodeWorkQueue, poll_interval: float = 0.1) -> None:
+        self.work_queue = work_queue
+        self.poll_interval = poll_interval
+
+    def _run_request(
+        self, request: Dict[str, Any], cancel_signal: ObservableCancelSignal
+    ) -> Iterator[_IterationMessage]:
+        job_id = self.work_queue.put_job(json.dumps(request, cls=VellumJsonEncoder))
+        after = 0
+        is_done = False
+        try:
+            while not cancel_signal.is_set():
+                for seq, payload in self.work_queue.get_results(job_id, after):
+                    after = seq
+                    message = json.loads(payload)
+                    if message[0] == "done":
+                        is_done = True
+                        return
+                    if message[0] == "error":
+                        raise NodeException(message=message[1], code=WorkflowErrorCode.NODE_EXECUTION)
+
+                    yield tuple(message)
+
+                cancel_signal.wait(self.poll_interval)
+        finally:
+            if is_done:
+                self.work_queue.delete_job(job_id)
+            else:
+                self.work_queue.cancel_job(job_id)
+
+
+def _watch_job_cancellation(
+    work_queue: BaseMapNodeWorkQueue,
+    job_id: str,
+    cancel_signal: ThreadingEvent,
+    is_done: ThreadingEvent,
+    poll_interval: float,
+) -> None:
+    while not is_done.wait(poll_interval):
+        if work_queue.is_cancelled(job_id):
+            cancel_signal.set()
+            return
+
+
+def run_map_node_worker(
+    work_queue: BaseMapNodeWorkQueue,
+    poll_interval: float = 0.1,
+    stop_signal: Optional[ThreadingEvent] = None,
+) -> None:
+    """
+    Runs the MapNode batches put on `work_queue` by a WorkQueueMapNodeExecutor, one at a time, until `stop_signal`
+    is set. Start as many workers as needed, in processes that can import the mapped subworkflows.
+    """
+
+    stop_signal = stop_signal or ThreadingEvent()
+    while not stop_signal.is_set():
+        job = work_queue.claim_job()
+        if job is None:
+            stop_signal.wait(poll_interval)
+            continue
+
+        job_id, payload = job
+        cancel_signal = ThreadingEvent()
+        is_done = ThreadingEvent()
+        watcher = Thread(
+            target=_watch_job_cancellation,
+            args=(work_queue, job_id, cancel_signal, is_done, poll_interval),
+            daemon=True,
+        )
+        watcher.start()
+        try:
+            for message in _run_batch_request(json.loads(payload), cancel_signal):
+                work_queue.put_result(job_id, json.dumps(message, cls=VellumJsonEncoder))
+        except Exception as e:
+            error_message = f"Failed to run the MapNode batch in a worker: {e}"
+            work_queue.put_result(job_id, json.dumps(("error", error_message)))
+        finally:
+            is_done.set()
+            work_queue.put_result(job_id, json.dumps(("done",)))
@@ -1,15 +1,18 @@
 from collections import defaultdict
 import concurrent.futures
 import logging
-from queue import Empty, Queue
+import os
+from queue import Full, Queue
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Dict,
     Generic,
     Iterator,
     List,
     Optional,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -25,15 +28,17 @@ from vellum.workflows.events.workflow import is_workflow_event
 from vellum.workflows.exceptions import NodeException
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases.base_adornment_node import BaseAdornmentNode
+from vellum.workflows.nodes.core.map_node.executors import BaseMapNodeExecutor, ThreadMapNodeExecutor
 from vellum.workflows.nodes.utils import create_adornment
 from vellum.workflows.outputs import BaseOutputs
 from vellum.workflows.outputs.base import BaseOutput
 from vellum.workflows.references.node import NodeReference
 from vellum.workflows.references.output import OutputReference
 from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.types.core import ObservableCancelSignal
 from vellum.workflows.types.generics import StateType
 from vellum.workflows.utils.uuids import uuid4_from_hash
-from vellum.workflows.workflows.event_filters import all_workflow_event_filter
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter, workflow_event_filter
 
 if TYPE_CHECKING:
     from vellum.workflows.events.workflow import WorkflowEvent
@@ -42,18 +47,51 @@ logger = logging.getLogger(__name__)
 
 MapNodeItemType = TypeVar("MapNodeItemType")
 
+# Iterations spend most of their time waiting on nested nodes, so like `concurrent.futures.ThreadPoolExecutor` we
+# run a few more of them than there are CPUs, without starting a thread per item for large lists
+DEFAULT_MAX_CONCURRENCY = min(32, (os.cpu_count() or 1) + 4)
+
+# Used by MapNodes that don't specify an `executor`
+DEFAULT_EXECUTOR = ThreadMapNodeExecutor()
+
+# The number of subworkflow events that iterations can queue up before they wait for the node to consume them
+EVENT_QUEUE_MAXSIZE = 1024
+
+
+class _SharedItems(List[MapNodeItemType]):
+    """
+    The list of items given to every iteration. Iterations only read it, so it is shared by reference instead of
+    being deep copied along with the rest of each subworkflow's inputs.
+    """
+
+    def __deepcopy__(self, memo: Any) -> "_SharedItems[MapNodeItemType]":
+        return self
+
 
 class MapNode(BaseAdornmentNode[StateType], Generic[StateType, MapNodeItemType]):
     """
     Used to map over a list of items and execute a Subworkflow on each iteration.
 
     items: List[MapNodeItemType] - The items to map over
-    max_concurrency: Optional[int] = None - The maximum number of concurrent subworkflow executions
+    max_concurrency: Optional[int] = None - The maximum number of concurrent subworkflow executions. Defaults to
+        `DEFAULT_MAX_CONCURRENCY`.
+    batch_size: Optional[int] = None - Groups items into batches of this size. Each batch runs its iterations back to
+        back on one worker with a single WorkflowContext, and `max_concurrency` limits the number of batches running
+        at once.
+    emit_iteration_events: bool = True - Whether each iteration's subworkflow events and INITIATED/FULFILLED output
+        deltas are streamed. When False, only the final outputs are, which avoids the cost of relaying every event
+        of large maps over cheap subworkflows.
+    executor: Optional[BaseMapNodeExecutor] = None - Runs each batch of iterations. Defaults to a
+        `ThreadMapNodeExecutor`, which runs them on the node's threads. `ProcessPoolMapNodeExecutor` and
+        `WorkQueueMapNodeExecutor` run them in worker processes or remote workers instead.
     subworkflow: Type["BaseWorkflow"] - The Subworkflow to execute
     """
 
     items: List[MapNodeItemType]
     max_concurrency: Optional[int] = None
+    batch_size: Optional[int] = None
+    emit_iteration_events: bool = True
+    executor: Optional[BaseMapNodeExecutor] = None
 
     class Outputs(BaseAdornmentNode.Outputs):
         pass
@@ -69,7 +107,7 @@ class MapNode(BaseAdornmentNode[StateType], Generic[StateType, MapNodeItemType])
 
     def run(self) -> Iterator[BaseOutput]:
         mapped_items: Dict[str, List] = defaultdict(list)
-        items = self.items or []
+        items = _SharedItems(self.items or [])
         for output_descripter in self.subworkflow.Outputs:
             mapped_items[output_descripter.name] = [None] * len(items)
 
@@ -78,119 +116,169 @@ class MapNode(BaseAdornmentNode[StateType], Generic[StateType, MapNodeItemType])
                 yield BaseOutput(name=output_name, value=output_list)
             return
 
-        self._event_queue: Queue[Tuple[int, WorkflowEvent]] = Queue()
+        # Each iteration puts `None` once it is done, so that we can block on the queue until every one of them is
+        self._event_queue: Queue[Tuple[int, Optional[WorkflowEvent]]] = Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+        self._iterations_cancel_signal = ObservableCancelSignal()
         fulfilled_iterations: List[bool] = [False] * len(items)
+        completed_iterations = 0
 
-        max_workers = self.max_concurrency if self.max_concurrency is not None else len(items)
+        batch_size = self.batch_size or 1
+        batches = [range(start, min(start + batch_size, len(items))) for start in range(0, len(items), batch_size)]
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
+        max_workers = self.max_concurrency if self.max_concurrency is not None else DEFAULT_MAX_CONCURRENCY
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(batches)))
+        try:
             current_execution_context = get_execution_context()
-            for index, item in enumerate(items):
-                future = executor.submit(
-                    self._context_run_subworkflow,
-                    item=item,
-                    index=index,
+            for batch in batches:
+                executor.submit(
+                    self._context_run_batch,
+                    items=items,
+                    batch=batch,
                     current_execution_context=current_execution_context,
                 )
-                futures.append(future)
 
-            while not all(fulfilled_iterations):
-                try:
-                    map_node_event = self._event_queue.get(block=False)
-                    index = map_node_event[0]
-                    subworkflow_event = map_node_event[1]
+            while completed_iterations < len(items):
+                index, subworkflow_event = self._event_queue.get()
+                if subworkflow_event is None:
+                    completed_iterations += 1
+                    continue
 
+                if self.emit_iteration_events:
                     self._context._emit_subworkflow_event(subworkflow_event)
 
-                    if not is_workflow_event(subworkflow_event):
-                        continue
-
-                    if subworkflow_event.workflow_definition != self.subworkflow:
-                        continue
-
-                    if subworkflow_event.name == "workflow.execution.initiated":
-                        for output_name in mapped_items.keys():
-                            yield BaseOutput(name=output_name, delta=(None, index, "INITIATED"))
-
-                    elif subworkflow_event.name == "workflow.execution.fulfilled":
-                        for output_reference, output_value in subworkflow_event.outputs:
-                            if not isinstance(output_reference, OutputReference):
-                                logger.error(
-                                    "Invalid key to map node's subworkflow event outputs",
-                                    extra={"output_reference_type": type(output_reference)},
-                                )
-                                continue
-
-                            output_mapped_items = mapped_items[output_reference.name]
-                            if index < 0 or index >= len(output_mapped_items):
-                                logger.error(
-                                    "Invalid map node index",
-                                    extra={"index": index, "output_name": output_reference.name},
-                                )
-                                continue
-
-                            output_mapped_items[index] = output_value
+                if not is_workflow_event(subworkflow_event):
+                    continue
+
+                if subworkflow_event.workflow_definition != self.subworkflow:
+                    continue
+
+                if subworkflow_event.name == "workflow.execution.initiated" and self.emit_iteration_events:
+                    for output_name in mapped_items.keys():
+                        yield BaseOutput(name=output_name, delta=(None, index, "INITIATED"))
+
+                elif subworkflow_event.name == "workflow.execution.fulfilled":
+                    for output_reference, output_value in subworkflow_event.outputs:
+                        if not isinstance(output_reference, OutputReference):
+                            logger.error(
+                                "Invalid key to map node's subworkflow event outputs",
+                                extra={"output_reference_type": type(output_reference)},
+                            )
+                            continue
+
+                        output_mapped_items = mapped_items[output_reference.name]
+                        if index < 0 or index >= len(output_mapped_items):
+                            logger.error(
+                                "Invalid map node index",
+                                extra={"index": index, "output_name": output_reference.name},
+                            )
+                            continue
+
+                        output_mapped_items[index] = output_value
+                        if self.emit_iteration_events:
                             yield BaseOutput(
                                 name=output_reference.name,
                                 delta=(output_value, index, "FULFILLED"),
                             )
 
-                        fulfilled_iterations[index] = True
-
-                    elif subworkflow_event.name == "workflow.execution.paused":
-                        raise NodeException(
-                            code=WorkflowErrorCode.INVALID_OUTPUTS,
-                            message=f"Subworkflow unexpectedly paused on iteration {index}",
-                        )
-                    elif subworkflow_event.name == "workflow.execution.rejected":
-                        raise NodeException(
-                            f"Subworkflow failed on iteration {index} with error: {subworkflow_event.error.message}",
-                            code=subworkflow_event.error.code,
-                        )
-                except Empty:
-                    all_futures_done = all(future.done() for future in futures)
-
-                    if all_futures_done:
-                        if not all(fulfilled_iterations):
-                            if self._event_queue.empty():
-                                logger.warning("All threads completed but not all iterations fulfilled")
-                                break
-                        else:
-                            break
+                    fulfilled_iterations[index] = True
+
+                elif subworkflow_event.name == "workflow.execution.paused":
+                    raise NodeException(
+                        code=WorkflowErrorCode.INVALID_OUTPUTS,
+                        message=f"Subworkflow unexpectedly paused on iteration {index}",
+                    )
+                elif subworkflow_event.name == "workflow.execution.rejected":
+                    raise NodeException(
+                        f"Subworkflow failed on iteration {index} with error: {subworkflow_event.error.message}",
+                        code=subworkflow_event.error.code,
+                    )
+        finally:
+            # We stopped consuming events before every iteration was done, so the rest of them are cancelled
+            # instead of running to completion against a full queue
+            if completed_iterations < len(items):
+                self._iterations_cancel_signal.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if not all(fulfilled_iterations):
+            logger.warning("All threads completed but not all iterations fulfilled")
 
         for output_name, output_list in mapped_items.items():
             yield BaseOutput(name=output_name, value=output_list)
 
-    def _context_run_subworkflow(
-        self, item: MapNodeItemType, index: int, current_execution_context: ExecutionContext
+    def _context_run_batch(
+        self, items: List[MapNodeItemType], batch: range, current_execution_context: ExecutionContext
     ) -> None:
         parent_context = current_execution_context.parent_context
         trace_id = current_execution_context.trace_id
+        executor = self.executor or DEFAULT_EXECUTOR
+        completed_indices: Set[int] = set()
         with execution_context(parent_context=parent_context, trace_id=trace_id):
-            self._run_subworkflow(item=item, index=index)
-
-    def _run_subworkflow(self, *, item: MapNodeItemType, index: int) -> None:
-        context = WorkflowContext.create_from(self._context)
+            try:
+                for index, event in executor.run_batch(self, items, batch, self._iterations_cancel_signal):
+                    if event is None:
+                        completed_indices.add(index)
+                    if not self._put_event(index, event):
+                        return
+            finally:
+                # Iterations that were skipped or cut short still count as completed, so the node doesn't wait on them
+                for index in batch:
+                    if index not in completed_indices and not self._put_event(index, None):
+                        return
+
+    def _put_event(self, index: int, event: Optional["WorkflowEvent"]) -> bool:
+        """
+        Waits for room in the event queue, returning False without queueing the event if iterations are cancelled.
+        """
+
+        while True:
+            try:
+                self._event_queue.put((index, event), timeout=0.1)
+                return True
+            except Full:
+                if self._iterations_cancel_signal.is_set():
+                    return False
+
+    def _stream_subworkflow(
+        self, *, items: List[MapNodeItemType], index: int, context: WorkflowContext
+    ) -> Iterator["WorkflowEvent"]:
         subworkflow = self.subworkflow(
             parent_state=self.state,
             context=context,
         )
         SubworkflowInputsClass = self.subworkflow.get_inputs_class()
         events = subworkflow.stream(
-            inputs=SubworkflowInputsClass(index=index, item=item, items=self.items),
+            inputs=SubworkflowInputsClass(index=index, item=items[index], items=items),
             node_output_mocks=self._context._get_all_node_output_mocks(),
-            event_filter=all_workflow_event_filter,
+            event_filter=all_workflow_event_filter if self.emit_iteration_events else workflow_event_filter,
+            cancel_signal=self._iterations_cancel_signal,
             event_max_size=self._context.event_max_size,
         )
 
         for event in events:
-            self._event_queue.put((index, event))
+            if not self.emit_iteration_events and event.name not in (
+                "workflow.execution.fulfilled",
+                "workflow.execution.rejected",
+                "workflow.execution.paused",
+            ):
+                continue
+
+            yield event
+
+    def __cancel__(self, message: str) -> None:
+        """
+        Propagate cancellation to every iteration's subworkflow by setting their shared cancel signal.
+        """
+        if hasattr(self, "_iterations_cancel_signal"):
+            self._iterations_cancel_signal.set()
 
     @overload
     @classmethod
     def wrap(
-        cls, items: List[MapNodeItemType], max_concurrency: Optional[int] = None
+        cls,
+        items: List[MapNodeItemType],
+        max_concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        emit_iteration_events: bool = True,
     ) -> Callable[..., Type["MapNode[StateType, MapNodeItemType]"]]: ...
 
     # TODO: We should be able to do this overload automatically as we do with node attributes
@@ -201,6 +289,8 @@ class MapNode(BaseAdornmentNode[StateType], Generic[StateType, MapNodeItemType])
         cls,
         items: BaseDescriptor[List[MapNodeItemType]],
         max_concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        emit_iteration_events: bool = True,
     ) -> Callable[..., Type["MapNode[StateType, MapNodeItemType]"]]: ...
 
     @classmethod
@@ -208,8 +298,18 @@ class MapNode(BaseAdornmentNode[StateType], Generic[StateType, MapNodeItemType])
         cls,
         items: Union[List[MapNodeItemType], BaseDescriptor[List[MapNodeItemType]]],
         max_concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        emit_iteration_events: bool = True,
     ) -> Callable[..., Type["MapNode[StateType, MapNodeItemType]"]]:
-        return create_adornment(cls, attributes={"items": items, "max_concurrency": max_concurrency})
+        return create_adornment(
+            cls,
+            attributes={
+                "items": items,
+                "max_concurrency": max_concurrency,
+                "batch_size": batch_size,
+                "emit_iteration_events": emit_iteration_events,
+            },
+        )
 
     @classmethod
     def __annotate_outputs_class__(cls, outputs_class: Type[BaseOutputs], reference: OutputReference) -> None:
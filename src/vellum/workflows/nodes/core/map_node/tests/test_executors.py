@@ -0,0 +1,65 @@
+import pytest
+import threading
+
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.core.map_node.executors import (
+    SqliteMapNodeWorkQueue,
+    WorkQueueMapNodeExecutor,
+    run_map_node_worker,
+)
+from vellum.workflows.nodes.core.map_node.node import MapNode
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.workflows.base import BaseWorkflow
+
+# Remote workers import subworkflows by their class path, so they are defined at the top level of this module
+
+
+class DoubleNode(BaseNode):
+    item = MapNode.SubworkflowInputs.item
+
+    class Outputs(BaseNode.Outputs):
+        value: int
+
+    def run(self) -> Outputs:
+        return self.Outputs(value=self.item * 2)
+
+
+class DoubleWorkflow(BaseWorkflow[MapNode.SubworkflowInputs, BaseState]):
+    graph = DoubleNode
+
+    class Outputs(BaseWorkflow.Outputs):
+        value = DoubleNode.Outputs.value
+
+
+@pytest.fixture
+def work_queue_executor():
+    work_queue = SqliteMapNodeWorkQueue()
+    stop_signal = threading.Event()
+    worker = threading.Thread(
+        target=run_map_node_worker,
+        kwargs={"work_queue": work_queue, "poll_interval": 0.01, "stop_signal": stop_signal},
+    )
+    worker.start()
+    yield WorkQueueMapNodeExecutor(work_queue, poll_interval=0.01)
+    stop_signal.set()
+    worker.join()
+
+
+def test_map_node_executor__maps_items_in_order(work_queue_executor):
+    # GIVEN a map node that runs its batches through a SQLite work queue
+    class DoubleMapNode(MapNode):
+        items = list(range(10))
+        subworkflow = DoubleWorkflow
+        batch_size = 3
+
+    DoubleMapNode.executor = work_queue_executor  # type: ignore[assignment]
+
+    # WHEN the node is run
+    node = DoubleMapNode(state=BaseState())
+    outputs = list(node.run())
+
+    # THEN every item is mapped in order, along with a delta for each iteration
+    assert outputs[-1].value == [item * 2 for item in range(10)]
+    deltas = [output.delta for output in outputs if output.is_streaming]
+    assert len(deltas) == 20
+    assert all((item * 2, item, "FULFILLED") in deltas for item in range(10))
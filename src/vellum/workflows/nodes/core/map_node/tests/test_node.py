@@ -5,7 +5,7 @@ import time
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes import FinalOutputNode
 from vellum.workflows.nodes.bases import BaseNode
-from vellum.workflows.nodes.core.map_node.node import MapNode
+from vellum.workflows.nodes.core.map_node.node import DEFAULT_MAX_CONCURRENCY, MapNode
 from vellum.workflows.nodes.core.try_node.node import TryNode
 from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
 from vellum.workflows.state.base import BaseState, StateMeta
@@ -327,3 +327,87 @@ def test_map_node__output_ids():
         subworkflow = SimpleMapNodeWorkflow
 
     assert len(TestMapNode.__output_ids__) == 1
+
+
+def test_map_node__default_concurrency_is_bounded():
+    # GIVEN a subworkflow that records how many iterations are running at once
+    lock = threading.Lock()
+    running = 0
+    peak_running = 0
+
+    class CountingNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+
+        class Outputs(BaseOutputs):
+            value: int
+
+        def run(self) -> Outputs:
+            nonlocal running, peak_running
+            with lock:
+                running += 1
+                peak_running = max(peak_running, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return self.Outputs(value=self.item * 2)
+
+    class CountingWorkflow(BaseWorkflow[MapNode.SubworkflowInputs, BaseState]):
+        graph = CountingNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            value = CountingNode.Outputs.value
+
+    # AND a map node over more items than the default concurrency, without a max_concurrency
+    item_count = DEFAULT_MAX_CONCURRENCY * 3
+
+    class CountingMapNode(MapNode):
+        items = list(range(item_count))
+        subworkflow = CountingWorkflow
+
+    # WHEN we run the map node
+    outputs = list(CountingMapNode(state=BaseState()).run())
+
+    # THEN every item should have been mapped in order
+    assert outputs[-1] == BaseOutput(name="value", value=[item * 2 for item in range(item_count)])
+
+    # AND no more than the default concurrency of iterations should have run at once
+    assert 1 < peak_running <= DEFAULT_MAX_CONCURRENCY
+
+
+def test_map_node__batch_size_shares_context_within_batch():
+    # GIVEN a subworkflow that records the context of each iteration
+    context_ids = {}
+
+    class RecordingNode(BaseNode):
+        item = MapNode.SubworkflowInputs.item
+        index = MapNode.SubworkflowInputs.index
+
+        class Outputs(BaseOutputs):
+            value: int
+
+        def run(self) -> Outputs:
+            context_ids[self.index] = id(self._context)
+            return self.Outputs(value=self.item * 10)
+
+    class RecordingWorkflow(BaseWorkflow[MapNode.SubworkflowInputs, BaseState]):
+        graph = RecordingNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            value = RecordingNode.Outputs.value
+
+    # AND a map node that runs its items in batches of 3
+    class BatchedMapNode(MapNode):
+        items = list(range(10))
+        subworkflow = RecordingWorkflow
+        batch_size = 3
+
+    # WHEN we run the map node
+    outputs = list(BatchedMapNode(state=BaseState()).run())
+
+    # THEN the outputs should still be assembled in index order
+    assert outputs[-1] == BaseOutput(name="value", value=[item * 10 for item in range(10)])
+
+    # AND the iterations of each batch should have shared one context
+    batch_context_ids = [{context_ids[index] for index in range(start, min(start + 3, 10))} for start in (0, 3, 6, 9)]
+    assert all(len(ids) == 1 for ids in batch_context_ids)
+    assert len(set(context_ids.values())) == 4
@@ -1,21 +1,50 @@
-from ..core.error_node import ErrorNode
-from ..core.inline_subworkflow_node import InlineSubworkflowNode
-from ..core.map_node import MapNode
-from ..core.templating_node import TemplatingNode
-from .api_node import APINode
-from .code_execution_node import CodeExecutionNode
-from .conditional_node import ConditionalNode
-from .final_output_node import FinalOutputNode
-from .guardrail_node import GuardrailNode
-from .inline_prompt_node import InlinePromptNode
-from .merge_node import MergeNode
-from .note_node import NoteNode
-from .prompt_deployment_node import PromptDeploymentNode
-from .search_node import SearchNode
-from .set_state_node import SetStateNode
-from .subworkflow_deployment_node import SubworkflowDeploymentNode
-from .tool_calling_node import ToolCallingNode
-from .web_search_node import WebSearchNode
+from typing import TYPE_CHECKING
+
+from vellum.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from ..core.error_node import ErrorNode
+    from ..core.inline_subworkflow_node import InlineSubworkflowNode
+    from ..core.map_node import MapNode
+    from ..core.templating_node import TemplatingNode
+    from .api_node import APINode
+    from .code_execution_node import CodeExecutionNode
+    from .conditional_node import ConditionalNode
+    from .final_output_node import FinalOutputNode
+    from .guardrail_node import GuardrailNode
+    from .inline_prompt_node import InlinePromptNode
+    from .merge_node import MergeNode
+    from .note_node import NoteNode
+    from .prompt_deployment_node import PromptDeploymentNode
+    from .search_node import SearchNode
+    from .set_state_node import SetStateNode
+    from .subworkflow_deployment_node import SubworkflowDeploymentNode
+    from .tool_calling_node import ToolCallingNode
+    from .web_search_node import WebSearchNode
+
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "ErrorNode": "..core.error_node",
+        "InlineSubworkflowNode": "..core.inline_subworkflow_node",
+        "MapNode": "..core.map_node",
+        "TemplatingNode": "..core.templating_node",
+        "APINode": ".api_node",
+        "CodeExecutionNode": ".code_execution_node",
+        "ConditionalNode": ".conditional_node",
+        "FinalOutputNode": ".final_output_node",
+        "GuardrailNode": ".guardrail_node",
+        "InlinePromptNode": ".inline_prompt_node",
+        "MergeNode": ".merge_node",
+        "NoteNode": ".note_node",
+        "PromptDeploymentNode": ".prompt_deployment_node",
+        "SearchNode": ".search_node",
+        "SetStateNode": ".set_state_node",
+        "SubworkflowDeploymentNode": ".subworkflow_deployment_node",
+        "ToolCallingNode": ".tool_calling_node",
+        "WebSearchNode": ".web_search_node",
+    },
+)
 
 __all__ = [
     "APINode",
@@ -1,4 +1,4 @@
-from typing import Generic, Optional, Union
+from typing import Any, Dict, Generic, Optional, Tuple, Union
 
 from vellum.workflows.constants import AuthorizationType
 from vellum.workflows.nodes.displayable.bases.api_node import BaseAPINode
@@ -36,6 +36,30 @@ class APINode(BaseAPINode[StateType], Generic[StateType]):
         merge_behavior = MergeBehavior.AWAIT_ANY
 
     def run(self) -> BaseAPINode.Outputs:
+        final_headers, bearer_token = self._get_request_headers()
+        return self._run(
+            method=self.method,
+            url=self.url,
+            data=self.data,
+            json=self.json,
+            headers=final_headers,
+            bearer_token=bearer_token,
+            timeout=self.timeout,
+        )
+
+    async def arun(self) -> BaseAPINode.Outputs:
+        final_headers, bearer_token = self._get_request_headers()
+        return await self._arun(
+            method=self.method,
+            url=self.url,
+            data=self.data,
+            json=self.json,
+            headers=final_headers,
+            bearer_token=bearer_token,
+            timeout=self.timeout,
+        )
+
+    def _get_request_headers(self) -> Tuple[Dict[str, Any], Optional[VellumSecret]]:
         self._validate()
 
         headers = self.headers or {}
@@ -63,12 +87,4 @@ class APINode(BaseAPINode[StateType], Generic[StateType]):
         ):
             final_headers["X-API-Key"] = vellum_client_wrapper.api_key
 
-        return self._run(
-            method=self.method,
-            url=self.url,
-            data=self.data,
-            json=self.json,
-            headers=final_headers,
-            bearer_token=bearer_token,
-            timeout=self.timeout,
-        )
+        return final_headers, bearer_token
@@ -1,6 +1,7 @@
-from typing import Any, Dict, Generic, Optional, Union
+from typing import Any, Dict, Generic, Optional, Tuple, Union, cast
 
-from requests import Request, RequestException, Session
+import httpx
+from requests import PreparedRequest, Request, RequestException
 from requests.exceptions import JSONDecodeError
 
 from vellum.client import ApiError
@@ -69,6 +70,11 @@ class BaseAPINode(BaseNode, Generic[StateType]):
             method=self.method, url=self.url, data=self.data, json=self.json, headers=self.headers, timeout=self.timeout
         )
 
+    async def arun(self) -> Outputs:
+        return await self._arun(
+            method=self.method, url=self.url, data=self.data, json=self.json, headers=self.headers, timeout=self.timeout
+        )
+
     def _run(
         self,
         url: str,
@@ -79,6 +85,38 @@ class BaseAPINode(BaseNode, Generic[StateType]):
         bearer_token: Optional[VellumSecret] = None,
         timeout: Optional[int] = None,
     ) -> Outputs:
+        normalized_method, is_vellum_request = self._prepare_run(method, headers, bearer_token)
+        if is_vellum_request:
+            return self._vellum_execute_api(bearer_token, json, headers, normalized_method, url, timeout)
+        else:
+            return self._local_execute_api(data, headers, json, normalized_method, url, timeout)
+
+    async def _arun(
+        self,
+        url: str,
+        method: Optional[Union[APIRequestMethod, MethodEnum]] = APIRequestMethod.GET,
+        data: Optional[Union[str, Any]] = None,
+        json: Any = None,
+        headers: Any = None,
+        bearer_token: Optional[VellumSecret] = None,
+        timeout: Optional[int] = None,
+    ) -> Outputs:
+        normalized_method, is_vellum_request = self._prepare_run(method, headers, bearer_token)
+        if is_vellum_request:
+            return await self._avellum_execute_api(bearer_token, json, headers, normalized_method, url, timeout)
+        else:
+            return await self._alocal_execute_api(data, headers, json, normalized_method, url, timeout)
+
+    def _prepare_run(
+        self,
+        method: Optional[Union[APIRequestMethod, MethodEnum]],
+        headers: Any,
+        bearer_token: Optional[VellumSecret],
+    ) -> Tuple[str, bool]:
+        """
+        Validates the node and returns the normalized HTTP method, and whether the request must be sent through
+        Vellum so that the secrets it references are resolved.
+        """
         self._validate()
 
         normalized_method = self._normalize_http_method(method) if method is not None else APIRequestMethod.GET.value
@@ -87,31 +125,13 @@ class BaseAPINode(BaseNode, Generic[StateType]):
         for header in headers or {}:
             if isinstance(headers[header], VellumSecret):
                 vellum_instance = True
-        if vellum_instance or bearer_token:
-            return self._vellum_execute_api(bearer_token, json, headers, normalized_method, url, timeout)
-        else:
-            return self._local_execute_api(data, headers, json, normalized_method, url, timeout)
+        return normalized_method, bool(vellum_instance or bearer_token)
 
     def _local_execute_api(self, data, headers, json, method, url, timeout):
-        headers = headers or {}
-        if "User-Agent" not in headers:
-            client_headers = self._context.vellum_client._client_wrapper.get_headers()
-            headers["User-Agent"] = client_headers.get("User-Agent")
-        try:
-            if data is not None:
-                prepped = Request(method=method, url=url, data=data, headers=headers).prepare()
-            elif json is not None:
-                prepped = Request(method=method, url=url, json=json, headers=headers).prepare()
-            else:
-                prepped = Request(method=method, url=url, headers=headers).prepare()
-        except Exception as e:
-            raise NodeException(f"Failed to prepare HTTP request: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
-
-        sign_request_with_env_secret(prepped)
+        prepped = self._prepare_local_request(data, headers, json, method, url)
 
         try:
-            with Session() as session:
-                response = session.send(prepped, timeout=timeout)
+            response = self._context.http_session.send(prepped, timeout=timeout)
         except RequestException as e:
             raise NodeException(f"HTTP request failed: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
         try:
@@ -125,18 +145,50 @@ class BaseAPINode(BaseNode, Generic[StateType]):
             text=response.text,
         )
 
-    def _vellum_execute_api(self, bearer_token, data, headers, method, url, timeout):
-        client_vellum_secret = ClientVellumSecret(name=bearer_token.name) if bearer_token else None
+    async def _alocal_execute_api(self, data, headers, json, method, url, timeout):
+        prepped = self._prepare_local_request(data, headers, json, method, url)
+
+        try:
+            response = await self._context.async_http_client.request(
+                cast(str, prepped.method),
+                cast(str, prepped.url),
+                headers=dict(prepped.headers),
+                content=prepped.body,
+                timeout=timeout,
+            )
+        except httpx.HTTPError as e:
+            raise NodeException(f"HTTP request failed: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
+        try:
+            json_response = response.json()
+        except ValueError:
+            json_response = None
+        return self.Outputs(
+            json=json_response,
+            headers={header: value for header, value in response.headers.items()},
+            status_code=response.status_code,
+            text=response.text,
+        )
 
+    def _prepare_local_request(self, data, headers, json, method, url) -> PreparedRequest:
         headers = headers or {}
         if "User-Agent" not in headers:
             client_headers = self._context.vellum_client._client_wrapper.get_headers()
             headers["User-Agent"] = client_headers.get("User-Agent")
+        try:
+            if data is not None:
+                prepped = Request(method=method, url=url, data=data, headers=headers).prepare()
+            elif json is not None:
+                prepped = Request(method=method, url=url, json=json, headers=headers).prepare()
+            else:
+                prepped = Request(method=method, url=url, headers=headers).prepare()
+        except Exception as e:
+            raise NodeException(f"Failed to prepare HTTP request: {e}", code=WorkflowErrorCode.PROVIDER_ERROR)
 
-        # Create request_options if timeout is specified
-        request_options = None
-        if timeout is not None:
-            request_options = RequestOptions(timeout_in_seconds=timeout)
+        sign_request_with_env_secret(prepped)
+        return prepped
+
+    def _vellum_execute_api(self, bearer_token, data, headers, method, url, timeout):
+        client_vellum_secret, headers, request_options = self._prepare_vellum_request(bearer_token, headers, timeout)
 
         try:
             vellum_response = self._context.vellum_client.execute_api(
@@ -156,3 +208,40 @@ class BaseAPINode(BaseNode, Generic[StateType]):
             status_code=vellum_response.status_code,
             text=vellum_response.text,
         )
+
+    async def _avellum_execute_api(self, bearer_token, data, headers, method, url, timeout):
+        client_vellum_secret, headers, request_options = self._prepare_vellum_request(bearer_token, headers, timeout)
+
+        try:
+            vellum_response = await self._context.async_vellum_client.execute_api(
+                url=url,
+                method=method,
+                body=data,
+                headers=headers,
+                bearer_token=client_vellum_secret,
+                request_options=request_options,
+            )
+        except ApiError as e:
+            raise NodeException(f"Failed to prepare HTTP request: {e}", code=WorkflowErrorCode.NODE_EXECUTION)
+
+        return self.Outputs(
+            json=vellum_response.json_,
+            headers={header: value for header, value in vellum_response.headers.items()},
+            status_code=vellum_response.status_code,
+            text=vellum_response.text,
+        )
+
+    def _prepare_vellum_request(self, bearer_token, headers, timeout):
+        client_vellum_secret = ClientVellumSecret(name=bearer_token.name) if bearer_token else None
+
+        headers = headers or {}
+        if "User-Agent" not in headers:
+            client_headers = self._context.vellum_client._client_wrapper.get_headers()
+            headers["User-Agent"] = client_headers.get("User-Agent")
+
+        # Create request_options if timeout is specified
+        request_options = None
+        if timeout is not None:
+            request_options = RequestOptions(timeout_in_seconds=timeout)
+
+        return client_vellum_secret, headers, request_options
@@ -1,13 +1,16 @@
 import pytest
 import os
 from unittest.mock import patch
+from typing import List
 
 from vellum.client.types.execute_api_response import ExecuteApiResponse
 from vellum.workflows.constants import APIRequestMethod
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
 from vellum.workflows.nodes.displayable.bases.api_node.node import BaseAPINode
+from vellum.workflows.state.context import WorkflowContext
 from vellum.workflows.types.core import VellumSecret
+from vellum.workflows.utils.http import create_http_session
 
 
 @pytest.mark.parametrize("method_value", ["GET", "get", APIRequestMethod.GET])
@@ -148,3 +151,30 @@ def test_local_execute_api_with_hmac_secret(requests_mock):
     assert "X-Vellum-Timestamp" in response_mock.last_request.headers
     assert "X-Vellum-Signature" in response_mock.last_request.headers
     assert result.status_code == 200
+
+
+def test_local_execute_api__reuses_connections(local_http_server):
+    # GIVEN a local server that keeps connections alive and records the client port of each request
+    client_ports: List[int] = []
+
+    def handle(request, body):
+        client_ports.append(request.client_address[1])
+        return 200, {"Content-Type": "application/json"}, b'{"ok": true}'
+
+    server_url = local_http_server(handle)
+
+    # AND an API node that calls it
+    class TestAPINode(BaseAPINode):
+        url = f"{server_url}/"
+
+    context = WorkflowContext(http_session=create_http_session())
+
+    # WHEN we run the node several times with the same context
+    results = [TestAPINode(context=context).run() for _ in range(3)]
+
+    # THEN every request succeeds
+    assert [result.json for result in results] == [{"ok": True}] * 3
+
+    # AND they were all sent over the same connection
+    assert len(client_ports) == 3
+    assert len(set(client_ports)) == 1
@@ -1,6 +1,7 @@
 from abc import abstractmethod
+from collections import deque
 from itertools import chain
-from typing import ClassVar, Generator, Generic, Iterator, List, Optional, Union, cast
+from typing import AsyncIterator, ClassVar, Deque, Generator, Generic, Iterator, List, Optional, TypeVar, Union, cast
 
 from vellum import AdHocExecutePromptEvent, ExecutePromptEvent, PromptOutput
 from vellum.client.core import RequestOptions
@@ -11,7 +12,7 @@ from vellum.workflows.events.node import NodeExecutionStreamingEvent
 from vellum.workflows.exceptions import NodeException
 from vellum.workflows.expressions.coalesce_expression import CoalesceExpression
 from vellum.workflows.nodes.bases import BaseNode
-from vellum.workflows.outputs.base import BaseOutput, BaseOutputs
+from vellum.workflows.outputs.base import AwaitingOutput, BaseOutput, BaseOutputs
 from vellum.workflows.references.output import OutputReference
 from vellum.workflows.types.core import EntityInputsInterface, MergeBehavior
 from vellum.workflows.types.generics import StateType
@@ -27,6 +28,52 @@ def _contains_reference_to_output(reference: BaseDescriptor, target_reference: O
     return False
 
 
+PromptEvent = Union[AdHocExecutePromptEvent, ExecutePromptEvent]
+PromptEventStream = Union[Iterator[AdHocExecutePromptEvent], Iterator[ExecutePromptEvent]]
+_PromptEventType = TypeVar("_PromptEventType")
+
+
+class _AsyncPromptEventStream:
+    """
+    The events of a Prompt executed with the async Vellum client, for `run` to process as they arrive. While the next
+    event hasn't arrived, iterating returns an AwaitingOutput that fetches it, which `run` yields for the
+    AsyncWorkflowRunner to await on the event loop.
+    """
+
+    def __init__(self, events: AsyncIterator[PromptEvent]) -> None:
+        self._events = events
+        self._pending: Deque[PromptEvent] = deque()
+        self._error: Optional[Exception] = None
+        self._is_done = False
+
+    def __iter__(self) -> "_AsyncPromptEventStream":
+        return self
+
+    def __next__(self) -> Union[PromptEvent, AwaitingOutput]:
+        if self._pending:
+            return self._pending.popleft()
+
+        if self._error is not None:
+            # Raised where the sync client would have raised it, so that `run` handles it the same way
+            error = self._error
+            self._error = None
+            self._is_done = True
+            raise error
+
+        if self._is_done:
+            raise StopIteration
+
+        return AwaitingOutput(self._fetch())
+
+    async def _fetch(self) -> None:
+        try:
+            self._pending.append(await self._events.__anext__())
+        except StopAsyncIteration:
+            self._is_done = True
+        except Exception as e:
+            self._error = e
+
+
 class BasePromptNode(BaseNode[StateType], Generic[StateType]):
     # Inputs that are passed to the Prompt
     prompt_inputs: ClassVar[Optional[EntityInputsInterface]] = None
@@ -39,10 +86,33 @@ class BasePromptNode(BaseNode[StateType], Generic[StateType]):
     class Outputs(BaseOutputs):
         results: List[PromptOutput]
 
+    # Set by `arun`, so that `run` executes the Prompt with the async Vellum client
+    _is_prompt_async: bool = False
+
     @abstractmethod
     def _get_prompt_event_stream(self) -> Union[Iterator[AdHocExecutePromptEvent], Iterator[ExecutePromptEvent]]:
         pass
 
+    def _run_prompt_async(self) -> Iterator[BaseOutput]:
+        """
+        Runs the node with its Prompt executed by the async Vellum client. Prompt events are awaited on the event loop
+        as they arrive, so outputs stream the same as with `run`.
+        """
+        self._is_prompt_async = True
+        return self.run()
+
+    def _stream_prompt_events_async(self, events: AsyncIterator[PromptEvent]) -> PromptEventStream:
+        return cast(PromptEventStream, _AsyncPromptEventStream(events))
+
+    def _next_prompt_event(
+        self, prompt_event_stream: Iterator[_PromptEventType]
+    ) -> Generator[BaseOutput, None, _PromptEventType]:
+        event = next(prompt_event_stream)
+        while isinstance(event, AwaitingOutput):
+            yield event
+            event = next(prompt_event_stream)
+        return event
+
     def _validate(self) -> None:
         pass
 
@@ -62,7 +132,7 @@ class BasePromptNode(BaseNode[StateType], Generic[StateType]):
             self._handle_api_error(e)
 
         try:
-            first_event = next(prompt_event_stream)
+            first_event = yield from self._next_prompt_event(prompt_event_stream)
         except ApiError as e:
             self._handle_api_error(e)
         else:
@@ -78,6 +148,10 @@ class BasePromptNode(BaseNode[StateType], Generic[StateType]):
         outputs: Optional[List[PromptOutput]] = None
         exception: Optional[NodeException] = None
         for event in prompt_event_stream:
+            if isinstance(event, AwaitingOutput):
+                yield event
+                continue
+
             if exception:
                 continue
 
@@ -3,8 +3,11 @@ import json
 from uuid import uuid4
 from typing import (
     TYPE_CHECKING,
+    Any,
+    AsyncIterator,
     Callable,
     ClassVar,
+    Dict,
     Generator,
     Generic,
     Iterator,
@@ -14,6 +17,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    cast,
 )
 
 import httpx
@@ -62,6 +66,8 @@ from vellum.workflows.exceptions import NodeException
 from vellum.workflows.nodes.displayable.bases.base_prompt_node import BasePromptNode
 from vellum.workflows.nodes.displayable.bases.utils import process_additional_prompt_outputs
 from vellum.workflows.outputs import BaseOutput
+from vellum.workflows.outputs.base import AwaitingOutput
+from vellum.workflows.references.node import NodeReference
 from vellum.workflows.types import MergeBehavior
 from vellum.workflows.types.definition import (
     ComposioToolDefinition,
@@ -203,7 +209,7 @@ class BaseInlinePromptNode(BasePromptNode[StateType], Generic[StateType]):
                 code=WorkflowErrorCode.INVALID_INPUTS,
             )
 
-    def _get_prompt_event_stream(self) -> Iterator[AdHocExecutePromptEvent]:
+    def _get_prompt_request_kwargs(self) -> Dict[str, Any]:
         input_variables, input_values = self._compile_prompt_inputs()
         execution_context = get_execution_context()
         request_options = self.request_options or RequestOptions()
@@ -264,36 +270,56 @@ class BaseInlinePromptNode(BasePromptNode[StateType], Generic[StateType]):
                         code=WorkflowErrorCode.INVALID_INPUTS,
                     )
 
+        return {
+            "ml_model": self.ml_model,
+            "input_values": input_values,
+            "input_variables": input_variables,
+            "parameters": processed_parameters,
+            "blocks": processed_blocks,
+            "settings": self.settings,
+            "functions": normalized_functions,
+            "expand_meta": self.expand_meta,
+            "request_options": request_options,
+        }
+
+    def _get_prompt_event_stream(self) -> Iterator[AdHocExecutePromptEvent]:
+        request_kwargs = self._get_prompt_request_kwargs()
+        if self._is_prompt_async:
+            return cast(
+                Iterator[AdHocExecutePromptEvent],
+                self._stream_prompt_events_async(self._aget_prompt_event_stream(request_kwargs)),
+            )
+
         if self.settings and not self.settings.stream_enabled:
             # This endpoint is returning a single event, so we need to wrap it in a generator
             # to match the existing interface.
-            response = self._context.vellum_client.ad_hoc.adhoc_execute_prompt(
-                ml_model=self.ml_model,
-                input_values=input_values,
-                input_variables=input_variables,
-                parameters=processed_parameters,
-                blocks=processed_blocks,
-                settings=self.settings,
-                functions=normalized_functions,
-                expand_meta=self.expand_meta,
-                request_options=request_options,
-            )
+            response = self._context.vellum_client.ad_hoc.adhoc_execute_prompt(**request_kwargs)
             initiated_event = InitiatedAdHocExecutePromptEvent(execution_id=response.execution_id)
             return iter([initiated_event, response])
         else:
-            return self._context.vellum_client.ad_hoc.adhoc_execute_prompt_stream(
-                ml_model=self.ml_model,
-                input_values=input_values,
-                input_variables=input_variables,
-                parameters=processed_parameters,
-                blocks=processed_blocks,
-                settings=self.settings,
-                functions=normalized_functions,
-                expand_meta=self.expand_meta,
-                request_options=request_options,
-            )
+            return self._context.vellum_client.ad_hoc.adhoc_execute_prompt_stream(**request_kwargs)
 
-    def _process_prompt_event_stream(self) -> Generator[BaseOutput, None, Optional[List[PromptOutput]]]:
+    async def _aget_prompt_event_stream(self, request_kwargs: Dict[str, Any]) -> AsyncIterator[AdHocExecutePromptEvent]:
+        ad_hoc_client = self._context.async_vellum_client.ad_hoc
+        if self.settings and not self.settings.stream_enabled:
+            response = await ad_hoc_client.adhoc_execute_prompt(**request_kwargs)
+            yield InitiatedAdHocExecutePromptEvent(execution_id=response.execution_id)
+            yield response
+        else:
+            async for event in ad_hoc_client.adhoc_execute_prompt_stream(**request_kwargs):
+                yield event
+
+    async def arun(self) -> Iterator[BaseOutput]:
+        return self._run_prompt_async()
+
+    @classmethod
+    def __has_arun__(cls) -> bool:
+        # Functions are compiled with sync clients that may call Vellum, Composio or MCP servers, which would block
+        # the event loop, so nodes with functions run on the node executor instead
+        functions = cls.functions.instance if isinstance(cls.functions, NodeReference) else cls.functions
+        return functions is None and super().__has_arun__()
+
+    def _compile_blocks(self) -> None:
         try:
             # Compile dict blocks into PromptBlocks
             exec_config = PromptExecConfig.model_validate(
@@ -311,6 +337,8 @@ class BaseInlinePromptNode(BasePromptNode[StateType], Generic[StateType]):
                 code=WorkflowErrorCode.INVALID_INPUTS,
             )
 
+    def _process_prompt_event_stream(self) -> Generator[BaseOutput, None, Optional[List[PromptOutput]]]:
+        self._compile_blocks()
         self._validate()
         try:
             prompt_event_stream = self._get_prompt_event_stream()
@@ -323,7 +351,7 @@ class BaseInlinePromptNode(BasePromptNode[StateType], Generic[StateType]):
             )
 
         try:
-            first_event = next(prompt_event_stream)
+            first_event = yield from self._next_prompt_event(prompt_event_stream)
         except ApiError as e:
             self._handle_api_error(e)
         except httpx.TransportError:
@@ -340,6 +368,10 @@ class BaseInlinePromptNode(BasePromptNode[StateType], Generic[StateType]):
 
         outputs: Optional[List[PromptOutput]] = None
         for event in prompt_event_stream:
+            if isinstance(event, AwaitingOutput):
+                yield event
+                continue
+
             if event.state == "INITIATED":
                 continue
             elif event.state == "STREAMING":
@@ -1,7 +1,7 @@
 from itertools import chain
 import json
 from uuid import UUID
-from typing import Any, ClassVar, Dict, Generator, Generic, Iterator, List, Optional, Sequence, Set, Union
+from typing import Any, ClassVar, Dict, Generator, Generic, Iterator, List, Optional, Sequence, Set, Union, cast
 
 from vellum import (
     AudioInputRequest,
@@ -36,6 +36,8 @@ from vellum.workflows.events.types import default_serializer
 from vellum.workflows.exceptions import NodeException
 from vellum.workflows.nodes.displayable.bases.base_prompt_node import BasePromptNode
 from vellum.workflows.outputs import BaseOutput
+from vellum.workflows.outputs.base import AwaitingOutput
+from vellum.workflows.references.node import NodeReference
 from vellum.workflows.types import MergeBehavior
 from vellum.workflows.types.generics import StateType
 
@@ -73,6 +75,32 @@ class BasePromptDeploymentNode(BasePromptNode, Generic[StateType]):
         merge_behavior = MergeBehavior.AWAIT_ANY
 
     def _get_prompt_event_stream(self, ml_model_fallback: Optional[str] = None) -> Iterator[ExecutePromptEvent]:
+        request_kwargs = self._get_prompt_request_kwargs(ml_model_fallback=ml_model_fallback)
+        if self._is_prompt_async:
+            return cast(
+                Iterator[ExecutePromptEvent],
+                self._stream_prompt_events_async(
+                    self._context.async_vellum_client.execute_prompt_stream(**request_kwargs)
+                ),
+            )
+
+        return self._context.vellum_client.execute_prompt_stream(**request_kwargs)
+
+    async def arun(self) -> Iterator[BaseOutput]:
+        return self._run_prompt_async()
+
+    @classmethod
+    def __has_arun__(cls) -> bool:
+        # Fallbacks are retried with the sync client, which would block the event loop, so nodes with fallbacks run
+        # on the node executor instead
+        ml_model_fallbacks = (
+            cls.ml_model_fallbacks.instance
+            if isinstance(cls.ml_model_fallbacks, NodeReference)
+            else cls.ml_model_fallbacks
+        )
+        return ml_model_fallbacks is None and super().__has_arun__()
+
+    def _get_prompt_request_kwargs(self, ml_model_fallback: Optional[str] = None) -> Dict[str, Any]:
         execution_context = get_execution_context()
         request_options = self.request_options or RequestOptions()
         request_options["additional_body_parameters"] = {
@@ -87,18 +115,18 @@ class BasePromptDeploymentNode(BasePromptNode, Generic[StateType]):
                 **request_options.get("additional_body_parameters", {}),
             }
 
-        return self._context.vellum_client.execute_prompt_stream(
-            inputs=self._compile_prompt_inputs(),
-            prompt_deployment_id=str(self.deployment) if isinstance(self.deployment, UUID) else None,
-            prompt_deployment_name=self.deployment if isinstance(self.deployment, str) else None,
-            release_tag=self.release_tag,
-            external_id=self.external_id,
-            expand_meta=self.expand_meta,
-            raw_overrides=self.raw_overrides,
-            expand_raw=self.expand_raw,
-            metadata=self.metadata,
-            request_options=request_options,
-        )
+        return {
+            "inputs": self._compile_prompt_inputs(),
+            "prompt_deployment_id": str(self.deployment) if isinstance(self.deployment, UUID) else None,
+            "prompt_deployment_name": self.deployment if isinstance(self.deployment, str) else None,
+            "release_tag": self.release_tag,
+            "external_id": self.external_id,
+            "expand_meta": self.expand_meta,
+            "raw_overrides": self.raw_overrides,
+            "expand_raw": self.expand_raw,
+            "metadata": self.metadata,
+            "request_options": request_options,
+        }
 
     def _process_prompt_event_stream(
         self,
@@ -114,7 +142,7 @@ class BasePromptDeploymentNode(BasePromptNode, Generic[StateType]):
         if prompt_event_stream is None:
             try:
                 prompt_event_stream = self._get_prompt_event_stream()
-                first_event = next(prompt_event_stream)
+                first_event = yield from self._next_prompt_event(prompt_event_stream)
             except ApiError as e:
                 if e.status_code and e.status_code < 500 and self.ml_model_fallbacks is not None:
                     prompt_event_stream = self._retry_prompt_stream_with_fallbacks(tried_fallbacks)
@@ -130,6 +158,10 @@ class BasePromptDeploymentNode(BasePromptNode, Generic[StateType]):
         outputs: Optional[List[PromptOutput]] = None
         if prompt_event_stream is not None:
             for event in prompt_event_stream:
+                if isinstance(event, AwaitingOutput):
+                    yield event
+                    continue
+
                 if event.state == "INITIATED":
                     continue
                 elif event.state == "STREAMING":
@@ -103,37 +103,52 @@ class BaseSearchNode(BaseNode[StateType], Generic[StateType]):
                 document_index=str(self.document_index),
                 options=self._get_options_request(),
             )
-        except NotFoundError:
-            raise NodeException(
+        except (ApiError, httpx.TransportError) as e:
+            raise self._get_search_exception(e) from e
+
+    async def _aperform_search(self) -> SearchResponse:
+        try:
+            return await self._context.async_vellum_client.search(
+                query=self.query,
+                document_index=str(self.document_index),
+                options=self._get_options_request(),
+            )
+        except (ApiError, httpx.TransportError) as e:
+            raise self._get_search_exception(e) from e
+
+    def _get_search_exception(self, e: Union[ApiError, httpx.TransportError]) -> NodeException:
+        if isinstance(e, NotFoundError):
+            return NodeException(
                 message=f"Document Index '{self.document_index}' not found",
                 code=WorkflowErrorCode.INVALID_INPUTS,
             )
-        except httpx.TransportError:
-            raise NodeException(
+
+        if isinstance(e, httpx.TransportError):
+            return NodeException(
                 message="Failed to connect to Vellum server",
                 code=WorkflowErrorCode.INTERNAL_ERROR,
             )
-        except ApiError as e:
-            raw_data = e.body if isinstance(e.body, dict) else None
-            if e.status_code and e.status_code == 403 and isinstance(e.body, dict):
-                raise NodeException(
-                    message=e.body.get("detail", "Provider credentials is missing or unavailable"),
-                    code=WorkflowErrorCode.PROVIDER_CREDENTIALS_UNAVAILABLE,
-                    raw_data=raw_data,
-                )
-            elif e.status_code and e.status_code >= 400 and e.status_code < 500 and isinstance(e.body, dict):
-                raise NodeException(
-                    message=e.body.get(
-                        "detail", f"An error occurred while searching against Document Index '{self.document_index}'"
-                    ),
-                    code=WorkflowErrorCode.INVALID_INPUTS,
-                    raw_data=raw_data,
-                ) from e
-            raise NodeException(
-                message=f"An error occurred while searching against Document Index '{self.document_index}'",
-                code=WorkflowErrorCode.INTERNAL_ERROR,
+
+        raw_data = e.body if isinstance(e.body, dict) else None
+        if e.status_code and e.status_code == 403 and isinstance(e.body, dict):
+            return NodeException(
+                message=e.body.get("detail", "Provider credentials is missing or unavailable"),
+                code=WorkflowErrorCode.PROVIDER_CREDENTIALS_UNAVAILABLE,
+                raw_data=raw_data,
+            )
+        elif e.status_code and e.status_code >= 400 and e.status_code < 500 and isinstance(e.body, dict):
+            return NodeException(
+                message=e.body.get(
+                    "detail", f"An error occurred while searching against Document Index '{self.document_index}'"
+                ),
+                code=WorkflowErrorCode.INVALID_INPUTS,
                 raw_data=raw_data,
-            ) from e
+            )
+        return NodeException(
+            message=f"An error occurred while searching against Document Index '{self.document_index}'",
+            code=WorkflowErrorCode.INTERNAL_ERROR,
+            raw_data=raw_data,
+        )
 
     def _get_options_request(self) -> SearchRequestOptionsRequest:
         return SearchRequestOptionsRequest(
@@ -155,3 +170,7 @@ class BaseSearchNode(BaseNode[StateType], Generic[StateType]):
     def run(self) -> Outputs:
         response = self._perform_search()
         return self.Outputs(results=response.results)
+
+    async def arun(self) -> Outputs:
+        response = await self._aperform_search()
+        return self.Outputs(results=response.results)
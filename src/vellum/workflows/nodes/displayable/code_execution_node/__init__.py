@@ -1,5 +1,7 @@
 from .node import CodeExecutionNode
+from .process_pool import CodeExecutionProcessPool
 
 __all__ = [
     "CodeExecutionNode",
+    "CodeExecutionProcessPool",
 ]
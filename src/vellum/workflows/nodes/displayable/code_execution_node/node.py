@@ -29,6 +29,7 @@ from vellum.workflows.exceptions import NodeException
 from vellum.workflows.nodes.bases import BaseNode
 from vellum.workflows.nodes.bases.base import BaseNodeMeta
 from vellum.workflows.nodes.displayable.bases.utils import primitive_to_vellum_value
+from vellum.workflows.nodes.displayable.code_execution_node.process_pool import CodeExecutionProcessPool
 from vellum.workflows.nodes.displayable.code_execution_node.utils import read_file_from_path, run_code_inline
 from vellum.workflows.outputs.base import BaseOutputs
 from vellum.workflows.types.core import EntityInputsInterface, MergeBehavior, VellumSecret
@@ -76,6 +77,8 @@ class CodeExecutionNode(BaseNode[StateType], Generic[StateType, _OutputType], me
     runtime: CodeExecutionRuntime = "PYTHON_3_12" - The runtime to use for the custom script.
     packages: Optional[Sequence[CodeExecutionPackage]] = None - The packages to use for the custom script.
     request_options: Optional[RequestOptions] = None - The request options to use for the custom script.
+    process_pool: Optional[CodeExecutionProcessPool] = None - The pool of worker processes to run inline Python code
+        in. By default, inline code runs on the workflow's own thread.
     """
 
     class Display(BaseNode.Display):
@@ -84,6 +87,7 @@ class CodeExecutionNode(BaseNode[StateType], Generic[StateType, _OutputType], me
 
     filepath: ClassVar[Optional[str]] = None
     code: ClassVar[Optional[str]] = None
+    process_pool: ClassVar[Optional[CodeExecutionProcessPool]] = None
 
     code_inputs: ClassVar[EntityInputsInterface] = {}
     runtime: CodeExecutionRuntime = "PYTHON_3_11_6"
@@ -104,7 +108,12 @@ class CodeExecutionNode(BaseNode[StateType], Generic[StateType, _OutputType], me
         output_type = self.__class__.get_output_type()
         code, filepath = self._resolve_code()
         if not self.packages and self.runtime == "PYTHON_3_11_6" and not self._has_secrets_in_code_inputs():
-            logs, result = run_code_inline(code, self.code_inputs, output_type, filepath, self._context.vellum_client)
+            if self.process_pool:
+                logs, result = self.process_pool.run_code(code, self.code_inputs, output_type, filepath)
+            else:
+                logs, result = run_code_inline(
+                    code, self.code_inputs, output_type, filepath, self._context.vellum_client
+                )
             outputs = self.Outputs(result=result, log=logs)
 
         else:
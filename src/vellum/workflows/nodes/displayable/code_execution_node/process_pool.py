@@ -0,0 +1,258 @@
+import multiprocessing
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnContext
+from multiprocessing.process import BaseProcess
+import os
+import queue
+import threading
+import weakref
+from typing import Any, List, Optional, Tuple
+
+from vellum.workflows.errors.types import WorkflowErrorCode
+from vellum.workflows.exceptions import NodeException
+from vellum.workflows.nodes.displayable.code_execution_node.utils import execute_code
+from vellum.workflows.nodes.utils import cast_to_output_type
+from vellum.workflows.types.core import EntityInputsInterface
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - resource is only available on Unix
+    resource = None  # type: ignore[assignment]
+
+
+def _apply_memory_limit(memory_limit: Optional[int]) -> None:
+    if memory_limit is None or resource is None:
+        return
+
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+
+def _worker_main(connection: Connection, memory_limit: Optional[int]) -> None:
+    # Imported here so that the client is only created in the worker process, from its environment variables
+    from vellum.workflows.vellum_client import create_vellum_client
+
+    _apply_memory_limit(memory_limit)
+    vellum_client = create_vellum_client()
+    connection.send("ready")
+
+    while True:
+        try:
+            request = connection.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+
+        if request is None:
+            return
+
+        code, inputs, filepath = request
+        try:
+            logs, result = execute_code(code, inputs, filepath, vellum_client)
+        except NodeException as e:
+            connection.send(("error", e.message, e.code))
+            continue
+        except Exception as e:
+            connection.send(("error", f"Failed to run the code: {e}", WorkflowErrorCode.INTERNAL_ERROR))
+            continue
+
+        try:
+            connection.send(("ok", logs, result))
+        except Exception as e:
+            # Return values that can't be pickled fail here, after the code itself has run
+            message = f"Failed to send the result of the code execution: {e}"
+            connection.send(("error", message, WorkflowErrorCode.INVALID_OUTPUTS))
+
+
+class _Worker:
+    def __init__(self, context: SpawnContext, memory_limit: Optional[int]) -> None:
+        self.connection, child_connection = context.Pipe()
+        self.process: BaseProcess = context.Process(
+            target=_worker_main,
+            args=(child_connection, memory_limit),
+            daemon=True,
+        )
+        self.process.start()
+        child_connection.close()
+
+    def wait_until_ready(self) -> None:
+        # Execution timeouts shouldn't include the time it takes a new worker to import its dependencies
+        try:
+            self.connection.recv()
+        except EOFError as e:
+            self.kill()
+            raise NodeException(
+                message=f"Code execution worker failed to start with exit code {self.process.exitcode}",
+                code=WorkflowErrorCode.INTERNAL_ERROR,
+            ) from e
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+        self.connection.close()
+
+
+def _stop_workers(workers: List[_Worker], lock: threading.Lock) -> None:
+    with lock:
+        stopped_workers = list(workers)
+        workers.clear()
+
+    for worker in stopped_workers:
+        worker.stop()
+
+
+class CodeExecutionProcessPool:
+    """
+    A pool of warm worker processes that CodeExecutionNodes can run their inline Python code in, instead of on the
+    workflow's own thread. CPU bound code can then run in parallel, for example across the items of a MapNode.
+
+    max_workers: Optional[int] = None - The maximum number of worker processes. Defaults to the number of CPUs.
+    timeout: Optional[float] = None - The number of seconds each execution may take before its worker is killed.
+    memory_limit: Optional[int] = None - The maximum address space, in bytes, of each worker process. Unix only.
+
+    Code inputs and return values are sent between processes, so they must be picklable. The `vellum_client`
+    available to the code is created in each worker from the `VELLUM_API_KEY` and `VELLUM_API_URL` environment
+    variables. Workers are started with the `spawn` method, so scripts that use a pool must guard their entry point
+    with `if __name__ == "__main__":`, as with `concurrent.futures.ProcessPoolExecutor`.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        memory_limit: Optional[int] = None,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+
+        self._context = multiprocessing.get_context("spawn")
+        self._idle_workers: "queue.LifoQueue[_Worker]" = queue.LifoQueue()
+        self._available_workers = threading.BoundedSemaphore(self.max_workers)
+        self._workers: List[_Worker] = []
+        self._starting_workers = 0
+        self._lock = threading.Lock()
+        self._is_shutdown = False
+
+        # Stops the workers once the pool is garbage collected or the interpreter exits, without keeping the pool alive
+        weakref.finalize(self, _stop_workers, self._workers, self._lock)
+
+    def warm_up(self) -> None:
+        """Starts worker processes ahead of the first executions, until there are `max_workers` of them."""
+        # Each worker is started with a free slot held, so that executions can't start more workers meanwhile
+        while self._available_workers.acquire(blocking=False):
+            try:
+                with self._lock:
+                    if self._is_shutdown or len(self._workers) + self._starting_workers >= self.max_workers:
+                        return
+                    self._starting_workers += 1
+
+                self._idle_workers.put(self._start_worker(is_reserved=True))
+            finally:
+                self._available_workers.release()
+
+    def run_code(
+        self,
+        code: str,
+        inputs: EntityInputsInterface,
+        output_type: Any,
+        filepath: str,
+    ) -> Tuple[str, Any]:
+        if self._is_shutdown:
+            raise NodeException(
+                message="Cannot run code in a CodeExecutionProcessPool that has been shut down",
+                code=WorkflowErrorCode.INTERNAL_ERROR,
+            )
+
+        with self._available_workers:
+            worker = self._acquire_worker()
+            try:
+                response = self._send(worker, (code, dict(inputs), filepath))
+            except BaseException:
+                self._discard_worker(worker)
+                raise
+
+            self._idle_workers.put(worker)
+
+        if response[0] == "error":
+            _, message, error_code = response
+            raise NodeException(message=message, code=error_code)
+
+        _, logs, result = response
+        return logs, cast_to_output_type(result, output_type)
+
+    def shutdown(self) -> None:
+        """Stops every worker process. Executions that are in flight are killed."""
+        with self._lock:
+            self._is_shutdown = True
+
+        _stop_workers(self._workers, self._lock)
+
+    def _send(self, worker: _Worker, request: Tuple[str, dict, str]) -> Tuple[Any, ...]:
+        try:
+            worker.connection.send(request)
+        except Exception as e:
+            raise NodeException(
+                message=f"Failed to send the code inputs to the worker process: {e}",
+                code=WorkflowErrorCode.INVALID_INPUTS,
+            ) from e
+
+        if not worker.connection.poll(self.timeout):
+            raise NodeException(
+                message=f"Code execution exceeded timeout of {self.timeout} seconds",
+                code=WorkflowErrorCode.NODE_EXECUTION,
+            )
+
+        try:
+            return worker.connection.recv()
+        except EOFError as e:
+            raise NodeException(
+                message=f"Code execution worker exited unexpectedly with exit code {worker.process.exitcode}",
+                code=WorkflowErrorCode.NODE_EXECUTION,
+            ) from e
+
+    def _acquire_worker(self) -> _Worker:
+        while True:
+            try:
+                worker = self._idle_workers.get_nowait()
+            except queue.Empty:
+                return self._start_worker()
+
+            if worker.process.is_alive():
+                return worker
+
+            self._discard_worker(worker)
+
+    def _start_worker(self, is_reserved: bool = False) -> _Worker:
+        if not is_reserved:
+            with self._lock:
+                self._starting_workers += 1
+
+        try:
+            worker = _Worker(self._context, self.memory_limit)
+            worker.wait_until_ready()
+        except BaseException:
+            with self._lock:
+                self._starting_workers -= 1
+            raise
+
+        with self._lock:
+            self._starting_workers -= 1
+            self._workers.append(worker)
+
+        return worker
+
+    def _discard_worker(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
@@ -22,7 +22,7 @@ from vellum.workflows.constants import undefined
 from vellum.workflows.errors import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
 from vellum.workflows.inputs.base import BaseInputs
-from vellum.workflows.nodes.displayable.code_execution_node import CodeExecutionNode
+from vellum.workflows.nodes.displayable.code_execution_node import CodeExecutionNode, CodeExecutionProcessPool
 from vellum.workflows.references.vellum_secret import VellumSecretReference
 from vellum.workflows.state.base import BaseState, StateMeta
 from vellum.workflows.state.context import WorkflowContext
@@ -1522,3 +1522,64 @@ def main(word: str) -> int:
         packages=[CodeExecutionPackage(name="requests", version="2.0.0")],
         request_options=None,
     )
+
+
+def test_run_node__inline_code_in_process_pool():
+    # GIVEN a process pool with a single worker and a short timeout
+    pool = CodeExecutionProcessPool(max_workers=1, timeout=2)
+
+    # AND a node that runs its inline code in the pool
+    class ExampleCodeExecutionNode(CodeExecutionNode[BaseState, int]):
+        code = """\
+import os
+
+def main(word: str) -> int:
+    print(os.getpid())
+    return len(word)
+"""
+        code_inputs = {"word": "hello"}
+        process_pool = pool
+
+    # AND a node whose code never returns
+    class StuckCodeExecutionNode(ExampleCodeExecutionNode):
+        code = """\
+def main(word: str) -> int:
+    while True:
+        pass
+"""
+
+    try:
+        # WHEN we run the node twice
+        first_outputs = ExampleCodeExecutionNode().run()
+        second_outputs = ExampleCodeExecutionNode().run()
+
+        # THEN the code runs in the same warm worker process each time
+        assert first_outputs.result == 5
+        assert first_outputs.log == second_outputs.log
+        assert first_outputs.log != f"{os.getpid()}\n"
+
+        # AND code that exceeds the timeout fails without blocking the pool
+        with pytest.raises(NodeException) as exc_info:
+            StuckCodeExecutionNode().run()
+        assert exc_info.value.message == "Code execution exceeded timeout of 2 seconds"
+        assert ExampleCodeExecutionNode().run().result == 5
+    finally:
+        pool.shutdown()
+
+
+def test_run_node__filepath_edited_between_runs(tmp_path):
+    # GIVEN a script on disk
+    script = tmp_path / "script.py"
+    script.write_text("def main() -> int:\n    return 1\n")
+
+    class ExampleCodeExecutionNode(CodeExecutionNode[BaseState, int]):
+        filepath = str(script)
+
+    # AND the node has already run once
+    assert ExampleCodeExecutionNode().run().result == 1
+
+    # WHEN the script is edited
+    script.write_text("def main() -> int:\n    return 20\n")
+
+    # THEN the next run picks up the new contents
+    assert ExampleCodeExecutionNode().run().result == 20
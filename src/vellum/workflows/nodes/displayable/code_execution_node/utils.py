@@ -1,7 +1,9 @@
+from functools import lru_cache
 import io
 import os
 import sys
 import traceback
+from types import CodeType
 from typing import Any, Optional, Tuple, Union
 
 from vellum import Vellum
@@ -31,12 +33,24 @@ def read_file_from_path(
 
     # Default logic for reading from filesystem
     try:
-        with open(full_filepath) as file:
-            return file.read()
+        file_stat = os.stat(full_filepath)
+        return _read_file(full_filepath, file_stat.st_mtime_ns, file_stat.st_size)
     except (FileNotFoundError, IsADirectoryError):
         return None
 
 
+@lru_cache(maxsize=256)
+def _read_file(full_filepath: str, mtime_ns: int, size: int) -> str:
+    # The modification time and size are part of the cache key so that edited scripts are read again
+    with open(full_filepath) as file:
+        return file.read()
+
+
+@lru_cache(maxsize=256)
+def _compile_code(execution_code: str, filepath: str) -> CodeType:
+    return compile(execution_code, filepath, "exec")
+
+
 def run_code_inline(
     code: str,
     inputs: EntityInputsInterface,
@@ -44,6 +58,23 @@ def run_code_inline(
     filepath: str,
     vellum_client: Vellum,
 ) -> Tuple[str, Any]:
+    logs, result = execute_code(code, inputs, filepath, vellum_client)
+    result = cast_to_output_type(result, output_type)
+
+    return logs, result
+
+
+def execute_code(
+    code: str,
+    inputs: EntityInputsInterface,
+    filepath: str,
+    vellum_client: Optional[Vellum],
+) -> Tuple[str, Any]:
+    """
+    Runs the `main` function of `code` with `inputs` and returns the captured logs along with its raw return value.
+    Compiled code objects are cached by the code's contents, so running the same script again skips compilation.
+    """
+
     log_buffer = io.StringIO()
 
     def _inline_print(*args: Any, **kwargs: Any) -> None:
@@ -65,7 +96,7 @@ def run_code_inline(
 __arg__out = main({", ".join(run_args)})
 """
     try:
-        compiled_code = compile(execution_code, filepath, "exec")
+        compiled_code = _compile_code(execution_code, filepath)
         exec(compiled_code, exec_globals)
     except Exception as e:
         lines = code.splitlines()
@@ -97,6 +128,4 @@ Traceback (most recent call last):
     logs = log_buffer.getvalue()
     result = exec_globals["__arg__out"]
 
-    result = cast_to_output_type(result, output_type)
-
     return logs, result
@@ -54,3 +54,7 @@ class InlinePromptNode(BaseInlinePromptNode[StateType], Generic[StateType]):
 
         if json_output:
             yield BaseOutput(name="json", value=json_output)
+
+    async def arun(self) -> Iterator[BaseOutput]:
+        # Overridden alongside `run`, which `arun` runs with the Prompt executed by the async Vellum client
+        return await super().arun()
@@ -1,8 +1,10 @@
 import pytest
+import asyncio
 from dataclasses import dataclass
 import json
+from unittest import mock
 from uuid import uuid4
-from typing import Any, Iterator, List
+from typing import Any, AsyncIterator, Iterator, List
 
 from httpx import Response
 
@@ -20,11 +22,17 @@ from vellum.client.types.initiated_execute_prompt_event import InitiatedExecuteP
 from vellum.client.types.prompt_output import PromptOutput
 from vellum.client.types.prompt_request_chat_history_input import PromptRequestChatHistoryInput
 from vellum.client.types.prompt_request_json_input import PromptRequestJsonInput
+from vellum.client.types.streaming_execute_prompt_event import StreamingExecutePromptEvent
 from vellum.client.types.string_vellum_value import StringVellumValue
 from vellum.workflows.context import execution_context
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.exceptions import NodeException
+from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.displayable.inline_prompt_node.node import InlinePromptNode
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
 
 
 def test_inline_prompt_node__json_inputs(vellum_adhoc_prompt_client):
@@ -300,3 +308,56 @@ def test_inline_prompt_node__parent_context(mock_httpx_transport, mock_complex_p
             "blocks": [],
         }
     ]
+
+
+@pytest.mark.asyncio
+async def test_inline_prompt_node__astream_streams_prompt_events_from_async_client(vellum_adhoc_prompt_client):
+    # GIVEN an async Vellum client that streams a delta, then waits to be released before it completes the prompt
+    released = asyncio.Event()
+
+    async def generate_prompt_events(*args: Any, **kwargs: Any) -> AsyncIterator[ExecutePromptEvent]:
+        execution_id = str(uuid4())
+        yield InitiatedExecutePromptEvent(execution_id=execution_id)
+        yield StreamingExecutePromptEvent(
+            execution_id=execution_id, output=StringVellumValue(value="Hello"), output_index=0
+        )
+        await released.wait()
+        yield FulfilledExecutePromptEvent(execution_id=execution_id, outputs=[StringVellumValue(value="Hello")])
+
+    async_vellum_client = mock.MagicMock()
+    async_vellum_client.ad_hoc.adhoc_execute_prompt_stream.side_effect = generate_prompt_events
+
+    # AND a workflow with a prompt node
+    class MyNode(InlinePromptNode):
+        ml_model = "gpt-4o"
+        blocks = []
+
+    class Workflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = MyNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            text = MyNode.Outputs.text
+
+    workflow = Workflow(context=WorkflowContext(async_vellum_client=async_vellum_client))
+
+    # WHEN we stream the workflow on the event loop, releasing the prompt once its delta has been streamed
+    events = []
+
+    async def stream_workflow() -> None:
+        async for event in workflow.astream(event_filter=all_workflow_event_filter):
+            events.append(event)
+            if event.name == "node.execution.streaming" and event.output.delta == "Hello":
+                released.set()
+
+    await asyncio.wait_for(stream_workflow(), timeout=10)
+
+    # THEN the delta was streamed before the prompt completed
+    assert released.is_set()
+
+    # AND the workflow is fulfilled with the prompt's text
+    assert events[-1].name == "workflow.execution.fulfilled", events[-1]
+    assert events[-1].outputs == {"text": "Hello"}
+
+    # AND the prompt was only executed with the async client
+    assert async_vellum_client.ad_hoc.adhoc_execute_prompt_stream.call_count == 1
+    assert vellum_adhoc_prompt_client.adhoc_execute_prompt_stream.call_count == 0
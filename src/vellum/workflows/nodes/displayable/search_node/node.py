@@ -42,6 +42,20 @@ class SearchNode(BaseSearchNode[StateType]):
         text: str
 
     def run(self) -> Outputs:
+        self._validate_query()
+
+        results = self._perform_search().results
+        text = self.chunk_separator.join([r.text for r in results])
+        return self.Outputs(results=results, text=text)
+
+    async def arun(self) -> Outputs:
+        self._validate_query()
+
+        results = (await self._aperform_search()).results
+        text = self.chunk_separator.join([r.text for r in results])
+        return self.Outputs(results=results, text=text)
+
+    def _validate_query(self) -> None:
         if self.query is undefined or self.query is None or self.query == "":
             raise NodeException(
                 message="Search query is required but was not provided",
@@ -50,7 +64,3 @@ class SearchNode(BaseSearchNode[StateType]):
 
         if not isinstance(self.query, str):
             self.query = json.dumps(self.query, cls=VellumJsonEncoder)
-
-        results = self._perform_search().results
-        text = self.chunk_separator.join([r.text for r in results])
-        return self.Outputs(results=results, text=text)
@@ -1,14 +1,13 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from vellum.workflows.integrations.composio_service import ComposioService, ConnectionInfo
 
 
 @pytest.fixture
 def mock_requests():
-    """Mock requests module"""
-    with patch("vellum.workflows.integrations.composio_service.requests") as mock_requests:
-        yield mock_requests
+    """Mock the HTTP session that the service sends requests with"""
+    return Mock()
 
 
 @pytest.fixture
@@ -60,9 +59,12 @@ def mock_tool_execution_error_response():
 
 
 @pytest.fixture
-def composio_service():
-    """Create ComposioService with test API key"""
-    return ComposioService(api_key="test-key")
+def composio_service(mock_requests):
+    """Create ComposioService with test API key, without the connections and tools cached for it by other tests"""
+    service = ComposioService(api_key="test-key", session=mock_requests)
+    service.invalidate_user_connections()
+    service.invalidate_tool()
+    return service
 
 
 class TestComposioAccountService:
@@ -217,3 +219,25 @@ class TestComposioCoreService:
 
         # THEN the result should contain the generic error message
         assert result == "Tool execution failed"
+
+    def test_get_tool_by_slug_is_cached_until_invalidated(self, composio_service, mock_requests):
+        """Test that tool details are only fetched again after the cached entry is invalidated"""
+        # GIVEN the API returns a tool's details
+        mock_response = Mock()
+        mock_response.json.return_value = {"slug": "GITHUB_GET_PR", "input_parameters": {"type": "object"}}
+        mock_response.raise_for_status.return_value = None
+        mock_requests.get.return_value = mock_response
+
+        # WHEN we get the tool twice, from two service instances
+        first = composio_service.get_tool_by_slug("GITHUB_GET_PR")
+        first["input_parameters"]["type"] = "mutated"
+        second = ComposioService(api_key="test-key", session=mock_requests).get_tool_by_slug("GITHUB_GET_PR")
+
+        # THEN the API is only called once, and callers can't mutate the cached details
+        assert mock_requests.get.call_count == 1
+        assert second == {"slug": "GITHUB_GET_PR", "input_parameters": {"type": "object"}}
+
+        # AND once the tool is invalidated, it is fetched again
+        composio_service.invalidate_tool("GITHUB_GET_PR")
+        composio_service.get_tool_by_slug("GITHUB_GET_PR")
+        assert mock_requests.get.call_count == 2
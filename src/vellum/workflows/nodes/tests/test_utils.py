@@ -179,3 +179,40 @@ def test_cast_to_output_type_any_json_parsing(input_value, expected_result):
     """Test that cast_to_output_type attempts JSON parsing for Any type and falls back gracefully."""
     result = cast_to_output_type(input_value, Any)
     assert result == expected_result
+
+
+@pytest.mark.parametrize(
+    "input_value,output_type,expected_result",
+    [
+        ("hello", str, "hello"),
+        (True, Union[int, bool], True),
+        (1, float, 1.0),
+        ({"name": "Alice", "age": 30, "colors": ["red"]}, Person, Person(name="Alice", age=30, colors=["red"])),
+        ([{"role": "USER", "text": "Hi"}], List[ChatMessage], [ChatMessage(role="USER", text="Hi")]),
+        ({"key": [1, "two"]}, Json, {"key": [1, "two"]}),
+    ],
+    ids=["string", "primitive_union", "int_to_float", "pydantic_model", "chat_history", "json"],
+)
+def test_cast_to_output_type__repeated_casts(input_value, output_type, expected_result):
+    """Test that casting to the same output type repeatedly, through the cached type adapters, is consistent."""
+    # WHEN we cast the same value to the same output type several times
+    results = [cast_to_output_type(input_value, output_type) for _ in range(3)]
+
+    # THEN every cast returns the expected value and type
+    for result in results:
+        assert result == expected_result
+        assert type(result) is type(expected_result)
+
+
+def test_cast_to_output_type__invalid_value_after_cached_cast():
+    """Test that an invalid value is still rejected once the output type's adapter is cached."""
+    # GIVEN an output type that has already been cast to
+    assert cast_to_output_type(["red"], List[str]) == ["red"]
+
+    # WHEN we cast a value that doesn't match it
+    with pytest.raises(NodeException) as exc_info:
+        cast_to_output_type([{"not": "a string"}], List[str])
+
+    # THEN the error names the expected and received types
+    assert exc_info.value.code == WorkflowErrorCode.INVALID_OUTPUTS
+    assert exc_info.value.message == "Expected an output of type 'typing.List[str]', but received 'list'"
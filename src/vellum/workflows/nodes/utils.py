@@ -1,4 +1,4 @@
-from functools import cache
+from functools import cache, lru_cache
 import inspect
 import json
 import sys
@@ -18,7 +18,7 @@ from typing import (
     get_origin,
 )
 
-from pydantic import BaseModel, create_model
+from pydantic import BaseModel, TypeAdapter
 
 from vellum.client.types.function_call import FunctionCall
 from vellum.workflows.constants import undefined
@@ -265,6 +265,31 @@ def _get_default_value(output_type: Any) -> Any:
         return None
 
 
+_PRIMITIVE_OUTPUT_TYPES = {str, int, float, bool}
+
+
+def _is_primitive_of_output_type(result: Any, output_type: Any) -> bool:
+    """
+    Whether `result` is a primitive whose exact type is `output_type`, or one of its members if it's a Union. Such
+    results would come out of validation unchanged, so validation can be skipped.
+    """
+    result_type = type(result)
+    if result_type not in _PRIMITIVE_OUTPUT_TYPES:
+        return False
+
+    if output_type is result_type:
+        return True
+
+    return get_origin(output_type) is Union and result_type in get_args(output_type)
+
+
+def _create_output_type_adapter(output_type: Any) -> TypeAdapter:
+    return TypeAdapter(_clean_output_type(output_type))
+
+
+_get_output_type_adapter = lru_cache(maxsize=256)(_create_output_type_adapter)
+
+
 def cast_to_output_type(result: Any, output_type: Any) -> Any:
     if result is None:
         return _get_default_value(output_type)
@@ -282,12 +307,19 @@ def cast_to_output_type(result: Any, output_type: Any) -> Any:
                 pass
         return result
 
-    clean_output_type = _clean_output_type(output_type)
-    DynamicModel = create_model("Output", output_type=(clean_output_type, ...))
+    if _is_primitive_of_output_type(result, output_type):
+        return result
+
+    try:
+        hash(output_type)
+    except TypeError:
+        # Output types that can't be hashed, like a Literal of a dict, can't be cached
+        type_adapter = _create_output_type_adapter(output_type)
+    else:
+        type_adapter = _get_output_type_adapter(output_type)
 
     try:
-        # mypy doesn't realize that this dynamic model has the output_type field defined above
-        return DynamicModel.model_validate({"output_type": result}).output_type  # type: ignore[attr-defined]
+        return type_adapter.validate_python(result)
     except Exception:
         output_type_name = _get_type_name(output_type)
         result_type_name = _get_type_name(type(result))
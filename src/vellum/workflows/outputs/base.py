@@ -1,6 +1,6 @@
 from dataclasses import field
 import inspect
-from typing import Any, Dict, Generic, Iterator, Set, Tuple, Type, TypeVar, Union, cast
+from typing import Any, Coroutine, Dict, Generic, Iterator, Set, Tuple, Type, TypeVar, Union, cast
 from typing_extensions import dataclass_transform
 
 from pydantic import GetCoreSchemaHandler, ValidationInfo
@@ -13,7 +13,7 @@ from vellum.workflows.exceptions import NodeException
 from vellum.workflows.executable import BaseExecutable
 from vellum.workflows.references.output import OutputReference
 from vellum.workflows.types.generics import import_workflow_class, is_node_instance
-from vellum.workflows.types.utils import get_class_attr_names, infer_types
+from vellum.workflows.types.utils import clear_type_cache, get_class_attr_names, infer_types
 
 _Delta = TypeVar("_Delta")
 _Accumulated = TypeVar("_Accumulated")
@@ -102,6 +102,17 @@ class BaseOutput(Generic[_Delta, _Accumulated]):
         return hash((self._name, self._value, self._value))
 
 
+class AwaitingOutput(BaseOutput):
+    """
+    Yielded by a node run with `arun` in place of its next output, while that output waits on I/O running on the
+    event loop. The AsyncWorkflowRunner awaits `awaitable` before it asks the node for its next output.
+    """
+
+    def __init__(self, awaitable: Coroutine[Any, Any, None]) -> None:
+        super().__init__(name="awaiting")
+        self.awaitable = awaitable
+
+
 @dataclass_transform(kw_only_default=True)
 class _BaseOutputsMeta(type):
     def __new__(cls, name: str, bases: Tuple[Type, ...], dct: Dict[str, Any]) -> Any:
@@ -144,9 +155,16 @@ class _BaseOutputsMeta(type):
             # We want to avoid this, so we check if the name of the class and the name of the descriptor
             # are the same, and if they are, we don't set the attribute.
             if f"{cls.__qualname__}.{name}" == str(value):
-                return super().__setattr__(name, value.instance)
+                value = value.instance
+
+        super().__setattr__(name, value)
+        if not name.startswith("_") or name == "__annotations__":
+            clear_type_cache(cls)
 
-        return super().__setattr__(name, value)
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if not name.startswith("_") or name == "__annotations__":
+            clear_type_cache(cls)
 
     def __getattribute__(cls, name: str) -> Any:
         if name.startswith("_") or not issubclass(cls, BaseOutputs):
@@ -1,5 +1,19 @@
+from .async_runner import AsyncWorkflowRunner
+from .emitter_worker import EmitterMetrics
 from .runner import WorkflowRunner
+from .snapshot_policy import (
+    CoalescingSnapshotPolicy,
+    NodeBoundarySnapshotPolicy,
+    RateLimitedSnapshotPolicy,
+    SnapshotPolicy,
+)
 
 __all__ = [
+    "AsyncWorkflowRunner",
+    "CoalescingSnapshotPolicy",
+    "EmitterMetrics",
+    "NodeBoundarySnapshotPolicy",
+    "RateLimitedSnapshotPolicy",
+    "SnapshotPolicy",
     "WorkflowRunner",
 ]
@@ -0,0 +1,277 @@
+import asyncio
+import logging
+from queue import Queue
+from threading import Event as ThreadingEvent
+from uuid import UUID
+from typing import Any, AsyncGenerator, Coroutine, Dict, Generator, Generic, Optional, TypeVar, cast
+
+from vellum.workflows.context import execution_context, get_execution_context
+from vellum.workflows.errors import WorkflowError, WorkflowErrorCode
+from vellum.workflows.events import NodeExecutionRejectedEvent, WorkflowEvent
+from vellum.workflows.events.types import NodeParentContext, ParentContext
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.nodes.bases.base import NodeRunResponse
+from vellum.workflows.outputs.base import AwaitingOutput
+from vellum.workflows.runner.runner import WorkflowRunner
+from vellum.workflows.types.generics import StateType
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AwaitableQueue(Queue[_T]):
+    """
+    A Queue that items can be put on from any thread, and that can be waited on from the event loop it was created
+    for without blocking the loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        super().__init__()
+        self._loop = loop
+        self._waiter: Optional["asyncio.Future[None]"] = None
+
+    def _put(self, item: _T) -> None:
+        # Called by `put` with `self.mutex` held
+        super()._put(item)
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            self._loop.call_soon_threadsafe(_wake, waiter)
+
+    async def aget(self) -> _T:
+        while True:
+            with self.mutex:
+                if self._qsize():
+                    item = self._get()
+                    self.not_full.notify()
+                    return item
+
+                waiter = self._loop.create_future()
+                self._waiter = waiter
+
+            await waiter
+
+
+class _ExecutionContextBoundCoroutine(Generic[_T]):
+    """
+    Awaits a coroutine with the given execution context set each time it is resumed. The execution context is
+    thread local, so it would otherwise be shared by every coroutine running on the event loop's thread.
+    """
+
+    def __init__(self, coroutine: Coroutine[Any, Any, _T], parent_context: ParentContext, trace_id: UUID) -> None:
+        self._coroutine = coroutine
+        self._parent_context = parent_context
+        self._trace_id = trace_id
+
+    def __await__(self) -> Generator[Any, Any, _T]:
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                with execution_context(parent_context=self._parent_context, trace_id=self._trace_id):
+                    if error is not None:
+                        yielded = self._coroutine.throw(error)
+                    else:
+                        yielded = self._coroutine.send(value)
+            except StopIteration as e:
+                return cast(_T, e.value)
+
+            value, error = None, None
+            try:
+                value = yield yielded
+            except GeneratorExit:
+                self._coroutine.close()
+                raise
+            except BaseException as e:
+                error = e
+
+
+class AsyncWorkflowRunner(WorkflowRunner[StateType]):
+    """
+    Runs a workflow on the running asyncio event loop. Nodes that implement `arun` are awaited on the loop itself,
+    so that many I/O bound nodes and workflows can wait at once without a thread each. Every other node runs on the
+    workflow context's node executor, the same as with `WorkflowRunner`.
+
+    Must be created from a coroutine running on the loop that will consume `astream`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._loop = asyncio.get_running_loop()
+
+        self._async_outer_queue: AwaitableQueue[Optional[WorkflowEvent]] = AwaitableQueue(self._loop)
+        self._async_inner_queue: AwaitableQueue[WorkflowEvent] = AwaitableQueue(self._loop)
+        self._workflow_event_outer_queue = self._async_outer_queue
+        self._workflow_event_inner_queue = self._async_inner_queue
+        self.workflow.context._register_event_queue(self._workflow_event_inner_queue)
+
+        self._node_tasks: Dict[UUID, "asyncio.Task[None]"] = {}
+        self._stream_task: Optional["asyncio.Task[None]"] = None
+
+    def _submit_work_item(
+        self,
+        node: BaseNode[StateType],
+        span_id: UUID,
+        parent_context: Optional[ParentContext],
+        trace_id: UUID,
+    ) -> None:
+        if not node.__has_arun__() or self._find_node_output_mock(node) is not None:
+            super()._submit_work_item(node, span_id, parent_context, trace_id)
+            return
+
+        task = self._loop.create_task(self._arun_work_item(node, span_id, parent_context, trace_id))
+        self._node_tasks[span_id] = task
+        task.add_done_callback(lambda _: self._node_tasks.pop(span_id, None))
+
+    async def _arun_work_item(
+        self,
+        node: BaseNode[StateType],
+        span_id: UUID,
+        parent_context: Optional[ParentContext],
+        trace_id: UUID,
+    ) -> None:
+        node_run_response: Optional[NodeRunResponse] = None
+        node_run_error: Optional[Exception] = None
+
+        def node_run() -> NodeRunResponse:
+            if node_run_error is not None:
+                raise node_run_error
+            return cast(NodeRunResponse, node_run_response)
+
+        with execution_context(parent_context=parent_context, trace_id=trace_id):
+            execution = get_execution_context()
+            node_events = self.run_node(node, span_id, node_run=node_run)
+
+            # `run_node` yields the initiated event before it asks for the node's run response
+            self._workflow_event_inner_queue.put(next(node_events))
+
+        node_parent_context = NodeParentContext(
+            span_id=span_id,
+            node_definition=node.__class__,
+            parent=execution.parent_context,
+        )
+        try:
+            node_run_response = await _ExecutionContextBoundCoroutine(
+                node.arun(), node_parent_context, execution.trace_id
+            )
+        except asyncio.CancelledError:
+            node_events.close()
+            raise
+        except Exception as e:
+            node_run_error = e
+
+        while True:
+            with execution_context(parent_context=parent_context, trace_id=trace_id):
+                event = next(node_events, None)
+            if event is None:
+                break
+
+            if isinstance(event, AwaitingOutput):
+                # The node's next output waits on I/O, which is awaited here so that it doesn't block the loop
+                try:
+                    await _ExecutionContextBoundCoroutine(event.awaitable, node_parent_context, execution.trace_id)
+                except asyncio.CancelledError:
+                    node_events.close()
+                    raise
+                continue
+
+            self._workflow_event_inner_queue.put(event)
+
+    def _emit_node_cancellation_events(self, error_message: str) -> None:
+        span_ids = list(self._active_nodes_by_execution_id.keys())
+        super()._emit_node_cancellation_events(error_message)
+
+        for span_id in span_ids:
+            task = self._node_tasks.get(span_id)
+            if task is not None:
+                self._loop.call_soon_threadsafe(task.cancel)
+
+    async def _awrapped_stream(self) -> None:
+        try:
+            with self._httpx_logger_with_span_id():
+                await self._astream()
+        except Exception:
+            logger.exception(f"An unexpected error occurred while running {self.workflow.__class__.__name__}")
+        finally:
+            self._workflow_event_outer_queue.put(None)
+
+    async def _astream(self) -> None:
+        current_parent = self._workflow_parent_context()
+        if not self._run_entrypoints(current_parent):
+            return
+
+        rejection_event: Optional[NodeExecutionRejectedEvent] = None
+
+        while True:
+            if not self._active_nodes_by_execution_id:
+                break
+
+            event = await self._async_inner_queue.aget()
+
+            rejection_event = self._process_work_item_event(event, current_parent)
+            if rejection_event:
+                break
+
+        self._finish_stream(current_parent, rejection_event)
+
+    async def _agenerate_events(self) -> AsyncGenerator[WorkflowEvent, None]:
+        self._start_emitter_workers()
+
+        cancel_thread_kill_switch = ThreadingEvent()
+        self._watch_cancel_signal(cancel_thread_kill_switch)
+
+        timeout_handle = self._loop.call_later(self._timeout, self._timeout_workflow) if self._timeout else None
+
+        event: WorkflowEvent
+        if self._is_resuming:
+            event = self._resume_workflow_event()
+        else:
+            event = self._initiate_workflow_event()
+
+        yield self._emit_event(event)
+
+        self._stream_task = self._loop.create_task(self._awrapped_stream())
+
+        while True:
+            queued_event = await self._async_outer_queue.aget()
+            if queued_event is None:
+                break
+
+            event = queued_event
+            yield self._emit_event(event)
+
+            if self._is_terminal_event(event):
+                break
+
+        while not self._async_outer_queue.empty():
+            queued_event = self._async_outer_queue.get_nowait()
+            if queued_event is None:
+                continue
+
+            event = queued_event
+            yield self._emit_event(event)
+
+        if not self._is_terminal_event(event):
+            yield self._reject_workflow_event(
+                WorkflowError(
+                    code=WorkflowErrorCode.INTERNAL_ERROR,
+                    message="An unexpected error occurred while streaming Workflow events",
+                )
+            )
+
+        self._finish_events(cancel_thread_kill_switch)
+        if timeout_handle:
+            timeout_handle.cancel()
+
+        # The stream may still be waiting on nodes that outlived a rejected or cancelled workflow
+        if self._stream_task and not self._stream_task.done():
+            self._stream_task.cancel()
+
+    def astream(self) -> AsyncGenerator[WorkflowEvent, None]:
+        return self._agenerate_events()
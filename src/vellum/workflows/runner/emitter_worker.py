@@ -0,0 +1,139 @@
+from collections import deque
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Deque, Tuple, Type, Union
+
+from vellum.workflows.emitters.base import BaseWorkflowEmitter
+from vellum.workflows.events.types import BaseEvent
+from vellum.workflows.events.workflow import WorkflowEvent
+from vellum.workflows.state.base import BaseState
+
+logger = logging.getLogger(__name__)
+
+EmitterItem = Union[BaseState, WorkflowEvent]
+
+
+@dataclass(frozen=True)
+class EmitterMetrics:
+    """
+    A point in time view of how far an emitter is behind the workflow run it is receiving events from.
+
+    queued: int - The number of events and snapshots waiting to be passed to the emitter.
+    delivered: int - The number of events and snapshots passed to the emitter so far.
+    dropped: int - The number of events and snapshots discarded because the emitter's queue was full.
+    lag: float - How many seconds the oldest waiting event or snapshot has been waiting.
+    max_lag: float - The longest any event or snapshot has waited, in seconds.
+    """
+
+    queued: int
+    delivered: int
+    dropped: int
+    lag: float
+    max_lag: float
+
+
+class EmitterWorker:
+    """
+    Passes the events and state snapshots of a workflow run to a single emitter, in order, from its own thread.
+    """
+
+    def __init__(self, emitter: BaseWorkflowEmitter, state_class: Type[BaseState], name: str) -> None:
+        self.emitter = emitter
+        self._state_class = state_class
+        self._max_queue_size = emitter.delivery_queue_size
+        self._overflow_policy = emitter.delivery_overflow_policy
+
+        # Each queued item is stored with the time it was queued
+        self._queue: Deque[Tuple[EmitterItem, float]] = deque()
+        self._condition = threading.Condition()
+        self._is_closed = False
+        self._delivered = 0
+        self._dropped = 0
+        self._max_lag = 0.0
+        self._thread = threading.Thread(target=self._run, name=name)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def put(self, item: EmitterItem) -> None:
+        with self._condition:
+            if self._is_closed:
+                return
+
+            if len(self._queue) >= self._max_queue_size:
+                if self._overflow_policy == "drop_newest":
+                    self._drop()
+                    return
+
+                if self._overflow_policy == "drop_oldest":
+                    self._queue.popleft()
+                    self._drop()
+                else:
+                    while len(self._queue) >= self._max_queue_size:
+                        self._condition.wait()
+
+            self._queue.append((item, time.monotonic()))
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """
+        Stops the worker once every item queued so far has been passed to the emitter.
+        """
+        with self._condition:
+            self._is_closed = True
+            self._condition.notify_all()
+
+    def join(self) -> None:
+        if self._thread.is_alive():
+            self._thread.join()
+
+    @property
+    def metrics(self) -> EmitterMetrics:
+        with self._condition:
+            lag = time.monotonic() - self._queue[0][1] if self._queue else 0.0
+            return EmitterMetrics(
+                queued=len(self._queue),
+                delivered=self._delivered,
+                dropped=self._dropped,
+                lag=lag,
+                max_lag=max(self._max_lag, lag),
+            )
+
+    def _drop(self) -> None:
+        if self._dropped == 0:
+            logger.warning(
+                f"Queue for {self.emitter.__class__.__name__} is full with {self._max_queue_size} items, dropping "
+                "events and snapshots until it catches up. Further dropped items will not be logged."
+            )
+
+        self._dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._is_closed:
+                    self._condition.wait()
+
+                if not self._queue:
+                    return
+
+                item, queued_at = self._queue.popleft()
+                self._max_lag = max(self._max_lag, time.monotonic() - queued_at)
+                self._condition.notify_all()
+
+            self._deliver(item)
+
+    def _deliver(self, item: EmitterItem) -> None:
+        try:
+            if isinstance(item, self._state_class):
+                self.emitter.snapshot_state(item)
+            elif isinstance(item, BaseEvent):
+                self.emitter.emit_event(item)
+        except Exception as e:
+            description = f"event {item.name}" if isinstance(item, BaseEvent) else "a state snapshot"
+            logger.exception(f"{self.emitter.__class__.__name__} failed to handle {description}: {e}")
+        finally:
+            with self._condition:
+                self._delivered += 1
@@ -1,16 +1,19 @@
-from collections import defaultdict
 from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
+from datetime import datetime
 import logging
+from multiprocessing.synchronize import Condition as MultiprocessingCondition
 from queue import Empty, Queue
 import sys
-from threading import Event as ThreadingEvent, Thread
+from threading import Condition, Event as ThreadingEvent, Lock, Thread
+import time
 import traceback
 from uuid import UUID, uuid4
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Generator,
     Generic,
@@ -23,6 +26,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    cast,
 )
 
 from vellum.client.core.api_error import ApiError
@@ -30,6 +34,7 @@ from vellum.workflows.constants import undefined
 from vellum.workflows.context import ExecutionContext, execution_context, get_execution_context
 from vellum.workflows.descriptors.base import BaseDescriptor
 from vellum.workflows.descriptors.exceptions import InvalidExpressionException
+from vellum.workflows.emitters.base import BaseWorkflowEmitter
 from vellum.workflows.errors import WorkflowError, WorkflowErrorCode
 from vellum.workflows.events import (
     NodeExecutionFulfilledEvent,
@@ -51,7 +56,6 @@ from vellum.workflows.events.node import (
     NodeExecutionStreamingBody,
 )
 from vellum.workflows.events.types import (
-    BaseEvent,
     NodeParentContext,
     ParentContext,
     SpanLink,
@@ -75,18 +79,19 @@ from vellum.workflows.exceptions import NodeException, WorkflowInitializationExc
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases import BaseNode
 from vellum.workflows.nodes.bases.base import NodeRunResponse
-from vellum.workflows.nodes.mocks import MockNodeExecutionArg
+from vellum.workflows.nodes.mocks import MockNodeExecution, MockNodeExecutionArg
 from vellum.workflows.outputs import BaseOutputs
-from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.outputs.base import AwaitingOutput, BaseOutput
 from vellum.workflows.ports.port import Port
 from vellum.workflows.references import ExternalInputReference, OutputReference
 from vellum.workflows.references.state_value import StateValueReference
-from vellum.workflows.state.base import BaseState
+from vellum.workflows.runner.emitter_worker import EmitterMetrics, EmitterWorker
+from vellum.workflows.runner.snapshot_policy import SnapshotPolicy
 from vellum.workflows.state.delta import StateDelta
 from vellum.workflows.triggers.base import BaseTrigger
 from vellum.workflows.triggers.integration import IntegrationTrigger
 from vellum.workflows.triggers.manual import ManualTrigger
-from vellum.workflows.types.core import CancelSignal
+from vellum.workflows.types.core import CancelSignal, ObservableCancelSignal, OutputValidationMode
 from vellum.workflows.types.generics import InputsType, OutputsType, StateType
 
 if TYPE_CHECKING:
@@ -96,7 +101,26 @@ logger = logging.getLogger(__name__)
 
 RunFromNodeArg = Sequence[Union[Type[BaseNode], UUID]]
 ExternalInputsArg = Dict[ExternalInputReference, Any]
-BackgroundThreadItem = Union[BaseState, WorkflowEvent, None]
+
+_ALWAYS_SERIALIZABLE_TYPES = (str, int, float, type(None), UUID, datetime)
+
+
+def _get_cancel_signal_condition(cancel_signal: CancelSignal) -> Union[Condition, MultiprocessingCondition]:
+    # Both kinds of Event notify waiters through a condition, which lets the cancel thread wait on the signal and on
+    # the workflow finishing at the same time
+    return cancel_signal._cond  # type: ignore[union-attr]
+
+
+def _is_cancel_signal_set(cancel_signal: CancelSignal) -> bool:
+    """Checks whether the cancel signal is set while its condition is held."""
+    if isinstance(cancel_signal, ThreadingEvent):
+        return cancel_signal.is_set()
+
+    # A multiprocessing Event takes its condition's lock in `is_set`, so its flag is checked the way its `wait` does
+    if cancel_signal._flag.acquire(False):  # type: ignore[attr-defined]
+        cancel_signal._flag.release()  # type: ignore[attr-defined]
+        return True
+    return False
 
 
 @dataclass
@@ -105,6 +129,13 @@ class ActiveNode(Generic[StateType]):
     was_outputs_streamed: bool = False
 
 
+@dataclass
+class PendingSnapshot(Generic[StateType]):
+    state: StateType
+    deltas: List[StateDelta]
+    edited_by: Any
+
+
 class WorkflowRunner(Generic[StateType]):
     _entrypoints: Iterable[Type[BaseNode]]
 
@@ -124,6 +155,7 @@ class WorkflowRunner(Generic[StateType]):
         trigger: Optional[BaseTrigger] = None,
         execution_id: Optional[UUID] = None,
         event_max_size: Optional[int] = None,
+        snapshot_policy: Optional[SnapshotPolicy] = None,
     ):
         if state and external_inputs:
             raise ValueError("Can only run a Workflow providing one of state or external inputs, not both")
@@ -133,7 +165,7 @@ class WorkflowRunner(Generic[StateType]):
         self._should_emit_initial_state = True
         self._span_link_info: Optional[Tuple[str, str, str, str]] = None
         if entrypoint_nodes:
-            nodes_by_id = {node.__id__: node for node in self.workflow.get_all_nodes()}
+            nodes_by_id = self.workflow.get_compiled_graph().nodes_by_id
 
             resolved_nodes = []
             for item in entrypoint_nodes:
@@ -257,8 +289,9 @@ class WorkflowRunner(Generic[StateType]):
             # Check if workflow requires a trigger but none was provided
             self._validate_no_trigger_provided()
 
-        # This queue is responsible for sending events from WorkflowRunner to the outside world
-        self._workflow_event_outer_queue: Queue[WorkflowEvent] = Queue()
+        # This queue is responsible for sending events from WorkflowRunner to the outside world. A `None`
+        # item is enqueued once the stream thread exits, waking the consumer without it needing to poll.
+        self._workflow_event_outer_queue: Queue[Optional[WorkflowEvent]] = Queue()
 
         # This queue is responsible for sending events from the inner worker threads to WorkflowRunner
         self._workflow_event_inner_queue: Queue[WorkflowEvent] = Queue()
@@ -266,11 +299,11 @@ class WorkflowRunner(Generic[StateType]):
         self._max_concurrency = max_concurrency
         self._concurrency_queue: Queue[Tuple[StateType, Type[BaseNode], Optional[UUID]]] = Queue()
 
-        # This queue is responsible for sending events from WorkflowRunner to the background thread
-        # for user defined emitters
-        self._background_thread_queue: Queue[BackgroundThreadItem] = Queue()
+        # Each user defined emitter receives events and snapshots from WorkflowRunner through its own worker,
+        # so that a slow emitter doesn't hold up the others
+        self._emitter_workers: List[EmitterWorker] = []
 
-        self._dependencies: Dict[Type[BaseNode], Set[Type[BaseNode]]] = defaultdict(set)
+        self._compiled_graph = self.workflow.get_compiled_graph()
         self._state_forks: Set[StateType] = {self._initial_state}
 
         self._active_nodes_by_execution_id: Dict[UUID, ActiveNode[StateType]] = {}
@@ -279,6 +312,10 @@ class WorkflowRunner(Generic[StateType]):
         self._execution_context = init_execution_context or get_execution_context()
         self._trigger = trigger
         self._event_max_size = event_max_size
+        self._snapshot_policy = snapshot_policy or self.workflow.snapshot_policy
+        self._snapshot_lock = Lock()
+        self._pending_snapshot: Optional[PendingSnapshot[StateType]] = None
+        self._last_snapshot_emitted_at = float("-inf")
 
         setattr(
             self._initial_state,
@@ -293,9 +330,13 @@ class WorkflowRunner(Generic[StateType]):
             descriptor for descriptor in self.workflow.Outputs if isinstance(descriptor.instance, StateValueReference)
         ]
 
-        self._background_thread: Optional[Thread] = None
         self._cancel_thread: Optional[Thread] = None
+        self._stream_thread: Optional[Thread] = None
         self._timeout_thread: Optional[Thread] = None
+        self._is_finished = ThreadingEvent()
+        self._cancellation_lock = Lock()
+        self._cancellation_emitted = ThreadingEvent()
+        self._is_cancelled = False
 
     def _has_manual_trigger(self) -> bool:
         """Check if workflow has ManualTrigger."""
@@ -440,7 +481,59 @@ class WorkflowRunner(Generic[StateType]):
         if execution.parent_context and hasattr(execution.parent_context, "node_definition"):
             edited_by = execution.parent_context.node_definition
 
-        self._workflow_event_inner_queue.put(
+        with self._snapshot_lock:
+            # Deltas are cleared by the state once this callback returns, so we keep our own copy
+            if self._pending_snapshot:
+                deltas = self._pending_snapshot.deltas + deltas
+            else:
+                deltas = list(deltas)
+
+            now = time.monotonic()
+            if not self._snapshot_policy.should_emit(now - self._last_snapshot_emitted_at):
+                self._pending_snapshot = PendingSnapshot(state=state, deltas=deltas, edited_by=edited_by)
+                return state
+
+            self._pending_snapshot = None
+            self._last_snapshot_emitted_at = now
+
+        self._emit_snapshot(self._workflow_event_inner_queue, state, deltas, edited_by)
+        return state
+
+    def _flush_pending_snapshot(self) -> None:
+        """
+        Emits the snapshot deferred by the snapshot policy, if any, directly to the outer queue. Only called from
+        the stream thread, so that the snapshot is ordered before the event that triggered the flush.
+        """
+        with self._snapshot_lock:
+            pending_snapshot = self._pending_snapshot
+            if not pending_snapshot:
+                return
+
+            self._pending_snapshot = None
+            self._last_snapshot_emitted_at = time.monotonic()
+
+        self._emit_snapshot(
+            self._workflow_event_outer_queue,
+            pending_snapshot.state,
+            pending_snapshot.deltas,
+            pending_snapshot.edited_by,
+        )
+
+    def _flush_pending_snapshot_before(self, event: WorkflowEvent) -> None:
+        if event.name == "workflow.execution.snapshotted":
+            return
+
+        if self._snapshot_policy.should_flush(event):
+            self._flush_pending_snapshot()
+
+    def _emit_snapshot(
+        self,
+        queue: "Queue[Any]",
+        state: StateType,
+        deltas: List[StateDelta],
+        edited_by: Any,
+    ) -> None:
+        queue.put(
             WorkflowExecutionSnapshottedEvent(
                 trace_id=self._execution_context.trace_id,
                 span_id=state.meta.span_id,
@@ -478,24 +571,48 @@ class WorkflowRunner(Generic[StateType]):
             )
 
         self.workflow._store.append_state_snapshot(state)
-        self._background_thread_queue.put(state)
-        return state
+        for emitter_worker in self._emitter_workers:
+            emitter_worker.put(state)
 
     def _emit_event(self, event: WorkflowEvent) -> WorkflowEvent:
         if self._event_max_size is not None:
             event._event_max_size = self._event_max_size
         self.workflow._store.append_event(event)
-        self._background_thread_queue.put(event)
+        for emitter_worker in self._emitter_workers:
+            emitter_worker.put(event)
         return event
 
     def _run_work_item(self, node: BaseNode[StateType], span_id: UUID) -> None:
         for event in self.run_node(node, span_id):
             self._workflow_event_inner_queue.put(event)
 
+    def _validate_node_output(self, node: "BaseNode[StateType]", output_name: str, value: Any) -> None:
+        """
+        Raises a NodeException if `value` could not be serialized to JSON when its event is emitted.
+        """
+        if self.workflow.context.output_validation_mode == OutputValidationMode.DEFERRED:
+            return
+
+        # These are serializable regardless of their value, so there is no need to encode them
+        if value is undefined or isinstance(value, _ALWAYS_SERIALIZABLE_TYPES):
+            return
+
+        try:
+            default_serializer(value)
+        except (TypeError, ValueError) as exc:
+            raise NodeException(
+                message=(
+                    f"Node {node.__class__.__name__} produced output '{output_name}' "
+                    f"that could not be serialized to JSON: {exc}"
+                ),
+                code=WorkflowErrorCode.INVALID_OUTPUTS,
+            ) from exc
+
     def run_node(
         self,
         node: "BaseNode[StateType]",
         span_id: UUID,
+        node_run: Optional[Callable[[], NodeRunResponse]] = None,
     ) -> Generator[NodeEvent, None, None]:
         """
         Execute a single node and yield workflow events.
@@ -503,14 +620,13 @@ class WorkflowRunner(Generic[StateType]):
         Args:
             node: The node instance to execute
             span_id: Unique identifier for this node execution
+            node_run: Called instead of `node.run` to get the node's run response, if provided
 
         Yields:
             NodeExecutionEvent: Events emitted during node execution (initiated, streaming, fulfilled, rejected)
         """
         execution = get_execution_context()
 
-        node_output_mocks_map = self.workflow.context.node_output_mocks_map
-
         yield NodeExecutionInitiatedEvent(
             trace_id=execution.trace_id,
             span_id=span_id,
@@ -531,20 +647,16 @@ class WorkflowRunner(Generic[StateType]):
             )
             node_run_response: NodeRunResponse
             was_mocked: Optional[bool] = None
-            mock_candidates = node_output_mocks_map.get(node.Outputs) or []
-            for mock_candidate in mock_candidates:
-                if mock_candidate.disabled:
-                    continue
-                if mock_candidate.when_condition.resolve(node.state):
-                    node_run_response = mock_candidate.then_outputs
-                    was_mocked = True
-                    break
-
-            if not was_mocked:
+            node_output_mock = self._find_node_output_mock(node)
+            if node_output_mock is not None:
+                node_run_response = node_output_mock.then_outputs
+                was_mocked = True
+            else:
                 with execution_context(parent_context=updated_parent_context, trace_id=execution.trace_id):
-                    node_run_response = node.run()
+                    node_run_response = node_run() if node_run is not None else node.run()
 
             ports = node.Ports()
+            validated_output_values: Dict[str, Any] = {}
             if not isinstance(node_run_response, (BaseOutputs, Iterator)):
                 raise NodeException(
                     message=f"Node {node.__class__.__name__} did not return a valid node run response",
@@ -590,16 +702,16 @@ class WorkflowRunner(Generic[StateType]):
 
                 with execution_context(parent_context=updated_parent_context, trace_id=execution.trace_id):
                     for output in node_run_response:
-                        try:
-                            default_serializer(output)
-                        except (TypeError, ValueError) as exc:
-                            raise NodeException(
-                                message=(
-                                    f"Node {node.__class__.__name__} produced output: "
-                                    f"'{output.name}' that could not be serialized to JSON: {exc}"
-                                ),
-                                code=WorkflowErrorCode.INVALID_OUTPUTS,
-                            ) from exc
+                        if isinstance(output, AwaitingOutput):
+                            # Passed on to the AsyncWorkflowRunner, which awaits it before the node's next output
+                            yield cast(NodeEvent, output)
+                            continue
+
+                        if output.is_streaming:
+                            self._validate_node_output(node, output.name, output.delta)
+                        elif output.is_fulfilled:
+                            self._validate_node_output(node, output.name, output.value)
+                            validated_output_values[output.name] = output.value
                         invoked_ports = output > ports
                         if output.is_initiated:
                             yield from initiate_node_streaming_output(output)
@@ -637,16 +749,10 @@ class WorkflowRunner(Generic[StateType]):
             for descriptor, output_value in outputs:
                 if output_value is undefined:
                     continue
-                try:
-                    default_serializer(output_value)
-                except (TypeError, ValueError) as exc:
-                    raise NodeException(
-                        message=(
-                            f"Node {node.__class__.__name__} produced output '{descriptor.name}' "
-                            f"that could not be serialized to JSON: {exc}"
-                        ),
-                        code=WorkflowErrorCode.INVALID_OUTPUTS,
-                    ) from exc
+                # Streamed outputs were already validated when they were fulfilled
+                if validated_output_values.get(descriptor.name, undefined) is output_value:
+                    continue
+                self._validate_node_output(node, descriptor.name, output_value)
 
             node.state.meta.node_execution_cache.fulfill_node_execution(node.__class__, span_id)
 
@@ -778,6 +884,16 @@ class WorkflowRunner(Generic[StateType]):
 
         logger.debug(f"Finished running node: {node.__class__.__name__}")
 
+    def _find_node_output_mock(self, node: "BaseNode[StateType]") -> Optional[MockNodeExecution]:
+        mock_candidates = self.workflow.context.node_output_mocks_map.get(node.Outputs) or []
+        for mock_candidate in mock_candidates:
+            if mock_candidate.disabled:
+                continue
+            if mock_candidate.when_condition.resolve(node.state):
+                return mock_candidate
+
+        return None
+
     def _handle_run_node_exception(
         self,
         exception: Union[NodeException, WorkflowInitializationException, InvalidExpressionException],
@@ -872,6 +988,9 @@ class WorkflowRunner(Generic[StateType]):
         node_class: Type[BaseNode],
         invoked_by: Optional[UUID] = None,
     ) -> None:
+        if self._is_cancelled:
+            return
+
         with state.__lock__:
             for descriptor in node_class.ExternalInputs:
                 if not isinstance(descriptor, ExternalInputReference):
@@ -881,7 +1000,7 @@ class WorkflowRunner(Generic[StateType]):
                     state.meta.external_inputs[descriptor] = undefined
                     return
 
-            all_deps = self._dependencies[node_class]
+            all_deps = self._compiled_graph.get_dependencies(node_class)
             node_span_id = node_class.Trigger._queue_node_execution(state, all_deps, invoked_by)
 
             try:
@@ -907,16 +1026,22 @@ class WorkflowRunner(Generic[StateType]):
             state.meta.node_execution_cache.initiate_node_execution(node_class, node_span_id)
             self._active_nodes_by_execution_id[node_span_id] = ActiveNode(node=node)
 
-            worker_thread = Thread(
-                target=self._context_run_work_item,
-                kwargs={
-                    "node": node,
-                    "span_id": node_span_id,
-                    "parent_context": execution.parent_context,
-                    "trace_id": execution.trace_id,
-                },
-            )
-            worker_thread.start()
+            self._submit_work_item(node, node_span_id, execution.parent_context, execution.trace_id)
+
+    def _submit_work_item(
+        self,
+        node: BaseNode[StateType],
+        span_id: UUID,
+        parent_context: Optional[ParentContext],
+        trace_id: UUID,
+    ) -> None:
+        self.workflow.context.node_executor.submit(
+            self._context_run_work_item,
+            node=node,
+            span_id=span_id,
+            parent_context=parent_context,
+            trace_id=trace_id,
+        )
 
     def _handle_work_item_event(self, event: WorkflowEvent) -> Optional[NodeExecutionRejectedEvent]:
         active_node = self._active_nodes_by_execution_id.get(event.span_id)
@@ -1141,23 +1266,47 @@ class WorkflowRunner(Generic[StateType]):
 
     def _wrapped_stream(self) -> None:
         """Wrapper for _stream that adds httpx logger span ID context."""
-        with self._httpx_logger_with_span_id():
-            self._stream()
+        try:
+            with self._httpx_logger_with_span_id():
+                self._stream()
+        finally:
+            self._workflow_event_outer_queue.put(None)
 
     def _stream(self) -> None:
-        for edge in self.workflow.get_edges():
-            self._dependencies[edge.to_node].add(edge.from_port.node_class)
+        current_parent = self._workflow_parent_context()
+        if not self._run_entrypoints(current_parent):
+            return
 
-        # Call trigger initiated hook so nodes can reference trigger state
-        if self._trigger is not None:
-            self._trigger.__on_workflow_initiated__(self._initial_state)
+        rejection_event: Optional[NodeExecutionRejectedEvent] = None
 
-        current_parent = WorkflowParentContext(
+        while True:
+            if not self._active_nodes_by_execution_id:
+                break
+
+            event = self._workflow_event_inner_queue.get()
+
+            rejection_event = self._process_work_item_event(event, current_parent)
+            if rejection_event:
+                break
+
+        self._finish_stream(current_parent, rejection_event)
+
+    def _workflow_parent_context(self) -> WorkflowParentContext:
+        return WorkflowParentContext(
             span_id=self._initial_state.meta.span_id,
             workflow_definition=self.workflow.__class__,
             parent=self._execution_context.parent_context,
             type="WORKFLOW",
         )
+
+    def _run_entrypoints(self, current_parent: WorkflowParentContext) -> bool:
+        """
+        Starts running the workflow's entrypoint nodes. Returns False if the workflow was rejected instead.
+        """
+        # Call trigger initiated hook so nodes can reference trigger state
+        if self._trigger is not None:
+            self._trigger.__on_workflow_initiated__(self._initial_state)
+
         for node_cls in self._entrypoints:
             try:
                 if not self._max_concurrency or len(self._active_nodes_by_execution_id) < self._max_concurrency:
@@ -1168,11 +1317,11 @@ class WorkflowRunner(Generic[StateType]):
             except NodeException as e:
                 captured_stacktrace = traceback.format_exc()
                 self._workflow_event_outer_queue.put(self._reject_workflow_event(e.error, captured_stacktrace))
-                return
+                return False
             except WorkflowInitializationException as e:
                 captured_stacktrace = traceback.format_exc()
                 self._workflow_event_outer_queue.put(self._reject_workflow_event(e.error, captured_stacktrace))
-                return
+                return False
             except Exception:
                 err_message = f"An unexpected error occurred while initializing node {node_cls.__name__}"
                 logger.exception(err_message)
@@ -1183,31 +1332,34 @@ class WorkflowRunner(Generic[StateType]):
                         captured_stacktrace,
                     )
                 )
-                return
+                return False
 
-        rejection_event: Optional[NodeExecutionRejectedEvent] = None
-
-        while True:
-            if not self._active_nodes_by_execution_id:
-                break
+        return True
 
-            event = self._workflow_event_inner_queue.get()
+    def _process_work_item_event(
+        self, event: WorkflowEvent, current_parent: WorkflowParentContext
+    ) -> Optional[NodeExecutionRejectedEvent]:
+        self._flush_pending_snapshot_before(event)
+        self._workflow_event_outer_queue.put(event)
 
-            self._workflow_event_outer_queue.put(event)
+        with execution_context(parent_context=current_parent, trace_id=self._execution_context.trace_id):
+            rejection_event = self._handle_work_item_event(event)
 
-            with execution_context(parent_context=current_parent, trace_id=self._execution_context.trace_id):
-                rejection_event = self._handle_work_item_event(event)
+        if rejection_event:
+            failed_node_name = rejection_event.body.node_definition.__name__
+            self._emit_node_cancellation_events(
+                error_message=f"Node execution cancelled due to {failed_node_name} failure",
+            )
 
-            if rejection_event:
-                failed_node_name = rejection_event.body.node_definition.__name__
-                self._emit_node_cancellation_events(
-                    error_message=f"Node execution cancelled due to {failed_node_name} failure",
-                )
-                break
+        return rejection_event
 
+    def _finish_stream(
+        self, current_parent: WorkflowParentContext, rejection_event: Optional[NodeExecutionRejectedEvent]
+    ) -> None:
         # Handle any remaining events
         try:
             while event := self._workflow_event_inner_queue.get_nowait():
+                self._flush_pending_snapshot_before(event)
                 self._workflow_event_outer_queue.put(event)
 
                 with execution_context(parent_context=current_parent, trace_id=self._execution_context.trace_id):
@@ -1220,6 +1372,14 @@ class WorkflowRunner(Generic[StateType]):
         except Empty:
             pass
 
+        self._flush_pending_snapshot()
+
+        if self._is_cancelled:
+            # Another thread is cancelling this run. Wait for its rejection to be queued so that it is delivered
+            # before the stream thread signals that it has exited.
+            self._cancellation_emitted.wait()
+            return
+
         final_state = self._state_forks.pop()
         for other_state in self._state_forks:
             final_state += other_state
@@ -1253,6 +1413,8 @@ class WorkflowRunner(Generic[StateType]):
             except Empty:
                 pass
 
+            self._flush_pending_snapshot()
+
         fulfilled_outputs = self.workflow.Outputs()
         for descriptor, value in fulfilled_outputs:
             if isinstance(value, BaseDescriptor):
@@ -1266,41 +1428,48 @@ class WorkflowRunner(Generic[StateType]):
 
         self._workflow_event_outer_queue.put(self._fulfill_workflow_event(fulfilled_outputs, final_state))
 
-    def _run_background_thread(self) -> None:
-        state_class = self.workflow.get_state_class()
-        while True:
-            item = self._background_thread_queue.get()
-            if item is None:
-                break
+    def _terminate_workflow(self, error: WorkflowError) -> None:
+        """
+        Cancels all active nodes and rejects the workflow. Safe to call from any thread, at most once per run.
+        """
+        with self._cancellation_lock:
+            if self._is_cancelled or self._is_finished.is_set():
+                return
+            self._is_cancelled = True
+
+        try:
+            self._emit_node_cancellation_events(
+                error_message=error.message,
+            )
 
-            if isinstance(item, state_class):
-                for emitter in self.workflow.emitters:
-                    emitter.snapshot_state(item)
-            elif isinstance(item, BaseEvent):
-                for emitter in self.workflow.emitters:
-                    emitter.emit_event(item)
+            captured_stacktrace = "".join(traceback.format_stack())
+            self._workflow_event_outer_queue.put(self._reject_workflow_event(error, captured_stacktrace))
+        finally:
+            self._cancellation_emitted.set()
+
+    def _cancel_workflow(self) -> None:
+        self._terminate_workflow(
+            WorkflowError(
+                code=WorkflowErrorCode.WORKFLOW_CANCELLED,
+                message="Workflow run cancelled",
+            )
+        )
 
     def _run_cancel_thread(self, kill_switch: ThreadingEvent) -> None:
         if not self._cancel_signal:
             return
 
-        while not kill_switch.wait(timeout=0.1):
-            if self._cancel_signal.is_set():
-                self._emit_node_cancellation_events(
-                    error_message="Workflow run cancelled",
-                )
+        # Waiting on the condition that the cancel signal notifies when it is set means cancellation is handled the
+        # instant it happens, while `_finish_events` notifies the same condition once the workflow has finished
+        condition = _get_cancel_signal_condition(self._cancel_signal)
+        with condition:
+            while not kill_switch.is_set():
+                if _is_cancel_signal_set(self._cancel_signal):
+                    break
+                condition.wait()
 
-                captured_stacktrace = "".join(traceback.format_stack())
-                self._workflow_event_outer_queue.put(
-                    self._reject_workflow_event(
-                        WorkflowError(
-                            code=WorkflowErrorCode.WORKFLOW_CANCELLED,
-                            message="Workflow run cancelled",
-                        ),
-                        captured_stacktrace,
-                    )
-                )
-                return
+        if not kill_switch.is_set():
+            self._cancel_workflow()
 
     def _run_timeout_thread(self, kill_switch: ThreadingEvent) -> None:
         if not self._timeout:
@@ -1309,18 +1478,13 @@ class WorkflowRunner(Generic[StateType]):
         if kill_switch.wait(timeout=self._timeout):
             return
 
-        self._emit_node_cancellation_events(
-            error_message=f"Workflow execution exceeded timeout of {self._timeout} seconds",
-        )
+        self._timeout_workflow()
 
-        captured_stacktrace = "".join(traceback.format_stack())
-        self._workflow_event_outer_queue.put(
-            self._reject_workflow_event(
-                WorkflowError(
-                    code=WorkflowErrorCode.WORKFLOW_TIMEOUT,
-                    message=f"Workflow execution exceeded timeout of {self._timeout} seconds",
-                ),
-                captured_stacktrace,
+    def _timeout_workflow(self) -> None:
+        self._terminate_workflow(
+            WorkflowError(
+                code=WorkflowErrorCode.WORKFLOW_TIMEOUT,
+                message=f"Workflow execution exceeded timeout of {self._timeout} seconds",
             )
         )
 
@@ -1333,22 +1497,48 @@ class WorkflowRunner(Generic[StateType]):
             return event.workflow_definition == self.workflow.__class__
         return False
 
-    def _generate_events(self) -> Generator[WorkflowEvent, None, None]:
-        self._background_thread = Thread(
-            target=self._run_background_thread,
-            name=f"{self.workflow.__class__.__name__}.background_thread",
-        )
-        self._background_thread.start()
+    def _start_emitter_workers(self) -> None:
+        state_class = self.workflow.get_state_class()
+        self._emitter_workers = [
+            EmitterWorker(
+                emitter,
+                state_class,
+                name=f"{self.workflow.__class__.__name__}.{emitter.__class__.__name__}.emitter_thread",
+            )
+            for emitter in self.workflow.emitters
+        ]
+        for emitter_worker in self._emitter_workers:
+            emitter_worker.start()
 
-        cancel_thread_kill_switch = ThreadingEvent()
-        if self._cancel_signal:
+    def _watch_cancel_signal(self, kill_switch: ThreadingEvent) -> None:
+        if isinstance(self._cancel_signal, ObservableCancelSignal):
+            self._cancel_signal.add_callback(self._cancel_workflow)
+        elif self._cancel_signal:
             self._cancel_thread = Thread(
                 target=self._run_cancel_thread,
                 name=f"{self.workflow.__class__.__name__}.cancel_thread",
-                kwargs={"kill_switch": cancel_thread_kill_switch},
+                kwargs={"kill_switch": kill_switch},
             )
             self._cancel_thread.start()
 
+    def _finish_events(self, cancel_thread_kill_switch: ThreadingEvent) -> None:
+        self._is_finished.set()
+        for emitter_worker in self._emitter_workers:
+            emitter_worker.close()
+        if isinstance(self._cancel_signal, ObservableCancelSignal):
+            self._cancel_signal.remove_callback(self._cancel_workflow)
+        cancel_thread_kill_switch.set()
+        if self._cancel_thread and self._cancel_signal:
+            condition = _get_cancel_signal_condition(self._cancel_signal)
+            with condition:
+                condition.notify_all()
+
+    def _generate_events(self) -> Generator[WorkflowEvent, None, None]:
+        self._start_emitter_workers()
+
+        cancel_thread_kill_switch = ThreadingEvent()
+        self._watch_cancel_signal(cancel_thread_kill_switch)
+
         timeout_thread_kill_switch = ThreadingEvent()
         if self._timeout:
             self._timeout_thread = Thread(
@@ -1373,19 +1563,24 @@ class WorkflowRunner(Generic[StateType]):
         )
         self._stream_thread.start()
 
-        while self._stream_thread.is_alive():
-            try:
-                event = self._workflow_event_outer_queue.get(timeout=0.1)
-            except Empty:
-                continue
+        while True:
+            queued_event = self._workflow_event_outer_queue.get()
+            if queued_event is None:
+                break
 
+            event = queued_event
             yield self._emit_event(event)
 
             if self._is_terminal_event(event):
                 break
 
         try:
-            while event := self._workflow_event_outer_queue.get_nowait():
+            while True:
+                queued_event = self._workflow_event_outer_queue.get_nowait()
+                if queued_event is None:
+                    continue
+
+                event = queued_event
                 yield self._emit_event(event)
         except Empty:
             pass
@@ -1398,13 +1593,19 @@ class WorkflowRunner(Generic[StateType]):
                 )
             )
 
-        self._background_thread_queue.put(None)
-        cancel_thread_kill_switch.set()
+        self._finish_events(cancel_thread_kill_switch)
         timeout_thread_kill_switch.set()
 
     def stream(self) -> WorkflowEventStream:
         return WorkflowEventGenerator(self._generate_events(), self._initial_state.meta.span_id)
 
+    @property
+    def emitter_metrics(self) -> Dict[BaseWorkflowEmitter, EmitterMetrics]:
+        """
+        How far each of the workflow's emitters is behind the events and snapshots of this run.
+        """
+        return {emitter_worker.emitter: emitter_worker.metrics for emitter_worker in self._emitter_workers}
+
     def join(self) -> None:
         """
         Wait for all background threads to complete.
@@ -1413,8 +1614,8 @@ class WorkflowRunner(Generic[StateType]):
         if self._stream_thread and self._stream_thread.is_alive():
             self._stream_thread.join()
 
-        if self._background_thread and self._background_thread.is_alive():
-            self._background_thread.join()
+        for emitter_worker in self._emitter_workers:
+            emitter_worker.join()
 
         if self._cancel_thread and self._cancel_thread.is_alive():
             self._cancel_thread.join()
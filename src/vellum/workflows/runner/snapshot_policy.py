@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from vellum.workflows.events.workflow import WorkflowEvent
+
+NODE_BOUNDARY_EVENT_NAMES = {"node.execution.fulfilled", "node.execution.rejected", "node.execution.paused"}
+
+
+class SnapshotPolicy:
+    """
+    Decides when the WorkflowRunner emits `workflow.execution.snapshotted` events for state mutations.
+
+    The default policy emits a snapshot for every mutation. Policies that defer a snapshot leave the runner
+    holding the latest deferred state along with every delta recorded since the last emitted snapshot. These are
+    emitted together as a single snapshot at the next flush point, and always before the workflow's terminal event.
+    """
+
+    def should_emit(self, seconds_since_last_snapshot: float) -> bool:
+        """
+        Whether the snapshot that was just taken should be emitted right away instead of deferred.
+        """
+        return True
+
+    def should_flush(self, event: "WorkflowEvent") -> bool:
+        """
+        Whether any deferred snapshot should be emitted before `event` is forwarded to the consumer.
+        """
+        return False
+
+
+class NodeBoundarySnapshotPolicy(SnapshotPolicy):
+    """
+    Only emits snapshots when a node execution finishes, covering every mutation the node made.
+    """
+
+    def should_emit(self, seconds_since_last_snapshot: float) -> bool:
+        return False
+
+    def should_flush(self, event: "WorkflowEvent") -> bool:
+        return event.name in NODE_BOUNDARY_EVENT_NAMES
+
+
+class RateLimitedSnapshotPolicy(SnapshotPolicy):
+    """
+    Emits at most `max_per_second` snapshots per second. Mutations made in between are emitted with the next
+    snapshot, or when the node that made them finishes.
+    """
+
+    def __init__(self, max_per_second: float) -> None:
+        if max_per_second <= 0:
+            raise ValueError("max_per_second must be greater than 0")
+
+        self.max_per_second = max_per_second
+
+    def should_emit(self, seconds_since_last_snapshot: float) -> bool:
+        return seconds_since_last_snapshot * self.max_per_second >= 1
+
+    def should_flush(self, event: "WorkflowEvent") -> bool:
+        return event.name in NODE_BOUNDARY_EVENT_NAMES
+
+
+class CoalescingSnapshotPolicy(SnapshotPolicy):
+    """
+    Merges consecutive mutations into a single snapshot, emitted just before the next non-snapshot event.
+    """
+
+    def should_emit(self, seconds_since_last_snapshot: float) -> bool:
+        return False
+
+    def should_flush(self, event: "WorkflowEvent") -> bool:
+        return True
@@ -1,10 +1,21 @@
+import pytest
+import threading
+from typing import Any, Iterator, List, Optional
+
 from vellum.client.core.api_error import ApiError
+from vellum.workflows.emitters.base import BaseWorkflowEmitter
 from vellum.workflows.errors.types import WorkflowErrorCode
 from vellum.workflows.events.node import NodeExecutionInitiatedEvent, NodeExecutionRejectedEvent
+from vellum.workflows.events.workflow import WorkflowEvent
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.nodes.bases.base import BaseNode
+from vellum.workflows.outputs.base import BaseOutput
+from vellum.workflows.runner import NodeBoundarySnapshotPolicy
 from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.types.core import OutputValidationMode
 from vellum.workflows.workflows.base import BaseWorkflow
+from vellum.workflows.workflows.event_filters import all_workflow_event_filter
 
 
 def test_workflow_runner__handles_400_api_error_with_integration_details():
@@ -168,3 +179,180 @@ def test_workflow_runner__handles_400_api_error_without_integration_details():
     # AND the error should NOT have INTEGRATION_CREDENTIALS_UNAVAILABLE code
     rejected_event = events[1]
     assert rejected_event.body.error.code != WorkflowErrorCode.INTEGRATION_CREDENTIALS_UNAVAILABLE
+
+
+def test_workflow_runner__node_boundary_snapshot_policy():
+    """
+    Tests that a NodeBoundarySnapshotPolicy emits a single snapshot per node covering all of its mutations.
+    """
+
+    # GIVEN a node that mutates state several times
+    class TestState(BaseState):
+        counter: int = 0
+
+    class CountingNode(BaseNode[TestState]):
+        def run(self) -> BaseNode.Outputs:
+            for _ in range(5):
+                self.state.counter += 1
+            return self.Outputs()
+
+    class TestWorkflow(BaseWorkflow[BaseInputs, TestState]):
+        graph = CountingNode
+
+        class Outputs(BaseWorkflow.Outputs):
+            counter = TestState.counter
+
+    # AND a workflow configured to only snapshot at node boundaries
+    workflow = TestWorkflow(snapshot_policy=NodeBoundarySnapshotPolicy())
+
+    # WHEN we stream the workflow
+    events = list(workflow.stream(event_filter=all_workflow_event_filter))
+
+    # THEN a single snapshot should be emitted before the node is fulfilled
+    event_names = [event.name for event in events]
+    assert event_names.count("workflow.execution.snapshotted") == 1
+    assert event_names.index("workflow.execution.snapshotted") < event_names.index("node.execution.fulfilled")
+
+    # AND the snapshot should contain every mutation the node made
+    snapshotted_event = next(event for event in events if event.name == "workflow.execution.snapshotted")
+    assert snapshotted_event.state.counter == 5
+
+    # AND the workflow should still be fulfilled with the final state
+    assert events[-1].name == "workflow.execution.fulfilled"
+    assert events[-1].outputs.counter == 5
+
+
+@pytest.mark.parametrize(
+    ["output_validation_mode", "expected_event_name"],
+    [
+        (OutputValidationMode.EAGER, "workflow.execution.rejected"),
+        (OutputValidationMode.DEFERRED, "workflow.execution.fulfilled"),
+    ],
+)
+def test_workflow_runner__output_validation_mode(output_validation_mode, expected_event_name):
+    """
+    Tests that streamed outputs that cannot be serialized are only rejected when validation is eager.
+    """
+
+    # GIVEN a node that streams string chunks followed by a value that cannot be serialized to JSON
+    class StreamingNode(BaseNode):
+        class Outputs(BaseNode.Outputs):
+            chunks: Any
+
+        def run(self) -> Iterator[BaseOutput]:
+            for chunk in ["Hello", ", ", "world"]:
+                yield BaseOutput(name="chunks", delta=chunk)
+            yield BaseOutput(name="chunks", delta=object())
+
+    class TestWorkflow(BaseWorkflow):
+        graph = StreamingNode
+
+    # AND a context configured with the given output validation mode
+    workflow = TestWorkflow(context=WorkflowContext(output_validation_mode=output_validation_mode))
+
+    # WHEN we run the workflow
+    terminal_event = workflow.run()
+
+    # THEN the workflow should only be rejected when outputs are validated eagerly
+    assert terminal_event.name == expected_event_name, terminal_event
+    if terminal_event.name == "workflow.execution.rejected":
+        assert terminal_event.error.code == WorkflowErrorCode.INVALID_OUTPUTS
+        assert "'chunks' that could not be serialized to JSON" in terminal_event.error.message
+
+
+class RecordingEmitter(BaseWorkflowEmitter):
+    def __init__(self, release: Optional[threading.Event] = None):
+        super().__init__()
+        self.release = release
+        self.event_names: List[str] = []
+        self.snapshot_count = 0
+        self.fulfilled = threading.Event()
+
+    def emit_event(self, event: WorkflowEvent) -> None:
+        if self.release:
+            self.release.wait()
+
+        self.event_names.append(event.name)
+        if event.name == "workflow.execution.fulfilled":
+            self.fulfilled.set()
+
+    def snapshot_state(self, state: BaseState) -> None:
+        self.snapshot_count += 1
+
+    def join(self) -> None:
+        pass
+
+
+def test_workflow_runner__slow_emitter_does_not_delay_other_emitters():
+    """
+    Tests that each emitter receives events on its own thread, in order, regardless of how slow other emitters are.
+    """
+
+    # GIVEN a workflow with an emitter that blocks until released, and an emitter that doesn't
+    class TestNode(BaseNode):
+        pass
+
+    class TestWorkflow(BaseWorkflow):
+        graph = TestNode
+
+    release = threading.Event()
+    slow_emitter = RecordingEmitter(release=release)
+    fast_emitter = RecordingEmitter()
+    workflow = TestWorkflow(emitters=[slow_emitter, fast_emitter])
+
+    # WHEN we run the workflow
+    terminal_event = workflow.run()
+    assert terminal_event.name == "workflow.execution.fulfilled", terminal_event
+
+    # THEN the fast emitter receives every event while the slow emitter is still blocked
+    assert fast_emitter.fulfilled.wait(timeout=5)
+    assert slow_emitter.event_names == []
+
+    # AND the slow emitter has fallen behind
+    assert workflow._current_runner
+    slow_metrics = workflow._current_runner.emitter_metrics[slow_emitter]
+    assert slow_metrics.queued > 0
+    assert slow_metrics.lag > 0
+
+    # AND once released, the slow emitter receives the same events in the same order
+    release.set()
+    workflow.join()
+    assert slow_emitter.event_names == fast_emitter.event_names
+    assert fast_emitter.event_names[0] == "workflow.execution.initiated"
+    assert fast_emitter.event_names[-1] == "workflow.execution.fulfilled"
+
+
+def test_workflow_runner__emitter_drops_newest_events_when_queue_is_full():
+    """
+    Tests that an emitter's overflow policy applies once its delivery queue is full.
+    """
+
+    # GIVEN a workflow with a node
+    class TestNode(BaseNode):
+        pass
+
+    class TestWorkflow(BaseWorkflow):
+        graph = TestNode
+
+    # AND a blocked emitter with room for a single waiting event that drops new events once full
+    release = threading.Event()
+    emitter = RecordingEmitter(release=release)
+    emitter.delivery_queue_size = 1
+    emitter.delivery_overflow_policy = "drop_newest"
+    workflow = TestWorkflow(emitters=[emitter])
+
+    # WHEN we run the workflow and then release the emitter
+    events = list(workflow.stream(event_filter=all_workflow_event_filter))
+    release.set()
+    workflow.join()
+
+    # THEN the workflow itself was not held up, and the emitter only received the events that fit in its queue
+    assert events[-1].name == "workflow.execution.fulfilled"
+    assert emitter.event_names == [event.name for event in events][: len(emitter.event_names)]
+
+    # AND everything else was counted as dropped
+    assert workflow._current_runner
+    metrics = workflow._current_runner.emitter_metrics[emitter]
+    assert metrics.delivered == len(emitter.event_names) + emitter.snapshot_count
+    assert metrics.dropped >= len(events) - len(emitter.event_names)
+    assert metrics.queued == 0
@@ -12,6 +12,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    ClassVar,
     Dict,
     Iterator,
     List,
@@ -40,10 +41,17 @@ from vellum.workflows.references import (
     TriggerAttributeReference,
 )
 from vellum.workflows.state.delta import AppendStateDelta, SetStateDelta, StateDelta
+from vellum.workflows.types.core import SnapshotMode
 from vellum.workflows.types.definition import CodeResourceDefinition, serialize_type_encoder_with_id
 from vellum.workflows.types.generics import StateType, import_workflow_class, is_workflow_class
 from vellum.workflows.types.stack import Stack
-from vellum.workflows.types.utils import datetime_now, deepcopy_with_exclusions, get_class_attr_names, infer_types
+from vellum.workflows.types.utils import (
+    clear_type_cache,
+    datetime_now,
+    deepcopy_with_exclusions,
+    get_class_attr_names,
+    infer_types,
+)
 
 if TYPE_CHECKING:
     from vellum.workflows import BaseWorkflow
@@ -77,6 +85,16 @@ class _BaseStateMeta(type):
 
         return super().__getattribute__(name)
 
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_") or name == "__annotations__":
+            clear_type_cache(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if not name.startswith("_") or name == "__annotations__":
+            clear_type_cache(cls)
+
     def __iter__(cls) -> Iterator[StateValueReference]:
         # We iterate through the inheritance hierarchy to find all the StateValueReference attached to this
         # Inputs class. __mro__ is the method resolution order, which is the order in which base classes are resolved.
@@ -113,16 +131,90 @@ class _SnapshottableDict(dict, _Snapshottable):
         return y
 
 
-class _SnapshottableList(list, _Snapshottable):
-    def __setitem__(self, index: Union[SupportsIndex, slice], value: Any) -> None:
+class _ListPrefixSource:
+    """
+    The list that lazy snapshots of a `_SnapshottableList` read their prefix from. It points at the live list
+    until the live list is next edited in place, at which point it is swapped for a frozen copy.
+    """
+
+    def __init__(self, items: List[Any]) -> None:
+        self.items = items
+
+
+class _LazyListSnapshot:
+    """
+    Placeholder stored on a structural snapshot in place of a list, resolved the first time the snapshot is read.
+    """
+
+    def __init__(self, source: _ListPrefixSource, length: int, lock: Optional[RLock]) -> None:
+        self._source = source
+        self._length = length
+        self._lock = lock
+
+    def materialize(self) -> List[Any]:
         if self._lock:
             with self._lock:
-                super().__setitem__(index, value)
-        else:
-            super().__setitem__(index, value)
+                return self._source.items[: self._length]
+        return self._source.items[: self._length]
+
+
+class _SnapshottableList(list, _Snapshottable):
+    _prefix_source: Optional[_ListPrefixSource] = None
+
+    def __setitem__(self, index: Union[SupportsIndex, slice], value: Any) -> None:
+        self._edit_in_place(list.__setitem__, index, value)
         if isinstance(index, int):
             self._snapshot_callback(SetStateDelta(name=f"{self._path}.{index}", delta=value))
 
+    def __delitem__(self, index: Union[SupportsIndex, slice]) -> None:
+        self._edit_in_place(list.__delitem__, index)
+
+    def __imul__(self, value: SupportsIndex) -> "_SnapshottableList":  # type: ignore[override, misc]
+        return self._edit_in_place(list.__imul__, value)
+
+    def insert(self, index: SupportsIndex, value: Any) -> None:
+        self._edit_in_place(list.insert, index, value)
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        return self._edit_in_place(list.pop, index)
+
+    def remove(self, value: Any) -> None:
+        self._edit_in_place(list.remove, value)
+
+    def clear(self) -> None:
+        self._edit_in_place(list.clear)
+
+    def reverse(self) -> None:
+        self._edit_in_place(list.reverse)
+
+    def sort(self, **kwargs: Any) -> None:
+        self._edit_in_place(list.sort, **kwargs)
+
+    def __lazy_snapshot__(self) -> _LazyListSnapshot:
+        """
+        Returns a placeholder for the current contents of this list without copying it. Appends leave the
+        placeholder's prefix untouched, and any other edit freezes it first.
+        """
+        if self._prefix_source is None:
+            self._prefix_source = _ListPrefixSource(self)
+        return _LazyListSnapshot(self._prefix_source, len(self), self._lock)
+
+    def _edit_in_place(self, edit: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if self._lock:
+            with self._lock:
+                self._freeze_lazy_snapshots()
+                return edit(self, *args, **kwargs)
+
+        self._freeze_lazy_snapshots()
+        return edit(self, *args, **kwargs)
+
+    def _freeze_lazy_snapshots(self) -> None:
+        if self._prefix_source is None:
+            return
+
+        self._prefix_source.items = list(self)
+        self._prefix_source = None
+
     def append(self, value: Any) -> None:
         if self._lock:
             with self._lock:
@@ -144,6 +236,80 @@ class _SnapshottableList(list, _Snapshottable):
         return y
 
 
+def _lazy_snapshot_getattribute(state: "BaseState", name: str) -> Any:
+    if name == "__dict__" or (name != "meta" and not name.startswith("_")):
+        _materialize_lazy_snapshot(state)
+    return object.__getattribute__(state, name)
+
+
+def _lazy_snapshot_class(state_class: Type["BaseState"]) -> Type["BaseState"]:
+    """
+    Returns the subclass that structural snapshots of `state_class` are created as, until they are first read.
+    """
+    lazy_snapshot_class = state_class.__dict__.get("__lazy_snapshot_class__")
+    if lazy_snapshot_class is None:
+        lazy_snapshot_class = _BaseStateMeta(
+            state_class.__name__,
+            (state_class,),
+            {
+                "__module__": state_class.__module__,
+                "__qualname__": state_class.__qualname__,
+                "__getattribute__": _lazy_snapshot_getattribute,
+                "__lazy_snapshot_of__": state_class,
+            },
+        )
+        type.__setattr__(state_class, "__lazy_snapshot_class__", lazy_snapshot_class)
+
+    return cast(Type["BaseState"], lazy_snapshot_class)
+
+
+def _structural_copy(state: "BaseState") -> "BaseState":
+    """
+    Copies `state` for a snapshot without copying its lists. Each list is replaced by a placeholder that is
+    resolved, along with the rest of the snapshot, the first time anything other than `meta` is read from it.
+    """
+    lazy_lists = {
+        name: value.__lazy_snapshot__()
+        for name, value in vars(state).items()
+        if not name.startswith("_") and name != "meta" and isinstance(value, _SnapshottableList)
+    }
+    new_state = deepcopy_with_exclusions(
+        state,
+        exclusions={
+            "__lock__": RLock(),
+            "__deltas__": [],
+            **lazy_lists,
+        },
+        memo={},
+    )
+    new_state.meta.add_snapshot_callback(new_state.__snapshot__, new_state.__lock__)
+
+    for name, value in list(vars(new_state).items()):
+        if not name.startswith("_") and name != "meta" and name not in lazy_lists:
+            rebound_value = _make_snapshottable(name, value, new_state.__snapshot__, new_state.__lock__)
+            object.__setattr__(new_state, name, rebound_value)
+
+    object.__setattr__(new_state, "__class__", _lazy_snapshot_class(type(state)))
+    return new_state
+
+
+def _materialize_lazy_snapshot(state: "BaseState") -> None:
+    attributes = object.__getattribute__(state, "__dict__")
+    with attributes["__lock__"]:
+        state_class = type(state).__dict__.get("__lazy_snapshot_of__")
+        if state_class is None:
+            return
+
+        snapshot_callback = object.__getattribute__(state, "__snapshot__")
+        for name, value in list(attributes.items()):
+            if isinstance(value, _LazyListSnapshot):
+                attributes[name] = _make_snapshottable(
+                    name, value.materialize(), snapshot_callback, attributes["__lock__"]
+                )
+
+        object.__setattr__(state, "__class__", state_class)
+
+
 def _make_snapshottable(
     path: str,
     value: Any,
@@ -176,6 +342,7 @@ NodeExecutionsInitiated = Dict[Type["BaseNode"], Set[UUID]]
 NodeExecutionsQueued = Dict[Type["BaseNode"], List[UUID]]
 NodeExecutionLookup = Dict[UUID, Type["BaseNode"]]
 DependenciesInvoked = Dict[UUID, Set[UUID]]
+DependencyClassesInvoked = Dict[UUID, Set[Type["BaseNode"]]]
 
 
 class NodeExecutionCache:
@@ -186,6 +353,7 @@ class NodeExecutionCache:
 
     # Derived fields - no need to serialize
     __node_execution_lookup__: NodeExecutionLookup  # execution_id -> node_class
+    __dependency_classes_invoked__: DependencyClassesInvoked  # execution_id -> node classes of its invokers
 
     def __init__(self) -> None:
         self._dependencies_invoked = defaultdict(set)
@@ -193,6 +361,7 @@ class NodeExecutionCache:
         self._node_executions_initiated = defaultdict(set)
         self._node_executions_queued = defaultdict(list)
         self.__node_execution_lookup__ = {}
+        self.__dependency_classes_invoked__ = defaultdict(set)
 
     @classmethod
     def deserialize(cls, raw_data: dict, nodes: Dict[Union[str, UUID], Type["BaseNode"]]):
@@ -239,6 +408,13 @@ class NodeExecutionCache:
                 for execution_id in execution_ids:
                     cache.__node_execution_lookup__[execution_id] = node_class
 
+        for execution_id, dependency_execution_ids in cache._dependencies_invoked.items():
+            cache.__dependency_classes_invoked__[execution_id] = {
+                cache.__node_execution_lookup__[dep]
+                for dep in dependency_execution_ids
+                if dep in cache.__node_execution_lookup__
+            }
+
         node_executions_queued = raw_data.get("node_executions_queued")
         if isinstance(node_executions_queued, dict):
             for node, execution_ids in node_executions_queued.items():
@@ -257,20 +433,24 @@ class NodeExecutionCache:
         invoked_by: UUID,
         dependencies: Set["Type[BaseNode]"],
     ) -> None:
-        self._dependencies_invoked[execution_id].add(invoked_by)
-        invoked_node_classes = {
-            self.__node_execution_lookup__[dep]
-            for dep in self._dependencies_invoked[execution_id]
-            if dep in self.__node_execution_lookup__
-        }
-        if len(invoked_node_classes) != len(dependencies):
-            return
-
-        if any(dep not in invoked_node_classes for dep in dependencies):
+        self._add_invoked_dependency(execution_id, invoked_by)
+        if self.get_dependency_classes_invoked(execution_id) != dependencies:
             return
 
         self._node_executions_queued[node].remove(execution_id)
 
+    def _add_invoked_dependency(self, execution_id: UUID, invoked_by: UUID) -> None:
+        self._dependencies_invoked[execution_id].add(invoked_by)
+        invoked_by_node = self.__node_execution_lookup__.get(invoked_by)
+        if invoked_by_node is not None:
+            self.__dependency_classes_invoked__[execution_id].add(invoked_by_node)
+
+    def get_dependency_classes_invoked(self, execution_id: UUID) -> Set[Type["BaseNode"]]:
+        """
+        Returns the node classes of the executions that have invoked `execution_id` so far.
+        """
+        return self.__dependency_classes_invoked__.get(execution_id, set())
+
     def is_node_execution_initiated(self, node: Type["BaseNode"], execution_id: UUID) -> bool:
         return execution_id in self._node_executions_initiated[node]
 
@@ -590,6 +770,7 @@ class BaseState(metaclass=_BaseStateMeta):
     __is_atomic__: bool = field(init=False)
     __snapshot_callback__: Callable[["BaseState", List[StateDelta]], None] = field(init=False)
     __deltas__: List[StateDelta] = field(init=False)
+    __snapshot_mode__: ClassVar[SnapshotMode] = SnapshotMode.DEEPCOPY
 
     def __init__(self, meta: Optional[StateMeta] = None, **kwargs: Any) -> None:
         self.__is_quiet__ = True
@@ -725,7 +906,10 @@ class BaseState(metaclass=_BaseStateMeta):
 
         try:
             with self.__lock__:
-                state_copy = deepcopy(self)
+                if self.__snapshot_mode__ == SnapshotMode.STRUCTURAL:
+                    state_copy = _structural_copy(self)
+                else:
+                    state_copy = deepcopy(self)
             self.__snapshot_callback__(state_copy, self.__deltas__)
         except Exception:
             logger.exception("Failed to snapshot Workflow state.")
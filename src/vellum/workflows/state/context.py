@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from functools import cached_property
 import json
@@ -5,20 +6,27 @@ import logging
 from queue import Queue
 import traceback
 from uuid import UUID, uuid4
+import weakref
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
-from vellum import Vellum, __version__
+import httpx
+from requests import Session
+
+from vellum import AsyncVellum, Vellum, __version__
 from vellum.client.types import SeverityEnum
 from vellum.workflows.context import ExecutionContext, get_execution_context, set_execution_context
 from vellum.workflows.events.node import NodeExecutionLogBody, NodeExecutionLogEvent
 from vellum.workflows.events.types import ExternalParentContext, NodeParentContext
+from vellum.workflows.executors import BaseNodeExecutor, get_default_node_executor
 from vellum.workflows.nodes.mocks import MockNodeExecution, MockNodeExecutionArg
 from vellum.workflows.outputs.base import BaseOutputs
 from vellum.workflows.references.constant import ConstantValueReference
 from vellum.workflows.state.store import Store
+from vellum.workflows.types.core import OutputValidationMode
+from vellum.workflows.utils.http import get_default_async_http_client, get_default_http_session
 from vellum.workflows.utils.uuids import generate_workflow_deployment_prefix
 from vellum.workflows.utils.zip import extract_zip_files
-from vellum.workflows.vellum_client import create_vellum_client
+from vellum.workflows.vellum_client import create_async_vellum_client_from, create_vellum_client
 
 if TYPE_CHECKING:
     from vellum.workflows.events.workflow import WorkflowEvent
@@ -50,14 +58,28 @@ class WorkflowContext:
         namespace: Optional[str] = None,
         store_class: Optional[Type[Store]] = None,
         event_max_size: Optional[int] = None,
+        node_executor: Optional[BaseNodeExecutor] = None,
+        output_validation_mode: OutputValidationMode = OutputValidationMode.EAGER,
+        http_session: Optional[Session] = None,
+        async_vellum_client: Optional[AsyncVellum] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
     ):
         self._vellum_client = vellum_client
+        self._async_vellum_client = async_vellum_client
+        self._async_vellum_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncVellum]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_http_client = async_http_client
         self._event_queue: Optional[Queue["WorkflowEvent"]] = None
         self._node_output_mocks_map: Dict[Type[BaseOutputs], List[MockNodeExecution]] = {}
         self._execution_context = get_execution_context()
         self._namespace = namespace
         self._store_class = store_class if store_class is not None else Store
         self._event_max_size = event_max_size
+        self._node_executor = node_executor
+        self._output_validation_mode = output_validation_mode
+        self._http_session = http_session
+        self._parent_workflow_context: Optional["WorkflowContext"] = None
 
         if execution_context is not None:
             self._execution_context.trace_id = execution_context.trace_id
@@ -79,8 +101,28 @@ class WorkflowContext:
         if self._vellum_client:
             return self._vellum_client
 
+        if self._parent_workflow_context is not None:
+            return self._parent_workflow_context.vellum_client
+
         return create_vellum_client()
 
+    @property
+    def async_vellum_client(self) -> AsyncVellum:
+        """
+        The client used by nodes that implement `arun`. Unless one was provided, an AsyncVellum client is created
+        for each event loop with the same configuration as `vellum_client`.
+        """
+        if self._async_vellum_client:
+            return self._async_vellum_client
+
+        loop = asyncio.get_running_loop()
+        async_vellum_client = self._async_vellum_clients.get(loop)
+        if async_vellum_client is None:
+            async_vellum_client = create_async_vellum_client_from(self.vellum_client)
+            self._async_vellum_clients[loop] = async_vellum_client
+
+        return async_vellum_client
+
     @cached_property
     def execution_context(self) -> ExecutionContext:
         return self._execution_context
@@ -105,6 +147,22 @@ class WorkflowContext:
     def event_max_size(self) -> Optional[int]:
         return self._event_max_size
 
+    @property
+    def node_executor(self) -> BaseNodeExecutor:
+        return self._node_executor or get_default_node_executor()
+
+    @property
+    def output_validation_mode(self) -> OutputValidationMode:
+        return self._output_validation_mode
+
+    @property
+    def http_session(self) -> Session:
+        return self._http_session or get_default_http_session()
+
+    @property
+    def async_http_client(self) -> httpx.AsyncClient:
+        return self._async_http_client or get_default_async_http_client()
+
     @property
     def monitoring_url(self) -> Optional[str]:
         """
@@ -361,10 +419,18 @@ class WorkflowContext:
 
     @classmethod
     def create_from(cls, context: "WorkflowContext") -> "WorkflowContext":
-        return cls(
-            vellum_client=context.vellum_client,
+        nested_context = cls(
+            vellum_client=context._vellum_client,
             generated_files=context.generated_files,
             namespace=context.namespace,
             store_class=context.store_class,
             event_max_size=context.event_max_size,
+            node_executor=context._node_executor,
+            output_validation_mode=context.output_validation_mode,
+            http_session=context._http_session,
+            async_vellum_client=context._async_vellum_client,
+            async_http_client=context._async_http_client,
         )
+        # Nested workflows share the parent's client, which is only created once one of their nodes needs it
+        nested_context._parent_workflow_context = context
+        return nested_context
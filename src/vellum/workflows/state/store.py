@@ -1,8 +1,21 @@
-from typing import Iterator, List
+from collections import deque
+from datetime import datetime, timedelta
+import json
+import os
+import sqlite3
+import tempfile
+from threading import Lock
+import weakref
+from typing import TYPE_CHECKING, Deque, Dict, Iterator, List, Optional, Type
 
+from vellum.utils.json_encoder import VellumJsonEncoder
 from vellum.workflows.events.workflow import WorkflowEvent
 from vellum.workflows.state.base import BaseState
 
+if TYPE_CHECKING:
+    from vellum.workflows import BaseWorkflow
+    from vellum.workflows.nodes.bases import BaseNode
+
 
 class Store:
     def __init__(self) -> None:
@@ -27,6 +40,37 @@ class Store:
     def state_snapshots(self) -> Iterator[BaseState]:
         return iter(self._state_snapshots)
 
+    def get_state_at_node(self, node: Type["BaseNode"]) -> Optional[BaseState]:
+        """
+        Returns the most recent state snapshot taken before `node` was last initiated, if any.
+        """
+        event_ts = datetime.min
+        for event in self.events:
+            if event.name == "node.execution.initiated" and event.node_definition == node:
+                event_ts = event.timestamp
+
+        most_recent_state_snapshot: Optional[BaseState] = None
+        for snapshot in self.state_snapshots:
+            if snapshot.meta.updated_ts > event_ts:
+                break
+
+            most_recent_state_snapshot = snapshot
+
+        return most_recent_state_snapshot
+
+    def get_most_recent_state(self) -> Optional[BaseState]:
+        """
+        Returns the state snapshot with the latest `updated_ts`, if any.
+        """
+        most_recent_state_snapshot: Optional[BaseState] = None
+        for snapshot in self.state_snapshots:
+            if not most_recent_state_snapshot:
+                most_recent_state_snapshot = snapshot
+            elif snapshot.meta.updated_ts >= most_recent_state_snapshot.meta.updated_ts:
+                most_recent_state_snapshot = snapshot
+
+        return most_recent_state_snapshot
+
 
 class EmptyStore(Store):
     """
@@ -39,3 +83,217 @@ class EmptyStore(Store):
 
     def append_state_snapshot(self, state: BaseState) -> None:
         pass
+
+
+class BoundedStore(Store):
+    """
+    A store that only retains the last `max_events` events and `max_state_snapshots` state snapshots. It also
+    keeps the snapshot that each node was last initiated from, so that workflows can still be resumed from any
+    node with memory that does not grow with the length of the run.
+    """
+
+    def __init__(self, max_events: int = 1000, max_state_snapshots: int = 100) -> None:
+        if max_events <= 0 or max_state_snapshots <= 0:
+            raise ValueError("max_events and max_state_snapshots must be greater than 0")
+
+        super().__init__()
+        self._max_events = max_events
+        self._max_state_snapshots = max_state_snapshots
+        self._reset()
+
+    def _reset(self) -> None:
+        self._events: Deque[WorkflowEvent] = deque(maxlen=self._max_events)  # type: ignore[assignment]
+        self._state_snapshots: Deque[BaseState] = deque(maxlen=self._max_state_snapshots)  # type: ignore[assignment]
+        self._evicted_state_snapshot: Optional[BaseState] = None
+        self._state_at_node: Dict[Type["BaseNode"], Optional[BaseState]] = {}
+
+    def append_event(self, event: WorkflowEvent) -> None:
+        self._events.append(event)
+        if event.name != "node.execution.initiated":
+            return
+
+        # Mirrors `Store.get_state_at_node`, but over the snapshots we still have when the node is initiated
+        most_recent_state_snapshot = self._evicted_state_snapshot
+        if most_recent_state_snapshot and most_recent_state_snapshot.meta.updated_ts > event.timestamp:
+            most_recent_state_snapshot = None
+
+        for snapshot in self._state_snapshots:
+            if snapshot.meta.updated_ts > event.timestamp:
+                break
+
+            most_recent_state_snapshot = snapshot
+
+        self._state_at_node[event.node_definition] = most_recent_state_snapshot
+
+    def append_state_snapshot(self, state: BaseState) -> None:
+        if len(self._state_snapshots) == self._max_state_snapshots:
+            self._evicted_state_snapshot = self._state_snapshots[0]
+        self._state_snapshots.append(state)
+
+    def clear(self) -> None:
+        self._reset()
+
+    def get_state_at_node(self, node: Type["BaseNode"]) -> Optional[BaseState]:
+        return self._state_at_node.get(node)
+
+
+def _timestamp_key(timestamp: datetime) -> int:
+    """
+    Returns `timestamp` as a whole number of microseconds, so that it can be compared exactly in SQL.
+    """
+    epoch = datetime(1970, 1, 1, tzinfo=timestamp.tzinfo)
+    return (timestamp - epoch) // timedelta(microseconds=1)
+
+
+def _close_database(connection: sqlite3.Connection, temporary_path: Optional[str]) -> None:
+    connection.close()
+    if temporary_path:
+        # The write-ahead log and its index are usually removed along with the last connection, but not always
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(temporary_path + suffix):
+                os.remove(temporary_path + suffix)
+
+
+class SqliteStore(Store):
+    """
+    A store that appends state snapshots and a lookup index of events to a SQLite database on disk, so that
+    long running workflows can still be resumed without holding their whole history in memory.
+
+    Only the last `max_events` events are kept in memory for `events`. State snapshots are serialized to JSON
+    when appended, and rehydrated with the workflow's `deserialize_state` when read back. If no `path` is given,
+    a temporary database is created and removed once the store is garbage collected.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_events: int = 1000) -> None:
+        if max_events <= 0:
+            raise ValueError("max_events must be greater than 0")
+
+        super().__init__()
+        is_temporary = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="vellum-workflow-store-", suffix=".sqlite3")
+            os.close(fd)
+
+        self._path = path
+        self._max_events = max_events
+        self._events: Deque[WorkflowEvent] = deque(maxlen=max_events)  # type: ignore[assignment]
+        self._workflow_definitions: Dict[str, Type["BaseWorkflow"]] = {}
+        self._lock = Lock()
+
+        # Snapshots are appended from node threads while events are appended from the consumer's thread
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        weakref.finalize(self, _close_database, self._connection, path if is_temporary else None)
+        # Every append is its own transaction, which the write-ahead log commits without syncing to disk each time.
+        # Committed appends survive a crash of the process, though not of the machine.
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS node_initiated_events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                node_id TEXT NOT NULL,
+                timestamp INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS node_initiated_events_node_id ON node_initiated_events (node_id, seq);
+            CREATE TABLE IF NOT EXISTS state_snapshots (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                workflow_definition_id TEXT NOT NULL,
+                updated_ts INTEGER NOT NULL,
+                payload TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS state_snapshots_updated_ts ON state_snapshots (updated_ts, seq);
+            """
+        )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def append_event(self, event: WorkflowEvent) -> None:
+        self._events.append(event)
+        if event.name != "node.execution.initiated":
+            return
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO node_initiated_events (node_id, timestamp) VALUES (?, ?)",
+                (str(event.node_definition.__id__), _timestamp_key(event.timestamp)),
+            )
+
+    def append_state_snapshot(self, state: BaseState) -> None:
+        workflow_definition = state.meta.workflow_definition
+        workflow_definition_id = str(workflow_definition.__id__)
+        payload = json.dumps(state, cls=VellumJsonEncoder)
+
+        with self._lock:
+            self._workflow_definitions[workflow_definition_id] = workflow_definition
+            self._connection.execute(
+                "INSERT INTO state_snapshots (workflow_definition_id, updated_ts, payload) VALUES (?, ?, ?)",
+                (workflow_definition_id, _timestamp_key(state.meta.updated_ts), payload),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._connection.executescript("DELETE FROM node_initiated_events; DELETE FROM state_snapshots;")
+
+    @property
+    def state_snapshots(self) -> Iterator[BaseState]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT workflow_definition_id, updated_ts, payload FROM state_snapshots ORDER BY seq"
+            ).fetchall()
+
+        for row in rows:
+            yield self._deserialize_state_snapshot(*row)
+
+    def get_state_at_node(self, node: Type["BaseNode"]) -> Optional[BaseState]:
+        with self._lock:
+            event_row = self._connection.execute(
+                "SELECT timestamp FROM node_initiated_events WHERE node_id = ? ORDER BY seq DESC LIMIT 1",
+                (str(node.__id__),),
+            ).fetchone()
+            if event_row is None:
+                return None
+
+            # The last snapshot appended before the first one taken after the node was initiated
+            snapshot_row = self._connection.execute(
+                """
+                SELECT workflow_definition_id, updated_ts, payload FROM state_snapshots
+                WHERE seq < COALESCE(
+                    (SELECT MIN(seq) FROM state_snapshots WHERE updated_ts > ?),
+                    (SELECT MAX(seq) + 1 FROM state_snapshots)
+                )
+                ORDER BY seq DESC LIMIT 1
+                """,
+                (event_row[0],),
+            ).fetchone()
+
+        if snapshot_row is None:
+            return None
+
+        return self._deserialize_state_snapshot(*snapshot_row)
+
+    def get_most_recent_state(self) -> Optional[BaseState]:
+        with self._lock:
+            snapshot_row = self._connection.execute(
+                """
+                SELECT workflow_definition_id, updated_ts, payload FROM state_snapshots
+                ORDER BY updated_ts DESC, seq DESC LIMIT 1
+                """
+            ).fetchone()
+
+        if snapshot_row is None:
+            return None
+
+        return self._deserialize_state_snapshot(*snapshot_row)
+
+    def _deserialize_state_snapshot(self, workflow_definition_id: str, updated_ts: int, payload: str) -> BaseState:
+        workflow_definition = self._workflow_definitions[workflow_definition_id]
+        state = workflow_definition.deserialize_state(json.loads(payload))
+
+        # Rehydrating the state counts as an edit, so we restore the timestamp of the snapshot itself
+        state.meta.updated_ts = datetime(1970, 1, 1, tzinfo=state.meta.updated_ts.tzinfo) + timedelta(
+            microseconds=updated_ts
+        )
+        return state
@@ -14,6 +14,7 @@ from vellum.workflows.nodes.bases import BaseNode
 from vellum.workflows.outputs.base import BaseOutputs
 from vellum.workflows.state.base import BaseState
 from vellum.workflows.state.delta import SetStateDelta, StateDelta
+from vellum.workflows.types import SnapshotMode
 from vellum.workflows.types.code_execution_node_wrappers import DictWrapper
 
 
@@ -553,3 +554,32 @@ def test_base_state_chat_history_with_default_factory_creates_separate_instances
     assert len(chat_history2) == 1
     assert chat_history1[0].text == "Message 1"
     assert chat_history2[0].text == "Message 2"
+
+
+def test_state_snapshot__structural_mode_shares_chat_history():
+    # GIVEN a state class that opts into structural snapshots
+    class TestState(BaseState):
+        __snapshot_mode__ = SnapshotMode.STRUCTURAL
+        chat_history: List[ChatMessage] = Field(default_factory=list)
+
+    snapshots: List[TestState] = []
+    state = TestState()
+    state.__snapshot_callback__ = lambda snapshot, _: snapshots.append(cast(TestState, snapshot))
+
+    # WHEN we append messages to the chat history
+    messages = [ChatMessage(role="USER", text=f"Message {index}") for index in range(3)]
+    for message in messages:
+        state.chat_history.append(message)
+
+    # AND then edit the chat history in place
+    state.chat_history.pop(0)
+
+    # THEN each snapshot should see the chat history as it was when it was taken
+    assert [len(snapshot.chat_history) for snapshot in snapshots] == [1, 2, 3]
+    assert snapshots[2].chat_history == messages
+
+    # AND the messages themselves should be shared rather than copied
+    assert snapshots[2].chat_history[0] is messages[0]
+
+    # AND the snapshots should be instances of the state class once read
+    assert all(type(snapshot) is TestState for snapshot in snapshots)
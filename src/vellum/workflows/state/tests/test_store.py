@@ -0,0 +1,61 @@
+import pytest
+
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.nodes.bases import BaseNode
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.store import BoundedStore, SqliteStore, Store
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+class State(BaseState):
+    counter: int = 0
+
+
+class IncrementNode(BaseNode[State]):
+    def run(self) -> BaseNode.Outputs:
+        for _ in range(10):
+            self.state.counter += 1
+        return self.Outputs()
+
+
+class FinalNode(BaseNode[State]):
+    pass
+
+
+class CountingWorkflow(BaseWorkflow[BaseInputs, State]):
+    graph = IncrementNode >> FinalNode
+
+
+@pytest.mark.parametrize(
+    "store_factory",
+    [
+        lambda: BoundedStore(max_events=2, max_state_snapshots=2),
+        lambda: SqliteStore(max_events=2),
+    ],
+    ids=["bounded", "sqlite"],
+)
+def test_store__state_lookups_match_unbounded_store(store_factory):
+    # GIVEN a workflow that has been run with the default store
+    reference_workflow = CountingWorkflow(store=Store())
+    reference_workflow.run()
+
+    # AND the same workflow run with a store that does not keep its whole history in memory
+    store = store_factory()
+    workflow = CountingWorkflow(store=store)
+    workflow.run()
+
+    # THEN only the most recent events should be retained in memory
+    assert len(list(store.events)) == 2
+
+    # AND the state at each node should match the one found by the default store
+    for node in [IncrementNode, FinalNode]:
+        state_at_node = workflow.get_state_at_node(node)
+        reference_state_at_node = reference_workflow.get_state_at_node(node)
+        assert state_at_node.counter == reference_state_at_node.counter
+
+    # AND so should the most recent state
+    assert workflow.get_most_recent_state().counter == 10
+    assert (
+        workflow.get_most_recent_state().meta.node_outputs
+        == reference_workflow.get_most_recent_state().meta.node_outputs
+    )
@@ -7,7 +7,7 @@ from uuid import UUID
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterator, Optional, Tuple, Type, cast, get_origin
 
 from vellum.workflows.references.trigger import TriggerAttributeReference
-from vellum.workflows.types.utils import get_class_attr_names, infer_types
+from vellum.workflows.types.utils import clear_type_cache, get_class_attr_names, infer_types
 from vellum.workflows.utils.files import virtual_open
 from vellum.workflows.utils.uuids import get_trigger_attribute_id, uuid4_from_hash
 from vellum_ee.workflows.display.editor import NodeDisplayComment
@@ -287,6 +287,16 @@ class BaseTriggerMeta(ABCMeta):
         reference = TriggerAttributeReference(name=name, types=types, instance=attribute, trigger_class=trigger_cls)
         return reference
 
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_") or name == "__annotations__":
+            clear_type_cache(cls)
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if not name.startswith("_") or name == "__annotations__":
+            clear_type_cache(cls)
+
     def __iter__(cls) -> Iterator[TriggerAttributeReference]:
         seen: Dict[str, TriggerAttributeReference] = {}
 
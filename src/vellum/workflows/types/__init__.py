@@ -1,6 +1,9 @@
-from .core import CancelSignal, MergeBehavior
+from .core import CancelSignal, MergeBehavior, ObservableCancelSignal, OutputValidationMode, SnapshotMode
 
 __all__ = [
     "CancelSignal",
     "MergeBehavior",
+    "ObservableCancelSignal",
+    "OutputValidationMode",
+    "SnapshotMode",
 ]
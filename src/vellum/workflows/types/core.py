@@ -1,8 +1,9 @@
 from enum import Enum
 from multiprocessing.synchronize import Event as MultiprocessingEvent
-from threading import Event as ThreadingEvent
+from threading import Event as ThreadingEvent, Lock
 from typing import (  # type: ignore[attr-defined]
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
@@ -35,6 +36,43 @@ def is_json_type(types: Iterable) -> bool:
     return types_list == actual_types_with_explicit_ref or types_list == with_none
 
 
+class ObservableCancelSignal(ThreadingEvent):
+    """
+    A threading Event that invokes registered callbacks the moment it is set. Workflow runners subscribe
+    to these signals directly instead of dedicating a thread to watching for cancellation.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._callbacks_lock = Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    def set(self) -> None:
+        super().set()
+        with self._callbacks_lock:
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Registers a callback to be invoked once the signal is set. If the signal is already set, the
+        callback is invoked immediately.
+        """
+        with self._callbacks_lock:
+            if not self.is_set():
+                self._callbacks.append(callback)
+                return
+
+        callback()
+
+    def remove_callback(self, callback: Callable[[], None]) -> None:
+        with self._callbacks_lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
 CancelSignal = Union[ThreadingEvent, MultiprocessingEvent]
 
 # Unions and Generics inherit from `_GenericAlias` instead of `type`
@@ -58,6 +96,34 @@ class MergeBehavior(Enum):
     CUSTOM = "CUSTOM"
 
 
+class SnapshotMode(Enum):
+    """
+    How `BaseState` copies itself each time it is snapshotted.
+
+    - DEEPCOPY: every snapshot is a full deep copy of the state.
+    - STRUCTURAL: snapshots share list elements with the live state and only materialize their lists the
+      first time they are read. Values appended to state lists are assumed not to be edited in place.
+    """
+
+    DEEPCOPY = "DEEPCOPY"
+    STRUCTURAL = "STRUCTURAL"
+
+
+class OutputValidationMode(Enum):
+    """
+    When the WorkflowRunner checks that node outputs can be serialized to JSON.
+
+    - EAGER: every output value is validated as soon as the node produces it, rejecting the node with
+      INVALID_OUTPUTS otherwise. Strings, numbers, booleans, None, UUIDs and datetimes are always serializable,
+      so they skip the check.
+    - DEFERRED: outputs are not validated while the node runs. A value that cannot be serialized raises once
+      the event carrying it is serialized instead, which avoids the cost of validating every streamed chunk.
+    """
+
+    EAGER = "EAGER"
+    DEFERRED = "DEFERRED"
+
+
 class ConditionType(Enum):
     IF = "IF"
     ELIF = "ELIF"
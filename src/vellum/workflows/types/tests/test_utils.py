@@ -113,3 +113,23 @@ def test_infer_types__non_existent_attribute__raises_clear_error():
         infer_types(ExampleClass, "non_existent_attribute")
 
     assert "'ExampleClass' has no attribute 'non_existent_attribute'" in str(exc_info.value)
+
+
+def test_get_class_attr_names__invalidated_when_base_class_changes():
+    # GIVEN a node class and a subclass whose attribute names and types have already been resolved
+    class ParentNode(BaseNode):
+        foo: str
+
+    class ChildNode(ParentNode):
+        bar: int
+
+    assert "baz" not in get_class_attr_names(ChildNode)
+    assert infer_types(ChildNode, "foo") == (str,)
+
+    # WHEN an attribute is added to the parent class and an annotation is changed
+    setattr(ParentNode, "baz", 3)
+    ParentNode.__annotations__ = {"foo": int}
+
+    # THEN the subclass sees the new attribute and the new annotation
+    assert "baz" in get_class_attr_names(ChildNode)
+    assert infer_types(ChildNode, "foo") == (int,)
@@ -39,6 +39,39 @@ LOCAL_NS = {
 }
 
 
+_TYPE_CACHE_ATTRIBUTE = "__type_cache__"
+
+
+def _get_type_cache(cls: Type) -> Optional[Dict[Any, Any]]:
+    """
+    Returns the cache of inferred types and attribute names stored on `cls` itself, or None if `cls` doesn't
+    support one, like builtin types. Subclasses don't share their parent's cache, so new classes start empty.
+    """
+    type_cache = cls.__dict__.get(_TYPE_CACHE_ATTRIBUTE)
+    if type_cache is not None:
+        return type_cache
+
+    type_cache = {}
+    try:
+        type.__setattr__(cls, _TYPE_CACHE_ATTRIBUTE, type_cache)
+    except TypeError:
+        return None
+
+    return type_cache
+
+
+def clear_type_cache(cls: Type) -> None:
+    """
+    Drops the types and attribute names cached for `cls` and every class that inherits from it. Metaclasses call
+    this whenever a public attribute or the annotations of one of their classes change.
+    """
+    if _TYPE_CACHE_ATTRIBUTE in cls.__dict__:
+        type.__delattr__(cls, _TYPE_CACHE_ATTRIBUTE)
+
+    for subclass in type.__subclasses__(cls):
+        clear_type_cache(subclass)
+
+
 def resolve_types(value: Union[BaseDescriptor[_T], _T]) -> Tuple[Type[_T], ...]:
     if isinstance(value, BaseDescriptor):
         return value.types
@@ -61,6 +94,23 @@ def resolve_combined_types(
 
 
 def infer_types(object_: Type, attr_name: str, localns: Optional[Dict[str, Any]] = None) -> Tuple[Type, ...]:
+    if not isinstance(object_, type):
+        return _infer_types(object_, attr_name, localns)
+
+    type_cache = _get_type_cache(object_)
+    if type_cache is None:
+        return _infer_types(object_, attr_name, localns)
+
+    cache_key = ("infer_types", attr_name, None if localns is None else tuple((k, id(v)) for k, v in localns.items()))
+    inferred_types = type_cache.get(cache_key)
+    if inferred_types is None:
+        inferred_types = _infer_types(object_, attr_name, localns)
+        type_cache[cache_key] = inferred_types
+
+    return inferred_types
+
+
+def _infer_types(object_: Type, attr_name: str, localns: Optional[Dict[str, Any]] = None) -> Tuple[Type, ...]:
     try:
         class_ = object_
         type_var_mapping = {}
@@ -139,6 +189,19 @@ def infer_types(object_: Type, attr_name: str, localns: Optional[Dict[str, Any]]
 
 
 def get_class_attr_names(cls: Type) -> List[str]:
+    type_cache = _get_type_cache(cls)
+    if type_cache is None:
+        return _get_class_attr_names(cls)
+
+    attr_names = type_cache.get("attr_names")
+    if attr_names is None:
+        attr_names = _get_class_attr_names(cls)
+        type_cache["attr_names"] = attr_names
+
+    return list(attr_names)
+
+
+def _get_class_attr_names(cls: Type) -> List[str]:
     # make sure we don't duplicate attributes
     collected_attributes: Set[str] = set()
 
@@ -0,0 +1,159 @@
+import asyncio
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+import threading
+import weakref
+from typing import AsyncIterator, Optional, cast
+
+import httpx
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 16
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_ASYNC_MAX_CONNECTIONS = 100
+
+
+def create_http_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+) -> Session:
+    """
+    Creates a `requests.Session` whose connections are kept alive and reused across requests, for nodes like APINode
+    that make HTTP requests on behalf of a workflow.
+
+    pool_connections: int - The number of hosts to keep a pool of connections for.
+    pool_maxsize: int - The maximum number of connections kept alive for each host.
+    pool_block: bool - Whether to wait for a free connection once a host has `pool_maxsize` connections in use,
+        instead of opening a new connection that is discarded after the request.
+    """
+
+    session = Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # The session is shared by unrelated requests, so cookies set by one response must not be sent with another
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+_default_http_session: Optional[Session] = None
+_default_http_session_lock = threading.Lock()
+
+
+def get_default_http_session() -> Session:
+    """
+    Returns the process-wide HTTP session used by every WorkflowContext that isn't given one explicitly.
+    """
+
+    global _default_http_session
+    if _default_http_session is None:
+        with _default_http_session_lock:
+            if _default_http_session is None:
+                _default_http_session = create_http_session()
+    return _default_http_session
+
+
+def set_default_http_session(session: Session) -> None:
+    global _default_http_session
+    with _default_http_session_lock:
+        _default_http_session = session
+
+
+class _ReleasingByteStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, semaphore: asyncio.Semaphore) -> None:
+        self._stream = stream
+        self._semaphore: Optional[asyncio.Semaphore] = semaphore
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+                self._semaphore = None
+
+
+class _ConcurrencyLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Holds requests back until fewer than `max_requests` responses are open. httpcore scans every request waiting for
+    a connection each time one frees up, which is quadratic once thousands of requests are waiting in its pool.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_requests: int) -> None:
+        self._transport = transport
+        self._max_requests = max_requests
+        # Created on first use, so that it belongs to the event loop the client is used from
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_requests)
+        semaphore = self._semaphore
+
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingByteStream(cast(httpx.AsyncByteStream, response.stream), semaphore),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def create_async_http_client(
+    max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_POOL_MAXSIZE,
+) -> httpx.AsyncClient:
+    """
+    Creates an `httpx.AsyncClient` whose connections are kept alive and reused across requests, for nodes like
+    APINode that make HTTP requests on behalf of a workflow run with `astream` or `arun`.
+
+    max_connections: int - The maximum number of connections open at once, across every host. Requests wait for a
+        free connection beyond that.
+    max_keepalive_connections: int - The maximum number of idle connections kept alive, across every host.
+    """
+
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections),
+    )
+    return httpx.AsyncClient(
+        transport=_ConcurrencyLimitedTransport(transport, max_requests=max_connections),
+        # The client is shared by unrelated requests, so cookies set by one response must not be sent with another
+        cookies=httpx.Cookies(CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))),
+        timeout=None,
+    )
+
+
+# Connections of an async client belong to the event loop they were opened on, so there is one client per loop
+_default_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_default_async_http_client() -> httpx.AsyncClient:
+    """
+    Returns the async HTTP client shared by every WorkflowContext on the running event loop that isn't given one
+    explicitly.
+    """
+
+    loop = asyncio.get_running_loop()
+    with _default_http_session_lock:
+        client = _default_async_http_clients.get(loop)
+        if client is None:
+            client = create_async_http_client()
+            _default_async_http_clients[loop] = client
+        return client
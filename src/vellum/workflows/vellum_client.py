@@ -1,4 +1,25 @@
 from vellum import Vellum
-from vellum.utils.vellum_client import create_vellum_client, create_vellum_environment
+from vellum.utils.vellum_client import (
+    ConnectionPoolStats,
+    clear_shared_vellum_httpx_clients,
+    create_async_vellum_client,
+    create_async_vellum_client_from,
+    create_async_vellum_httpx_client,
+    create_vellum_client,
+    create_vellum_environment,
+    create_vellum_httpx_client,
+    get_connection_pool_stats,
+)
 
-__all__ = ["Vellum", "create_vellum_client", "create_vellum_environment"]
+__all__ = [
+    "ConnectionPoolStats",
+    "Vellum",
+    "clear_shared_vellum_httpx_clients",
+    "create_async_vellum_client",
+    "create_async_vellum_client_from",
+    "create_async_vellum_httpx_client",
+    "create_vellum_client",
+    "create_vellum_environment",
+    "create_vellum_httpx_client",
+    "get_connection_pool_stats",
+]
@@ -1,5 +1,5 @@
+from collections import defaultdict
 from dataclasses import field
-from datetime import datetime
 from functools import lru_cache
 import importlib
 import inspect
@@ -10,6 +10,7 @@ from uuid import UUID, uuid4
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
     Callable,
     ClassVar,
     Dict,
@@ -77,6 +78,7 @@ from vellum.workflows.events.workflow import (
 from vellum.workflows.exceptions import WorkflowInitializationException
 from vellum.workflows.executable import BaseExecutable
 from vellum.workflows.graph import Graph
+from vellum.workflows.graph.compiled import CompiledGraph
 from vellum.workflows.inputs.base import BaseInputs
 from vellum.workflows.loaders.base import BaseWorkflowFinder
 from vellum.workflows.nodes.bases import BaseNode
@@ -86,8 +88,9 @@ from vellum.workflows.outputs import BaseOutputs
 from vellum.workflows.ports import Port
 from vellum.workflows.references.trigger import TriggerAttributeReference
 from vellum.workflows.resolvers.base import BaseWorkflowResolver
-from vellum.workflows.runner import WorkflowRunner
+from vellum.workflows.runner import AsyncWorkflowRunner, WorkflowRunner
 from vellum.workflows.runner.runner import ExternalInputsArg, RunFromNodeArg
+from vellum.workflows.runner.snapshot_policy import SnapshotPolicy
 from vellum.workflows.state.base import BaseState, StateMeta
 from vellum.workflows.state.context import WorkflowContext
 from vellum.workflows.state.store import Store
@@ -251,6 +254,7 @@ class BaseWorkflow(Generic[InputsType, StateType], BaseExecutable, metaclass=_Ba
     unused_graphs: ClassVar[Set[GraphAttribute]]  # nodes or graphs that are defined but not used in the graph
     emitters: List[BaseWorkflowEmitter]
     resolvers: List[BaseWorkflowResolver]
+    snapshot_policy: SnapshotPolicy
     is_dynamic: ClassVar[bool] = False
 
     class Display:
@@ -284,11 +288,15 @@ class BaseWorkflow(Generic[InputsType, StateType], BaseExecutable, metaclass=_Ba
         emitters: Optional[List[BaseWorkflowEmitter]] = None,
         resolvers: Optional[List[BaseWorkflowResolver]] = None,
         store: Optional[Store] = None,
+        snapshot_policy: Optional[SnapshotPolicy] = None,
     ):
         self._parent_state = parent_state
         self._context = context or WorkflowContext()
         self.emitters = emitters or (self.emitters if hasattr(self, "emitters") else [])
         self.resolvers = resolvers or (self.resolvers if hasattr(self, "resolvers") else [])
+        self.snapshot_policy = snapshot_policy or (
+            self.snapshot_policy if hasattr(self, "snapshot_policy") else SnapshotPolicy()
+        )
         # Prioritize store type from WorkflowContext to allow subworkflows to inherit EmptyStore
         # TODO(v2.0.0): Remove the concept of an internal store altogether (important-comment)
         self._store = store or self._context.store_class()
@@ -349,51 +357,87 @@ class BaseWorkflow(Generic[InputsType, StateType], BaseExecutable, metaclass=_Ba
                     nodes.add(node)
                     yield node
 
+    @classmethod
+    def get_compiled_graph(cls) -> CompiledGraph:
+        """
+        Returns the workflow's graph resolved into its edges, nodes and dependencies. The result is cached on the
+        class until `graph` or `unused_graphs` is reassigned, except for dynamic workflows.
+        """
+        graph = cls.graph
+        unused_graphs = cls.unused_graphs if hasattr(cls, "unused_graphs") else None
+        cached = cls.__dict__.get("__compiled_graph__")
+        if cached is not None and cached[0] is graph and cached[1] is unused_graphs:
+            return cached[2]
+
+        subgraphs = cls._resolve_graph(graph)
+        unused_subgraphs: List[Graph] = []
+        for item in unused_graphs or []:
+            unused_subgraphs.extend(cls._resolve_graph(item))
+
+        edges = list(cls._get_edges_from_subgraphs(subgraphs))
+        nodes = list(cls._get_nodes_from_subgraphs(subgraphs))
+        unused_nodes = list(cls._get_nodes_from_subgraphs(unused_subgraphs))
+
+        dependencies: Dict[Type[BaseNode], Set[Type[BaseNode]]] = defaultdict(set)
+        for edge in edges:
+            dependencies[edge.to_node].add(edge.from_port.node_class)
+
+        compiled_graph = CompiledGraph(
+            subgraphs=subgraphs,
+            unused_subgraphs=unused_subgraphs,
+            edges=edges,
+            nodes=nodes,
+            unused_edges=list(cls._get_edges_from_subgraphs(unused_subgraphs)),
+            unused_nodes=unused_nodes,
+            entrypoints={entrypoint for subgraph in subgraphs for entrypoint in subgraph.entrypoints},
+            nodes_by_id={node.__id__: node for node in [*nodes, *unused_nodes]},
+            dependencies=dict(dependencies),
+        )
+
+        # Dynamic workflows build their graphs at runtime, so there is nothing to gain from caching them
+        if not cls.is_dynamic:
+            setattr(cls, "__compiled_graph__", (graph, unused_graphs, compiled_graph))
+
+        return compiled_graph
+
     @classmethod
     def get_subgraphs(cls) -> List[Graph]:
-        return cls._resolve_graph(cls.graph)
+        return list(cls.get_compiled_graph().subgraphs)
 
     @classmethod
     def get_edges(cls) -> Iterator[Edge]:
         """
-        Returns an iterator over the edges in the workflow. We use a set to
-        ensure uniqueness, and the iterator to preserve order.
+        Returns an iterator over the edges in the workflow, in the order they were first defined.
         """
-        return cls._get_edges_from_subgraphs(cls.get_subgraphs())
+        return iter(cls.get_compiled_graph().edges)
 
     @classmethod
     def get_nodes(cls) -> Iterator[Type[BaseNode]]:
         """
-        Returns an iterator over the nodes in the workflow. We use a set to
-        ensure uniqueness, and the iterator to preserve order.
+        Returns an iterator over the nodes in the workflow, in the order they were first defined.
         """
-        return cls._get_nodes_from_subgraphs(cls.get_subgraphs())
+        return iter(cls.get_compiled_graph().nodes)
 
     @classmethod
     def get_unused_subgraphs(cls) -> List[Graph]:
         """
         Returns a list of subgraphs that are defined but not used in the graph
         """
-        if not hasattr(cls, "unused_graphs"):
-            return []
-        graphs = []
-        for item in cls.unused_graphs:
-            graphs.extend(cls._resolve_graph(item))
-        return graphs
+        return list(cls.get_compiled_graph().unused_subgraphs)
 
     @classmethod
     def get_unused_nodes(cls) -> Iterator[Type[BaseNode]]:
         """
         Returns an iterator over the nodes that are defined but not used in the graph.
         """
-        return cls._get_nodes_from_subgraphs(cls.get_unused_subgraphs())
+        return iter(cls.get_compiled_graph().unused_nodes)
 
     @classmethod
     def get_unused_edges(cls) -> Iterator[Edge]:
         """
         Returns an iterator over edges that are defined but not used in the graph.
         """
-        return cls._get_edges_from_subgraphs(cls.get_unused_subgraphs())
+        return iter(cls.get_compiled_graph().unused_edges)
 
     @classmethod
     def get_all_nodes(cls) -> Iterator[Type[BaseNode]]:
@@ -405,7 +449,7 @@ class BaseWorkflow(Generic[InputsType, StateType], BaseExecutable, metaclass=_Ba
 
     @classmethod
     def get_entrypoints(cls) -> Iterable[Type[BaseNode]]:
-        return iter({e for g in cls.get_subgraphs() for e in g.entrypoints})
+        return iter(cls.get_compiled_graph().entrypoints)
 
     def run(
         self,
@@ -496,6 +540,13 @@ class BaseWorkflow(Generic[InputsType, StateType], BaseExecutable, metaclass=_Ba
                 first_event = event
             last_event = event
 
+        return self._get_terminal_event(first_event, last_event)
+
+    def _get_terminal_event(
+        self,
+        first_event: Optional[Union[WorkflowExecutionInitiatedEvent, WorkflowExecutionResumedEvent]],
+        last_event: Optional["BaseWorkflow.WorkflowEvent"],
+    ) -> TerminalWorkflowEvent:
         if not last_event:
             rejected_event = WorkflowExecutionRejectedEvent(
                 trace_id=self._execution_context.trace_id,
@@ -643,6 +694,98 @@ class BaseWorkflow(Generic[InputsType, StateType], BaseExecutable, metaclass=_Ba
 
         return WorkflowEventGenerator(_generate_filtered_events(), runner_stream.span_id)
 
+    async def astream(
+        self,
+        inputs: Optional[InputsType] = None,
+        *,
+        event_filter: Optional[Callable[[Type["BaseWorkflow"], WorkflowEvent], bool]] = None,
+        state: Optional[StateType] = None,
+        entrypoint_nodes: Optional[RunFromNodeArg] = None,
+        external_inputs: Optional[ExternalInputsArg] = None,
+        previous_execution_id: Optional[Union[str, UUID]] = None,
+        execution_id: Optional[UUID] = None,
+        cancel_signal: Optional[CancelSignal] = None,
+        node_output_mocks: Optional[MockNodeExecutionArg] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        trigger: Optional[BaseTrigger] = None,
+        event_max_size: Optional[int] = None,
+    ) -> AsyncGenerator[WorkflowEvent, None]:
+        """
+        Invoke a Workflow on the running event loop, yielding events as they are emitted. Accepts the same
+        parameters as `stream`.
+
+        Nodes that implement `arun` are awaited on the event loop, so a single thread can run many I/O bound
+        Workflows at once. All other nodes run on the Workflow's node executor, as they do with `stream`.
+        """
+
+        should_yield = event_filter or workflow_event_filter
+        runner: AsyncWorkflowRunner[StateType] = AsyncWorkflowRunner(
+            self,
+            inputs=inputs,
+            state=state,
+            entrypoint_nodes=entrypoint_nodes,
+            external_inputs=external_inputs,
+            previous_execution_id=previous_execution_id,
+            cancel_signal=cancel_signal,
+            node_output_mocks=node_output_mocks,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            init_execution_context=self._execution_context,
+            trigger=trigger,
+            execution_id=execution_id,
+            event_max_size=event_max_size,
+        )
+        self._current_runner = runner
+        async for event in runner.astream():
+            if should_yield(self.__class__, event):
+                yield event
+
+    async def arun(
+        self,
+        inputs: Optional[InputsType] = None,
+        *,
+        state: Optional[StateType] = None,
+        entrypoint_nodes: Optional[RunFromNodeArg] = None,
+        external_inputs: Optional[ExternalInputsArg] = None,
+        previous_execution_id: Optional[Union[str, UUID]] = None,
+        execution_id: Optional[UUID] = None,
+        cancel_signal: Optional[CancelSignal] = None,
+        node_output_mocks: Optional[MockNodeExecutionArg] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        trigger: Optional[BaseTrigger] = None,
+    ) -> TerminalWorkflowEvent:
+        """
+        Invoke a Workflow on the running event loop, returning the last event emitted. Accepts the same parameters
+        as `run`, and runs nodes the same way as `astream`.
+        """
+
+        runner: AsyncWorkflowRunner[StateType] = AsyncWorkflowRunner(
+            self,
+            inputs=inputs,
+            state=state,
+            entrypoint_nodes=entrypoint_nodes,
+            external_inputs=external_inputs,
+            previous_execution_id=previous_execution_id,
+            cancel_signal=cancel_signal,
+            node_output_mocks=node_output_mocks,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            init_execution_context=self._execution_context,
+            trigger=trigger,
+            execution_id=execution_id,
+        )
+        self._current_runner = runner
+        first_event: Optional[Union[WorkflowExecutionInitiatedEvent, WorkflowExecutionResumedEvent]] = None
+        last_event = None
+        async for event in runner.astream():
+            if event.name == "workflow.execution.initiated" or event.name == "workflow.execution.resumed":
+                first_event = event
+            last_event = event
+
+        return self._get_terminal_event(first_event, last_event)
+
     @classmethod
     def validate(cls) -> None:
         """
@@ -820,37 +963,18 @@ class BaseWorkflow(Generic[InputsType, StateType], BaseExecutable, metaclass=_Ba
         return self.get_state_class()(meta=meta)
 
     def get_state_at_node(self, node: Type[BaseNode], execution_id: Optional[UUID] = None) -> StateType:
-        event_ts = datetime.min
-        for event in self._store.events:
-            if event.name == "node.execution.initiated" and event.node_definition == node:
-                event_ts = event.timestamp
-
-        most_recent_state_snapshot: Optional[StateType] = None
-        for snapshot in self._store.state_snapshots:
-            if snapshot.meta.updated_ts > event_ts:
-                break
-
-            most_recent_state_snapshot = cast(StateType, snapshot)
-
+        most_recent_state_snapshot = self._store.get_state_at_node(node)
         if not most_recent_state_snapshot:
             return self.get_default_state(execution_id=execution_id)
 
-        return most_recent_state_snapshot
+        return cast(StateType, most_recent_state_snapshot)
 
     def get_most_recent_state(self, execution_id: Optional[UUID] = None) -> StateType:
-        most_recent_state_snapshot: Optional[StateType] = None
-
-        for snapshot in self._store.state_snapshots:
-            next_state = cast(StateType, snapshot)
-            if not most_recent_state_snapshot:
-                most_recent_state_snapshot = next_state
-            elif next_state.meta.updated_ts >= most_recent_state_snapshot.meta.updated_ts:
-                most_recent_state_snapshot = next_state
-
+        most_recent_state_snapshot = self._store.get_most_recent_state()
         if not most_recent_state_snapshot:
             return self.get_default_state(execution_id=execution_id)
 
-        return most_recent_state_snapshot
+        return cast(StateType, most_recent_state_snapshot)
 
     @overload
     @classmethod
@@ -229,6 +229,40 @@ def test_workflow__get_edges():
     }
 
 
+def test_workflow__compiled_graph__cached_until_graph_is_reassigned():
+    # GIVEN a workflow with a merge
+    class NodeA(BaseNode):
+        pass
+
+    class NodeB(BaseNode):
+        pass
+
+    class NodeC(BaseNode):
+        pass
+
+    class TestWorkflow(BaseWorkflow[BaseInputs, BaseState]):
+        graph = {NodeA, NodeB} >> NodeC
+
+    # WHEN we compile its graph twice
+    compiled_graph = TestWorkflow.get_compiled_graph()
+
+    # THEN the same compiled graph should be returned
+    assert TestWorkflow.get_compiled_graph() is compiled_graph
+
+    # AND it should index the workflow's nodes and dependencies
+    assert compiled_graph.nodes_by_id[NodeC.__id__] is NodeC
+    assert compiled_graph.get_dependencies(NodeC) == {NodeA, NodeB}
+    assert compiled_graph.get_dependencies(NodeA) == set()
+
+    # WHEN the graph is reassigned
+    TestWorkflow.graph = NodeA >> NodeC
+
+    # THEN the graph should be compiled again
+    assert TestWorkflow.get_compiled_graph() is not compiled_graph
+    assert TestWorkflow.get_compiled_graph().get_dependencies(NodeC) == {NodeA}
+    assert set(TestWorkflow.get_nodes()) == {NodeA, NodeC}
+
+
 def test_workflow__get_unused_nodes():
     class NodeA(BaseNode):
         pass
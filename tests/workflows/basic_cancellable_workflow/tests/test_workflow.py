@@ -2,6 +2,7 @@ from threading import Event as ThreadingEvent, Thread
 import time
 
 from vellum.workflows.errors.types import WorkflowErrorCode
+from vellum.workflows.types import ObservableCancelSignal
 from vellum.workflows.workflows.event_filters import root_workflow_event_filter
 
 from tests.workflows.basic_cancellable_workflow.workflow import BasicCancellableWorkflow
@@ -46,19 +47,17 @@ def test_workflow__cancel_stream():
     # AND we have a cancel signal
     cancel_signal = ThreadingEvent()
 
-    # AND some other thread triggers the cancel signal
-    def cancel_target():
-        time.sleep(0.01)
-        cancel_signal.set()
-
-    cancel_thread = Thread(target=cancel_target)
-    cancel_thread.start()
-
-    # WHEN we run the workflow
+    # WHEN we stream the workflow
     result = workflow.stream(cancel_signal=cancel_signal, event_filter=root_workflow_event_filter)
 
+    # AND some other thread triggers the cancel signal once the node has started
+    events = []
+    for event in result:
+        events.append(event)
+        if event.name == "node.execution.initiated":
+            Thread(target=cancel_signal.set).start()
+
     # THEN we should get the expected initiated and rejected events
-    events = list(result)
     assert events[0].name == "workflow.execution.initiated"
     assert events[-1].name == "workflow.execution.rejected"
     assert events[-1].error.message == "Workflow run cancelled"
@@ -98,3 +97,39 @@ def test_workflow__cancel_signal_not_set__run():
     # THEN the workflow should run to completion
     assert terminal_event.name == "workflow.execution.fulfilled"
     assert terminal_event.outputs.final_value == "hello world"
+
+    # AND joining the workflow shouldn't wait on the thread watching the cancel signal
+    start = time.monotonic()
+    workflow.join()
+    assert time.monotonic() - start < 0.5
+
+
+def test_workflow__cancel_run__observable_cancel_signal():
+    """
+    Test that an observable cancel signal cancels a run without the runner spawning a cancel thread.
+    """
+
+    # GIVEN a workflow that is long running
+    workflow = BasicCancellableWorkflow()
+
+    # AND we have an observable cancel signal
+    cancel_signal = ObservableCancelSignal()
+
+    # AND some other thread triggers the cancel signal
+    def cancel_target():
+        time.sleep(0.01)
+        cancel_signal.set()
+
+    cancel_thread = Thread(target=cancel_target)
+    cancel_thread.start()
+
+    # WHEN we run the workflow
+    terminal_event = workflow.run(cancel_signal=cancel_signal)
+
+    # THEN we should get the expected rejection
+    assert terminal_event.name == "workflow.execution.rejected"
+    assert terminal_event.error.code == WorkflowErrorCode.WORKFLOW_CANCELLED
+
+    # AND the runner never needed a dedicated thread to watch the signal
+    assert workflow._current_runner is not None
+    assert workflow._current_runner._cancel_thread is None
@@ -246,7 +246,8 @@ def test_run_workflow__happy_path(vellum_adhoc_prompt_client, mock_uuid4_generat
             name="create_repository", arguments={"name": "new_test_repo", "autoInit": True}
         )
 
-        assert mock_mcp_client_class.call_count == 2
+        # AND listing the tools and calling one share a single pooled session
+        assert mock_mcp_client_class.call_count == 1
 
         for call in mock_mcp_client_class.call_args_list:
             assert call.args == (
@@ -255,7 +256,7 @@ def test_run_workflow__happy_path(vellum_adhoc_prompt_client, mock_uuid4_generat
             )
 
         # AND verify that the MCP client methods were called correctly
-        assert mock_client_instance.initialize.call_count == 2
+        assert mock_client_instance.initialize.call_count == 1
         assert mock_client_instance.list_tools.call_count == 1
         assert mock_client_instance.call_tool.call_count == 1
 
@@ -46,7 +46,7 @@ def test_vellum_emitter__happy_path(mock_httpx_transport):
 
     workflow.join()
 
-    # THEN the emitter should have called client.events.create
+    # THEN the emitter should have sent the event to the events endpoint
     assert mock_httpx_transport.handle_request.call_count == 1
 
     # AND the call should be for the event emission
@@ -0,0 +1,90 @@
+import pytest
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler
+import json
+import threading
+from uuid import UUID
+from typing import Any, Dict, List, Tuple
+
+from vellum import Vellum, VellumEnvironment
+from vellum.workflows.emitters.vellum_emitter import VellumEmitter
+from vellum.workflows.events.workflow import WorkflowExecutionInitiatedBody, WorkflowExecutionInitiatedEvent
+from vellum.workflows.inputs.base import BaseInputs
+from vellum.workflows.state.base import BaseState
+from vellum.workflows.state.context import WorkflowContext
+from vellum.workflows.workflows.base import BaseWorkflow
+
+
+class TestInputs(BaseInputs):
+    foo: str = "bar"
+
+
+class TestWorkflow(BaseWorkflow[TestInputs, BaseState]):
+    pass
+
+
+class StubEventsServer:
+    """A local stand-in for Vellum's events endpoint that records the events in each request it receives."""
+
+    url: str
+
+    def __init__(self) -> None:
+        self.batches: List[List[Any]] = []
+
+    def handle(self, request: BaseHTTPRequestHandler, content: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        events = json.loads(content)
+        self.batches.append(events)
+
+        return 200, {"Content-Type": "application/json"}, json.dumps({"success": True, "count": len(events)}).encode()
+
+    @property
+    def event_ids(self) -> List[str]:
+        return [event["id"] for batch in self.batches for event in batch]
+
+
+@pytest.fixture
+def stub_events_server(local_http_server) -> StubEventsServer:
+    stub = StubEventsServer()
+    stub.url = local_http_server(stub.handle)
+    return stub
+
+
+def _build_emitter(server: StubEventsServer, **kwargs: Any) -> VellumEmitter:
+    emitter = VellumEmitter(**kwargs)
+    environment = VellumEnvironment(default=server.url, documents=server.url, predict=server.url)
+    emitter.register_context(WorkflowContext(vellum_client=Vellum(api_key="test", environment=environment)))
+    return emitter
+
+
+def _build_event(index: int) -> WorkflowExecutionInitiatedEvent:
+    return WorkflowExecutionInitiatedEvent(
+        id=UUID(int=index),
+        timestamp=datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        trace_id=UUID(int=index),
+        span_id=UUID(int=index),
+        body=WorkflowExecutionInitiatedBody(
+            workflow_definition=TestWorkflow,
+            inputs=TestInputs(foo=f"test{index}"),
+        ),
+    )
+
+
+def test_vellum_emitter__batches_by_size_with_a_single_flusher(stub_events_server):
+    # GIVEN an emitter that sends at most 10 events per request, with a debounce long enough to never fire
+    emitter = _build_emitter(stub_events_server, max_batch_size=10, debounce_timeout=30, max_latency=30)
+
+    # WHEN we emit 25 events
+    events = [_build_event(index) for index in range(25)]
+    for event in events:
+        emitter.emit_event(event)
+
+    # AND only a single flusher thread was started for all of them
+    flushers = [thread for thread in threading.enumerate() if thread.name == "VellumEmitter.flusher"]
+    assert len(flushers) == 1
+
+    # AND we join the emitter
+    emitter.join()
+
+    # THEN every event is delivered in order, in full batches with the remainder sent on join
+    assert [len(batch) for batch in stub_events_server.batches] == [10, 10, 5]
+    assert stub_events_server.event_ids == [str(event.id) for event in events]
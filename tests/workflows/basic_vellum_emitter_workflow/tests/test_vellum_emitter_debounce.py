@@ -1,7 +1,9 @@
 from datetime import datetime, timezone
+import json
 import time
 from unittest import mock
 from uuid import UUID
+from typing import Any, List
 
 from vellum.workflows.emitters.vellum_emitter import VellumEmitter
 from vellum.workflows.events.workflow import WorkflowExecutionInitiatedBody, WorkflowExecutionInitiatedEvent
@@ -18,6 +20,19 @@ class TestWorkflow(BaseWorkflow[TestInputs, BaseState]):
     pass
 
 
+def _mock_vellum_client() -> mock.MagicMock:
+    mock_client = mock.MagicMock()
+    mock_client._client_wrapper.httpx_client.request.return_value.status_code = 200
+    return mock_client
+
+
+def _get_sent_batches(mock_client: mock.MagicMock) -> List[List[Any]]:
+    """Returns the events sent in each request to the events endpoint."""
+    return [
+        json.loads(call.kwargs["content"]) for call in mock_client._client_wrapper.httpx_client.request.call_args_list
+    ]
+
+
 def test_vellum_emitter_debounce_batches_events():
     """
     Test that VellumEmitter batches multiple events when they arrive within debounce window.
@@ -25,7 +40,7 @@ def test_vellum_emitter_debounce_batches_events():
     emitter = VellumEmitter(debounce_timeout=0.05)
 
     mock_context = mock.MagicMock()
-    mock_client = mock.MagicMock()
+    mock_client = _mock_vellum_client()
     mock_context.vellum_client = mock_client
     emitter._context = mock_context
 
@@ -55,11 +70,9 @@ def test_vellum_emitter_debounce_batches_events():
 
     time.sleep(0.15)
 
-    assert mock_client.events.create.call_count == 1
-    call_args = mock_client.events.create.call_args
-    assert len(call_args.kwargs["request"]) == 2
-    assert call_args.kwargs["request"][0] == event1
-    assert call_args.kwargs["request"][1] == event2
+    sent_batches = _get_sent_batches(mock_client)
+    assert len(sent_batches) == 1
+    assert [sent_event["id"] for sent_event in sent_batches[0]] == [str(event1.id), str(event2.id)]
 
 
 def test_vellum_emitter_debounce_single_event():
@@ -69,7 +82,7 @@ def test_vellum_emitter_debounce_single_event():
     emitter = VellumEmitter(debounce_timeout=0.05)
 
     mock_context = mock.MagicMock()
-    mock_client = mock.MagicMock()
+    mock_client = _mock_vellum_client()
     mock_context.vellum_client = mock_client
     emitter._context = mock_context
 
@@ -88,9 +101,8 @@ def test_vellum_emitter_debounce_single_event():
 
     time.sleep(0.1)
 
-    assert mock_client.events.create.call_count == 1
-    call_args = mock_client.events.create.call_args
-    assert call_args.kwargs["request"] == [event]
+    sent_batches = _get_sent_batches(mock_client)
+    assert [[sent_event["id"] for sent_event in batch] for batch in sent_batches] == [[str(event.id)]]
 
 
 def test_vellum_emitter_debounce_timer_reset():
@@ -100,7 +112,7 @@ def test_vellum_emitter_debounce_timer_reset():
     emitter = VellumEmitter(debounce_timeout=0.4)
 
     mock_context = mock.MagicMock()
-    mock_client = mock.MagicMock()
+    mock_client = _mock_vellum_client()
     mock_context.vellum_client = mock_client
     emitter._context = mock_context
 
@@ -133,13 +145,13 @@ def test_vellum_emitter_debounce_timer_reset():
 
     time.sleep(0.1)
 
-    assert mock_client.events.create.call_count == 0
+    assert _get_sent_batches(mock_client) == []
 
     # Sleep 0.4 with 0.1 + 0.1 above to ensure the total time is 0.6, which is greater than the debounce time of 0.4
     time.sleep(0.4)
-    assert mock_client.events.create.call_count == 1
-    call_args = mock_client.events.create.call_args
-    assert len(call_args.kwargs["request"]) == 2
+    sent_batches = _get_sent_batches(mock_client)
+    assert len(sent_batches) == 1
+    assert len(sent_batches[0]) == 2
 
 
 def test_vellum_emitter_debounce_no_context():
@@ -173,7 +185,7 @@ def test_vellum_emitter_debounce_disallowed_events():
     emitter = VellumEmitter(debounce_timeout=0.05)
 
     mock_context = mock.MagicMock()
-    mock_client = mock.MagicMock()
+    mock_client = _mock_vellum_client()
     mock_context.vellum_client = mock_client
     emitter._context = mock_context
 
@@ -184,5 +196,5 @@ def test_vellum_emitter_debounce_disallowed_events():
 
     time.sleep(0.1)
 
-    assert mock_client.events.create.call_count == 0
+    assert _get_sent_batches(mock_client) == []
     assert len(emitter._event_queue) == 0